@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 application = get_asgi_application()
+
+# Планировщик периодических задач — только в веб-процессах (SCHEDULER_ENABLED), не в management-командах
+from src.common.infrastructure.scheduler import start_scheduler  # noqa: E402
+
+start_scheduler()
@@ -204,3 +204,85 @@ SPECTACULAR_SETTINGS = {
     },
 }
 
+
+# Аналитика просмотров: дневные агрегаты и ретенция сырого лога ListingViewLog
+LISTING_VIEW_ROLLUP_BATCH_SIZE = int(os.getenv("LISTING_VIEW_ROLLUP_BATCH_SIZE", "5000"))
+# Не трогаем самые свежие записи: id выдаются до коммита, «хвост» может ещё дописываться
+LISTING_VIEW_ROLLUP_SAFETY_LAG_SECONDS = int(os.getenv("LISTING_VIEW_ROLLUP_SAFETY_LAG_SECONDS", "60"))
+LISTING_VIEW_LOG_RETENTION_DAYS = int(os.getenv("LISTING_VIEW_LOG_RETENTION_DAYS", "90"))
+LISTING_VIEW_LOG_PURGE_BATCH_SIZE = int(os.getenv("LISTING_VIEW_LOG_PURGE_BATCH_SIZE", "1000"))
+LISTING_VIEW_LOG_PURGE_SLEEP_SECONDS = float(os.getenv("LISTING_VIEW_LOG_PURGE_SLEEP_SECONDS", "0.5"))
+# Дедупликация просмотров: повтор тем же посетителем в пределах окна не пишется (0 — выключено)
+LISTING_VIEW_DEDUP_WINDOW_SECONDS = int(os.getenv("LISTING_VIEW_DEDUP_WINDOW_SECONDS", "1800"))
+LISTING_VIEW_DEDUP_BUCKETS = int(os.getenv("LISTING_VIEW_DEDUP_BUCKETS", "6"))
+LISTING_VIEW_DEDUP_MAX_KEYS = int(os.getenv("LISTING_VIEW_DEDUP_MAX_KEYS", "200000"))
+# Число доверенных reverse-proxy перед приложением: IP клиента для отпечатка берётся из X-Forwarded-For
+# на этой позиции справа. 0 — заголовок не учитывается (его может подставить любой клиент), берётся REMOTE_ADDR
+TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", "0"))
+
+# Бронирования: повтор транзакции при конфликте блокировок (deadlock / lock wait timeout)
+BOOKING_LOCK_RETRY_ATTEMPTS = int(os.getenv("BOOKING_LOCK_RETRY_ATTEMPTS", "3"))
+BOOKING_LOCK_RETRY_BASE_DELAY_SECONDS = float(os.getenv("BOOKING_LOCK_RETRY_BASE_DELAY_SECONDS", "0.05"))
+
+# Бронирования: in-memory индекс подтверждённых броней (доступность без запросов к bookings)
+BOOKING_INTERVAL_INDEX_ENABLED = env_bool("BOOKING_INTERVAL_INDEX_ENABLED", False)
+BOOKING_INTERVAL_INDEX_REFRESH_SECONDS = float(os.getenv("BOOKING_INTERVAL_INDEX_REFRESH_SECONDS", "5"))
+
+# Бронирования: автозавершение прошедших броней и истечение заявок (auto_transition_bookings)
+BOOKING_REQUEST_EXPIRE_DAYS = int(os.getenv("BOOKING_REQUEST_EXPIRE_DAYS", "7"))
+BOOKING_MAINTENANCE_BATCH_SIZE = int(os.getenv("BOOKING_MAINTENANCE_BATCH_SIZE", "500"))
+BOOKING_MAINTENANCE_SLEEP_SECONDS = float(os.getenv("BOOKING_MAINTENANCE_SLEEP_SECONDS", "0.1"))
+
+# Цены: TTL кэша расчётов стоимости (ключ включает версию тарифов — инвалидация не нужна)
+PRICING_QUOTE_CACHE_SECONDS = int(os.getenv("PRICING_QUOTE_CACHE_SECONDS", "300"))
+
+# iCal: окно экспортируемой ленты (дней в прошлом) и размер порции записи при импорте внешних лент
+ICAL_EXPORT_PAST_DAYS = int(os.getenv("ICAL_EXPORT_PAST_DAYS", "30"))
+ICAL_IMPORT_BATCH_SIZE = int(os.getenv("ICAL_IMPORT_BATCH_SIZE", "1000"))
+# Предельный размер загружаемой .ics (байт): импорт идёт в одной транзакции
+ICAL_IMPORT_MAX_BYTES = int(os.getenv("ICAL_IMPORT_MAX_BYTES", str(5 * 1024 * 1024)))
+
+# Transactional outbox: диспетчер событий (dispatch_outbox)
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+# Сколько событие считается захваченным: упавший диспетчер «отпускает» его по истечении
+OUTBOX_LEASE_SECONDS = float(os.getenv("OUTBOX_LEASE_SECONDS", "60"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "8"))
+OUTBOX_RETRY_BASE_DELAY_SECONDS = float(os.getenv("OUTBOX_RETRY_BASE_DELAY_SECONDS", "5"))
+OUTBOX_RETRY_MAX_DELAY_SECONDS = float(os.getenv("OUTBOX_RETRY_MAX_DELAY_SECONDS", "600"))
+OUTBOX_RETENTION_DAYS = int(os.getenv("OUTBOX_RETENTION_DAYS", "7"))
+
+# Фоновые задачи (enqueue → run_workers)
+JOB_WORKER_MODE = os.getenv("JOB_WORKER_MODE", "thread")  # thread | process
+JOB_WORKER_CONCURRENCY = int(os.getenv("JOB_WORKER_CONCURRENCY", "4"))
+JOB_CLAIM_BATCH_SIZE = int(os.getenv("JOB_CLAIM_BATCH_SIZE", "10"))
+# Сколько задача считается захваченной воркером: не отчитался — задача снова доступна
+JOB_VISIBILITY_TIMEOUT_SECONDS = float(os.getenv("JOB_VISIBILITY_TIMEOUT_SECONDS", "300"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+JOB_RETRY_BASE_DELAY_SECONDS = float(os.getenv("JOB_RETRY_BASE_DELAY_SECONDS", "10"))
+JOB_RETRY_MAX_DELAY_SECONDS = float(os.getenv("JOB_RETRY_MAX_DELAY_SECONDS", "3600"))
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "1"))
+JOB_RETENTION_DAYS = int(os.getenv("JOB_RETENTION_DAYS", "7"))
+# Лимиты одновременно выполняемых задач по очередям (на все воркеры): "default=8,logging=2"
+JOB_QUEUE_CONCURRENCY = {
+    name.strip(): int(limit)
+    for name, _, limit in (item.partition("=") for item in env_list("JOB_QUEUE_CONCURRENCY"))
+    if limit.strip()
+}
+# Поисковые запросы логировать фоновой задачей (очередь logging), а не в запросе
+SEARCH_LOG_ASYNC = env_bool("SEARCH_LOG_ASYNC", False)
+
+# Планировщик периодических задач: запускается в каждом веб-процессе (core.wsgi/core.asgi) или отдельно
+# командой run_scheduler; задачи выполняет только лидер (аренда в БД)
+SCHEDULER_ENABLED = env_bool("SCHEDULER_ENABLED", False)
+SCHEDULER_TICK_SECONDS = float(os.getenv("SCHEDULER_TICK_SECONDS", "15"))
+SCHEDULER_LEASE_SECONDS = float(os.getenv("SCHEDULER_LEASE_SECONDS", "60"))
+# Очередь фоновых задач, в которую лидер ставит наступившие слоты (её должны слушать воркеры run_workers)
+SCHEDULER_JOB_QUEUE = os.getenv("SCHEDULER_JOB_QUEUE", "default")
+# Насколько поздно ещё можно выполнить слот расписания (после простоя старые слоты пропускаются)
+SCHEDULER_MISFIRE_GRACE_SECONDS = float(os.getenv("SCHEDULER_MISFIRE_GRACE_SECONDS", "300"))
+# Запуск «running» дольше этого считается брошенным упавшей репликой
+SCHEDULER_STALE_RUN_SECONDS = float(os.getenv("SCHEDULER_STALE_RUN_SECONDS", "21600"))
+
+# Отзывы: сверка денормализованного рейтинга объявлений с отзывами (reconcile_ratings)
+RATING_RECONCILE_BATCH_SIZE = int(os.getenv("RATING_RECONCILE_BATCH_SIZE", "500"))
+RATING_RECONCILE_SLEEP_SECONDS = float(os.getenv("RATING_RECONCILE_SLEEP_SECONDS", "0.05"))
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from datetime import date
+from typing import Optional, Sequence
 
 
 @dataclass(frozen=True)
@@ -43,3 +44,21 @@ class ToggleAvailabilityCommand:
     id: int
     owner_id: int
     value: Optional[bool] = None  # None = переключить; True/False = установить явно
+
+
+@dataclass(frozen=True)
+class AddRateRuleCommand:
+    accommodation_id: int
+    owner_id: int
+    price_eur: float
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    weekdays: Sequence[int] = ()  # пусто — все дни недели; 0 = понедельник
+    priority: int = 0
+
+
+@dataclass(frozen=True)
+class DeleteRateRuleCommand:
+    accommodation_id: int
+    owner_id: int
+    rule_id: int
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from datetime import date
+from typing import List, Optional
 
 from src.accommodations.domain.dtos import AccommodationDTO
 
@@ -16,4 +17,32 @@ class SearchPageDTO:
 @dataclass
 class SearchResultDTO:
     items: List[AccommodationDTO]
-    page: SearchPageDTO
\ No newline at end of file
+    page: SearchPageDTO
+
+
+@dataclass
+class NightPriceDTO:
+    date: date
+    price_eur: float
+
+
+@dataclass
+class StayQuoteDTO:
+    accommodation_id: int
+    check_in: date
+    check_out: date
+    nights: int
+    total_cents: int
+    total_eur: float
+    nightly: List[NightPriceDTO]
+
+
+@dataclass
+class RateRuleDTO:
+    id: int
+    accommodation_id: int
+    price_eur: float
+    start_date: Optional[date]
+    end_date: Optional[date]
+    weekdays: List[int]
+    priority: int
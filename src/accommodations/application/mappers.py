@@ -1,10 +1,24 @@
 from __future__ import annotations
 
-from src.accommodations.domain.dtos import AccommodationDTO
+from datetime import timedelta
+
+from src.accommodations.application.dtos import NightPriceDTO, RateRuleDTO, StayQuoteDTO
+from src.accommodations.domain.dtos import AccommodationDTO, ReviewsSummaryDTO
 from src.accommodations.domain.entities import Accommodation
+from src.accommodations.domain.pricing import NightlyRateRule, StayQuote
+from src.accommodations.domain.services import rating_distribution
 
 
 def to_dto(acc: Accommodation) -> AccommodationDTO:
+    distribution = rating_distribution(acc.rating_counts)
+    summary = None
+    if acc.latest_reviews is not None:
+        summary = ReviewsSummaryDTO(
+            average_rating=acc.average_rating,
+            reviews_count=acc.reviews_count,
+            rating_distribution=distribution,
+            latest=acc.latest_reviews,
+        )
     return AccommodationDTO(
         id=acc.id or 0,
         owner_id=acc.owner_id,
@@ -21,4 +35,33 @@ def to_dto(acc: Accommodation) -> AccommodationDTO:
         views_count=acc.views_count,
         reviews_count=acc.reviews_count,
         average_rating=acc.average_rating,
+        rating_distribution=distribution,
+        reviews_summary=summary,
+    )
+
+
+def to_quote_dto(quote: StayQuote) -> StayQuoteDTO:
+    return StayQuoteDTO(
+        accommodation_id=quote.accommodation_id,
+        check_in=quote.check_in,
+        check_out=quote.check_out,
+        nights=quote.nights,
+        total_cents=quote.total_cents,
+        total_eur=quote.total_cents / 100.0,
+        nightly=[
+            NightPriceDTO(date=quote.check_in + timedelta(days=i), price_eur=cents / 100.0)
+            for i, cents in enumerate(quote.nightly_cents)
+        ],
+    )
+
+
+def to_rule_dto(rule: NightlyRateRule) -> RateRuleDTO:
+    return RateRuleDTO(
+        id=rule.id or 0,
+        accommodation_id=rule.accommodation_id,
+        price_eur=rule.price_cents / 100.0,
+        start_date=rule.start_date,
+        end_date=rule.end_date,
+        weekdays=[d for d in range(7) if rule.weekdays >> d & 1],
+        priority=rule.priority,
     )
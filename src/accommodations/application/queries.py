@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import date
 from typing import Optional, Sequence
 
 from src.accommodations.domain.value_objects import HousingType
@@ -11,6 +12,7 @@ from src.accommodations.domain.dtos import SearchSort
 @dataclass(frozen=True)
 class GetAccommodationByIdQuery:
     id: int
+    include_reviews_summary: bool = False
 
 @dataclass(frozen=True)
 class SearchAccommodationsQuery:
@@ -26,4 +28,25 @@ class SearchAccommodationsQuery:
     sort: SearchSort = SearchSort.CREATED_AT_DESC
     page: int = 1
     page_size: int = 20
+    min_rating: Optional[float] = None
 
+
+@dataclass(frozen=True)
+class QuoteStayQuery:
+    accommodation_id: int
+    check_in: date
+    check_out: date
+
+
+@dataclass(frozen=True)
+class QuoteStaysQuery:
+    accommodation_ids: Sequence[int]
+    check_in: date
+    check_out: date
+    sort: Optional[str] = None  # None — порядок запроса; "total_asc" | "total_desc"
+
+
+@dataclass(frozen=True)
+class ListRateRulesQuery:
+    accommodation_id: int
+    owner_id: int
@@ -12,7 +12,7 @@ class GetAccommodationByIdUseCase:
         self._repo = repo
 
     def execute(self, q: GetAccommodationByIdQuery) -> AccommodationDTO:
-        acc = self._repo.get_by_id(q.id)
+        acc = self._repo.get_by_id(q.id, with_reviews_snapshot=q.include_reviews_summary)
         if not acc:
             raise ApplicationError("Accommodation not found")
         return to_dto(acc)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from src.shared.errors import ApplicationError
+from src.accommodations.application.dtos import StayQuoteDTO
+from src.accommodations.application.mappers import to_quote_dto
+from src.accommodations.application.queries import QuoteStayQuery, QuoteStaysQuery
+from src.accommodations.domain.pricing import PricingSnapshot, StayQuote, quote_stay, validate_quote_period
+from src.accommodations.domain.repository_interfaces import IPricingRepository, IQuoteCache
+
+QUOTE_SORTS = ("total_asc", "total_desc")
+
+
+def quote_cache_key(head: PricingSnapshot, q: QuoteStaysQuery) -> str:
+    # Базовая цена — в ключе: она меняется без версии тарифов (PATCH объявления)
+    return (
+        f"quote:{head.accommodation_id}:{head.version}:{head.base_price_cents}:"
+        f"{q.check_in.isoformat()}:{q.check_out.isoformat()}"
+    )
+
+
+class QuoteStaysUseCase:
+    """
+    Стоимость проживания для набора объявлений на одни даты (страница поиска — один вызов):
+    1 выборка версий → кэш → тарифы одной выборкой только для промахов.
+    """
+
+    def __init__(self, repo: IPricingRepository, cache: Optional[IQuoteCache] = None, cache_timeout: float = 300):
+        self._repo = repo
+        self._cache = cache
+        self._timeout = cache_timeout
+
+    def execute(self, q: QuoteStaysQuery) -> List[StayQuoteDTO]:
+        try:
+            validate_quote_period(q.check_in, q.check_out)
+        except ValueError as ex:
+            raise ApplicationError(str(ex))
+        if q.sort is not None and q.sort not in QUOTE_SORTS:
+            raise ApplicationError(f"sort must be one of {', '.join(QUOTE_SORTS)}")
+
+        ids = list(dict.fromkeys(q.accommodation_ids))
+        heads = self._repo.get_price_heads(ids)
+        keys = {acc_id: quote_cache_key(head, q) for acc_id, head in heads.items()}
+        cached: Dict[str, Tuple[int, ...]] = self._cache.get_many(list(keys.values())) if self._cache else {}
+
+        quotes: Dict[int, StayQuote] = {}
+        misses = []
+        for acc_id, key in keys.items():
+            nightly = cached.get(key)
+            if nightly is None:
+                misses.append(acc_id)
+            else:
+                quotes[acc_id] = StayQuote(acc_id, q.check_in, q.check_out, tuple(nightly))
+
+        if misses:
+            rules = self._repo.get_rules(misses)
+            fresh = {}
+            for acc_id in misses:
+                head = heads[acc_id]
+                snapshot = PricingSnapshot(
+                    accommodation_id=acc_id,
+                    base_price_cents=head.base_price_cents,
+                    version=head.version,
+                    rules=tuple(rules.get(acc_id, ())),
+                )
+                quotes[acc_id] = quote_stay(snapshot, q.check_in, q.check_out)
+                fresh[keys[acc_id]] = quotes[acc_id].nightly_cents
+            if self._cache is not None:
+                self._cache.set_many(fresh, timeout=self._timeout)
+
+        ordered = [quotes[i] for i in ids if i in quotes]
+        if q.sort is not None:
+            ordered.sort(key=lambda x: (x.total_cents, x.accommodation_id), reverse=q.sort == "total_desc")
+        return [to_quote_dto(x) for x in ordered]
+
+
+class QuoteStayUseCase:
+    def __init__(self, repo: IPricingRepository, cache: Optional[IQuoteCache] = None, cache_timeout: float = 300):
+        self._batch = QuoteStaysUseCase(repo, cache, cache_timeout)
+
+    def execute(self, q: QuoteStayQuery) -> StayQuoteDTO:
+        items = self._batch.execute(
+            QuoteStaysQuery(accommodation_ids=(q.accommodation_id,), check_in=q.check_in, check_out=q.check_out)
+        )
+        if not items:
+            raise ApplicationError("Accommodation not found")
+        return items[0]
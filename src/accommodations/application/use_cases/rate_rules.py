@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import List
+
+from src.shared.errors import ApplicationError
+from src.accommodations.application.commands import AddRateRuleCommand, DeleteRateRuleCommand
+from src.accommodations.application.dtos import RateRuleDTO
+from src.accommodations.application.mappers import to_rule_dto
+from src.accommodations.application.queries import ListRateRulesQuery
+from src.accommodations.domain.pricing import ALL_WEEKDAYS, NightlyRateRule, weekday_mask
+from src.accommodations.domain.repository_interfaces import IAccommodationRepository, IPricingRepository
+from src.accommodations.domain.value_objects import Price
+
+
+def _ensure_owner(repo: IAccommodationRepository, acc_id: int, owner_id: int) -> None:
+    acc = repo.get_by_id(acc_id)
+    if not acc:
+        raise ApplicationError("Accommodation not found")
+    if acc.owner_id != owner_id:
+        raise ApplicationError("Forbidden: not owner of the accommodation")
+
+
+class ListRateRulesUseCase:
+    def __init__(self, acc_repo: IAccommodationRepository, pricing_repo: IPricingRepository):
+        self._acc_repo = acc_repo
+        self._pricing_repo = pricing_repo
+
+    def execute(self, q: ListRateRulesQuery) -> List[RateRuleDTO]:
+        _ensure_owner(self._acc_repo, q.accommodation_id, q.owner_id)
+        rules = self._pricing_repo.get_rules([q.accommodation_id]).get(q.accommodation_id, [])
+        return [to_rule_dto(r) for r in rules]
+
+
+class AddRateRuleUseCase:
+    def __init__(self, acc_repo: IAccommodationRepository, pricing_repo: IPricingRepository):
+        self._acc_repo = acc_repo
+        self._pricing_repo = pricing_repo
+
+    def execute(self, cmd: AddRateRuleCommand) -> RateRuleDTO:
+        _ensure_owner(self._acc_repo, cmd.accommodation_id, cmd.owner_id)
+        try:
+            rule = NightlyRateRule(
+                id=None,
+                accommodation_id=cmd.accommodation_id,
+                price_cents=Price.from_euros(cmd.price_eur).amount_cents,
+                start_date=cmd.start_date,
+                end_date=cmd.end_date,
+                weekdays=weekday_mask(cmd.weekdays) if cmd.weekdays else ALL_WEEKDAYS,
+                priority=cmd.priority,
+            )
+        except ValueError as ex:
+            raise ApplicationError(str(ex))
+        return to_rule_dto(self._pricing_repo.add_rule(rule))
+
+
+class DeleteRateRuleUseCase:
+    def __init__(self, acc_repo: IAccommodationRepository, pricing_repo: IPricingRepository):
+        self._acc_repo = acc_repo
+        self._pricing_repo = pricing_repo
+
+    def execute(self, cmd: DeleteRateRuleCommand) -> None:
+        _ensure_owner(self._acc_repo, cmd.accommodation_id, cmd.owner_id)
+        if not self._pricing_repo.delete_rule(cmd.accommodation_id, cmd.rule_id):
+            raise ApplicationError("Rate rule not found")
@@ -27,6 +27,7 @@ class SearchAccommodationsUseCase:
             sort=q.sort,
             page=q.page,
             page_size=q.page_size,
+            min_rating=q.min_rating,
         )
         domain_q = normalize_search_query(domain_q)
 
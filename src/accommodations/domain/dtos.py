@@ -3,8 +3,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum, unique
-from typing import Optional, Sequence
+from typing import List, Optional, Sequence
 
+from .entities import ReviewSnippet
 from .value_objects import HousingType
 
 
@@ -28,6 +29,25 @@ class AccommodationDTO:
     average_rating: float
     reviews_count: int
     average_rating: float
+    rating_distribution: List["RatingBucketDTO"] = field(default_factory=list)
+    reviews_summary: Optional["ReviewsSummaryDTO"] = None  # только при ?include=reviews_summary
+
+
+@dataclass
+class RatingBucketDTO:
+    """Строка гистограммы оценок: stars (1..5), число отзывов и доля от всех, %."""
+    stars: int
+    count: int
+    percent: float
+
+
+@dataclass
+class ReviewsSummaryDTO:
+    """Сводка отзывов для страницы объявления: статистика рейтинга и последние отзывы."""
+    average_rating: float
+    reviews_count: int
+    rating_distribution: List[RatingBucketDTO]
+    latest: List[ReviewSnippet]
 
 
 @dataclass
@@ -84,6 +104,7 @@ class SearchQueryDTO:
     - only_active: брать только активные объявления
     - sort: вариант сортировки
     - page/page_size: пагинация (на усмотрение application-слоя)
+    - min_rating: минимальный средний рейтинг (по денормализованному average_rating, без JOIN с отзывами)
     """
     keyword: Optional[str] = None
     price_min: Optional[float] = None
@@ -97,3 +118,4 @@ class SearchQueryDTO:
     sort: SearchSort = SearchSort.CREATED_AT_DESC
     page: int = 1
     page_size: int = 20
+    min_rating: Optional[float] = None
@@ -3,11 +3,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from .value_objects import Location, Price, RoomsCount, HousingType
 
 
+@dataclass(frozen=True)
+class ReviewSnippet:
+    """Отзыв из снимка на объявлении (текст — превью)."""
+    id: int
+    author_id: int
+    rating: int
+    text: str
+    text_truncated: bool
+    created_at: datetime
+
+
 @dataclass
 class Accommodation:
     """
@@ -29,6 +40,8 @@ class Accommodation:
     views_count: int = 0
     reviews_count: int = 0
     average_rating: float = 0.0
+    rating_counts: Tuple[int, int, int, int, int] = (0, 0, 0, 0, 0)  # число оценок 1★..5★
+    latest_reviews: Optional[List[ReviewSnippet]] = None  # None — снимок не загружался
 
     def rename(self, new_title: str) -> None:
         if not new_title or len(new_title.strip()) < 3:
@@ -0,0 +1,108 @@
+# Слой domain: посуточные тарифы и расчёт стоимости проживания (без зависимостей от Django)
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+ALL_WEEKDAYS = 0b1111111  # бит i — день недели i (0 = понедельник)
+MAX_QUOTE_NIGHTS = 365
+# 1970-01-01 (нулевой день datetime64[D]) — четверг: (день + 3) % 7 даёт 0 для понедельника
+_EPOCH_WEEKDAY_SHIFT = 3
+
+
+@dataclass(frozen=True)
+class NightlyRateRule:
+    """
+    Тариф на ночи: цена price_cents для ночей, попадающих в период [start_date, end_date)
+    (None — без ограничения) и в дни недели по маске weekdays.
+    При пересечении правил побеждает больший priority (при равенстве — более позднее правило).
+    """
+    id: Optional[int]
+    accommodation_id: int
+    price_cents: int
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    weekdays: int = ALL_WEEKDAYS
+    priority: int = 0
+
+    def __post_init__(self):
+        if self.price_cents <= 0:
+            raise ValueError("Price must be > 0 cents")
+        if self.start_date and self.end_date and self.start_date >= self.end_date:
+            raise ValueError("start_date must be before end_date")
+        if not 0 < self.weekdays <= ALL_WEEKDAYS:
+            raise ValueError("weekdays mask must select at least one day")
+
+
+@dataclass(frozen=True)
+class PricingSnapshot:
+    """Всё, что нужно для расчёта: базовая цена, версия тарифов и сами тарифы."""
+    accommodation_id: int
+    base_price_cents: int
+    version: int
+    rules: Tuple[NightlyRateRule, ...] = ()
+
+
+@dataclass(frozen=True)
+class StayQuote:
+    accommodation_id: int
+    check_in: date
+    check_out: date
+    nightly_cents: Tuple[int, ...]
+
+    @property
+    def nights(self) -> int:
+        return len(self.nightly_cents)
+
+    @property
+    def total_cents(self) -> int:
+        return sum(self.nightly_cents)
+
+
+def validate_quote_period(check_in: date, check_out: date) -> None:
+    if check_in >= check_out:
+        raise ValueError("check_in must be before check_out")
+    if (check_out - check_in).days > MAX_QUOTE_NIGHTS:
+        raise ValueError(f"Stay must not exceed {MAX_QUOTE_NIGHTS} nights")
+
+
+def weekday_mask(days: Sequence[int]) -> int:
+    """[4, 5] -> маска пятницы и субботы."""
+    mask = 0
+    for d in days:
+        if not 0 <= d <= 6:
+            raise ValueError("weekday must be in 0..6")
+        mask |= 1 << d
+    return mask
+
+
+def nightly_prices(snapshot: PricingSnapshot, check_in: date, check_out: date) -> np.ndarray:
+    """
+    Цена каждой ночи [check_in, check_out) векторно: для каждого правила — одна булева маска по всем ночам,
+    правила применяются по возрастанию приоритета, поэтому последнее подходящее перезаписывает предыдущие.
+    """
+    nights = np.arange(np.datetime64(check_in, "D"), np.datetime64(check_out, "D"))
+    weekday = (nights.astype(np.int64) + _EPOCH_WEEKDAY_SHIFT) % 7
+    prices = np.full(nights.shape, snapshot.base_price_cents, dtype=np.int64)
+    for rule in sorted(snapshot.rules, key=lambda r: (r.priority, r.id or 0)):
+        mask = ((rule.weekdays >> weekday) & 1).astype(bool)
+        if rule.start_date is not None:
+            mask &= nights >= np.datetime64(rule.start_date, "D")
+        if rule.end_date is not None:
+            mask &= nights < np.datetime64(rule.end_date, "D")
+        prices[mask] = rule.price_cents
+    return prices
+
+
+def quote_stay(snapshot: PricingSnapshot, check_in: date, check_out: date) -> StayQuote:
+    validate_quote_period(check_in, check_out)
+    prices: List[int] = nightly_prices(snapshot, check_in, check_out).tolist()
+    return StayQuote(
+        accommodation_id=snapshot.accommodation_id,
+        check_in=check_in,
+        check_out=check_out,
+        nightly_cents=tuple(prices),
+    )
@@ -1,17 +1,20 @@
 # Слой domain: контракты репозиториев
 from __future__ import annotations
 
-from typing import Iterable, Optional, Protocol, runtime_checkable, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Protocol, runtime_checkable, Tuple
 
 from .entities import Accommodation
 from .dtos import SearchQueryDTO
+from .pricing import NightlyRateRule, PricingSnapshot
 
 
 @runtime_checkable
 class IAccommodationRepository(Protocol):
     """Контракт репозитория для объявлений."""
 
-    def get_by_id(self, acc_id: int) -> Optional[Accommodation]: ...
+    def get_by_id(self, acc_id: int, *, with_reviews_snapshot: bool = False) -> Optional[Accommodation]:
+        """with_reviews_snapshot — заодно прочитать снимок последних отзывов (та же строка, без JOIN)."""
+        ...
 
     def list_by_owner(self, owner_id: int, active_only: bool = False) -> list[Accommodation]: ...
 
@@ -24,3 +27,26 @@ class IAccommodationRepository(Protocol):
     def delete(self, acc_id: int, owner_id: Optional[int] = None) -> None: ...
 
     def search(self, q: SearchQueryDTO) -> Tuple[list[Accommodation], int]: ...
+
+
+@runtime_checkable
+class IPricingRepository(Protocol):
+    """Контракт хранилища посуточных тарифов. Любое изменение тарифов увеличивает версию цен объявления."""
+
+    def get_price_heads(self, acc_ids: Iterable[int]) -> Dict[int, PricingSnapshot]:
+        """Базовая цена и версия тарифов активных объявлений (rules не заполняются) — одна выборка."""
+        ...
+
+    def get_rules(self, acc_ids: Iterable[int]) -> Dict[int, List[NightlyRateRule]]: ...
+
+    def add_rule(self, rule: NightlyRateRule) -> NightlyRateRule: ...
+
+    def delete_rule(self, acc_id: int, rule_id: int) -> bool: ...
+
+
+class IQuoteCache(Protocol):
+    """Кэш расчётов (совместим с django.core.cache)."""
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]: ...
+
+    def set_many(self, data: Mapping[str, Any], timeout: Optional[float] = ...) -> Any: ...
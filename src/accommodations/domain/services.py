@@ -1,9 +1,11 @@
 # Слой domain: доменные сервисы (чистые функции/классы без инфраструктуры)
 from __future__ import annotations
 
+from typing import List, Sequence
+
 from .entities import Accommodation
 from .value_objects import Location, Price, RoomsCount, HousingType
-from .dtos import SearchQueryDTO, SearchSort
+from .dtos import RatingBucketDTO, SearchQueryDTO, SearchSort
 
 
 def validate_title(title: str) -> None:
@@ -116,6 +118,11 @@ def normalize_search_query(q: SearchQueryDTO) -> SearchQueryDTO:
 
     sort = q.sort if isinstance(q.sort, SearchSort) else SearchSort.CREATED_AT_DESC
 
+    # Рейтинг: 0 и меньше — без фильтра, больше 5 — как 5
+    min_rating = q.min_rating if q.min_rating is not None and q.min_rating > 0 else None
+    if min_rating is not None:
+        min_rating = min(min_rating, 5.0)
+
     return SearchQueryDTO(
         keyword=keyword,
         price_min=price_min,
@@ -129,4 +136,18 @@ def normalize_search_query(q: SearchQueryDTO) -> SearchQueryDTO:
         sort=sort,
         page=page,
         page_size=page_size,
+        min_rating=min_rating,
     )
+
+
+def rating_distribution(counts: Sequence[int]) -> List[RatingBucketDTO]:
+    """Гистограмма оценок от 5★ к 1★ по счётчикам (1★..5★); доли в процентах с одним знаком."""
+    total = sum(counts)
+    return [
+        RatingBucketDTO(
+            stars=stars,
+            count=counts[stars - 1],
+            percent=round(counts[stars - 1] * 100.0 / total, 1) if total else 0.0,
+        )
+        for stars in range(5, 0, -1)
+    ]
@@ -1,7 +1,7 @@
 # Django admin регистрации (инфраструктурный слой)
 from django.contrib import admin
 
-from .orm.models import Accommodation
+from .orm.models import Accommodation, NightlyRateRule
 
 
 @admin.register(Accommodation)
@@ -14,3 +14,10 @@ class AccommodationAdmin(admin.ModelAdmin):
     search_fields = ("title", "description", "city", "region")
     autocomplete_fields = ("owner",)
     ordering = ("-created_at",)
+
+
+@admin.register(NightlyRateRule)
+class NightlyRateRuleAdmin(admin.ModelAdmin):
+    list_display = ("id", "accommodation_id", "price_cents", "start_date", "end_date", "weekdays", "priority")
+    raw_id_fields = ("accommodation",)
+    ordering = ("accommodation_id", "priority", "id")
@@ -45,14 +45,45 @@ class Accommodation(models.Model):
         default=0,
         help_text="Количество отзывов по объявлению"
     )
+    # Сумма оценок: reviews_count и rating_sum сдвигаются дельтами при записи отзыва, average_rating выводится из них
+    rating_sum = models.PositiveIntegerField(default=0)
+    # Распределение оценок (гистограмма «5★: 70%…») — тем же путём дельт, без GROUP BY по отзывам
+    rating_1_count = models.PositiveIntegerField(default=0)
+    rating_2_count = models.PositiveIntegerField(default=0)
+    rating_3_count = models.PositiveIntegerField(default=0)
+    rating_4_count = models.PositiveIntegerField(default=0)
+    rating_5_count = models.PositiveIntegerField(default=0)
+    # Снимок последних отзывов для ?include=reviews_summary: {"latest": [...]} — обновляется по событию review.changed
+    reviews_snapshot = models.JSONField(default=dict, blank=True)
+    # Растёт при каждом изменении тарифов — часть ключа кэша расчётов стоимости
+    pricing_version = models.PositiveIntegerField(default=0)
 
     class Meta:
         db_table = "accommodations"
         indexes = [
             models.Index(fields=["is_active", "price_cents"]),
+            models.Index(fields=["is_active", "average_rating"]),  # фильтр min_rating и сортировка по рейтингу
             models.Index(fields=["city", "region"]),
             models.Index(fields=["created_at"]),
         ]
 
     def __str__(self) -> str:
         return f"{self.title} ({self.city}, {self.region})"
+
+
+class NightlyRateRule(models.Model):
+    """Посуточный тариф: цена для ночей в периоде [start_date, end_date) и днях недели по маске."""
+    accommodation = models.ForeignKey(Accommodation, on_delete=models.CASCADE, related_name="rate_rules")
+    price_cents = models.PositiveIntegerField()
+    start_date = models.DateField(null=True, blank=True)
+    end_date = models.DateField(null=True, blank=True, help_text="Не включительно")
+    weekdays = models.PositiveSmallIntegerField(default=0b1111111, help_text="Бит i — день недели i (0 = пн)")
+    priority = models.SmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "accommodation_rate_rules"
+        ordering = ["accommodation_id", "priority", "id"]
+
+    def __str__(self) -> str:
+        return f"Rate #{self.id} acc={self.accommodation_id} {self.price_cents}c"
@@ -1,21 +1,43 @@
 # Слой infrastructure: реализации репозиториев (Django ORM) адаптеры для domain.repository_interfaces
 from __future__ import annotations
 
-from typing import Iterable, Optional, Tuple
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.db.models import Q, QuerySet, F, Count
 
-from src.accommodations.domain.entities import Accommodation as AccDomain
-from src.accommodations.domain.repository_interfaces import IAccommodationRepository
+from src.accommodations.domain.entities import Accommodation as AccDomain, ReviewSnippet
+from src.accommodations.domain.pricing import NightlyRateRule, PricingSnapshot
+from src.accommodations.domain.repository_interfaces import IAccommodationRepository, IPricingRepository
 from src.accommodations.domain.value_objects import Location, Price, RoomsCount, HousingType
 from src.accommodations.domain.dtos import SearchQueryDTO, SearchSort
-from src.accommodations.infrastructure.orm.models import Accommodation as AccORM
+from src.accommodations.infrastructure.orm.models import Accommodation as AccORM, NightlyRateRule as RateRuleORM
+from src.common.infrastructure.listing_stats import record_impressions
+from src.common.infrastructure.outbox import ACCOMMODATION_CHANGED, publish_event
 
 User = get_user_model()
 
 
+def _latest_reviews(obj: AccORM) -> Optional[List[ReviewSnippet]]:
+    # Поле отложено (.defer) — снимок не запрашивали, не дочитываем его отдельным запросом
+    if "reviews_snapshot" in obj.get_deferred_fields():
+        return None
+    return [
+        ReviewSnippet(
+            id=item["id"],
+            author_id=item["author_id"],
+            rating=item["rating"],
+            text=item["text"],
+            text_truncated=item["text_truncated"],
+            created_at=datetime.fromisoformat(item["created_at"]),
+        )
+        for item in (obj.reviews_snapshot or {}).get("latest", [])
+    ]
+
+
 def _to_domain(obj: AccORM) -> AccDomain:
     return AccDomain(
         id=obj.id,
@@ -33,9 +55,20 @@ def _to_domain(obj: AccORM) -> AccDomain:
         views_count=obj.views_count,
         reviews_count=getattr(obj, "reviews_count", 0),
         average_rating=float(getattr(obj, "average_rating", 0) or 0),
+        rating_counts=(
+            obj.rating_1_count, obj.rating_2_count, obj.rating_3_count, obj.rating_4_count, obj.rating_5_count,
+        ),
+        latest_reviews=_latest_reviews(obj),
     )
 
 
+# Поля, которые меняет владелец. Счётчики (рейтинг, просмотры) и снимок отзывов пишутся атомарными UPDATE
+# в других местах — полный save() перетёр бы их конкурентные изменения прочитанными ранее значениями
+_EDITABLE_FIELDS = (
+    "title", "description", "city", "region", "country", "price_cents", "rooms", "housing_type", "is_active",
+)
+
+
 def _apply_domain(acc: AccDomain, obj: AccORM) -> AccORM:
     obj.title = acc.title
     obj.description = acc.description
@@ -50,44 +83,54 @@ def _apply_domain(acc: AccDomain, obj: AccORM) -> AccORM:
 
 
 class DjangoAccommodationRepository(IAccommodationRepository):
-    def get_by_id(self, acc_id: int) -> Optional[AccDomain]:
+    def get_by_id(self, acc_id: int, *, with_reviews_snapshot: bool = False) -> Optional[AccDomain]:
         try:
             qs = AccORM.objects.filter(pk=acc_id)
+            if not with_reviews_snapshot:
+                qs = qs.defer("reviews_snapshot")
             return _to_domain(qs.get())
         except AccORM.DoesNotExist:
             return None
 
     def list_by_owner(self, owner_id: int, active_only: bool = False) -> list[AccDomain]:
-        qs = AccORM.objects.filter(owner_id=owner_id)
+        qs = AccORM.objects.filter(owner_id=owner_id).defer("reviews_snapshot")
         if active_only:
             qs = qs.filter(is_active=True)
         qs = qs.order_by("-created_at")
         return [_to_domain(o) for o in qs]
 
     def search_ids(self, ids: Iterable[int]) -> list[AccDomain]:
-        qs = AccORM.objects.filter(id__in=list(ids))
+        qs = AccORM.objects.filter(id__in=list(ids)).defer("reviews_snapshot")
         return [_to_domain(o) for o in qs]
 
     def create(self, acc: AccDomain) -> AccDomain:
         obj = AccORM(owner_id=acc.owner_id)
         obj = _apply_domain(acc, obj)
-        obj.save()
-        return _to_domain(AccORM.objects.get(pk=obj.id))
+        with transaction.atomic():
+            obj.save()
+            publish_event(ACCOMMODATION_CHANGED, "accommodation", obj.id, {"action": "created"})
+        return _to_domain(AccORM.objects.defer("reviews_snapshot").get(pk=obj.id))
 
     def update(self, acc: AccDomain) -> AccDomain:
-        obj = AccORM.objects.get(pk=acc.id)
+        obj = AccORM.objects.defer("reviews_snapshot").get(pk=acc.id)
         obj = _apply_domain(acc, obj)
-        obj.save()
-        return _to_domain(AccORM.objects.get(pk=obj.id))
+        with transaction.atomic():
+            obj.save(update_fields=[*_EDITABLE_FIELDS, "updated_at"])
+            publish_event(ACCOMMODATION_CHANGED, "accommodation", obj.id, {"action": "updated"})
+        return _to_domain(AccORM.objects.defer("reviews_snapshot").get(pk=obj.id))
 
     def delete(self, acc_id: int, owner_id: Optional[int] = None) -> None:
         qs = AccORM.objects.filter(pk=acc_id)
         if owner_id is not None:
             qs = qs.filter(owner_id=owner_id)
-        qs.delete()
+        with transaction.atomic():
+            deleted, _ = qs.delete()
+            if deleted:
+                publish_event(ACCOMMODATION_CHANGED, "accommodation", acc_id, {"action": "deleted"})
 
-    def increment_views(self, acc_id: int) -> None:
-        AccORM.objects.filter(pk=acc_id).update(views_count=F("views_count") + 1)
+    def increment_views(self, acc_id: int) -> bool:
+        """+1 к views_count. False — объявления нет."""
+        return AccORM.objects.filter(pk=acc_id).update(views_count=F("views_count") + 1) > 0
 
     def _apply_sort(self, qs: QuerySet, sort: SearchSort) -> QuerySet:
         # Маппинг сортировок на поля ORM (используем денормализованные поля модели)
@@ -117,7 +160,7 @@ class DjangoAccommodationRepository(IAccommodationRepository):
         return qs.order_by("-created_at", "-id")
 
     def search(self, q: SearchQueryDTO) -> Tuple[list[AccDomain], int]:
-        qs = AccORM.objects.all()
+        qs = AccORM.objects.defer("reviews_snapshot")
 
         if q.only_active:
             qs = qs.filter(is_active=True)
@@ -144,6 +187,10 @@ class DjangoAccommodationRepository(IAccommodationRepository):
         if q.housing_types:
             qs = qs.filter(housing_type__in=[t.value for t in q.housing_types])
 
+        if q.min_rating is not None:
+            # Денормализованное поле — без JOIN/GROUP BY по отзывам
+            qs = qs.filter(average_rating__gte=Decimal(str(q.min_rating)))
+
         total = qs.count()
 
         # Инкремент показов для всех найденных, но только если есть хоть один фильтр/keyword
@@ -161,6 +208,7 @@ class DjangoAccommodationRepository(IAccommodationRepository):
             ids = list(qs.values_list("id", flat=True))
             with transaction.atomic():
                 AccORM.objects.filter(id__in=ids).update(impressions_count=F("impressions_count") + 1)
+                record_impressions(ids)
 
         # Сортировка — берём из q.sort
         qs = self._apply_sort(qs, q.sort)
@@ -171,3 +219,57 @@ class DjangoAccommodationRepository(IAccommodationRepository):
         items_qs = qs[offset: offset + page_size]
 
         return ([_to_domain(o) for o in items_qs], total)
+
+
+def _rule_to_domain(obj: RateRuleORM) -> NightlyRateRule:
+    return NightlyRateRule(
+        id=obj.id,
+        accommodation_id=obj.accommodation_id,
+        price_cents=obj.price_cents,
+        start_date=obj.start_date,
+        end_date=obj.end_date,
+        weekdays=obj.weekdays,
+        priority=obj.priority,
+    )
+
+
+class DjangoPricingRepository(IPricingRepository):
+    def get_price_heads(self, acc_ids: Iterable[int]) -> Dict[int, PricingSnapshot]:
+        rows = AccORM.objects.filter(id__in=list(acc_ids), is_active=True).values_list(
+            "id", "price_cents", "pricing_version"
+        )
+        return {
+            acc_id: PricingSnapshot(accommodation_id=acc_id, base_price_cents=price, version=version)
+            for acc_id, price, version in rows
+        }
+
+    def get_rules(self, acc_ids: Iterable[int]) -> Dict[int, List[NightlyRateRule]]:
+        out: Dict[int, List[NightlyRateRule]] = {}
+        for obj in RateRuleORM.objects.filter(accommodation_id__in=list(acc_ids)).order_by("priority", "id"):
+            out.setdefault(obj.accommodation_id, []).append(_rule_to_domain(obj))
+        return out
+
+    def add_rule(self, rule: NightlyRateRule) -> NightlyRateRule:
+        with transaction.atomic():
+            obj = RateRuleORM.objects.create(
+                accommodation_id=rule.accommodation_id,
+                price_cents=rule.price_cents,
+                start_date=rule.start_date,
+                end_date=rule.end_date,
+                weekdays=rule.weekdays,
+                priority=rule.priority,
+            )
+            self._bump_version(rule.accommodation_id)
+        return _rule_to_domain(obj)
+
+    def delete_rule(self, acc_id: int, rule_id: int) -> bool:
+        with transaction.atomic():
+            deleted, _ = RateRuleORM.objects.filter(pk=rule_id, accommodation_id=acc_id).delete()
+            if deleted:
+                self._bump_version(acc_id)
+        return bool(deleted)
+
+    @staticmethod
+    def _bump_version(acc_id: int) -> None:
+        # Новая версия — новые ключи кэша: старые расчёты просто перестают читаться и истекают по TTL
+        AccORM.objects.filter(pk=acc_id).update(pricing_version=F("pricing_version") + 1)
@@ -4,7 +4,9 @@ from __future__ import annotations
 from rest_framework import serializers
 
 from src.accommodations.domain.value_objects import HousingType
+from src.accommodations.application.use_cases.quote_stay import QUOTE_SORTS
 from src.accommodations.domain.dtos import SearchSort
+from src.accommodations.domain.pricing import MAX_QUOTE_NIGHTS
 
 
 class AccommodationCreateUpdateSerializer(serializers.Serializer):
@@ -34,6 +36,28 @@ class AccommodationPartialUpdateSerializer(serializers.Serializer):
     is_active = serializers.BooleanField(required=False)
 
 
+class RatingBucketSerializer(serializers.Serializer):
+    stars = serializers.IntegerField()
+    count = serializers.IntegerField()
+    percent = serializers.FloatField()
+
+
+class ReviewSnippetSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    author_id = serializers.IntegerField()
+    rating = serializers.IntegerField()
+    text = serializers.CharField()
+    text_truncated = serializers.BooleanField()
+    created_at = serializers.DateTimeField()
+
+
+class ReviewsSummarySerializer(serializers.Serializer):
+    average_rating = serializers.DecimalField(max_digits=3, decimal_places=2)
+    reviews_count = serializers.IntegerField()
+    rating_distribution = RatingBucketSerializer(many=True)
+    latest = ReviewSnippetSerializer(many=True, help_text="Последние отзывы (до 3), текст — превью")
+
+
 class AccommodationDetailSerializer(serializers.Serializer):
     id = serializers.IntegerField()
     owner_id = serializers.IntegerField()
@@ -48,6 +72,26 @@ class AccommodationDetailSerializer(serializers.Serializer):
     views_count = serializers.IntegerField()
     reviews_count = serializers.IntegerField()
     average_rating = serializers.DecimalField(max_digits=3, decimal_places=2)
+    rating_distribution = RatingBucketSerializer(many=True, help_text="Доли оценок от 5★ к 1★")
+    reviews_summary = ReviewsSummarySerializer(
+        allow_null=True, required=False, help_text="Только при ?include=reviews_summary, иначе null"
+    )
+
+
+DETAIL_INCLUDES = ("reviews_summary",)
+
+
+class AccommodationDetailQuerySerializer(serializers.Serializer):
+    include = serializers.CharField(
+        required=False, help_text=f"Дополнительные блоки через запятую: {', '.join(DETAIL_INCLUDES)}"
+    )
+
+    def validate_include(self, value: str):
+        parts = {p.strip() for p in value.split(",") if p.strip()}
+        unknown = parts - set(DETAIL_INCLUDES)
+        if unknown:
+            raise serializers.ValidationError(f"Unknown include: {', '.join(sorted(unknown))}")
+        return parts
 
 
 class SearchQueryParamsSerializer(serializers.Serializer):
@@ -62,6 +106,9 @@ class SearchQueryParamsSerializer(serializers.Serializer):
         child=serializers.ChoiceField(choices=[(e.value, e.value) for e in HousingType]),
         required=False
     )
+    min_rating = serializers.FloatField(
+        required=False, min_value=0.0, max_value=5.0, help_text="Минимальный средний рейтинг (0..5)"
+    )
     only_active = serializers.BooleanField(required=False, default=True)
     sort = serializers.ChoiceField(
         choices=[(s.value, s.value) for s in SearchSort],
@@ -81,3 +128,64 @@ class SearchPageSerializer(serializers.Serializer):
 class SearchResultSerializer(serializers.Serializer):
     items = AccommodationDetailSerializer(many=True)
     page = SearchPageSerializer()
+
+
+QUOTE_BATCH_MAX_IDS = 100
+
+
+def _validate_stay(attrs):
+    if attrs["check_out"] <= attrs["check_in"]:
+        raise serializers.ValidationError({"check_out": "check_out must be greater than check_in"})
+    if (attrs["check_out"] - attrs["check_in"]).days > MAX_QUOTE_NIGHTS:
+        raise serializers.ValidationError({"check_out": f"Stay must not exceed {MAX_QUOTE_NIGHTS} nights"})
+    return attrs
+
+
+class QuoteQuerySerializer(serializers.Serializer):
+    check_in = serializers.DateField()
+    check_out = serializers.DateField()
+
+    def validate(self, attrs):
+        return _validate_stay(attrs)
+
+
+class BatchQuoteRequestSerializer(QuoteQuerySerializer):
+    accommodation_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=QUOTE_BATCH_MAX_IDS
+    )
+    sort = serializers.ChoiceField(choices=QUOTE_SORTS, required=False, help_text="По умолчанию — порядок запроса")
+
+
+class NightPriceSerializer(serializers.Serializer):
+    date = serializers.DateField()
+    price_eur = serializers.FloatField()
+
+
+class StayQuoteSerializer(serializers.Serializer):
+    accommodation_id = serializers.IntegerField()
+    check_in = serializers.DateField()
+    check_out = serializers.DateField()
+    nights = serializers.IntegerField()
+    total_eur = serializers.FloatField()
+    nightly = NightPriceSerializer(many=True)
+
+
+class BatchQuoteResponseSerializer(serializers.Serializer):
+    items = StayQuoteSerializer(many=True)
+
+
+class RateRuleSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    price_eur = serializers.FloatField(min_value=0.01)
+    start_date = serializers.DateField(required=False, allow_null=True)
+    end_date = serializers.DateField(required=False, allow_null=True, help_text="Не включительно")
+    weekdays = serializers.ListField(
+        child=serializers.IntegerField(min_value=0, max_value=6), required=False, max_length=7,
+        help_text="Дни недели (0 = понедельник). Пусто — все дни",
+    )
+    priority = serializers.IntegerField(required=False, default=0, min_value=-1000, max_value=1000)
+
+    def validate(self, attrs):
+        if attrs.get("start_date") and attrs.get("end_date") and attrs["start_date"] >= attrs["end_date"]:
+            raise serializers.ValidationError({"end_date": "end_date must be greater than start_date"})
+        return attrs
@@ -1,17 +1,33 @@
 # Слой interfaces: маршрутизация текущего приложения
 from django.urls import path
 
+from src.bookings.interfaces.rest.views import (
+    AccommodationCalendarView, AccommodationICalFeedView, ImportExternalCalendarView,
+)
+from src.common.interfaces.rest.views import HostListingStatsView, ListingUniqueVisitorsView
 from src.reviews.interfaces.rest.views import AccommodationReviewsView
 from .views import (
     CreateAccommodationView, ToggleAvailabilityView,
     AccommodationDetailView, ListMyAccommodationsView, SearchAccommodationsView,
+    StayQuoteView, BatchQuoteView, RateRulesView, RateRuleDetailView,
 )
 
 urlpatterns = [
     path("", CreateAccommodationView.as_view(), name="accommodations-create"),  # POST
     path("mine/", ListMyAccommodationsView.as_view(), name="accommodations-mine"),  # GET
+    path("my/stats/", HostListingStatsView.as_view(), name="accommodations-my-stats"),  # GET
     path("search/", SearchAccommodationsView.as_view(), name="accommodations-search"),  # GET
+    path("quotes/", BatchQuoteView.as_view(), name="accommodations-quotes"),  # POST
     path("<int:acc_id>/", AccommodationDetailView.as_view(), name="accommodations-detail"),  # GET/PATCH/DELETE
     path("<int:accommodation_id>/reviews/", AccommodationReviewsView.as_view(), name="accommodations-reviews"), # GET/POST
     path("<int:acc_id>/toggle/", ToggleAvailabilityView.as_view(), name="accommodations-toggle"),  # POST
+    path("<int:acc_id>/calendar/", AccommodationCalendarView.as_view(), name="accommodations-calendar"),  # GET
+    path("<int:acc_id>/calendar.ics", AccommodationICalFeedView.as_view(), name="accommodations-calendar-ics"),  # GET
+    path("<int:acc_id>/calendar/import/", ImportExternalCalendarView.as_view(),
+         name="accommodations-calendar-import"),  # POST
+    path("<int:acc_id>/quote/", StayQuoteView.as_view(), name="accommodations-quote"),  # GET
+    path("<int:acc_id>/rate-rules/", RateRulesView.as_view(), name="accommodations-rate-rules"),  # GET/POST
+    path("<int:acc_id>/rate-rules/<int:rule_id>/", RateRuleDetailView.as_view(),
+         name="accommodations-rate-rule-detail"),  # DELETE
+    path("<int:acc_id>/stats/visitors/", ListingUniqueVisitorsView.as_view(), name="accommodations-stats-visitors"),  # GET
 ]
@@ -1,6 +1,8 @@
 # Слой interfaces: представления/ендпоинты
 from __future__ import annotations
 
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_protect
 from drf_spectacular.utils import extend_schema, OpenApiResponse
@@ -11,26 +13,46 @@ from rest_framework.views import APIView
 from src.accommodations.interfaces.rest.serializers import (
     AccommodationCreateUpdateSerializer,
     AccommodationPartialUpdateSerializer,
+    AccommodationDetailQuerySerializer,
     AccommodationDetailSerializer,
     SearchQueryParamsSerializer,
     SearchResultSerializer,
+    BatchQuoteRequestSerializer,
+    BatchQuoteResponseSerializer,
+    QuoteQuerySerializer,
+    RateRuleSerializer,
+    StayQuoteSerializer,
 )
 from src.accommodations.interfaces.rest.permissions import IsAuthenticatedAndActive, IsHost
 from src.accommodations.application.commands import (
-    CreateAccommodationCommand, UpdateAccommodationCommand, DeleteAccommodationCommand, ToggleAvailabilityCommand
+    CreateAccommodationCommand, UpdateAccommodationCommand, DeleteAccommodationCommand, ToggleAvailabilityCommand,
+    AddRateRuleCommand, DeleteRateRuleCommand,
+)
+from src.accommodations.application.queries import (
+    GetAccommodationByIdQuery, SearchAccommodationsQuery, ListRateRulesQuery, QuoteStayQuery, QuoteStaysQuery,
 )
-from src.accommodations.application.queries import GetAccommodationByIdQuery, SearchAccommodationsQuery
 from src.accommodations.application.use_cases.create_accommodation import CreateAccommodationUseCase
 from src.accommodations.application.use_cases.update_accommodation import UpdateAccommodationUseCase
 from src.accommodations.application.use_cases.delete_accommodation import DeleteAccommodationUseCase
 from src.accommodations.application.use_cases.toggle_availability import ToggleAvailabilityUseCase
 from src.accommodations.application.use_cases.get_accommodation import GetAccommodationByIdUseCase
 from src.accommodations.application.use_cases.search_accommodations import SearchAccommodationsUseCase
+from src.accommodations.application.use_cases.quote_stay import QuoteStayUseCase, QuoteStaysUseCase
+from src.accommodations.application.use_cases.rate_rules import (
+    AddRateRuleUseCase, DeleteRateRuleUseCase, ListRateRulesUseCase,
+)
 from src.accommodations.application.mappers import to_dto
 from src.accommodations.domain.value_objects import HousingType
 from src.accommodations.domain.dtos import SearchSort
-from src.accommodations.infrastructure.repositories import DjangoAccommodationRepository
-from src.common.infrastructure.repositories import log_search_query, log_listing_view
+from src.accommodations.infrastructure.repositories import DjangoAccommodationRepository, DjangoPricingRepository
+from src.common.infrastructure.jobs import enqueue
+from src.common.infrastructure.repositories import (
+    LOG_SEARCH_QUERY_JOB, log_search_query, log_listing_view, visitor_key,
+)
+from src.common.infrastructure.view_dedup import should_record_listing_view
+from src.common.interfaces.fingerprint import client_fingerprint
+from src.shared.errors import ApplicationError
+from src.shared.interfaces.api_errors import response_from_app_error
 
 
 @extend_schema(
@@ -66,8 +88,14 @@ class CreateAccommodationView(APIView):
 
 @extend_schema(
     tags=["accommodations"],
+    parameters=[AccommodationDetailQuerySerializer],
     responses={200: AccommodationDetailSerializer, 404: OpenApiResponse(description="Not found")},
     operation_id="accommodations_get_by_id",
+    description=(
+        "Объявление. ?include=reviews_summary добавляет статистику рейтинга и последние отзывы "
+        "из снимка на той же строке — странице объявления не нужен отдельный запрос списка отзывов."
+    ),
+    methods=["GET"],
 )
 @extend_schema(
     tags=["accommodations"],
@@ -93,18 +121,28 @@ class AccommodationDetailView(APIView):
         return [permissions.AllowAny()]
 
     def get(self, request, acc_id: int):
+        params = AccommodationDetailQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        includes = params.validated_data.get("include", set())
         repo = DjangoAccommodationRepository()
 
-        user_id = request.user.id if getattr(request, "user", None) and request.user.is_authenticated else None
-        log_listing_view(accommodation_id=acc_id, user_id=user_id)
-
-        # Сначала инкрементируем просмотры
-        repo.increment_views(acc_id=acc_id)
+        try:
+            dto = GetAccommodationByIdUseCase(repo).execute(
+                GetAccommodationByIdQuery(id=acc_id, include_reviews_summary="reviews_summary" in includes)
+            )
+        except ApplicationError as e:
+            return response_from_app_error(e)
 
-        # Затем берём актуальные данные
-        dto = GetAccommodationByIdUseCase(repo).execute(GetAccommodationByIdQuery(id=acc_id))
+        # Просмотр учитываем только для существующего объявления: перебор id не засоряет
+        # окно дедупликации и не создаёт счётчики посетителей для несуществующих объявлений
+        user_id = request.user.id if getattr(request, "user", None) and request.user.is_authenticated else None
+        fingerprint = client_fingerprint(request)
+        visitor = visitor_key(user_id=user_id, fingerprint=fingerprint)
+        # Повторный просмотр тем же посетителем в пределах окна не пишем (ни счётчик, ни лог)
+        if should_record_listing_view(accommodation_id=acc_id, visitor=visitor) and repo.increment_views(acc_id=acc_id):
+            log_listing_view(accommodation_id=acc_id, user_id=user_id, fingerprint=fingerprint)
+            dto.views_count += 1  # в ответе — счётчик с учётом этого просмотра
 
-        # Возвращаем без ручного "+1"
         return Response(AccommodationDetailSerializer(dto).data, status=status.HTTP_200_OK)
 
     def patch(self, request, acc_id: int):
@@ -207,6 +245,7 @@ class SearchAccommodationsView(APIView):
                 sort=sort,
                 page=v.get("page", 1),
                 page_size=v.get("page_size", 20),
+                min_rating=v.get("min_rating"),
             )
         )
 
@@ -222,7 +261,7 @@ class SearchAccommodationsView(APIView):
             bool(v.get("housing_types")),
         ])
         if has_filters:
-            log_search_query(
+            search_params = dict(
                 user_id=request.user.id if getattr(request, "user", None) and request.user.is_authenticated else None,
                 keyword=v.get("keyword"),
                 city=v.get("city"),
@@ -233,6 +272,10 @@ class SearchAccommodationsView(APIView):
                 rooms_max=v.get("rooms_max"),
                 housing_types=v.get("housing_types") or [],
             )
+            if settings.SEARCH_LOG_ASYNC:
+                enqueue(LOG_SEARCH_QUERY_JOB, search_params, queue="logging")
+            else:
+                log_search_query(**search_params)
 
         items = [AccommodationDetailSerializer(dto).data for dto in result.items]
         payload = {
@@ -240,3 +283,136 @@ class SearchAccommodationsView(APIView):
             "page": {"page": result.page.page, "page_size": result.page.page_size, "total": result.page.total},
         }
         return Response(payload, status=status.HTTP_200_OK)
+
+
+def _quote_kwargs() -> dict:
+    return {"cache": cache, "cache_timeout": settings.PRICING_QUOTE_CACHE_SECONDS}
+
+
+@extend_schema(
+    tags=["accommodations"],
+    parameters=[QuoteQuerySerializer],
+    responses={200: StayQuoteSerializer, 404: OpenApiResponse(description="Not found")},
+    operation_id="accommodations_quote",
+    description=(
+        "Стоимость проживания [check_in, check_out) с учётом посуточных тарифов (сезоны, выходные). "
+        "Расчёт кэшируется по (объявление, версия тарифов, даты)."
+    ),
+)
+class StayQuoteView(APIView):
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, acc_id: int):
+        params = QuoteQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        v = params.validated_data
+        try:
+            dto = QuoteStayUseCase(DjangoPricingRepository(), **_quote_kwargs()).execute(
+                QuoteStayQuery(accommodation_id=acc_id, check_in=v["check_in"], check_out=v["check_out"])
+            )
+        except ApplicationError as e:
+            return response_from_app_error(e)
+        return Response(StayQuoteSerializer(dto).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["accommodations"],
+    request=BatchQuoteRequestSerializer,
+    responses={200: BatchQuoteResponseSerializer, 400: OpenApiResponse(description="Bad request")},
+    operation_id="accommodations_quotes_batch",
+    description=(
+        "Пакетный расчёт стоимости (до 100 объявлений, например страница поиска) на одни даты, "
+        "с опциональной сортировкой по итоговой цене. Неактивные и несуществующие объявления пропускаются. "
+        "POST только из-за размера тела — данные не меняются, CSRF не требуется."
+    ),
+)
+class BatchQuoteView(APIView):
+    permission_classes = [permissions.AllowAny]
+
+    def post(self, request):
+        ser = BatchQuoteRequestSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        v = ser.validated_data
+        try:
+            items = QuoteStaysUseCase(DjangoPricingRepository(), **_quote_kwargs()).execute(
+                QuoteStaysQuery(
+                    accommodation_ids=tuple(v["accommodation_ids"]),
+                    check_in=v["check_in"],
+                    check_out=v["check_out"],
+                    sort=v.get("sort"),
+                )
+            )
+        except ApplicationError as e:
+            return response_from_app_error(e)
+        return Response(BatchQuoteResponseSerializer({"items": items}).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["accommodations"],
+    responses={200: RateRuleSerializer(many=True)},
+    operation_id="accommodations_rate_rules_list",
+    description="Посуточные тарифы объявления (только владелец).",
+)
+@extend_schema(
+    tags=["accommodations"],
+    request=RateRuleSerializer,
+    responses={201: RateRuleSerializer},
+    operation_id="accommodations_rate_rules_create",
+    methods=["POST"],
+    description=(
+        "Добавить тариф (только владелец): цена за ночь для периода [start_date, end_date) и/или дней недели. "
+        "При пересечении побеждает больший priority. Требуется CSRF."
+    ),
+)
+@method_decorator(csrf_protect, name="dispatch")
+class RateRulesView(APIView):
+    permission_classes = [IsAuthenticatedAndActive, IsHost]
+
+    def get(self, request, acc_id: int):
+        try:
+            items = ListRateRulesUseCase(DjangoAccommodationRepository(), DjangoPricingRepository()).execute(
+                ListRateRulesQuery(accommodation_id=acc_id, owner_id=request.user.id)
+            )
+        except ApplicationError as e:
+            return response_from_app_error(e)
+        return Response(RateRuleSerializer(items, many=True).data, status=status.HTTP_200_OK)
+
+    def post(self, request, acc_id: int):
+        ser = RateRuleSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        v = ser.validated_data
+        try:
+            dto = AddRateRuleUseCase(DjangoAccommodationRepository(), DjangoPricingRepository()).execute(
+                AddRateRuleCommand(
+                    accommodation_id=acc_id,
+                    owner_id=request.user.id,
+                    price_eur=v["price_eur"],
+                    start_date=v.get("start_date"),
+                    end_date=v.get("end_date"),
+                    weekdays=tuple(v.get("weekdays") or ()),
+                    priority=v.get("priority", 0),
+                )
+            )
+        except ApplicationError as e:
+            return response_from_app_error(e)
+        return Response(RateRuleSerializer(dto).data, status=status.HTTP_201_CREATED)
+
+
+@extend_schema(
+    tags=["accommodations"],
+    responses={204: OpenApiResponse(description="Deleted"), 404: OpenApiResponse(description="Not found")},
+    operation_id="accommodations_rate_rules_delete",
+    description="Удалить тариф (только владелец). Требуется CSRF.",
+)
+@method_decorator(csrf_protect, name="dispatch")
+class RateRuleDetailView(APIView):
+    permission_classes = [IsAuthenticatedAndActive, IsHost]
+
+    def delete(self, request, acc_id: int, rule_id: int):
+        try:
+            DeleteRateRuleUseCase(DjangoAccommodationRepository(), DjangoPricingRepository()).execute(
+                DeleteRateRuleCommand(accommodation_id=acc_id, owner_id=request.user.id, rule_id=rule_id)
+            )
+        except ApplicationError as e:
+            return response_from_app_error(e)
+        return Response(status=status.HTTP_204_NO_CONTENT)
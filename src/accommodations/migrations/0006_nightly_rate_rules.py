@@ -0,0 +1,36 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0005_accommodation_average_rating_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accommodation',
+            name='pricing_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='NightlyRateRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('price_cents', models.PositiveIntegerField()),
+                ('start_date', models.DateField(blank=True, null=True)),
+                ('end_date', models.DateField(blank=True, help_text='Не включительно', null=True)),
+                ('weekdays', models.PositiveSmallIntegerField(default=127, help_text='Бит i — день недели i (0 = пн)')),
+                ('priority', models.SmallIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('accommodation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rate_rules', to='accommodations.accommodation')),
+            ],
+            options={
+                'db_table': 'accommodation_rate_rules',
+                'ordering': ['accommodation_id', 'priority', 'id'],
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:17
+
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def backfill_rating_sum(apps, schema_editor):
+    # Сумма, число и среднее — заново из отзывов (заодно выравнивает возможный дрейф старых счётчиков)
+    Accommodation = apps.get_model("accommodations", "Accommodation")
+    Review = apps.get_model("reviews", "Review")
+    totals = {
+        acc_id: (int(total or 0), int(cnt))
+        for acc_id, total, cnt in Review.objects.values("accommodation_id")
+        .annotate(total=Sum("rating"), cnt=Count("id"))
+        .values_list("accommodation_id", "total", "cnt")
+    }
+    batch = []
+    for acc in Accommodation.objects.only("id").order_by("id").iterator(chunk_size=BACKFILL_BATCH_SIZE):
+        total, cnt = totals.get(acc.id, (0, 0))
+        acc.rating_sum, acc.reviews_count = total, cnt
+        acc.average_rating = (
+            (Decimal(total) / Decimal(cnt)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP) if cnt else Decimal("0")
+        )
+        batch.append(acc)
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            Accommodation.objects.bulk_update(batch, ["rating_sum", "reviews_count", "average_rating"])
+            batch = []
+    if batch:
+        Accommodation.objects.bulk_update(batch, ["rating_sum", "reviews_count", "average_rating"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0006_nightly_rate_rules'),
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accommodation',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rating_sum, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:20
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+BACKFILL_BATCH_SIZE = 1000
+STAR_FIELDS = [f"rating_{stars}_count" for stars in range(1, 6)]
+
+
+def backfill_rating_histogram(apps, schema_editor):
+    # Число отзывов по каждой оценке 1..5 — одним GROUP BY по отзывам
+    Accommodation = apps.get_model("accommodations", "Accommodation")
+    Review = apps.get_model("reviews", "Review")
+    counts = {
+        row[0]: row[1:]
+        for row in Review.objects.values("accommodation_id")
+        .annotate(**{name: Count("id", filter=Q(rating=stars)) for stars, name in enumerate(STAR_FIELDS, 1)})
+        .values_list("accommodation_id", *STAR_FIELDS)
+    }
+    batch = []
+    for acc in Accommodation.objects.only("id").order_by("id").iterator(chunk_size=BACKFILL_BATCH_SIZE):
+        for name, value in zip(STAR_FIELDS, counts.get(acc.id, (0,) * len(STAR_FIELDS))):
+            setattr(acc, name, value)
+        batch.append(acc)
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            Accommodation.objects.bulk_update(batch, STAR_FIELDS)
+            batch = []
+    if batch:
+        Accommodation.objects.bulk_update(batch, STAR_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0007_accommodation_rating_sum'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accommodation',
+            name='rating_1_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='accommodation',
+            name='rating_2_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='accommodation',
+            name='rating_3_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='accommodation',
+            name='rating_4_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='accommodation',
+            name='rating_5_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rating_histogram, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='accommodation',
+            index=models.Index(fields=['is_active', 'average_rating'], name='accommodati_is_acti_57c555_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:26
+
+from django.db import migrations, models
+from django.db.models.functions import Substr
+
+BACKFILL_BATCH_SIZE = 1000
+SNAPSHOT_REVIEWS = 3
+SNAPSHOT_TEXT_LENGTH = 200
+
+
+def backfill_reviews_snapshot(apps, schema_editor):
+    # Тот же формат, что у src.reviews.infrastructure.snapshots (код приложения в миграции не импортируем)
+    Accommodation = apps.get_model("accommodations", "Accommodation")
+    Review = apps.get_model("reviews", "Review")
+    acc_ids = Accommodation.objects.filter(reviews_count__gt=0).order_by("id").values_list("id", flat=True)
+    batch = []
+    for acc_id in acc_ids.iterator(chunk_size=BACKFILL_BATCH_SIZE):
+        rows = (
+            Review.objects.filter(accommodation_id=acc_id)
+            .order_by("-created_at", "-id")
+            .annotate(preview=Substr("text", 1, SNAPSHOT_TEXT_LENGTH + 1))
+            .values("id", "author_id", "rating", "preview", "created_at")[:SNAPSHOT_REVIEWS]
+        )
+        latest = []
+        for row in rows:
+            truncated = len(row["preview"]) > SNAPSHOT_TEXT_LENGTH
+            latest.append({
+                "id": row["id"],
+                "author_id": row["author_id"],
+                "rating": row["rating"],
+                "text": row["preview"][:SNAPSHOT_TEXT_LENGTH].rstrip() + "…" if truncated else row["preview"],
+                "text_truncated": truncated,
+                "created_at": row["created_at"].isoformat(),
+            })
+        batch.append(Accommodation(id=acc_id, reviews_snapshot={"latest": latest}))
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            Accommodation.objects.bulk_update(batch, ["reviews_snapshot"])
+            batch = []
+    if batch:
+        Accommodation.objects.bulk_update(batch, ["reviews_snapshot"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0008_accommodation_rating_histogram'),
+        ('reviews', '0002_review_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accommodation',
+            name='reviews_snapshot',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(backfill_reviews_snapshot, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,4 @@
 # Реэкспорт ORM-модели, чтобы Django "видел" её как src.accommodations.models.Accommodation
-from .infrastructure.orm.models import Accommodation
+from .infrastructure.orm.models import Accommodation, NightlyRateRule
 
-__all__ = ["Accommodation"]
\ No newline at end of file
+__all__ = ["Accommodation", "NightlyRateRule"]
\ No newline at end of file
@@ -3,6 +3,7 @@ from __future__ import annotations
 from django.test import TestCase
 from rest_framework.test import APIClient
 
+from src.common.infrastructure.view_dedup import reset_listing_view_dedup
 from src.shared.testing.factories import create_user, create_accommodation
 from src.shared.testing.api import ensure_csrf
 
@@ -10,6 +11,7 @@ from src.shared.testing.api import ensure_csrf
 class AccommodationsApiPermissionsTests(TestCase):
     def setUp(self):
         self.client = APIClient()
+        reset_listing_view_dedup()
         # Пользователь-владелец с ролью host
         self.host_owner = create_user("owner@example.com", roles=["host"])
         # Другой пользователь-гость (без host)
@@ -40,10 +42,15 @@ class AccommodationsApiPermissionsTests(TestCase):
 
         # Счётчик просмотров увеличился (вьюха теперь инкрементирует до чтения)
         first_views = data["views_count"]
+        self.assertEqual(first_views, 1)
+        # Повтор тем же посетителем в окне дедупликации не считается
         resp2 = self.client.get(f"/api/accommodations/{self.acc.id}/")
         self.assertEqual(resp2.status_code, 200, resp2.content)
-        data2 = resp2.json()
-        self.assertGreaterEqual(data2["views_count"], first_views + 1)
+        self.assertEqual(resp2.json()["views_count"], first_views)
+        # Другой посетитель — считается
+        resp3 = self.client.get(f"/api/accommodations/{self.acc.id}/", HTTP_USER_AGENT="another-browser")
+        self.assertEqual(resp3.status_code, 200, resp3.content)
+        self.assertEqual(resp3.json()["views_count"], first_views + 1)
         self.assertEqual(data["id"], self.acc.id)
         self.assertEqual(data["title"], "My listing")
 
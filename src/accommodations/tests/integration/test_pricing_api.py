@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from src.shared.testing.api import ensure_csrf
+from src.shared.testing.factories import create_user, create_accommodation
+
+# 2026-03-06 — пятница
+FRI = date(2026, 3, 6)
+
+
+class PricingApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.host = create_user("host@example.com", roles=["host"])
+        self.other_host = create_user("other@example.com", roles=["host"])
+        self.acc = create_accommodation(owner_id=self.host.id, price_cents=10000)
+        self.cheap = create_accommodation(owner_id=self.host.id, price_cents=5000)
+        self.rules_url = f"/api/accommodations/{self.acc.id}/rate-rules/"
+        self.quote_url = f"/api/accommodations/{self.acc.id}/quote/"
+        self.params = {"check_in": "2026-03-05", "check_out": "2026-03-08"}  # чт, пт, сб
+
+    def _add_weekend_rule(self, user=None):
+        self.client.force_authenticate(user=user or self.host)
+        headers = ensure_csrf(self.client)
+        return self.client.post(
+            self.rules_url, {"price_eur": 150.0, "weekdays": [4, 5]}, format="json", **headers
+        )
+
+    def test_quote_uses_rules_and_rule_change_invalidates_cache(self):
+        resp = self.client.get(self.quote_url, self.params)
+        self.assertEqual(resp.status_code, 200, resp.content)
+        self.assertEqual(resp.json()["total_eur"], 300.0)
+
+        rule = self._add_weekend_rule()
+        self.assertEqual(rule.status_code, 201, rule.content)
+        self.assertEqual(rule.json()["weekdays"], [4, 5])
+
+        self.client.force_authenticate(user=None)
+        with self.assertNumQueries(2):  # версия + тарифы (промах: версия изменилась)
+            body = self.client.get(self.quote_url, self.params).json()
+        self.assertEqual(body["total_eur"], 400.0)
+        self.assertEqual(body["nights"], 3)
+        self.assertEqual(body["nightly"][1], {"date": FRI.isoformat(), "price_eur": 150.0})
+
+        with self.assertNumQueries(1):  # только версия — расчёт из кэша
+            self.assertEqual(self.client.get(self.quote_url, self.params).json()["total_eur"], 400.0)
+
+        self.client.force_authenticate(user=self.host)
+        headers = ensure_csrf(self.client)
+        resp = self.client.delete(f"{self.rules_url}{rule.json()['id']}/", **headers)
+        self.assertEqual(resp.status_code, 204)
+        self.assertEqual(self.client.get(self.quote_url, self.params).json()["total_eur"], 300.0)
+
+    def test_only_owner_manages_rules(self):
+        self.assertEqual(self._add_weekend_rule(user=self.other_host).status_code, 403)
+        self.client.force_authenticate(user=self.other_host)
+        self.assertEqual(self.client.get(self.rules_url).status_code, 403)
+
+    def test_quote_validation_and_not_found(self):
+        same_day = {"check_in": "2026-03-05", "check_out": "2026-03-05"}
+        self.assertEqual(self.client.get(self.quote_url, same_day).status_code, 400)
+        self.assertEqual(self.client.get("/api/accommodations/999999/quote/", self.params).status_code, 404)
+
+    def test_batch_quotes_sorted_by_total(self):
+        self._add_weekend_rule()
+        self.client.force_authenticate(user=None)
+        payload = {"accommodation_ids": [self.acc.id, self.cheap.id, 999999], **self.params, "sort": "total_asc"}
+        with self.assertNumQueries(2):
+            resp = self.client.post("/api/accommodations/quotes/", payload, format="json")
+        self.assertEqual(resp.status_code, 200, resp.content)
+        items = resp.json()["items"]
+        self.assertEqual([(i["accommodation_id"], i["total_eur"]) for i in items],
+                         [(self.cheap.id, 150.0), (self.acc.id, 400.0)])
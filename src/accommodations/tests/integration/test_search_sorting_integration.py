@@ -90,3 +90,11 @@ class SearchSortingIntegrationTests(TestCase):
         )
         ids = self._ids(r)
         self.assertEqual(ids[:3], [self.c.id, self.a.id, self.b.id])
+
+    def test_min_rating_filter(self):
+        ids = self._ids(self.client.get("/api/accommodations/search/?min_rating=4.5&sort=rating_desc"))
+        self.assertEqual(ids, [self.b.id, self.a.id])
+        # 0 — без фильтра
+        self.assertEqual(len(self._ids(self.client.get("/api/accommodations/search/?min_rating=0"))), 3)
+        r = self.client.get("/api/accommodations/search/?min_rating=6")
+        self.assertEqual(r.status_code, 400, r.content)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Dict, Iterable, List
+
+from django.test import SimpleTestCase
+
+from src.accommodations.application.queries import QuoteStaysQuery
+from src.accommodations.application.use_cases.quote_stay import QuoteStaysUseCase
+from src.accommodations.domain.pricing import NightlyRateRule, PricingSnapshot, quote_stay, weekday_mask
+from src.accommodations.domain.repository_interfaces import IPricingRepository
+from src.shared.errors import ApplicationError
+
+# 2026-03-02 — понедельник
+MON = date(2026, 3, 2)
+
+
+class NightlyPricesTests(SimpleTestCase):
+    def test_weekend_and_season_rules_with_priority(self):
+        snapshot = PricingSnapshot(
+            accommodation_id=1,
+            base_price_cents=10000,
+            version=1,
+            rules=(
+                NightlyRateRule(id=1, accommodation_id=1, price_cents=15000, weekdays=weekday_mask([4, 5])),
+                NightlyRateRule(
+                    id=2, accommodation_id=1, price_cents=20000, priority=1,
+                    start_date=date(2026, 3, 7), end_date=date(2026, 3, 9),
+                ),
+            ),
+        )
+        quote = quote_stay(snapshot, MON, date(2026, 3, 10))
+        # пн..чт — база, пт — выходной тариф, сб/вс — сезон (priority выше), пн — база
+        self.assertEqual(quote.nightly_cents, (10000, 10000, 10000, 10000, 15000, 20000, 20000, 10000))
+        self.assertEqual(quote.total_cents, 105000)
+
+    def test_invalid_period(self):
+        snapshot = PricingSnapshot(accommodation_id=1, base_price_cents=10000, version=0)
+        with self.assertRaises(ValueError):
+            quote_stay(snapshot, MON, MON)
+
+
+class FakePricingRepo(IPricingRepository):
+    def __init__(self, heads: Dict[int, PricingSnapshot], rules: Dict[int, List[NightlyRateRule]]):
+        self.heads = heads
+        self.rules = rules
+        self.rules_calls: List[List[int]] = []
+
+    def get_price_heads(self, acc_ids: Iterable[int]) -> Dict[int, PricingSnapshot]:
+        return {i: self.heads[i] for i in acc_ids if i in self.heads}
+
+    def get_rules(self, acc_ids: Iterable[int]) -> Dict[int, List[NightlyRateRule]]:
+        ids = list(acc_ids)
+        self.rules_calls.append(ids)
+        return {i: self.rules[i] for i in ids if i in self.rules}
+
+    def add_rule(self, rule):
+        raise NotImplementedError
+
+    def delete_rule(self, acc_id, rule_id):
+        raise NotImplementedError
+
+
+class DictCache:
+    def __init__(self):
+        self.data = {}
+
+    def get_many(self, keys):
+        return {k: self.data[k] for k in keys if k in self.data}
+
+    def set_many(self, data, timeout=None):
+        self.data.update(data)
+
+
+class QuoteStaysUseCaseTests(SimpleTestCase):
+    def setUp(self):
+        self.repo = FakePricingRepo(
+            heads={
+                1: PricingSnapshot(accommodation_id=1, base_price_cents=10000, version=0),
+                2: PricingSnapshot(accommodation_id=2, base_price_cents=8000, version=3),
+            },
+            rules={2: [NightlyRateRule(id=5, accommodation_id=2, price_cents=30000, weekdays=weekday_mask([0]))]},
+        )
+        self.cache = DictCache()
+        self.uc = QuoteStaysUseCase(self.repo, self.cache)
+
+    def _query(self, ids, sort=None):
+        return QuoteStaysQuery(accommodation_ids=ids, check_in=MON, check_out=date(2026, 3, 4), sort=sort)
+
+    def test_batch_reads_rules_once_and_caches(self):
+        items = self.uc.execute(self._query([2, 1, 99]))
+        self.assertEqual([(i.accommodation_id, i.total_cents) for i in items], [(2, 38000), (1, 20000)])
+        self.assertEqual(self.repo.rules_calls, [[2, 1]])
+
+        self.uc.execute(self._query([1, 2]))
+        self.assertEqual(len(self.repo.rules_calls), 1)  # всё из кэша
+
+    def test_new_version_misses_cache(self):
+        self.uc.execute(self._query([2]))
+        self.repo.heads[2] = PricingSnapshot(accommodation_id=2, base_price_cents=8000, version=4)
+        self.repo.rules[2] = []
+        items = self.uc.execute(self._query([2]))
+        self.assertEqual(items[0].total_cents, 16000)
+        self.assertEqual(len(self.repo.rules_calls), 2)
+
+    def test_sort_by_total(self):
+        items = self.uc.execute(self._query([1, 2], sort="total_desc"))
+        self.assertEqual([i.accommodation_id for i in items], [2, 1])
+        with self.assertRaises(ApplicationError):
+            self.uc.execute(self._query([1], sort="price"))
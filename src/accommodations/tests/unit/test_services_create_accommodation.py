@@ -3,7 +3,12 @@ from __future__ import annotations
 from django.test import SimpleTestCase
 
 from src.accommodations.domain.entities import Accommodation
-from src.accommodations.domain.services import create_accommodation
+from src.accommodations.domain.dtos import SearchQueryDTO
+from src.accommodations.domain.services import (
+    create_accommodation,
+    normalize_search_query,
+    rating_distribution,
+)
 from src.accommodations.domain.value_objects import Location, Price, RoomsCount, HousingType
 
 
@@ -55,3 +60,18 @@ class CreateAccommodationServiceTests(SimpleTestCase):
                 housing_type=HousingType("apartment"),
                 is_active=True,
             )
+
+
+class RatingDistributionTests(SimpleTestCase):
+    def test_buckets_from_five_to_one_with_percent(self):
+        buckets = rating_distribution((1, 0, 0, 1, 1))
+        self.assertEqual([b.stars for b in buckets], [5, 4, 3, 2, 1])
+        self.assertEqual([b.count for b in buckets], [1, 1, 0, 0, 1])
+        self.assertEqual([b.percent for b in buckets], [33.3, 33.3, 0.0, 0.0, 33.3])
+
+    def test_no_reviews_gives_zero_percent(self):
+        self.assertEqual({b.percent for b in rating_distribution((0, 0, 0, 0, 0))}, {0.0})
+
+    def test_min_rating_normalized(self):
+        self.assertIsNone(normalize_search_query(SearchQueryDTO(min_rating=0)).min_rating)
+        self.assertEqual(normalize_search_query(SearchQueryDTO(min_rating=7)).min_rating, 5.0)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
+from typing import Tuple
 
 
 @dataclass(frozen=True)
@@ -32,3 +33,17 @@ class CancelBookingCommand:
     actor_user_id: int  # гость или хост
     today: date
     cancel_deadline_days: int = 1  # можно переопределить при необходимости
+
+
+@dataclass(frozen=True)
+class BookingDecision:
+    booking_id: int
+    action: str  # "confirm" | "reject" | "cancel"
+
+
+@dataclass(frozen=True)
+class BatchDecideCommand:
+    actor_user_id: int  # host
+    items: Tuple[BookingDecision, ...]
+    today: date
+    cancel_deadline_days: int = 1
@@ -0,0 +1,31 @@
+# Слой application: непрозрачные курсоры keyset-пагинации (base64url JSON [ключ сортировки, id])
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Optional, Tuple, Type, TypeVar
+
+from src.shared.errors import ApplicationError
+
+K = TypeVar("K", date, datetime)
+
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 100
+
+
+def encode_cursor(key: date | datetime, booking_id: int) -> str:
+    raw = json.dumps([key.isoformat(), booking_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], key_type: Type[K]) -> Optional[Tuple[K, int]]:
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key, booking_id = json.loads(raw)
+        return key_type.fromisoformat(key), int(booking_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise ApplicationError("Invalid cursor")
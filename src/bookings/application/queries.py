@@ -2,6 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Tuple
+
+from src.bookings.application.pagination import DEFAULT_PAGE_LIMIT
+from src.bookings.domain.entities import BookingStatus
+
+# Разрезы отчёта о загрузке (occupancy): по объявлению, городу, месяцу, городу и месяцу
+OCCUPANCY_GROUP_BY_CHOICES = ("listing", "city", "month", "city_month")
 
 
 @dataclass(frozen=True)
@@ -13,8 +21,32 @@ class GetBookingByIdQuery:
 class ListMyBookingsQuery:
     guest_id: int
     active_only: bool = False
+    statuses: Tuple[BookingStatus, ...] = ()
+    start_from: Optional[date] = None  # start_date >= start_from
+    start_to: Optional[date] = None  # start_date <= start_to
+    cursor: Optional[str] = None
+    limit: int = DEFAULT_PAGE_LIMIT
 
 
 @dataclass(frozen=True)
 class ListMyRequestsForHostQuery:
     host_id: int
+    statuses: Tuple[BookingStatus, ...] = (BookingStatus.REQUESTED,)
+    start_from: Optional[date] = None
+    start_to: Optional[date] = None
+    cursor: Optional[str] = None
+    limit: int = DEFAULT_PAGE_LIMIT
+
+
+@dataclass(frozen=True)
+class CheckAvailabilityQuery:
+    accommodation_ids: Tuple[int, ...]
+    start_date: date
+    end_date: date
+
+
+@dataclass(frozen=True)
+class GetCalendarQuery:
+    accommodation_id: int
+    start_date: date
+    end_date: date  # включительно
@@ -0,0 +1,48 @@
+# Слой application: общий сценарий смены статуса брони через compare-and-set
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from src.shared.errors import ApplicationError
+from src.bookings.domain.entities import Booking
+from src.bookings.domain.repository_interfaces import IBookingRepository
+from src.bookings.domain.services import CONCURRENT_CHANGE_ERROR
+
+
+def apply_status_transition(
+        repo: IBookingRepository,
+        booking_id: int,
+        actor_user_id: int,
+        decide: Callable[[Booking], None],
+        *,
+        guard: Optional[Callable[[Booking], None]] = None,
+        exclusive: bool = False,
+) -> Booking:
+    """
+    1) SELECT брони; 2) доменный метод decide (confirm/reject/cancel) решает, допустим ли переход;
+    3) один условный UPDATE ... WHERE id AND status = прочитанный AND host_id/guest_id = actor.
+    Если UPDATE не затронул строк — бронь изменилась между чтением и записью: перечитываем и снова
+    прогоняем домен, чтобы вернуть его собственную ошибку (ValueError/PermissionError).
+    guard — доп. проверка перед записью (например, пересечения), exclusive — под блокировкой объявления.
+    """
+    booking = repo.get_by_id(booking_id)
+    if not booking:
+        raise ApplicationError("Booking not found")
+    expected = booking.status
+    decide(booking)
+    actor = {"host_id": actor_user_id} if actor_user_id == booking.host_id else {"guest_id": actor_user_id}
+
+    def write() -> bool:
+        if guard is not None:
+            guard(booking)
+        return repo.apply_transition(booking, expected, **actor)
+
+    applied = repo.run_exclusive(booking.accommodation_id, write) if exclusive else write()
+    if applied:
+        return booking
+
+    fresh = repo.get_by_id(booking_id)
+    if not fresh:
+        raise ApplicationError("Booking not found")
+    decide(fresh)  # как правило, здесь домен и бросит актуальную ошибку
+    raise ValueError(CONCURRENT_CHANGE_ERROR)
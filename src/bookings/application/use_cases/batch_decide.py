@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Dict, List, Tuple
+
+from src.shared.errors import ApplicationError
+from src.bookings.application.commands import BatchDecideCommand
+from src.bookings.domain.dtos import DecisionOutcomeDTO
+from src.bookings.domain.entities import Booking, BookingStatus
+from src.bookings.domain.interval_index import BookingIntervalIndex
+from src.bookings.domain.repository_interfaces import IBookingRepository
+from src.bookings.domain.services import BLOCKING_STATUSES, OVERLAP_ERROR
+from src.bookings.domain.value_objects import StayPeriod
+
+BATCH_ACTIONS = ("confirm", "reject", "cancel")
+
+
+class BatchDecideBookingsUseCase:
+    """
+    Пакетное решение хоста по заявкам:
+    - одна выборка FOR UPDATE проверяет владельца и статусы всех броней;
+    - переходы решает домен (confirm/reject/cancel) для каждой брони отдельно;
+    - подтверждения сверяются с CONFIRMED-бронями одним запросом и между собой (в порядке запроса);
+    - запись — по одному UPDATE на пару (исходный статус, новый статус), всё в одной транзакции.
+    Ошибка отдельного элемента не отменяет остальные — возвращается исход по каждому.
+    """
+
+    def __init__(self, repo: IBookingRepository):
+        self._repo = repo
+
+    def execute(self, cmd: BatchDecideCommand) -> List[DecisionOutcomeDTO]:
+        try:
+            # Дешёвое чтение без блокировок — только чтобы знать, какие объявления блокировать
+            acc_ids = {
+                b.accommodation_id
+                for b in self._repo.get_many(i.booking_id for i in cmd.items)
+                if b.host_id == cmd.actor_user_id
+            }
+            return self._repo.run_exclusive_many(acc_ids, lambda: self._decide(cmd))
+        except ApplicationError:
+            raise
+        except Exception as ex:
+            raise ApplicationError(str(ex))
+
+    def _decide(self, cmd: BatchDecideCommand) -> List[DecisionOutcomeDTO]:
+        bookings = {b.id: b for b in self._repo.get_many((i.booking_id for i in cmd.items), for_update=True)}
+        outcomes: List[DecisionOutcomeDTO] = []
+        decided: List[Tuple[DecisionOutcomeDTO, Booking, BookingStatus]] = []
+        seen = set()
+
+        for item in cmd.items:
+            out = DecisionOutcomeDTO(booking_id=item.booking_id, action=item.action, ok=False)
+            outcomes.append(out)
+            booking = bookings.get(item.booking_id)
+            if item.booking_id in seen:
+                out.error = "Duplicate booking_id in batch"
+                continue
+            seen.add(item.booking_id)
+            if booking is None or booking.host_id != cmd.actor_user_id:
+                out.error = "Booking not found"
+                continue
+            expected = booking.status
+            try:
+                self._apply_domain(booking, item.action, cmd.actor_user_id, cmd.today, cmd.cancel_deadline_days)
+            except (ValueError, PermissionError) as ex:
+                out.error = str(ex)
+                continue
+            decided.append((out, booking, expected))
+
+        self._check_confirmation_overlaps(decided)
+
+        groups: Dict[BookingStatus, List[Booking]] = {}
+        for out, booking, expected in decided:
+            if out.error is None:
+                groups.setdefault(expected, []).append(booking)
+                out.ok, out.status = True, booking.status
+        for expected, group in groups.items():
+            self._repo.apply_transition_many(group, expected, host_id=cmd.actor_user_id)
+        return outcomes
+
+    def _check_confirmation_overlaps(self, decided: List[Tuple[DecisionOutcomeDTO, Booking, BookingStatus]]) -> None:
+        confirms = [(out, b) for out, b, _ in decided if b.status == BookingStatus.CONFIRMED]
+        if not confirms:
+            return
+        bounds: Dict[int, StayPeriod] = {}
+        for _, b in confirms:
+            cur = bounds.get(b.accommodation_id)
+            bounds[b.accommodation_id] = b.period if cur is None else StayPeriod(
+                min(cur.start_date, b.period.start_date), max(cur.end_date, b.period.end_date)
+            )
+        index = BookingIntervalIndex()
+        for existing in self._repo.find_overlaps_many(bounds, BLOCKING_STATUSES):
+            index.add(existing.accommodation_id, existing.id, existing.period)
+        # Даты, занятые во внешних календарях; отрицательный id — не пересечётся с id броней
+        for block_id, acc_id, period in self._repo.find_external_blocks_many(bounds):
+            index.add(acc_id, -block_id, period)
+        # Брони, которые этот же пакет снимает с CONFIRMED, даты уже не держат
+        for _, b, expected in decided:
+            if expected == BookingStatus.CONFIRMED and b.status != BookingStatus.CONFIRMED:
+                index.remove(b.accommodation_id, b.id)
+        for out, b in confirms:
+            if index.has_overlap(b.accommodation_id, b.period):
+                out.error = OVERLAP_ERROR
+            else:
+                index.add(b.accommodation_id, b.id, b.period)
+
+    @staticmethod
+    def _apply_domain(booking: Booking, action: str, actor: int, today: date, cancel_deadline_days: int) -> None:
+        if action == "confirm":
+            booking.confirm(actor_user_id=actor)
+        elif action == "reject":
+            booking.reject(actor_user_id=actor)
+        elif action == "cancel":
+            booking.cancel(actor_user_id=actor, today=today, cancel_deadline_days=cancel_deadline_days)
+        else:
+            raise ValueError(f"Unknown action: {action}")
@@ -3,6 +3,7 @@ from __future__ import annotations
 from src.shared.errors import ApplicationError
 from src.bookings.application.commands import CancelBookingCommand
 from src.bookings.application.mappers import to_dto
+from src.bookings.application.transitions import apply_status_transition
 from src.bookings.domain.dtos import BookingDTO
 from src.bookings.domain.repository_interfaces import IBookingRepository
 
@@ -12,16 +13,19 @@ class CancelBookingUseCase:
         self._repo = repo
 
     def execute(self, cmd: CancelBookingCommand) -> BookingDTO:
-        booking = self._repo.get_by_id(cmd.booking_id)
-        if not booking:
-            raise ApplicationError("Booking not found")
         try:
-            booking.cancel(
-                actor_user_id=cmd.actor_user_id,
-                today=cmd.today,
-                cancel_deadline_days=cmd.cancel_deadline_days,
+            saved = apply_status_transition(
+                self._repo,
+                cmd.booking_id,
+                cmd.actor_user_id,
+                lambda b: b.cancel(
+                    actor_user_id=cmd.actor_user_id,
+                    today=cmd.today,
+                    cancel_deadline_days=cmd.cancel_deadline_days,
+                ),
             )
-            saved = self._repo.update(booking)
             return to_dto(saved)
+        except ApplicationError:
+            raise
         except Exception as ex:
             raise ApplicationError(str(ex))
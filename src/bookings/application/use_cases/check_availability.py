@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from src.shared.errors import ApplicationError
+from src.bookings.application.queries import CheckAvailabilityQuery
+from src.bookings.domain.dtos import AvailabilityDTO
+from src.bookings.domain.repository_interfaces import IBookingRepository
+from src.bookings.domain.value_objects import StayPeriod
+
+
+class CheckAvailabilityUseCase:
+    def __init__(self, repo: IBookingRepository):
+        self._repo = repo
+
+    def execute(self, q: CheckAvailabilityQuery) -> AvailabilityDTO:
+        try:
+            period = StayPeriod(start_date=q.start_date, end_date=q.end_date)
+        except ValueError as ex:
+            raise ApplicationError(str(ex))
+        free = set(self._repo.find_available(q.accommodation_ids, period))
+        # Порядок битов — порядок id в запросе (дубликаты допустимы)
+        return AvailabilityDTO(
+            start_date=q.start_date,
+            end_date=q.end_date,
+            available_ids=[i for i in dict.fromkeys(q.accommodation_ids) if i in free],
+            bitmap="".join("1" if i in free else "0" for i in q.accommodation_ids),
+        )
@@ -3,8 +3,11 @@ from __future__ import annotations
 from src.shared.errors import ApplicationError
 from src.bookings.application.commands import ConfirmBookingCommand
 from src.bookings.application.mappers import to_dto
+from src.bookings.application.transitions import apply_status_transition
 from src.bookings.domain.dtos import BookingDTO
+from src.bookings.domain.entities import Booking
 from src.bookings.domain.repository_interfaces import IBookingRepository
+from src.bookings.domain.services import BLOCKING_STATUSES, OVERLAP_ERROR
 
 
 class ConfirmBookingUseCase:
@@ -12,12 +15,24 @@ class ConfirmBookingUseCase:
         self._repo = repo
 
     def execute(self, cmd: ConfirmBookingCommand) -> BookingDTO:
-        booking = self._repo.get_by_id(cmd.booking_id)
-        if not booking:
-            raise ApplicationError("Booking not found")
+        def ensure_dates_free(booking: Booking) -> None:
+            # Под блокировкой объявления: параллельное подтверждение пересекающейся заявки не проскочит
+            if self._repo.has_overlap(
+                    booking.accommodation_id, booking.period, BLOCKING_STATUSES, exclude_booking_id=booking.id
+            ):
+                raise ValueError(OVERLAP_ERROR)
+
         try:
-            booking.confirm(actor_user_id=cmd.actor_user_id)
-            saved = self._repo.update(booking)
+            saved = apply_status_transition(
+                self._repo,
+                cmd.booking_id,
+                cmd.actor_user_id,
+                lambda b: b.confirm(actor_user_id=cmd.actor_user_id),
+                guard=ensure_dates_free,
+                exclusive=True,
+            )
             return to_dto(saved)
+        except ApplicationError:
+            raise
         except Exception as ex:
             raise ApplicationError(str(ex))
@@ -5,7 +5,7 @@ from src.bookings.application.commands import CreateBookingCommand
 from src.bookings.application.mappers import to_dto
 from src.bookings.domain.dtos import BookingDTO
 from src.bookings.domain.repository_interfaces import IBookingRepository
-from src.bookings.domain.services import create_booking
+from src.bookings.domain.services import BLOCKING_STATUSES, OVERLAP_ERROR, create_booking
 from src.bookings.domain.value_objects import StayPeriod
 
 
@@ -16,15 +16,20 @@ class CreateBookingUseCase:
     def execute(self, cmd: CreateBookingCommand) -> BookingDTO:
         try:
             period = StayPeriod(start_date=cmd.start_date, end_date=cmd.end_date)
-            existing = self._repo.find_overlaps(cmd.accommodation_id, period)
-            entity = create_booking(
-                accommodation_id=cmd.accommodation_id,
-                guest_id=cmd.guest_id,
-                host_id=cmd.host_id,
-                period=period,
-                existing_for_acc=existing,
-            )
-            created = self._repo.create(entity)
+
+            def reserve():
+                # Проверка пересечений и вставка — под блокировкой объявления, иначе параллельные запросы проскочат
+                if self._repo.has_overlap(cmd.accommodation_id, period, BLOCKING_STATUSES):
+                    raise ValueError(OVERLAP_ERROR)
+                entity = create_booking(
+                    accommodation_id=cmd.accommodation_id,
+                    guest_id=cmd.guest_id,
+                    host_id=cmd.host_id,
+                    period=period,
+                )
+                return self._repo.create(entity)
+
+            created = self._repo.run_exclusive(cmd.accommodation_id, reserve)
             return to_dto(created)
         except ApplicationError:
             raise
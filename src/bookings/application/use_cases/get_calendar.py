@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from src.bookings.application.queries import GetCalendarQuery
+from src.bookings.domain.calendar import occupancy_string
+from src.bookings.domain.dtos import CalendarDTO
+from src.bookings.domain.repository_interfaces import IBookingRepository
+
+
+class GetCalendarUseCase:
+    def __init__(self, repo: IBookingRepository):
+        self._repo = repo
+
+    def execute(self, q: GetCalendarQuery) -> CalendarDTO:
+        masks = self._repo.get_occupancy_masks(q.accommodation_id, q.start_date, q.end_date)
+        return CalendarDTO(
+            accommodation_id=q.accommodation_id,
+            date_from=q.start_date,
+            date_to=q.end_date,
+            occupancy=occupancy_string(masks, q.start_date, q.end_date),
+        )
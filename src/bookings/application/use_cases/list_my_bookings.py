@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import List
+from datetime import datetime
 
 from src.bookings.application.mappers import to_dto
+from src.bookings.application.pagination import MAX_PAGE_LIMIT, decode_cursor, encode_cursor
 from src.bookings.application.queries import ListMyBookingsQuery
-from src.bookings.domain.dtos import BookingDTO
+from src.bookings.domain.dtos import BookingPageDTO
 from src.bookings.domain.repository_interfaces import IBookingRepository
 
 
@@ -12,6 +13,18 @@ class ListMyBookingsUseCase:
     def __init__(self, repo: IBookingRepository):
         self._repo = repo
 
-    def execute(self, q: ListMyBookingsQuery) -> List[BookingDTO]:
-        bookings = self._repo.list_by_guest(guest_id=q.guest_id, active_only=q.active_only)
-        return [to_dto(b) for b in bookings]
+    def execute(self, q: ListMyBookingsQuery) -> BookingPageDTO:
+        limit = max(1, min(q.limit, MAX_PAGE_LIMIT))
+        # limit + 1: лишняя строка говорит, есть ли следующая страница, без COUNT(*)
+        bookings = self._repo.list_by_guest(
+            guest_id=q.guest_id,
+            active_only=q.active_only,
+            statuses=q.statuses,
+            start_from=q.start_from,
+            start_to=q.start_to,
+            after=decode_cursor(q.cursor, datetime),
+            limit=limit + 1,
+        )
+        page, more = bookings[:limit], len(bookings) > limit
+        next_cursor = encode_cursor(page[-1].created_at, page[-1].id) if more else None
+        return BookingPageDTO(items=[to_dto(b) for b in page], next_cursor=next_cursor)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import List
+from datetime import date
 
 from src.bookings.application.mappers import to_dto
+from src.bookings.application.pagination import MAX_PAGE_LIMIT, decode_cursor, encode_cursor
 from src.bookings.application.queries import ListMyRequestsForHostQuery
-from src.bookings.domain.dtos import BookingDTO
+from src.bookings.domain.dtos import BookingPageDTO
 from src.bookings.domain.repository_interfaces import IBookingRepository
 
 
@@ -12,6 +13,16 @@ class ListMyRequestsForHostUseCase:
     def __init__(self, repo: IBookingRepository):
         self._repo = repo
 
-    def execute(self, q: ListMyRequestsForHostQuery) -> List[BookingDTO]:
-        bookings = self._repo.list_requests_for_host(host_id=q.host_id)
-        return [to_dto(b) for b in bookings]
+    def execute(self, q: ListMyRequestsForHostQuery) -> BookingPageDTO:
+        limit = max(1, min(q.limit, MAX_PAGE_LIMIT))
+        bookings = self._repo.list_requests_for_host(
+            host_id=q.host_id,
+            statuses=q.statuses,
+            start_from=q.start_from,
+            start_to=q.start_to,
+            after=decode_cursor(q.cursor, date),
+            limit=limit + 1,
+        )
+        page, more = bookings[:limit], len(bookings) > limit
+        next_cursor = encode_cursor(page[-1].period.start_date, page[-1].id) if more else None
+        return BookingPageDTO(items=[to_dto(b) for b in page], next_cursor=next_cursor)
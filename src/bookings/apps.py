@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class BookingsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'src.bookings'
+
+    def ready(self):
+        from src.bookings.infrastructure.maintenance import auto_transition_bookings
+        from src.common.infrastructure.scheduler import register_periodic
+
+        # Автозавершение прошедших броней и истечение заявок (см. auto_transition_bookings)
+        register_periodic("bookings.auto_transition", "10 * * * *", auto_transition_bookings)
@@ -0,0 +1,47 @@
+# Слой domain: помесячные битовые маски занятости (бит d-1 — день d месяца), чистые функции
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Dict, Iterator
+
+from .value_objects import StayPeriod
+
+MONTH_BITS = 31
+FULL_MONTH_MASK = (1 << MONTH_BITS) - 1
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def next_month(d: date) -> date:
+    return (d.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def iter_months(start: date, end_inclusive: date) -> Iterator[date]:
+    m = month_start(start)
+    while m <= end_inclusive:
+        yield m
+        m = next_month(m)
+
+
+def month_masks(period: StayPeriod) -> Dict[date, int]:
+    """Ночи [start_date, end_date) -> {первое число месяца: маска}. День выезда не занят."""
+    masks: Dict[date, int] = {}
+    last_night = period.end_date - timedelta(days=1)
+    for m in iter_months(period.start_date, last_night):
+        first = max(period.start_date, m)
+        last = min(last_night, next_month(m) - timedelta(days=1))
+        # Биты first.day-1 .. last.day-1 включительно
+        masks[m] = ((1 << last.day) - 1) ^ ((1 << (first.day - 1)) - 1)
+    return masks
+
+
+def occupancy_string(masks: Dict[date, int], start: date, end_inclusive: date) -> str:
+    """Строка из 0/1 по дням [start, end_inclusive]: 1 — ночь занята."""
+    out = []
+    d = start
+    while d <= end_inclusive:
+        out.append("1" if masks.get(month_start(d), 0) >> (d.day - 1) & 1 else "0")
+        d += timedelta(days=1)
+    return "".join(out)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
+from typing import List, Optional
 
 from .entities import BookingStatus
 
@@ -24,4 +25,36 @@ class CreateBookingDTO:
     guest_id: int
     host_id: int
     start_date: date
-    end_date: date
\ No newline at end of file
+    end_date: date
+
+@dataclass
+class AvailabilityDTO:
+    """Ответ на пакетную проверку: bitmap[i] == "1" — accommodation_ids[i] свободно на весь период."""
+    start_date: date
+    end_date: date
+    available_ids: List[int]
+    bitmap: str
+
+
+@dataclass
+class CalendarDTO:
+    """occupancy[i] == "1" — ночь date_from + i занята подтверждённой бронью."""
+    accommodation_id: int
+    date_from: date
+    date_to: date
+    occupancy: str
+
+
+@dataclass
+class DecisionOutcomeDTO:
+    booking_id: int
+    action: str
+    ok: bool
+    status: Optional[BookingStatus] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BookingPageDTO:
+    items: List[BookingDTO]
+    next_cursor: Optional[str] = None
@@ -16,6 +16,7 @@ class BookingStatus(Enum):
     REJECTED = "rejected"  # отклонено хостом
     CANCELLED = "cancelled"  # отменено гостем/хостом по правилам
     COMPLETED = "completed"  # завершено (по окончании проживания)
+    EXPIRED = "expired"  # заявка не рассмотрена хостом вовремя
 
 
 @dataclass
@@ -72,3 +73,10 @@ class Booking:
         """Помечает как завершённое, если период истёк."""
         if self.status == BookingStatus.CONFIRMED and today >= self.period.end_date:
             self.status = BookingStatus.COMPLETED
+
+    def expire_if_stale(self, today: date, requested_before: datetime) -> None:
+        """Заявка истекает, если хост не ответил до requested_before или заезд уже наступил."""
+        if self.status != BookingStatus.REQUESTED:
+            return
+        if today >= self.period.start_date or (self.created_at is not None and self.created_at < requested_before):
+            self.status = BookingStatus.EXPIRED
@@ -0,0 +1,142 @@
+# Слой domain: iCalendar (RFC 5545) — генерация ленты занятости и потоковый разбор внешних лент
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, Optional
+
+ICS_LINE_LIMIT = 75  # октетов на строку, дальше — folding
+
+
+class CalendarFormatError(ValueError):
+    """Поток не является iCalendar: нет обрамления BEGIN:VCALENDAR ... END:VCALENDAR."""
+
+
+@dataclass(frozen=True)
+class CalendarEvent:
+    """Занятый период: ночи [start, end). Для импорта uid — идентификатор события во внешней ленте."""
+    uid: str
+    start: date
+    end: date
+    summary: str = ""
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    raw = line.encode("utf-8")
+    if len(raw) <= ICS_LINE_LIMIT:
+        return line
+    parts, chunk = [], b""
+    for ch in line:
+        b = ch.encode("utf-8")
+        if len(chunk) + len(b) > (ICS_LINE_LIMIT if not parts else ICS_LINE_LIMIT - 1):
+            parts.append(chunk.decode("utf-8"))
+            chunk = b""
+        chunk += b
+    parts.append(chunk.decode("utf-8"))
+    return "\r\n ".join(parts)
+
+
+def render_ics(events: Iterable[CalendarEvent], *, prodid: str, calname: str, stamp: datetime) -> str:
+    """VCALENDAR с all-day VEVENT на каждый период (DTEND не включительно — как и end брони)."""
+    dtstamp = stamp.strftime("%Y%m%dT%H%M%SZ")
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{prodid}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(calname)}",
+    ]
+    for ev in events:
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{ev.uid}",
+            f"DTSTAMP:{dtstamp}",
+            f"DTSTART;VALUE=DATE:{ev.start:%Y%m%d}",
+            f"DTEND;VALUE=DATE:{ev.end:%Y%m%d}",
+            f"SUMMARY:{_escape(ev.summary)}",
+            "TRANSP:OPAQUE",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "".join(_fold(line) + "\r\n" for line in lines)
+
+
+def unfold_lines(raw_lines: Iterable[str]) -> Iterator[str]:
+    """Склеивает перенесённые строки (продолжение начинается с пробела/табуляции). Хранит в памяти одну строку."""
+    current: Optional[str] = None
+    for raw in raw_lines:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def _parse_date(value: str) -> date:
+    # DATE (20260301) или DATE-TIME (20260301T140000Z) — для занятости берём дату
+    return datetime.strptime(value.strip()[:8], "%Y%m%d").date()
+
+
+def _unescape(text: str) -> str:
+    return text.replace("\\n", "\n").replace("\\N", "\n").replace("\\,", ",").replace("\\;", ";").replace("\\\\", "\\")
+
+
+def iter_events(raw_lines: Iterable[str]) -> Iterator[CalendarEvent]:
+    """
+    Потоковый разбор: события отдаются по мере чтения, лента целиком в памяти не держится.
+    События без UID/DTSTART, с нераспознанными датами или отменённые (STATUS:CANCELLED) пропускаются;
+    без DTEND — одна ночь. Поток без BEGIN:VCALENDAR в начале или без END:VCALENDAR (обрезанный файл,
+    не календарь) — CalendarFormatError; ошибка в конце потока позволяет откатить уже прочитанное.
+    """
+    props: Optional[Dict[str, str]] = None
+    started = finished = False
+    for line in unfold_lines(raw_lines):
+        if not started:
+            if not line.strip():
+                continue
+            if line.lstrip("\ufeff").strip().upper() != "BEGIN:VCALENDAR":
+                raise CalendarFormatError("Invalid iCalendar file: expected BEGIN:VCALENDAR")
+            started = True
+            continue
+        name, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key = name.split(";", 1)[0].upper()
+        if key == "END" and value.strip().upper() == "VCALENDAR":
+            finished = True
+        elif key == "BEGIN" and value.strip().upper() == "VEVENT":
+            props = {}
+        elif key == "END" and value.strip().upper() == "VEVENT":
+            event = _to_event(props or {})
+            props = None
+            if event is not None:
+                yield event
+        elif props is not None and key not in props:
+            props[key] = value
+    if not finished:
+        raise CalendarFormatError("Invalid iCalendar file: missing END:VCALENDAR")
+
+
+def _to_event(props: Dict[str, str]) -> Optional[CalendarEvent]:
+    uid = props.get("UID", "").strip()
+    if not uid or "DTSTART" not in props or props.get("STATUS", "").strip().upper() == "CANCELLED":
+        return None
+    try:
+        start = _parse_date(props["DTSTART"])
+        end = _parse_date(props["DTEND"]) if "DTEND" in props else start + timedelta(days=1)
+    except ValueError:
+        return None
+    if end <= start:
+        return None
+    return CalendarEvent(uid=uid[:255], start=start, end=end, summary=_unescape(props.get("SUMMARY", ""))[:255])
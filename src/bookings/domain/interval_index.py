@@ -0,0 +1,83 @@
+# Слой domain: in-memory индекс интервалов броней по объявлениям (без зависимостей от Django)
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Tuple
+
+from .value_objects import StayPeriod
+
+
+class _ListingIntervals:
+    """
+    Интервалы одного объявления, отсортированные по началу (ordinal-дни [start, end)).
+    max_len — длина самого длинного интервала: всё, что началось не позже start - max_len,
+    закончилось до start, поэтому сканируем только окно (start - max_len, end) — O(log n + k).
+    Подтверждённые брони не пересекаются, но индекс корректен и для пересекающихся интервалов.
+    """
+
+    __slots__ = ("starts", "items", "by_id", "max_len")
+
+    def __init__(self):
+        self.starts: List[int] = []
+        self.items: List[Tuple[int, int, int]] = []  # (start, end, booking_id)
+        self.by_id: Dict[int, Tuple[int, int, int]] = {}
+        self.max_len = 0
+
+    def add(self, booking_id: int, start: int, end: int) -> None:
+        if booking_id in self.by_id:
+            self.remove(booking_id)
+        item = (start, end, booking_id)
+        pos = bisect_left(self.items, item)
+        self.items.insert(pos, item)
+        self.starts.insert(pos, start)
+        self.by_id[booking_id] = item
+        # max_len не уменьшаем при удалении — оценка остаётся верхней границей
+        self.max_len = max(self.max_len, end - start)
+
+    def remove(self, booking_id: int) -> bool:
+        item = self.by_id.pop(booking_id, None)
+        if item is None:
+            return False
+        pos = bisect_left(self.items, item)
+        del self.items[pos]
+        del self.starts[pos]
+        return True
+
+    def overlapping(self, start: int, end: int) -> Iterable[int]:
+        lo = bisect_right(self.starts, start - self.max_len)
+        hi = bisect_left(self.starts, end)
+        for s, e, booking_id in self.items[lo:hi]:
+            if e > start:
+                yield booking_id
+
+
+class BookingIntervalIndex:
+    """Индекс интервалов по объявлениям: вставка/удаление по id брони, запросы «пересекает ли период»."""
+
+    def __init__(self):
+        self._listings: Dict[int, _ListingIntervals] = {}
+
+    def __len__(self) -> int:
+        return sum(len(x.by_id) for x in self._listings.values())
+
+    def add(self, accommodation_id: int, booking_id: int, period: StayPeriod) -> None:
+        listing = self._listings.get(accommodation_id)
+        if listing is None:
+            listing = self._listings[accommodation_id] = _ListingIntervals()
+        listing.add(booking_id, period.start_date.toordinal(), period.end_date.toordinal())
+
+    def remove(self, accommodation_id: int, booking_id: int) -> bool:
+        listing = self._listings.get(accommodation_id)
+        return bool(listing and listing.remove(booking_id))
+
+    def overlapping(self, accommodation_id: int, period: StayPeriod) -> List[int]:
+        listing = self._listings.get(accommodation_id)
+        if listing is None:
+            return []
+        return list(listing.overlapping(period.start_date.toordinal(), period.end_date.toordinal()))
+
+    def has_overlap(self, accommodation_id: int, period: StayPeriod) -> bool:
+        listing = self._listings.get(accommodation_id)
+        if listing is None:
+            return False
+        return next(iter(listing.overlapping(period.start_date.toordinal(), period.end_date.toordinal())), None) is not None
@@ -1,23 +1,128 @@
 # Слой domain: контракты репозиториев, абстрактные интерфейсы репозиториев (protocols/ABC)
 from __future__ import annotations
 
-from typing import Optional, Protocol, runtime_checkable, Iterable, Tuple
-from datetime import date
+from enum import Enum, unique
+from typing import Callable, Dict, Optional, Protocol, runtime_checkable, Iterable, Tuple, TypeVar, Union
+from datetime import date, datetime
 
-from .entities import Booking
+from .entities import Booking, BookingStatus
 from .value_objects import StayPeriod
 
+T = TypeVar("T")
+
+
+@unique
+class BookingDueField(str, Enum):
+    """Поле брони, по которому отбираются «наступившие» строки при обслуживании (lock_next_batch)."""
+    CREATED_AT = "created_at"
+    START_DATE = "start_date"
+    END_DATE = "end_date"
+
 
 @runtime_checkable
 class IBookingRepository(Protocol):
     """Контракт хранилища бронирований."""
     def get_by_id(self, booking_id: int) -> Optional[Booking]: ...
+    def get_many(self, booking_ids: Iterable[int], for_update: bool = False) -> list[Booking]:
+        """Брони по id одним запросом (for_update — SELECT ... FOR UPDATE, только внутри транзакции)."""
+        ...
     def create(self, booking: Booking) -> Booking: ...
     def update(self, booking: Booking) -> Booking: ...
-    def list_by_guest(self, guest_id: int, active_only: bool = False) -> list[Booking]: ...
-    def list_requests_for_host(self, host_id: int) -> list[Booking]: ...
+    def apply_transition(
+        self,
+        booking: Booking,
+        expected_status: BookingStatus,
+        *,
+        host_id: Optional[int] = None,
+        guest_id: Optional[int] = None,
+    ) -> bool:
+        """
+        Условный переход одним UPDATE: status = booking.status WHERE id AND status = expected_status
+        (и host_id/guest_id, если заданы). False — строка не совпала (бронь изменили/удалили параллельно).
+        """
+        ...
+    def apply_transition_many(
+        self, bookings: list[Booking], expected_status: BookingStatus, *, host_id: Optional[int] = None
+    ) -> int:
+        """Set-based вариант apply_transition: один UPDATE на каждый целевой статус. Возвращает число строк."""
+        ...
+    def lock_next_batch(
+        self,
+        status: BookingStatus,
+        field: BookingDueField,
+        cutoff: Union[date, datetime],
+        after: Optional[Tuple[Union[date, datetime], int]],
+        limit: int,
+    ) -> list[Booking]:
+        """
+        До limit броней в status с field < cutoff по возрастанию (field, id) после keyset-курсора after,
+        под SELECT ... FOR UPDATE SKIP LOCKED: строки, заблокированные другими транзакциями, пропускаются.
+        Вызывать внутри транзакции.
+        """
+        ...
+    def list_by_guest(
+        self,
+        guest_id: int,
+        active_only: bool = False,
+        *,
+        statuses: Iterable[BookingStatus] = (),
+        start_from: Optional[date] = None,
+        start_to: Optional[date] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None,
+    ) -> list[Booking]:
+        """Брони гостя по убыванию (created_at, id); after — keyset-курсор последней выданной строки."""
+        ...
+    def list_requests_for_host(
+        self,
+        host_id: int,
+        *,
+        statuses: Iterable[BookingStatus] = (BookingStatus.REQUESTED,),
+        start_from: Optional[date] = None,
+        start_to: Optional[date] = None,
+        after: Optional[Tuple[date, int]] = None,
+        limit: Optional[int] = None,
+    ) -> list[Booking]:
+        """Брони хоста по возрастанию (start_date, id); after — keyset-курсор последней выданной строки."""
+        ...
     def list_for_accommodation_confirmed(self, accommodation_id: int) -> list[Booking]: ...
     def find_overlaps(
-        self, accommodation_id: int, period: StayPeriod, exclude_booking_id: Optional[int] = None
+        self,
+        accommodation_id: int,
+        period: StayPeriod,
+        exclude_booking_id: Optional[int] = None,
+        statuses: Optional[Iterable[BookingStatus]] = None,
     ) -> list[Booking]: ...
-    def list_in_period_for_guest(self, guest_id: int, start: date, end: date) -> list[Booking]: ...
\ No newline at end of file
+    def find_overlaps_many(
+        self, periods: Dict[int, StayPeriod], statuses: Iterable[BookingStatus]
+    ) -> list[Booking]:
+        """Брони в statuses, пересекающие period своего объявления ({accommodation_id: period}), одним запросом."""
+        ...
+    def find_external_blocks_many(self, periods: Dict[int, StayPeriod]) -> list[Tuple[int, int, StayPeriod]]:
+        """Блоки внешних календарей (id, accommodation_id, период), пересекающие period своего объявления."""
+        ...
+    def has_overlap(
+        self,
+        accommodation_id: int,
+        period: StayPeriod,
+        statuses: Iterable[BookingStatus],
+        exclude_booking_id: Optional[int] = None,
+    ) -> bool:
+        """Есть ли бронь в statuses, пересекающая period (проверка без загрузки строк)."""
+        ...
+    def find_available(self, accommodation_ids: Iterable[int], period: StayPeriod) -> list[int]:
+        """Активные объявления из набора, свободные на весь period (одним запросом)."""
+        ...
+    def get_occupancy_masks(self, accommodation_id: int, start: date, end_inclusive: date) -> dict[date, int]:
+        """Помесячные маски занятости {первое число месяца: bits}, покрывающие [start, end_inclusive]."""
+        ...
+    def list_in_period_for_guest(self, guest_id: int, start: date, end: date) -> list[Booking]: ...
+    def run_exclusive(self, accommodation_id: int, fn: Callable[[], T]) -> T:
+        """
+        Выполняет fn в транзакции под эксклюзивной блокировкой объявления
+        (проверка пересечений + запись атомарны относительно других броней этого объявления).
+        """
+        ...
+    def run_exclusive_many(self, accommodation_ids: Iterable[int], fn: Callable[[], T]) -> T:
+        """То же для набора объявлений (блокировки берутся в порядке id)."""
+        ...
@@ -10,19 +10,24 @@ from .value_objects import StayPeriod
 
 DEFAULT_CANCEL_DEADLINE_DAYS = 1  # гость может отменить не позднее чем за 1 день до начала
 
+# Статусы, занимающие даты объявления (REQUESTED-заявки могут пересекаться между собой)
+BLOCKING_STATUSES = frozenset({BookingStatus.CONFIRMED})
+OVERLAP_ERROR = "Booking overlaps with an existing confirmed booking"
+CONCURRENT_CHANGE_ERROR = "Booking was modified concurrently, retry the request"
+
 
 def ensure_no_overlaps(existing: Iterable[Booking], new_period: StayPeriod) -> None:
     """
-    Проверка пересечений: запрещаем пересечения с CONFIRMED.
-    Для простоты: блочим пересечения с CONFIRMED.
+    Проверка пересечений: запрещаем пересечения с броней в BLOCKING_STATUSES.
+    В сценариях с БД вместо неё используется IBookingRepository.has_overlap (EXISTS в SQL).
     """
     for b in existing:
-        if b.status == BookingStatus.CONFIRMED and b.period.overlaps(new_period):
-            raise ValueError("Booking overlaps with an existing confirmed booking")
+        if b.status in BLOCKING_STATUSES and b.period.overlaps(new_period):
+            raise ValueError(OVERLAP_ERROR)
 
 
 def create_booking(
-    *, accommodation_id: int, guest_id: int, host_id: int, period: StayPeriod, existing_for_acc: Iterable[Booking]
+    *, accommodation_id: int, guest_id: int, host_id: int, period: StayPeriod, existing_for_acc: Iterable[Booking] = ()
 ) -> Booking:
     """Фабрика бронирования с проверкой пересечений и начальными инвариантами."""
     ensure_no_overlaps(existing_for_acc, period)
@@ -0,0 +1,82 @@
+# Слой infrastructure: хранение помесячных масок занятости (booking_month_occupancy)
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional
+
+from django.db import transaction
+from django.db.models import F
+
+from src.bookings.domain.calendar import FULL_MONTH_MASK, month_masks, month_start
+from src.bookings.domain.value_objects import StayPeriod
+from src.bookings.infrastructure.orm.models import (
+    AccommodationMonthOccupancy,
+    Booking as BookingORM,
+    ExternalCalendarBlock,
+)
+
+
+def mark_period(accommodation_id: int, period: StayPeriod, occupied: bool) -> None:
+    """
+    Ставит/снимает биты ночей периода. Каждое изменение — атомарный UPDATE bits = bits | mask
+    (или bits & ~mask), так что параллельные изменения разных дат одного месяца не теряются.
+    """
+    masks = month_masks(period)
+    with transaction.atomic():
+        if occupied:
+            AccommodationMonthOccupancy.objects.bulk_create(
+                [AccommodationMonthOccupancy(accommodation_id=accommodation_id, month=m, bits=0) for m in masks],
+                ignore_conflicts=True,
+            )
+        for m, mask in masks.items():
+            qs = AccommodationMonthOccupancy.objects.filter(accommodation_id=accommodation_id, month=m)
+            if occupied:
+                qs.update(bits=F("bits").bitor(mask))
+            else:
+                qs.update(bits=F("bits").bitand(FULL_MONTH_MASK ^ mask))
+
+
+def read_month_masks(accommodation_id: int, start: date, end_inclusive: date) -> Dict[date, int]:
+    """
+    Маски броней из booking_month_occupancy плюс блоки внешних календарей. Блоки накладываются при чтении,
+    а не хранятся в битах: повторный импорт ленты иначе не смог бы снять свои биты, не задев биты броней.
+    """
+    first = month_start(start)
+    masks: Dict[date, int] = dict(
+        AccommodationMonthOccupancy.objects.filter(
+            accommodation_id=accommodation_id, month__gte=first, month__lte=end_inclusive
+        ).values_list("month", "bits")
+    )
+    blocks = ExternalCalendarBlock.objects.filter(
+        accommodation_id=accommodation_id, start_date__lte=end_inclusive, end_date__gt=first
+    ).values_list("start_date", "end_date")
+    for block_start, block_end in blocks:
+        period = StayPeriod(max(block_start, first), min(block_end, end_inclusive + timedelta(days=1)))
+        for m, mask in month_masks(period).items():
+            masks[m] = masks.get(m, 0) | mask
+    return masks
+
+
+def rebuild_calendar(accommodation_ids: Optional[Iterable[int]] = None) -> int:
+    """Полный пересчёт масок из CONFIRMED/COMPLETED броней (бэкфилл и сверка). Возвращает число строк."""
+    bookings = BookingORM.objects.filter(
+        status__in=[BookingORM.Status.CONFIRMED, BookingORM.Status.COMPLETED]
+    )
+    rows = AccommodationMonthOccupancy.objects.all()
+    if accommodation_ids is not None:
+        ids = list(accommodation_ids)
+        bookings = bookings.filter(accommodation_id__in=ids)
+        rows = rows.filter(accommodation_id__in=ids)
+
+    acc: Dict[tuple, int] = {}
+    for acc_id, start, end in bookings.values_list("accommodation_id", "start_date", "end_date").iterator():
+        for m, mask in month_masks(StayPeriod(start, end)).items():
+            acc[(acc_id, m)] = acc.get((acc_id, m), 0) | mask
+
+    with transaction.atomic():
+        rows.delete()
+        AccommodationMonthOccupancy.objects.bulk_create(
+            [AccommodationMonthOccupancy(accommodation_id=a, month=m, bits=b) for (a, m), b in acc.items()],
+            batch_size=1000,
+        )
+    return len(acc)
@@ -0,0 +1,149 @@
+# Слой infrastructure: iCal-лента занятости (версионированный снимок + ETag) и импорт внешних лент
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from src.accommodations.infrastructure.orm.models import Accommodation as AccommodationORM
+from src.bookings.domain.ical import CalendarEvent, iter_events, render_ics
+from src.bookings.infrastructure.orm.models import (
+    AccommodationCalendarFeed,
+    Booking as BookingORM,
+    ExternalCalendarBlock,
+)
+
+ICS_PRODID = "-//ICHBooking//Booking calendar//EN"
+ICS_CONTENT_TYPE = "text/calendar; charset=utf-8"
+FEED_STATUSES = (BookingORM.Status.CONFIRMED, BookingORM.Status.COMPLETED)
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+
+def bump_calendar_versions(accommodation_ids: Iterable[int]) -> None:
+    """+1 к версии календаря (в транзакции смены статуса). Нет строки — нет и снимка, инвалидировать нечего."""
+    ids = set(accommodation_ids)
+    if ids:
+        AccommodationCalendarFeed.objects.filter(pk__in=ids).update(version=F("version") + 1)
+
+
+def get_feed(accommodation_id: int) -> Optional[AccommodationCalendarFeed]:
+    """Строка ленты (создаётся при первом обращении). None — объявления нет. Обычно — один SELECT."""
+    feed = AccommodationCalendarFeed.objects.filter(pk=accommodation_id).first()
+    if feed is not None:
+        return feed
+    if not AccommodationORM.objects.filter(pk=accommodation_id).exists():
+        return None
+    AccommodationCalendarFeed.objects.bulk_create(
+        [AccommodationCalendarFeed(pk=accommodation_id)], ignore_conflicts=True
+    )
+    return AccommodationCalendarFeed.objects.get(pk=accommodation_id)
+
+
+def feed_etag(feed: AccommodationCalendarFeed, today: Optional[date] = None) -> str:
+    # День — часть версии: окно ленты сдвигается ежедневно
+    today = today or timezone.localdate()
+    return f'"{feed.accommodation_id}-{feed.version}-{today:%Y%m%d}"'
+
+
+def feed_body(feed: AccommodationCalendarFeed, today: Optional[date] = None) -> str:
+    """
+    Снимок .ics для текущей версии. Пересборка — только если снимок устарел; сохраняем его условным UPDATE
+    по version, чтобы не затереть более новую версию, поднятую параллельной сменой статуса.
+    """
+    today = today or timezone.localdate()
+    if feed.snapshot_version == feed.version and feed.snapshot_day == today:
+        return feed.snapshot
+    since = today - timedelta(days=settings.ICAL_EXPORT_PAST_DAYS)
+    rows = (
+        BookingORM.objects.filter(
+            accommodation_id=feed.accommodation_id, status__in=FEED_STATUSES, end_date__gt=since
+        )
+        .order_by("start_date", "id")
+        .values_list("id", "start_date", "end_date")
+    )
+    body = render_ics(
+        (CalendarEvent(uid=f"booking-{pk}@ichbooking", start=s, end=e, summary="Reserved") for pk, s, e in rows),
+        prodid=ICS_PRODID,
+        calname=f"Accommodation {feed.accommodation_id}",
+        stamp=timezone.now(),  # UTC при USE_TZ
+    )
+    AccommodationCalendarFeed.objects.filter(pk=feed.accommodation_id, version=feed.version).update(
+        snapshot=body, snapshot_version=feed.version, snapshot_day=today
+    )
+    return body
+
+
+def _flush(to_create: List[ExternalCalendarBlock], to_update: List[ExternalCalendarBlock]) -> None:
+    if to_create:
+        ExternalCalendarBlock.objects.bulk_create(to_create)
+        to_create.clear()
+    if to_update:
+        ExternalCalendarBlock.objects.bulk_update(to_update, ["start_date", "end_date", "summary", "updated_at"])
+        to_update.clear()
+
+
+def import_external_calendar(
+        accommodation_id: int,
+        raw_lines: Iterable[str],
+        *,
+        source: str = "default",
+        batch_size: Optional[int] = None,
+) -> ImportResult:
+    """
+    Синхронизирует блоки одной внешней ленты с её текущим содержимым.
+    Лента читается потоково; в памяти — только (uid → период) уже импортированных блоков и множество
+    увиденных uid. Записываются лишь различия: новые — bulk_create, изменённые — bulk_update (порциями),
+    исчезнувшие из ленты — удаляются. Всё в одной транзакции: читатели видят либо старую, либо новую ленту.
+    """
+    batch_size = batch_size or settings.ICAL_IMPORT_BATCH_SIZE
+    result = ImportResult()
+    now = timezone.now()
+    with transaction.atomic():
+        existing: Dict[str, Tuple[int, date, date, str]] = {
+            uid: (pk, s, e, summary)
+            for pk, uid, s, e, summary in ExternalCalendarBlock.objects.filter(
+                accommodation_id=accommodation_id, source=source
+            ).values_list("id", "uid", "start_date", "end_date", "summary").iterator()
+        }
+        seen: Set[str] = set()
+        to_create: List[ExternalCalendarBlock] = []
+        to_update: List[ExternalCalendarBlock] = []
+        for ev in iter_events(raw_lines):
+            if ev.uid in seen:
+                continue  # повтор UID в ленте — учитываем первое вхождение
+            seen.add(ev.uid)
+            cur = existing.get(ev.uid)
+            if cur is None:
+                to_create.append(ExternalCalendarBlock(
+                    accommodation_id=accommodation_id, source=source, uid=ev.uid,
+                    start_date=ev.start, end_date=ev.end, summary=ev.summary,
+                ))
+                result.created += 1
+            elif cur[1:] != (ev.start, ev.end, ev.summary):
+                to_update.append(ExternalCalendarBlock(
+                    pk=cur[0], start_date=ev.start, end_date=ev.end, summary=ev.summary, updated_at=now,
+                ))
+                result.updated += 1
+            else:
+                result.unchanged += 1
+            if len(to_create) + len(to_update) >= batch_size:
+                _flush(to_create, to_update)
+        _flush(to_create, to_update)
+
+        stale = [pk for uid, (pk, *_rest) in existing.items() if uid not in seen]
+        for i in range(0, len(stale), batch_size):
+            deleted, _ = ExternalCalendarBlock.objects.filter(pk__in=stale[i:i + batch_size]).delete()
+            result.deleted += deleted
+    return result
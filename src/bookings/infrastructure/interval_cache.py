@@ -0,0 +1,207 @@
+# Слой infrastructure: процесс-локальный индекс CONFIRMED-броней для проверок доступности без БД.
+# Читает его только DjangoBookingRepository.find_available (поиск свободных объявлений); has_overlap
+# при создании/подтверждении брони, календарь и выдача поиска по-прежнему проверяют занятость в SQL.
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Iterable, Optional, Set
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections
+from django.utils import timezone
+
+from src.bookings.domain.interval_index import BookingIntervalIndex
+from src.bookings.domain.value_objects import StayPeriod
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+
+logger = logging.getLogger(__name__)
+
+# Запас на рассинхрон часов/длинные транзакции при инкрементальной подгрузке изменений
+_REFRESH_SKEW = timedelta(seconds=5)
+
+
+class ConfirmedBookingsCache:
+    """
+    Индекс подтверждённых броней с end_date >= даты прогрева.
+    - warm(): строит индекс заново и атомарно подменяет им текущий;
+    - apply(): синхронизация по переходам статусов этого процесса (после коммита);
+    - изменения из других процессов подтягиваются инкрементально по updated_at раз в refresh_seconds;
+      удаления по updated_at не видны, поэтому после дельты число записей индекса сверяется с БД
+      (один COUNT) и при расхождении индекс перестраивается целиком.
+    Пока индекс не прогрет (или период раньше горизонта) — методы возвращают None, вызывающий идёт в БД.
+    Прогрев ленивый: первое чтение холодного индекса один раз вызывает on_cold (фоновый warm()).
+    """
+
+    def __init__(
+            self,
+            *,
+            refresh_seconds: float,
+            clock: Callable[[], float] = time.monotonic,
+            on_cold: Optional[Callable[[], None]] = None,
+    ):
+        self._refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._on_cold = on_cold
+        self._warmup_requested = False
+        self._lock = threading.RLock()
+        self._index: Optional[BookingIntervalIndex] = None
+        self._horizon: Optional[date] = None
+        self._synced_at: Optional[datetime] = None
+        self._refreshed_mono = 0.0
+
+    @property
+    def is_warm(self) -> bool:
+        return self._index is not None
+
+    def warm(self) -> int:
+        n = self._rebuild()
+        # Переходы, закоммиченные во время построения, догоняем сразу
+        self.refresh(force=True)
+        return n
+
+    def _rebuild(self) -> int:
+        synced_at = timezone.now()
+        horizon = timezone.localdate()
+        index = BookingIntervalIndex()
+        rows = _indexed_rows(horizon).values_list("id", "accommodation_id", "start_date", "end_date")
+        for booking_id, acc_id, start, end in rows.iterator(chunk_size=5000):
+            index.add(acc_id, booking_id, StayPeriod(start, end))
+        with self._lock:
+            self._index, self._horizon, self._synced_at = index, horizon, synced_at
+            self._refreshed_mono = self._clock()
+        return len(index)
+
+    def apply(self, *, booking_id: int, accommodation_id: int, start: date, end: date, status: str) -> None:
+        with self._lock:
+            if self._index is None:
+                return
+            # Брони, закончившиеся до горизонта, не храним — так размер индекса сравним с COUNT в БД
+            if status == BookingORM.Status.CONFIRMED and end >= self._horizon:
+                self._index.add(accommodation_id, booking_id, StayPeriod(start, end))
+            else:
+                self._index.remove(accommodation_id, booking_id)
+
+    def refresh(self, force: bool = False) -> None:
+        if self._index is None:
+            return
+        if not force and self._clock() - self._refreshed_mono < self._refresh_seconds:
+            return
+        with self._lock:
+            since = self._synced_at - _REFRESH_SKEW
+            synced_at = timezone.now()
+            rows = BookingORM.objects.filter(updated_at__gte=since).values_list(
+                "id", "accommodation_id", "start_date", "end_date", "status"
+            )
+            for booking_id, acc_id, start, end, status in rows:
+                self.apply(booking_id=booking_id, accommodation_id=acc_id, start=start, end=end, status=status)
+            if _indexed_rows(self._horizon).count() != len(self._index):
+                # Удалённые брони (в т. ч. каскадом вместе с объявлением) дельта по updated_at не видит
+                logger.info("booking interval index out of sync with database, rebuilding")
+                self._rebuild()
+                return
+            self._synced_at = synced_at
+            self._refreshed_mono = self._clock()
+
+    def has_overlap(self, accommodation_id: int, period: StayPeriod) -> Optional[bool]:
+        if not self._covers(period):
+            return None
+        with self._lock:
+            return self._index.has_overlap(accommodation_id, period)
+
+    def free_ids(self, accommodation_ids: Iterable[int], period: StayPeriod) -> Optional[Set[int]]:
+        if not self._covers(period):
+            return None
+        with self._lock:
+            return {i for i in accommodation_ids if not self._index.has_overlap(i, period)}
+
+    def warmup_failed(self) -> None:
+        """Прогрев не удался — следующее чтение холодного индекса запросит его снова."""
+        with self._lock:
+            self._warmup_requested = False
+
+    def _request_warmup(self) -> None:
+        with self._lock:
+            if self._warmup_requested or self._on_cold is None:
+                return
+            self._warmup_requested = True
+        self._on_cold()
+
+    def _covers(self, period: StayPeriod) -> bool:
+        if self._index is None:
+            self._request_warmup()
+            return False
+        try:
+            self.refresh()
+        except DatabaseError:
+            logger.warning("booking interval index refresh failed", exc_info=True)
+            return False
+        # Брони, закончившиеся до горизонта, не загружены — более ранние периоды проверяем в БД
+        return period.start_date >= self._horizon
+
+
+def _indexed_rows(horizon: date):
+    return BookingORM.objects.filter(status=BookingORM.Status.CONFIRMED, end_date__gte=horizon)
+
+
+_cache: Optional[ConfirmedBookingsCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_confirmed_bookings_cache() -> Optional[ConfirmedBookingsCache]:
+    """Процесс-локальный индекс (None — отключён: BOOKING_INTERVAL_INDEX_ENABLED = False)."""
+    global _cache
+    if not settings.BOOKING_INTERVAL_INDEX_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ConfirmedBookingsCache(
+                    refresh_seconds=settings.BOOKING_INTERVAL_INDEX_REFRESH_SECONDS,
+                    on_cold=lambda: start_background_warmup(),
+                )
+    return _cache
+
+
+def reset_confirmed_bookings_cache() -> None:
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+def warm_confirmed_bookings_cache() -> None:
+    """Прогрев индекса; при ошибке индекс остаётся холодным — работаем через БД, прогрев повторится позже."""
+    cache = get_confirmed_bookings_cache()
+    if cache is None:
+        return
+    try:
+        n = cache.warm()
+        logger.info("booking interval index warmed: %s confirmed bookings", n)
+    except DatabaseError:
+        logger.warning("booking interval index warm-up failed", exc_info=True)
+        cache.warmup_failed()
+    finally:
+        close_old_connections()
+
+
+def start_background_warmup() -> None:
+    """
+    Фоновый прогрев. Запускается лениво при первом чтении индекса, а не из AppConfig.ready():
+    иначе поток читал бы БД в каждой management-команде (migrate, test, shell), в том числе до миграций.
+    """
+    if settings.BOOKING_INTERVAL_INDEX_ENABLED:
+        threading.Thread(target=warm_confirmed_bookings_cache, name="booking-interval-index", daemon=True).start()
+
+
+def sync_booking_status(obj: BookingORM) -> None:
+    cache = get_confirmed_bookings_cache()
+    if cache is not None:
+        cache.apply(
+            booking_id=obj.id,
+            accommodation_id=obj.accommodation_id,
+            start=obj.start_date,
+            end=obj.end_date,
+            status=obj.status,
+        )
@@ -0,0 +1,147 @@
+# Слой infrastructure: периодическое автозавершение прошедших броней и истечение старых заявок порциями
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from src.bookings.domain.entities import Booking as BookingDomain, BookingStatus
+from src.bookings.domain.repository_interfaces import BookingDueField
+from src.bookings.infrastructure.repositories import DjangoBookingRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MaintenanceResult:
+    batches: int = 0
+    scanned: int = 0
+    completed: int = 0
+    expired: int = 0
+    elapsed_ms: float = 0.0
+    max_batch_ms: float = 0.0  # самая долгая транзакция — ориентир, сколько держались блокировки
+    batch_ms: List[float] = field(default_factory=list)
+
+
+def _due_key(booking: BookingDomain, due: BookingDueField) -> date | datetime:
+    if due == BookingDueField.CREATED_AT:
+        return booking.created_at
+    return booking.period.start_date if due == BookingDueField.START_DATE else booking.period.end_date
+
+
+def _run_chunks(
+        *,
+        expected: BookingStatus,
+        due: BookingDueField,
+        cutoff: date | datetime,
+        decide: Callable[[BookingDomain], None],
+        result: MaintenanceResult,
+        batch_size: int,
+        sleep_seconds: float,
+        max_batches: Optional[int],
+) -> None:
+    """
+    Keyset-проход по (due, id) среди броней в статусе expected с due < cutoff — индекс (status, due).
+    Каждая порция — отдельная короткая транзакция: SELECT ... FOR UPDATE SKIP LOCKED
+    (строки, которые сейчас меняют пользователи, пропускаем до следующего запуска) + set-based UPDATE.
+    Закоммиченная порция — чекпоинт: обработанные строки покидают статус, повторный запуск продолжает с остатка.
+    """
+    repo = DjangoBookingRepository()
+    cursor = None
+    while max_batches is None or result.batches < max_batches:
+        t0 = time.perf_counter()
+        with transaction.atomic():
+            rows = repo.lock_next_batch(expected, due, cutoff, cursor, batch_size)
+            if not rows:
+                break
+            cursor = (_due_key(rows[-1], due), rows[-1].id)
+            changed = []
+            for booking in rows:
+                decide(booking)
+                if booking.status != expected:
+                    changed.append(booking)
+            if changed:
+                repo.apply_transition_many(changed, expected)
+        ms = (time.perf_counter() - t0) * 1000
+        result.batches += 1
+        result.scanned += len(rows)
+        result.batch_ms.append(ms)
+        result.max_batch_ms = max(result.max_batch_ms, ms)
+        for b in changed:
+            if b.status == BookingStatus.COMPLETED:
+                result.completed += 1
+            elif b.status == BookingStatus.EXPIRED:
+                result.expired += 1
+        logger.info(
+            "bookings maintenance: %s by %s batch=%s scanned=%s changed=%s %.1fms",
+            expected.value, due.value, result.batches, len(rows), len(changed), ms,
+        )
+        if len(rows) < batch_size:
+            break
+        if sleep_seconds:
+            time.sleep(sleep_seconds)
+
+
+def auto_transition_bookings(
+        *,
+        today: Optional[date] = None,
+        now: Optional[datetime] = None,
+        expire_after_days: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        sleep_seconds: Optional[float] = None,
+        max_batches: Optional[int] = None,
+) -> MaintenanceResult:
+    """
+    CONFIRMED с end_date <= today -> COMPLETED; REQUESTED старше expire_after_days
+    (или с наступившей датой заезда) -> EXPIRED. Какие переходы допустимы, решают доменные методы.
+    """
+    now = now or timezone.now()
+    today = today or timezone.localdate()
+    expire_after_days = settings.BOOKING_REQUEST_EXPIRE_DAYS if expire_after_days is None else expire_after_days
+    batch_size = batch_size or settings.BOOKING_MAINTENANCE_BATCH_SIZE
+    sleep_seconds = settings.BOOKING_MAINTENANCE_SLEEP_SECONDS if sleep_seconds is None else sleep_seconds
+    requested_before = now - timedelta(days=expire_after_days)
+
+    result = MaintenanceResult()
+    t0 = time.perf_counter()
+    tomorrow = today + timedelta(days=1)
+    _run_chunks(
+        expected=BookingStatus.CONFIRMED,
+        due=BookingDueField.END_DATE,
+        cutoff=tomorrow,  # end_date <= today
+        decide=lambda b: b.complete_if_finished(today),
+        result=result,
+        batch_size=batch_size,
+        sleep_seconds=sleep_seconds,
+        max_batches=max_batches,
+    )
+    # Заявка истекает, если она старая ИЛИ наступил заезд: два прохода вместо OR-условия,
+    # каждый идёт по своему индексу (status, created_at) / (status, start_date)
+    _run_chunks(
+        expected=BookingStatus.REQUESTED,
+        due=BookingDueField.CREATED_AT,
+        cutoff=requested_before,
+        decide=lambda b: b.expire_if_stale(today, requested_before),
+        result=result,
+        batch_size=batch_size,
+        sleep_seconds=sleep_seconds,
+        max_batches=max_batches,
+    )
+    _run_chunks(
+        expected=BookingStatus.REQUESTED,
+        due=BookingDueField.START_DATE,
+        cutoff=tomorrow,  # start_date <= today
+        decide=lambda b: b.expire_if_stale(today, requested_before),
+        result=result,
+        batch_size=batch_size,
+        sleep_seconds=sleep_seconds,
+        max_batches=max_batches,
+    )
+    result.elapsed_ms = (time.perf_counter() - t0) * 1000
+    return result
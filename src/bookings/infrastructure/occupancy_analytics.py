@@ -0,0 +1,173 @@
+# Слой infrastructure: аналитика загрузки (occupancy) на NumPy-матрицах «объявления × дни»
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from django.db.models import Q
+from django.utils import timezone
+
+from src.accommodations.infrastructure.orm.models import Accommodation as AccommodationORM
+from src.bookings.application.queries import OCCUPANCY_GROUP_BY_CHOICES
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+
+DEFAULT_CHUNK_SIZE = 500
+OCCUPYING_STATUSES = (BookingORM.Status.CONFIRMED, BookingORM.Status.COMPLETED)
+
+GroupKey = Tuple[Optional[int], Optional[str], Optional[str]]  # (accommodation_id, city, "YYYY-MM")
+
+
+@dataclass
+class _Totals:
+    occupied_nights: int = 0
+    available_nights: int = 0
+    stays: int = 0
+    stay_nights: int = 0
+    lead_days: int = 0
+
+
+def _month_columns(start: date, days: int) -> Tuple[np.ndarray, List[str]]:
+    """Индексы первых дней месяцев в диапазоне (для np.add.reduceat) и подписи месяцев."""
+    offsets, labels = [], []
+    for i in range(days):
+        d = start + timedelta(days=i)
+        if i == 0 or d.day == 1:
+            offsets.append(i)
+            labels.append(f"{d:%Y-%m}")
+    return np.asarray(offsets, dtype=np.int64), labels
+
+
+def _iter_listing_chunks(end_excl: date, chunk_size: int) -> Iterator[List[Tuple[int, str, datetime]]]:
+    """Активные объявления, созданные до конца диапазона, порциями по id."""
+    qs = AccommodationORM.objects.filter(is_active=True, created_at__lt=_local_midnight(end_excl)).order_by("id")
+    last_id = 0
+    while True:
+        chunk = list(qs.filter(id__gt=last_id).values_list("id", "city", "created_at")[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1][0]
+
+
+def _sort_key(item: Tuple[GroupKey, _Totals]) -> Tuple[int, str, str]:
+    acc_id, city, month = item[0]
+    return acc_id or 0, city or "", month or ""
+
+
+def _local_midnight(d: date) -> datetime:
+    return timezone.make_aware(datetime.combine(d, time.min), timezone.get_current_timezone())
+
+
+def occupancy_matrix(
+        rows: np.ndarray, starts: np.ndarray, ends: np.ndarray, n_listings: int, n_days: int
+) -> np.ndarray:
+    """
+    Векторное заполнение диапазонов: +1 в день заезда, -1 в день выезда, cumsum по дням.
+    rows/starts/ends — индексы строк и дней (уже обрезанные до [0, n_days]). Результат — bool (n_listings × n_days).
+    """
+    diff = np.zeros((n_listings, n_days + 1), dtype=np.int32)
+    np.add.at(diff, (rows, starts), 1)
+    np.add.at(diff, (rows, ends), -1)
+    return np.cumsum(diff[:, :-1], axis=1) > 0
+
+
+def occupancy_report(
+        start: date,
+        end: date,
+        *,
+        group_by: str = "listing",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[Dict[str, Any]]:
+    """
+    Загрузка по ночам [start, end] (включительно) из CONFIRMED/COMPLETED броней.
+    Объявления обрабатываются порциями по chunk_size: память — O(chunk_size × дней) независимо от их числа.
+    - учитываются только активные объявления; доступные ночи считаются с даты создания объявления
+      (ночь, которая уже занята бронью, доступна всегда);
+    - occupancy_rate = занятые ночи / доступные ночи;
+    - avg_stay_nights и avg_lead_days — по броням с заездом внутри диапазона
+      (lead time — от создания брони до заезда), относятся к месяцу заезда.
+    """
+    if group_by not in OCCUPANCY_GROUP_BY_CHOICES:
+        raise ValueError(f"group_by must be one of {', '.join(OCCUPANCY_GROUP_BY_CHOICES)}")
+    n_days = (end - start).days + 1
+    if n_days < 1:
+        raise ValueError("'from' must be <= 'to'")
+    end_excl = end + timedelta(days=1)
+    month_offsets, month_labels = _month_columns(start, n_days)
+    day_idx = np.arange(n_days)
+    tz = timezone.get_current_timezone()
+
+    totals: Dict[GroupKey, _Totals] = {}
+
+    def key_for(acc_id: int, city: str, month_idx: int) -> GroupKey:
+        if group_by == "listing":
+            return acc_id, None, None
+        if group_by == "city":
+            return None, city, None
+        if group_by == "month":
+            return None, None, month_labels[month_idx]
+        return None, city, month_labels[month_idx]
+
+    for chunk in _iter_listing_chunks(end_excl, chunk_size):
+        row_of = {acc_id: i for i, (acc_id, _, _) in enumerate(chunk)}
+        bookings = np.array(
+            [
+                (
+                    row_of[acc_id],
+                    (max(s, start) - start).days,
+                    (min(e, end_excl) - start).days,
+                    (e - s).days,
+                    (s - timezone.localtime(created, tz).date()).days,
+                    (s - start).days if start <= s <= end else -1,
+                )
+                for acc_id, s, e, created in BookingORM.objects.filter(
+                    Q(start_date__lt=end_excl) & Q(end_date__gt=start),
+                    accommodation_id__in=list(row_of),
+                    status__in=OCCUPYING_STATUSES,
+                ).values_list("accommodation_id", "start_date", "end_date", "created_at").iterator()
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 6)
+
+        occ = occupancy_matrix(bookings[:, 0], bookings[:, 1], bookings[:, 2], len(chunk), n_days)
+        occupied = np.add.reduceat(occ, month_offsets, axis=1)  # (объявления × месяцы), ночи
+        listed_from = np.array(
+            [(timezone.localtime(created, tz).date() - start).days for _, _, created in chunk], dtype=np.int64
+        )
+        available = np.add.reduceat((day_idx[None, :] >= listed_from[:, None]) | occ, month_offsets, axis=1)
+
+        # Статистика заездов: только брони с заездом в диапазоне, в ячейку (объявление, месяц заезда)
+        arriving = bookings[bookings[:, 5] >= 0]
+        arrival_month = np.searchsorted(month_offsets, arriving[:, 5], side="right") - 1
+        stays = np.zeros_like(occupied, dtype=np.int64)
+        stay_nights = np.zeros_like(stays)
+        lead_days = np.zeros_like(stays)
+        np.add.at(stays, (arriving[:, 0], arrival_month), 1)
+        np.add.at(stay_nights, (arriving[:, 0], arrival_month), arriving[:, 3])
+        np.add.at(lead_days, (arriving[:, 0], arrival_month), np.maximum(arriving[:, 4], 0))
+
+        for i, (acc_id, city, _) in enumerate(chunk):
+            for m in range(len(month_labels)):
+                t = totals.setdefault(key_for(acc_id, city, m), _Totals())
+                t.occupied_nights += int(occupied[i, m])
+                t.available_nights += int(available[i, m])
+                t.stays += int(stays[i, m])
+                t.stay_nights += int(stay_nights[i, m])
+                t.lead_days += int(lead_days[i, m])
+
+    out = []
+    for (acc_id, city, month), t in sorted(totals.items(), key=_sort_key):
+        out.append({
+            "accommodation_id": acc_id,
+            "city": city,
+            "month": month,
+            "occupied_nights": t.occupied_nights,
+            "available_nights": t.available_nights,
+            "occupancy_rate": round(t.occupied_nights / t.available_nights, 4) if t.available_nights else 0.0,
+            "stays": t.stays,
+            "avg_stay_nights": round(t.stay_nights / t.stays, 2) if t.stays else None,
+            "avg_lead_days": round(t.lead_days / t.stays, 2) if t.stays else None,
+        })
+    return out
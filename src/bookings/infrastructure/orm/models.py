@@ -12,6 +12,7 @@ class Booking(models.Model):
         REJECTED = "rejected", "Rejected"
         CANCELLED = "cancelled", "Cancelled"
         COMPLETED = "completed", "Completed"
+        EXPIRED = "expired", "Expired"
 
     accommodation = models.ForeignKey(
         "accommodations.Accommodation",
@@ -43,11 +44,111 @@ class Booking(models.Model):
     class Meta:
         db_table = "bookings"
         indexes = [
-            models.Index(fields=["accommodation", "start_date", "end_date"]),
-            models.Index(fields=["guest", "status"]),
-            models.Index(fields=["host", "status"]),
+            # Проверка пересечений: accommodation = ? AND status IN (...) AND start_date < ? AND end_date > ?
+            models.Index(fields=["accommodation", "status", "start_date", "end_date"]),
+            # Keyset-списки: гость — по created_at, хост — по start_date (в пределах статуса)
+            models.Index(fields=["guest", "status", "created_at"]),
+            models.Index(fields=["host", "status", "start_date"]),
+            # Обслуживание (maintenance): keyset-проходы по наступившим броням внутри статуса
             models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["status", "start_date"]),
+            models.Index(fields=["status", "end_date"]),
+            # Инкрементальная синхронизация in-memory индекса броней (interval_cache)
+            models.Index(fields=["updated_at"]),
         ]
 
     def __str__(self) -> str:
         return f"Booking#{self.pk} acc={self.accommodation_id} {self.start_date}->{self.end_date} {self.status}"
+
+
+class AccommodationBookingLock(models.Model):
+    """
+    Строка-замок объявления: SELECT ... FOR UPDATE по ней сериализует «проверку пересечений + запись»
+    для одного объявления, не блокируя ни другие объявления, ни горячую строку accommodations (счётчики).
+    """
+    accommodation = models.OneToOneField(
+        "accommodations.Accommodation",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="booking_lock",
+    )
+
+    class Meta:
+        db_table = "booking_locks"
+
+    def __str__(self) -> str:
+        return f"BookingLock acc={self.accommodation_id}"
+
+
+class AccommodationMonthOccupancy(models.Model):
+    """
+    Предрассчитанный календарь: одна строка на объявление × месяц, bits — 31-битная маска занятых ночей
+    (бит d-1 — день d). Обновляется при подтверждении/отмене брони; 12 месяцев — 12 маленьких строк.
+    """
+    accommodation = models.ForeignKey(
+        "accommodations.Accommodation",
+        on_delete=models.CASCADE,
+        related_name="month_occupancy",
+    )
+    month = models.DateField()  # первое число месяца
+    bits = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "booking_month_occupancy"
+        constraints = [
+            models.UniqueConstraint(fields=["accommodation", "month"], name="uniq_booking_month_occupancy"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Occupancy acc={self.accommodation_id} {self.month:%Y-%m} {self.bits:031b}"
+
+
+class AccommodationCalendarFeed(models.Model):
+    """
+    Версия календаря объявления и закэшированный снимок .ics-ленты.
+    version растёт при каждом изменении подтверждённых ночей; снимок пересобирается лениво,
+    только если собран для другой версии (или другого дня — окно ленты привязано к дате).
+    """
+    accommodation = models.OneToOneField(
+        "accommodations.Accommodation",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="calendar_feed",
+    )
+    version = models.PositiveBigIntegerField(default=0)
+    snapshot_version = models.PositiveBigIntegerField(null=True, blank=True)
+    snapshot_day = models.DateField(null=True, blank=True)
+    snapshot = models.TextField(blank=True, default="")
+
+    class Meta:
+        db_table = "booking_calendar_feeds"
+
+    def __str__(self) -> str:
+        return f"CalendarFeed acc={self.accommodation_id} v{self.version}"
+
+
+class ExternalCalendarBlock(models.Model):
+    """Занятый период из внешней iCal-ленты (source — имя ленты, uid — UID события в ней)."""
+    accommodation = models.ForeignKey(
+        "accommodations.Accommodation",
+        on_delete=models.CASCADE,
+        related_name="external_blocks",
+    )
+    source = models.CharField(max_length=64)
+    uid = models.CharField(max_length=255)
+    start_date = models.DateField()
+    end_date = models.DateField()
+    summary = models.CharField(max_length=255, blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "booking_external_blocks"
+        constraints = [
+            models.UniqueConstraint(fields=["accommodation", "source", "uid"], name="uniq_booking_external_block"),
+        ]
+        indexes = [
+            models.Index(fields=["accommodation", "start_date", "end_date"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"ExternalBlock acc={self.accommodation_id} {self.source}:{self.uid} {self.start_date}->{self.end_date}"
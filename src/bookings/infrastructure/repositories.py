@@ -1,15 +1,35 @@
 # Слой infrastructure: реализации репозиториев (Django ORM), адаптеры для domain.repository_interfaces
 from __future__ import annotations
 
-from datetime import date
-from typing import Optional
+import random
+import time
+from collections import Counter
+from datetime import date, datetime
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
-from django.db.models import Q
+from django.conf import settings
+from django.db import IntegrityError, OperationalError, transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
 
 from src.bookings.domain.entities import Booking as BookingDomain, BookingStatus
-from src.bookings.domain.repository_interfaces import IBookingRepository
+from src.bookings.domain.repository_interfaces import BookingDueField, IBookingRepository
+from src.bookings.domain.services import BLOCKING_STATUSES, CONCURRENT_CHANGE_ERROR
 from src.bookings.domain.value_objects import StayPeriod
-from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.accommodations.infrastructure.orm.models import Accommodation as AccommodationORM
+from src.bookings.infrastructure.calendar import mark_period, read_month_masks
+from src.bookings.infrastructure.ical import bump_calendar_versions
+from src.bookings.infrastructure.interval_cache import get_confirmed_bookings_cache, sync_booking_status
+from src.bookings.infrastructure.orm.models import (
+    AccommodationBookingLock,
+    Booking as BookingORM,
+    ExternalCalendarBlock,
+)
+from src.common.infrastructure.listing_stats import record_booking_confirmed, record_booking_requested
+from src.common.infrastructure.outbox import BOOKING_STATUS_CHANGED, publish_events
+
+T = TypeVar("T")
 
 
 def _to_domain(obj: BookingORM) -> BookingDomain:
@@ -35,34 +55,271 @@ def _apply_domain(src: BookingDomain, dst: BookingORM) -> BookingORM:
     return dst
 
 
+def _acquire_lock_row(accommodation_id: int) -> None:
+    # Обычный путь — один SELECT ... FOR UPDATE; строку-замок создаём лениво при первой брони объявления
+    if AccommodationBookingLock.objects.select_for_update().filter(pk=accommodation_id).exists():
+        return
+    try:
+        with transaction.atomic():
+            AccommodationBookingLock.objects.create(pk=accommodation_id)
+    except IntegrityError:
+        # Строку параллельно создал другой запрос — ждём его блокировку (иначе объявления нет — ошибка FK)
+        if not AccommodationBookingLock.objects.select_for_update().filter(pk=accommodation_id).exists():
+            raise
+
+
+def _overlaps_qs(
+        accommodation_id,  # int или OuterRef("pk") для коррелированного подзапроса
+        period: StayPeriod,
+        exclude_booking_id: Optional[int],
+        statuses: Optional[Iterable[BookingStatus]],
+):
+    """
+    Пересечение полуинтервалов [start, end):
+      NOT (end <= start2 OR end2 <= start)
+    """
+    qs = BookingORM.objects.filter(
+        accommodation_id=accommodation_id,
+        start_date__lt=period.end_date,
+        end_date__gt=period.start_date,
+    )
+    if statuses is not None:
+        qs = qs.filter(status__in=[s.value for s in statuses])
+    # Опционально исключим текущую бронь
+    if exclude_booking_id is not None:
+        qs = qs.exclude(pk=exclude_booking_id)
+    return qs
+
+
+def _external_blocks_qs(accommodation_id, period: StayPeriod):
+    """Занятые периоды из внешних iCal-лент, пересекающие period (индекс (accommodation, start_date, end_date))."""
+    return ExternalCalendarBlock.objects.filter(
+        accommodation_id=accommodation_id,
+        start_date__lt=period.end_date,
+        end_date__gt=period.start_date,
+    )
+
+
+def _with_date_filters(qs, status_values, start_from: Optional[date], start_to: Optional[date]):
+    if status_values:
+        qs = qs.filter(status__in=sorted(status_values))
+    if start_from is not None:
+        qs = qs.filter(start_date__gte=start_from)
+    if start_to is not None:
+        qs = qs.filter(start_date__lte=start_to)
+    return qs
+
+
+def _on_status_changes(objs: List[BookingORM], old_status: str) -> None:
+    """Побочные эффекты смены статуса в той же транзакции: воронка и календарь занятости."""
+    objs = [o for o in objs if o.status != old_status]
+    confirmed = Counter()
+    calendar_changed = set()
+    for obj in objs:
+        period = StayPeriod(start_date=obj.start_date, end_date=obj.end_date)
+        if BookingORM.Status.CONFIRMED in (old_status, obj.status):
+            transaction.on_commit(partial(sync_booking_status, obj))
+        if obj.status == BookingORM.Status.CONFIRMED:
+            confirmed[obj.accommodation_id] += 1
+            mark_period(obj.accommodation_id, period, occupied=True)
+            calendar_changed.add(obj.accommodation_id)
+        elif old_status == BookingORM.Status.CONFIRMED and obj.status != BookingORM.Status.COMPLETED:
+            # Завершённое проживание остаётся в календаре, отменённое — освобождает ночи
+            mark_period(obj.accommodation_id, period, occupied=False)
+            calendar_changed.add(obj.accommodation_id)
+    for acc_id, n in confirmed.items():
+        record_booking_confirmed(acc_id, count=n)
+    bump_calendar_versions(calendar_changed)
+    publish_events(_status_event(obj, old_status) for obj in objs)
+
+
+def _status_event(obj: BookingORM, old_status: Optional[str]):
+    payload = {"accommodation_id": obj.accommodation_id, "from": old_status, "to": obj.status}
+    return BOOKING_STATUS_CHANGED, "booking", obj.pk, payload
+
+
+def _on_status_change(obj: BookingORM, old_status: str) -> None:
+    _on_status_changes([obj], old_status)
+
+
+def _acquire_lock_rows(accommodation_ids: List[int]) -> None:
+    # Несколько объявлений — всегда в порядке возрастания id, чтобы параллельные пакеты не взаимоблокировались
+    ids = sorted(set(accommodation_ids))
+    AccommodationBookingLock.objects.bulk_create(
+        [AccommodationBookingLock(pk=i) for i in ids], ignore_conflicts=True
+    )
+    list(AccommodationBookingLock.objects.select_for_update().filter(pk__in=ids).order_by("pk").values_list("pk"))
+
+
+def _with_lock_retry(acquire: Callable[[], None], fn: Callable[[], T]) -> T:
+    """
+    Транзакция: acquire() (SELECT ... FOR UPDATE строк-замков) + fn().
+    Deadlock / lock wait timeout (OperationalError) — ограниченный повтор с экспоненциальной паузой и джиттером;
+    доменные ошибки (ValueError/PermissionError) пробрасываются сразу.
+    """
+    attempts = max(1, settings.BOOKING_LOCK_RETRY_ATTEMPTS)
+    base_delay = settings.BOOKING_LOCK_RETRY_BASE_DELAY_SECONDS
+    for attempt in range(1, attempts + 1):
+        try:
+            with transaction.atomic():
+                acquire()
+                return fn()
+        except OperationalError:
+            # Внутри внешней транзакции повтор невозможен — решает вызывающий код
+            if attempt == attempts or transaction.get_connection().in_atomic_block:
+                raise
+            time.sleep(base_delay * (2 ** (attempt - 1)) * (0.5 + random.random()))
+    raise AssertionError("unreachable")
+
+
 class DjangoBookingRepository(IBookingRepository):
+    def run_exclusive(self, accommodation_id: int, fn: Callable[[], T]) -> T:
+        """Короткая транзакция под SELECT ... FOR UPDATE строки booking_locks объявления (с повтором)."""
+        return _with_lock_retry(lambda: _acquire_lock_row(accommodation_id), fn)
+
+    def run_exclusive_many(self, accommodation_ids: Iterable[int], fn: Callable[[], T]) -> T:
+        ids = list(accommodation_ids)
+        return _with_lock_retry(lambda: _acquire_lock_rows(ids), fn)
+
     def get_by_id(self, booking_id: int) -> Optional[BookingDomain]:
         try:
             return _to_domain(BookingORM.objects.get(pk=booking_id))
         except BookingORM.DoesNotExist:
             return None
 
+    def get_many(self, booking_ids: Iterable[int], for_update: bool = False) -> list[BookingDomain]:
+        qs = BookingORM.objects.filter(pk__in=set(booking_ids)).order_by("pk")
+        if for_update:
+            qs = qs.select_for_update()
+        return [_to_domain(o) for o in qs]
+
     def create(self, booking: BookingDomain) -> BookingDomain:
         obj = BookingORM()
         obj = _apply_domain(booking, obj)
-        obj.save()
+        with transaction.atomic():
+            obj.save()
+            record_booking_requested(obj.accommodation_id)
+            publish_events([_status_event(obj, None)])
         return _to_domain(obj)
 
     def update(self, booking: BookingDomain) -> BookingDomain:
         obj = BookingORM.objects.get(pk=booking.id)
+        old_status = obj.status
         obj = _apply_domain(booking, obj)
-        obj.save()
+        with transaction.atomic():
+            obj.save()
+            _on_status_change(obj, old_status)
         return _to_domain(obj)
 
-    def list_by_guest(self, guest_id: int, active_only: bool = False) -> list[BookingDomain]:
+    def apply_transition(
+            self,
+            booking: BookingDomain,
+            expected_status: BookingStatus,
+            *,
+            host_id: Optional[int] = None,
+            guest_id: Optional[int] = None,
+    ) -> bool:
+        qs = BookingORM.objects.filter(pk=booking.id, status=expected_status.value)
+        if host_id is not None:
+            qs = qs.filter(host_id=host_id)
+        if guest_id is not None:
+            qs = qs.filter(guest_id=guest_id)
+        now = timezone.now()
+        with transaction.atomic():
+            # update() не трогает auto_now — updated_at ставим явно (по нему синхронизируется interval_cache)
+            if not qs.update(status=booking.status.value, updated_at=now):
+                return False
+            obj = _apply_domain(booking, BookingORM(pk=booking.id, updated_at=now))
+            _on_status_change(obj, expected_status.value)
+        booking.updated_at = now
+        return True
+
+    def apply_transition_many(
+            self, bookings: list[BookingDomain], expected_status: BookingStatus, *, host_id: Optional[int] = None
+    ) -> int:
+        by_status: Dict[BookingStatus, List[BookingDomain]] = {}
+        for b in bookings:
+            by_status.setdefault(b.status, []).append(b)
+        now = timezone.now()
+        updated = 0
+        with transaction.atomic():
+            for new_status, group in by_status.items():
+                qs = BookingORM.objects.filter(pk__in=[b.id for b in group], status=expected_status.value)
+                if host_id is not None:
+                    qs = qs.filter(host_id=host_id)
+                n = qs.update(status=new_status.value, updated_at=now)
+                if n != len(group):
+                    # Строки должны быть заблокированы вызывающим (get_many(for_update=True))
+                    raise ValueError(CONCURRENT_CHANGE_ERROR)
+                updated += n
+                _on_status_changes(
+                    [_apply_domain(b, BookingORM(pk=b.id, updated_at=now)) for b in group], expected_status.value
+                )
+        for b in bookings:
+            b.updated_at = now
+        return updated
+
+    def lock_next_batch(
+            self,
+            status: BookingStatus,
+            field: BookingDueField,
+            cutoff: date | datetime,
+            after: Optional[Tuple[date | datetime, int]],
+            limit: int,
+    ) -> list[BookingDomain]:
+        # Keyset по (field, id) в пределах статуса — индексы (status, created_at/start_date/end_date)
+        name = field.value
+        qs = BookingORM.objects.filter(status=status.value, **{f"{name}__lt": cutoff})
+        if after is not None:
+            qs = qs.filter(Q(**{f"{name}__gt": after[0]}) | Q(**{name: after[0], "id__gt": after[1]}))
+        return [_to_domain(o) for o in qs.select_for_update(skip_locked=True).order_by(name, "id")[:limit]]
+
+    def list_by_guest(
+            self,
+            guest_id: int,
+            active_only: bool = False,
+            *,
+            statuses: Iterable[BookingStatus] = (),
+            start_from: Optional[date] = None,
+            start_to: Optional[date] = None,
+            after: Optional[Tuple[datetime, int]] = None,
+            limit: Optional[int] = None,
+    ) -> list[BookingDomain]:
         qs = BookingORM.objects.filter(guest_id=guest_id)
+        status_values = {s.value for s in statuses}
         if active_only:
-            qs = qs.filter(status__in=[BookingORM.Status.REQUESTED, BookingORM.Status.CONFIRMED])
-        return [_to_domain(o) for o in qs.order_by("-created_at")]
+            active = {BookingORM.Status.REQUESTED.value, BookingORM.Status.CONFIRMED.value}
+            status_values = (status_values & active) if status_values else active
+            if not status_values:
+                return []
+        # Индекс (guest, status, created_at): равенство/IN по статусу + упорядоченный диапазон по created_at
+        qs = _with_date_filters(qs, status_values, start_from, start_to)
+        if after is not None:
+            qs = qs.filter(Q(created_at__lt=after[0]) | Q(created_at=after[0], id__lt=after[1]))
+        qs = qs.order_by("-created_at", "-id")
+        if limit is not None:
+            qs = qs[:limit]
+        return [_to_domain(o) for o in qs]
 
-    def list_requests_for_host(self, host_id: int) -> list[BookingDomain]:
-        qs = BookingORM.objects.filter(host_id=host_id, status=BookingORM.Status.REQUESTED)
-        return [_to_domain(o) for o in qs.order_by("start_date", "id")]
+    def list_requests_for_host(
+            self,
+            host_id: int,
+            *,
+            statuses: Iterable[BookingStatus] = (BookingStatus.REQUESTED,),
+            start_from: Optional[date] = None,
+            start_to: Optional[date] = None,
+            after: Optional[Tuple[date, int]] = None,
+            limit: Optional[int] = None,
+    ) -> list[BookingDomain]:
+        qs = BookingORM.objects.filter(host_id=host_id)
+        # Индекс (host, status, start_date)
+        qs = _with_date_filters(qs, {s.value for s in statuses}, start_from, start_to)
+        if after is not None:
+            qs = qs.filter(Q(start_date__gt=after[0]) | Q(start_date=after[0], id__gt=after[1]))
+        qs = qs.order_by("start_date", "id")
+        if limit is not None:
+            qs = qs[:limit]
+        return [_to_domain(o) for o in qs]
 
     def list_for_accommodation_confirmed(self, accommodation_id: int) -> list[BookingDomain]:
         qs = BookingORM.objects.filter(
@@ -71,21 +328,83 @@ class DjangoBookingRepository(IBookingRepository):
         return [_to_domain(o) for o in qs.order_by("start_date", "id")]
 
     def find_overlaps(
-            self, accommodation_id: int, period: StayPeriod, exclude_booking_id: Optional[int] = None
+            self,
+            accommodation_id: int,
+            period: StayPeriod,
+            exclude_booking_id: Optional[int] = None,
+            statuses: Optional[Iterable[BookingStatus]] = None,
+    ) -> list[BookingDomain]:
+        return [_to_domain(o) for o in _overlaps_qs(accommodation_id, period, exclude_booking_id, statuses)]
+
+    def find_overlaps_many(
+            self, periods: Dict[int, StayPeriod], statuses: Iterable[BookingStatus]
     ) -> list[BookingDomain]:
+        if not periods:
+            return []
+        cond = Q()
+        for acc_id, period in periods.items():
+            cond |= Q(accommodation_id=acc_id, start_date__lt=period.end_date, end_date__gt=period.start_date)
+        qs = BookingORM.objects.filter(cond, status__in=[s.value for s in statuses])
+        return [_to_domain(o) for o in qs.order_by("accommodation_id", "start_date")]
+
+    def find_external_blocks_many(self, periods: Dict[int, StayPeriod]) -> list[Tuple[int, int, StayPeriod]]:
+        if not periods:
+            return []
+        cond = Q()
+        for acc_id, period in periods.items():
+            cond |= Q(accommodation_id=acc_id, start_date__lt=period.end_date, end_date__gt=period.start_date)
+        rows = ExternalCalendarBlock.objects.filter(cond).values_list(
+            "id", "accommodation_id", "start_date", "end_date"
+        )
+        return [(block_id, acc_id, StayPeriod(s, e)) for block_id, acc_id, s, e in rows]
+
+    def has_overlap(
+            self,
+            accommodation_id: int,
+            period: StayPeriod,
+            statuses: Iterable[BookingStatus],
+            exclude_booking_id: Optional[int] = None,
+    ) -> bool:
+        # Один запрос: EXISTS по броням (индекс (accommodation, status, start_date, end_date))
+        # или по блокам внешних календарей — даты, занятые на другом канале, тоже недоступны
+        bookings = _overlaps_qs(accommodation_id, period, exclude_booking_id, statuses)
+        return AccommodationORM.objects.filter(pk=accommodation_id).filter(
+            Exists(bookings) | Exists(_external_blocks_qs(accommodation_id, period))
+        ).exists()
+
+    def find_available(self, accommodation_ids: Iterable[int], period: StayPeriod) -> list[int]:
         """
-        Пересечение полуинтервалов [start, end):
-          NOT (end <= start2 OR end2 <= start)
+        Анти-джойн: SELECT id FROM accommodations WHERE id IN (...) AND is_active
+          AND NOT EXISTS (бронь в BLOCKING_STATUSES, пересекающая period)
+          AND NOT EXISTS (блок внешнего календаря, пересекающий period).
+        Подзапросы идут по индексам (accommodation, status, start_date, end_date)
+        и (accommodation, start_date, end_date).
         """
-        qs = BookingORM.objects.filter(accommodation_id=accommodation_id)
-        # Опционально исключим текущую бронь
-        if exclude_booking_id is not None:
-            qs = qs.exclude(pk=exclude_booking_id)
-
-        # Формула пересечения
-        overlaps_filter = Q(end_date__gt=period.start_date) & Q(start_date__lt=period.end_date)
-        qs = qs.filter(overlaps_filter)
-        return [_to_domain(o) for o in qs]
+        ids = {int(i) for i in accommodation_ids}
+        if not ids:
+            return []
+        cache = get_confirmed_bookings_cache()
+        free = cache.free_ids(ids, period) if cache is not None else None
+        if free is not None:
+            # Индекс прогрет (в нём только брони): из БД — фильтр активности и внешние блоки
+            return list(
+                AccommodationORM.objects.filter(id__in=free, is_active=True)
+                .exclude(Exists(_external_blocks_qs(OuterRef("pk"), period)))
+                .order_by("id")
+                .values_list("id", flat=True)
+            )
+        blocking = _overlaps_qs(OuterRef("pk"), period, None, BLOCKING_STATUSES)
+        qs = (
+            AccommodationORM.objects.filter(id__in=ids, is_active=True)
+            .exclude(Exists(blocking))
+            .exclude(Exists(_external_blocks_qs(OuterRef("pk"), period)))
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        return list(qs)
+
+    def get_occupancy_masks(self, accommodation_id: int, start: date, end_inclusive: date) -> dict[date, int]:
+        return read_month_masks(accommodation_id, start, end_inclusive)
 
     def list_in_period_for_guest(self, guest_id: int, start: date, end: date) -> list[BookingDomain]:
         qs = BookingORM.objects.filter(
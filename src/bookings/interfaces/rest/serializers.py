@@ -1,9 +1,16 @@
 # Слой interfaces: DRF сериалайзеры (если используете DRF)
 from __future__ import annotations
 
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
 
+from src.bookings.application.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from src.bookings.application.queries import OCCUPANCY_GROUP_BY_CHOICES
 from src.bookings.domain.entities import BookingStatus
+from src.common.interfaces.rest.serializers import DateRangeQuerySerializer
 
 
 class BookingCreateSerializer(serializers.Serializer):
@@ -20,3 +27,151 @@ class BookingDetailSerializer(serializers.Serializer):
     start_date = serializers.DateField()
     end_date = serializers.DateField()
     status = serializers.ChoiceField(choices=[(s.value, s.value) for s in BookingStatus])
+
+
+AVAILABILITY_MAX_IDS = 500
+
+
+class AvailabilityRequestSerializer(serializers.Serializer):
+    accommodation_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=AVAILABILITY_MAX_IDS
+    )
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+
+    def validate(self, attrs):
+        if attrs["end_date"] <= attrs["start_date"]:
+            raise serializers.ValidationError({"end_date": "end_date must be greater than start_date"})
+        return attrs
+
+
+class AvailabilityResponseSerializer(serializers.Serializer):
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+    available_ids = serializers.ListField(child=serializers.IntegerField())
+    bitmap = serializers.CharField(help_text="Строка из 0/1 в порядке accommodation_ids запроса: 1 — свободно")
+
+
+CALENDAR_MAX_DAYS = 366
+
+
+class CalendarQuerySerializer(DateRangeQuerySerializer):
+    """
+    Параметры ?from=&to= (даты включительно). По умолчанию — 12 месяцев начиная с сегодняшнего дня.
+    В validated_data ключи "from" и "to".
+    """
+
+    def validate(self, attrs):
+        start = attrs.get("from") or timezone.localdate()
+        to = attrs.get("to") or (start + timedelta(days=CALENDAR_MAX_DAYS - 1))
+        if start > to:
+            raise serializers.ValidationError("'from' must be <= 'to'")
+        if (to - start).days + 1 > CALENDAR_MAX_DAYS:
+            raise serializers.ValidationError(f"Range must not exceed {CALENDAR_MAX_DAYS} days")
+        return {"from": start, "to": to}
+
+
+class CalendarSerializer(serializers.Serializer):
+    accommodation_id = serializers.IntegerField()
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    occupancy = serializers.CharField(help_text="Строка из 0/1 по дням от date_from до date_to: 1 — ночь занята")
+
+
+BATCH_DECIDE_MAX_ITEMS = 100
+
+
+class BatchDecideItemSerializer(serializers.Serializer):
+    booking_id = serializers.IntegerField(min_value=1)
+    action = serializers.ChoiceField(choices=["confirm", "reject", "cancel"])
+
+
+class BatchDecideRequestSerializer(serializers.Serializer):
+    items = BatchDecideItemSerializer(many=True, allow_empty=False, max_length=BATCH_DECIDE_MAX_ITEMS)
+
+
+class DecisionOutcomeSerializer(serializers.Serializer):
+    booking_id = serializers.IntegerField()
+    action = serializers.CharField()
+    ok = serializers.BooleanField()
+    status = serializers.ChoiceField(choices=[(s.value, s.value) for s in BookingStatus], allow_null=True)
+    error = serializers.CharField(allow_null=True)
+
+
+class BatchDecideResponseSerializer(serializers.Serializer):
+    applied = serializers.IntegerField()
+    results = DecisionOutcomeSerializer(many=True)
+
+
+class BookingListQuerySerializer(serializers.Serializer):
+    status = serializers.ListField(
+        child=serializers.ChoiceField(choices=[s.value for s in BookingStatus]), required=False,
+        help_text="Фильтр по статусу, можно повторять: ?status=requested&status=confirmed",
+    )
+    start_from = serializers.DateField(required=False, help_text="start_date >= start_from")
+    start_to = serializers.DateField(required=False, help_text="start_date <= start_to")
+    cursor = serializers.CharField(required=False, help_text="next_cursor из предыдущей страницы")
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=MAX_PAGE_LIMIT, default=DEFAULT_PAGE_LIMIT)
+
+    def validate(self, attrs):
+        if attrs.get("start_from") and attrs.get("start_to") and attrs["start_from"] > attrs["start_to"]:
+            raise serializers.ValidationError("'start_from' must be <= 'start_to'")
+        return attrs
+
+
+class BookingPageSerializer(serializers.Serializer):
+    items = BookingDetailSerializer(many=True)
+    next_cursor = serializers.CharField(allow_null=True)
+
+
+class OccupancyQuerySerializer(DateRangeQuerySerializer):
+    group_by = serializers.ChoiceField(choices=OCCUPANCY_GROUP_BY_CHOICES, required=False, default="listing")
+
+    def validate(self, attrs):
+        group_by = attrs.get("group_by", "listing")
+        return {**super().validate(attrs), "group_by": group_by}
+
+
+class OccupancyRowSerializer(serializers.Serializer):
+    accommodation_id = serializers.IntegerField(allow_null=True)
+    city = serializers.CharField(allow_null=True)
+    month = serializers.CharField(allow_null=True, help_text="YYYY-MM")
+    occupied_nights = serializers.IntegerField()
+    available_nights = serializers.IntegerField()
+    occupancy_rate = serializers.FloatField()
+    stays = serializers.IntegerField()
+    avg_stay_nights = serializers.FloatField(allow_null=True)
+    avg_lead_days = serializers.FloatField(allow_null=True)
+
+
+class OccupancyReportSerializer(serializers.Serializer):
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    group_by = serializers.CharField()
+    rows = OccupancyRowSerializer(many=True)
+
+
+ICS_UPLOAD_CONTENT_TYPES = ("text/calendar", "text/plain", "application/octet-stream")
+
+
+class ExternalCalendarImportSerializer(serializers.Serializer):
+    file = serializers.FileField(help_text=".ics внешней площадки")
+    source = serializers.SlugField(max_length=64, required=False, default="default",
+                                   help_text="Имя ленты: блоки разных площадок синхронизируются независимо")
+
+    def validate_file(self, value):
+        # Клиенты и площадки отдают .ics как text/calendar, text/plain или просто octet-stream
+        content_type = (getattr(value, "content_type", "") or "").split(";", 1)[0].strip().lower()
+        if content_type and content_type not in ICS_UPLOAD_CONTENT_TYPES:
+            raise serializers.ValidationError(f"Unsupported content type: {content_type}")
+        if value.size > settings.ICAL_IMPORT_MAX_BYTES:
+            raise serializers.ValidationError(f"File must not exceed {settings.ICAL_IMPORT_MAX_BYTES} bytes")
+        return value
+
+
+class ExternalCalendarImportResultSerializer(serializers.Serializer):
+    source = serializers.CharField()
+    created = serializers.IntegerField()
+    updated = serializers.IntegerField()
+    deleted = serializers.IntegerField()
+    unchanged = serializers.IntegerField()
@@ -8,11 +8,17 @@ from .views import (
     ConfirmBookingView,
     RejectBookingView,
     CancelBookingView, BookingDetailView,
+    AvailabilityView,
+    BatchDecideBookingsView,
+    OccupancyAnalyticsView,
 )
 
 urlpatterns = [
     path("", CreateBookingView.as_view(), name="bookings-create"),  # POST
     path("me/", ListMyBookingsView.as_view(), name="bookings-me"),  # GET
+    path("availability/", AvailabilityView.as_view(), name="bookings-availability"),  # POST
+    path("batch-decide/", BatchDecideBookingsView.as_view(), name="bookings-batch-decide"),  # POST
+    path("analytics/occupancy/", OccupancyAnalyticsView.as_view(), name="bookings-analytics-occupancy"),  # GET
     path("requests/", ListMyRequestsForHostView.as_view(), name="bookings-requests"),  # GET
     path("<int:booking_id>/", BookingDetailView.as_view(), name="bookings-detail"),  # GET
     path("<int:booking_id>/confirm/", ConfirmBookingView.as_view(), name="bookings-confirm"),  # POST
@@ -3,13 +3,14 @@ from __future__ import annotations
 
 from datetime import date
 
+from django.http import HttpResponse, HttpResponseNotModified
 from django.utils.decorators import method_decorator
 
 from django.views.decorators.csrf import csrf_protect
 
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
-from rest_framework import status
+from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -20,14 +21,40 @@ from src.shared.interfaces.api_errors import response_from_app_error
 
 from src.users.interfaces.rest.permissions import IsGuest, IsHost
 
-from src.bookings.interfaces.rest.serializers import BookingCreateSerializer, BookingDetailSerializer
+from src.bookings.interfaces.rest.serializers import (
+    AvailabilityRequestSerializer,
+    AvailabilityResponseSerializer,
+    BatchDecideRequestSerializer,
+    BatchDecideResponseSerializer,
+    BookingCreateSerializer,
+    BookingDetailSerializer,
+    BookingListQuerySerializer,
+    BookingPageSerializer,
+    CalendarQuerySerializer,
+    CalendarSerializer,
+    ExternalCalendarImportResultSerializer,
+    ExternalCalendarImportSerializer,
+    OccupancyQuerySerializer,
+    OccupancyReportSerializer,
+)
 from src.bookings.application.commands import (
+    BatchDecideCommand,
+    BookingDecision,
     CreateBookingCommand,
     ConfirmBookingCommand,
     RejectBookingCommand,
     CancelBookingCommand,
 )
-from src.bookings.application.queries import ListMyBookingsQuery, ListMyRequestsForHostQuery, GetBookingByIdQuery
+from src.bookings.application.queries import (
+    CheckAvailabilityQuery,
+    GetCalendarQuery,
+    ListMyBookingsQuery,
+    ListMyRequestsForHostQuery,
+    GetBookingByIdQuery,
+)
+from src.bookings.application.use_cases.batch_decide import BatchDecideBookingsUseCase
+from src.bookings.application.use_cases.check_availability import CheckAvailabilityUseCase
+from src.bookings.application.use_cases.get_calendar import GetCalendarUseCase
 from src.bookings.application.use_cases.create_booking import CreateBookingUseCase
 from src.bookings.application.use_cases.list_my_bookings import ListMyBookingsUseCase
 from src.bookings.application.use_cases.list_my_requests import ListMyRequestsForHostUseCase
@@ -36,6 +63,10 @@ from src.bookings.application.use_cases.reject_booking import RejectBookingUseCa
 from src.bookings.application.use_cases.cancel_booking import CancelBookingUseCase
 from src.bookings.application.use_cases.get_booking import GetBookingByIdUseCase
 
+from src.bookings.domain.entities import BookingStatus
+from src.bookings.domain.ical import CalendarFormatError
+from src.bookings.infrastructure.ical import ICS_CONTENT_TYPE, feed_body, feed_etag, get_feed, import_external_calendar
+from src.bookings.infrastructure.occupancy_analytics import occupancy_report
 from src.bookings.infrastructure.repositories import DjangoBookingRepository
 from src.accommodations.infrastructure.repositories import DjangoAccommodationRepository
 
@@ -101,32 +132,68 @@ class CreateBookingView(APIView):
 
 @extend_schema(
     tags=["bookings"],
-    responses={200: BookingDetailSerializer(many=True)},
+    parameters=[BookingListQuerySerializer],
+    responses={200: BookingPageSerializer},
     operation_id="bookings_list_me",
-    description="Список моих бронирований (guest).",
+    description=(
+        "Список моих бронирований (guest), от новых к старым. Курсорная пагинация: "
+        "передайте next_cursor из ответа в ?cursor=, пока он не станет null."
+    ),
 )
 class ListMyBookingsView(APIView):
     permission_classes = [IsAuthenticatedAndActive, IsGuest]
 
     def get(self, request):
+        params = BookingListQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        v = params.validated_data
         repo = DjangoBookingRepository()
-        dtos = ListMyBookingsUseCase(repo).execute(ListMyBookingsQuery(guest_id=request.user.id, active_only=False))
-        return Response(BookingDetailSerializer(dtos, many=True).data, status=status.HTTP_200_OK)
+        try:
+            page = ListMyBookingsUseCase(repo).execute(ListMyBookingsQuery(
+                guest_id=request.user.id,
+                active_only=False,
+                statuses=tuple(BookingStatus(s) for s in v.get("status", [])),
+                start_from=v.get("start_from"),
+                start_to=v.get("start_to"),
+                cursor=v.get("cursor"),
+                limit=v["limit"],
+            ))
+        except ApplicationError as e:
+            return response_from_app_error(e)
+        return Response(BookingPageSerializer(page).data, status=status.HTTP_200_OK)
 
 
 @extend_schema(
     tags=["bookings"],
-    responses={200: BookingDetailSerializer(many=True)},
+    parameters=[BookingListQuerySerializer],
+    responses={200: BookingPageSerializer},
     operation_id="bookings_list_requests_for_host",
-    description="Список заявок со статусом requested, где я — host.",
+    description=(
+        "Брони, где я — host, по дате заезда (по умолчанию только requested). "
+        "Курсорная пагинация через next_cursor."
+    ),
 )
 class ListMyRequestsForHostView(APIView):
     permission_classes = [IsAuthenticatedAndActive, IsHost]
 
     def get(self, request):
+        params = BookingListQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        v = params.validated_data
+        statuses = tuple(BookingStatus(s) for s in v.get("status", [])) or (BookingStatus.REQUESTED,)
         repo = DjangoBookingRepository()
-        dtos = ListMyRequestsForHostUseCase(repo).execute(ListMyRequestsForHostQuery(host_id=request.user.id))
-        return Response(BookingDetailSerializer(dtos, many=True).data, status=status.HTTP_200_OK)
+        try:
+            page = ListMyRequestsForHostUseCase(repo).execute(ListMyRequestsForHostQuery(
+                host_id=request.user.id,
+                statuses=statuses,
+                start_from=v.get("start_from"),
+                start_to=v.get("start_to"),
+                cursor=v.get("cursor"),
+                limit=v["limit"],
+            ))
+        except ApplicationError as e:
+            return response_from_app_error(e)
+        return Response(BookingPageSerializer(page).data, status=status.HTTP_200_OK)
 
 
 @extend_schema(
@@ -203,3 +270,180 @@ class CancelBookingView(APIView):
         except ApplicationError as e:
             return response_from_app_error(e)
         return Response(BookingDetailSerializer(dto).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["bookings"],
+    request=BatchDecideRequestSerializer,
+    responses={200: BatchDecideResponseSerializer, 400: OpenApiResponse(description="Bad request")},
+    operation_id="bookings_batch_decide",
+    description=(
+        "Пакетно подтвердить/отклонить/отменить до 100 броней (host). Элементы обрабатываются независимо, "
+        "в ответе — исход по каждому в порядке запроса. Требуется CSRF."
+    ),
+)
+@method_decorator(csrf_protect, name="dispatch")
+class BatchDecideBookingsView(APIView):
+    permission_classes = [IsAuthenticatedAndActive, IsHost]
+
+    def post(self, request):
+        ser = BatchDecideRequestSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        cmd = BatchDecideCommand(
+            actor_user_id=request.user.id,
+            items=tuple(
+                BookingDecision(booking_id=i["booking_id"], action=i["action"]) for i in ser.validated_data["items"]
+            ),
+            today=date.today(),
+        )
+        try:
+            outcomes = BatchDecideBookingsUseCase(DjangoBookingRepository()).execute(cmd)
+        except ApplicationError as e:
+            return response_from_app_error(e)
+        payload = {"applied": sum(1 for o in outcomes if o.ok), "results": outcomes}
+        return Response(BatchDecideResponseSerializer(payload).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["bookings"],
+    request=AvailabilityRequestSerializer,
+    responses={200: AvailabilityResponseSerializer, 400: OpenApiResponse(description="Bad request")},
+    operation_id="bookings_availability",
+    description=(
+        "Пакетная проверка: какие из объявлений (до 500 id) свободны на весь период [start_date, end_date). "
+        "Один запрос к БД. POST только из-за размера тела — данные не меняются, CSRF не требуется."
+    ),
+)
+class AvailabilityView(APIView):
+    permission_classes = [permissions.AllowAny]
+
+    def post(self, request):
+        ser = AvailabilityRequestSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        v = ser.validated_data
+        try:
+            dto = CheckAvailabilityUseCase(DjangoBookingRepository()).execute(
+                CheckAvailabilityQuery(
+                    accommodation_ids=tuple(v["accommodation_ids"]),
+                    start_date=v["start_date"],
+                    end_date=v["end_date"],
+                )
+            )
+        except ApplicationError as e:
+            return response_from_app_error(e)
+        return Response(AvailabilityResponseSerializer(dto).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["bookings"],
+    parameters=[CalendarQuerySerializer],
+    responses={200: CalendarSerializer, 404: OpenApiResponse(description="Not found")},
+    operation_id="accommodations_calendar",
+    description=(
+        "Календарь занятости объявления по дням (подтверждённые брони). "
+        "Читается из помесячных битовых масок: 12 месяцев — одна небольшая выборка."
+    ),
+)
+class AccommodationCalendarView(APIView):
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, acc_id: int):
+        params = CalendarQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        if not DjangoAccommodationRepository().get_by_id(acc_id):
+            return Response({"detail": "Accommodation not found"}, status=status.HTTP_404_NOT_FOUND)
+        dto = GetCalendarUseCase(DjangoBookingRepository()).execute(
+            GetCalendarQuery(
+                accommodation_id=acc_id,
+                start_date=params.validated_data["from"],
+                end_date=params.validated_data["to"],
+            )
+        )
+        return Response(CalendarSerializer(dto).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["bookings"],
+    parameters=[OccupancyQuerySerializer],
+    responses={200: OccupancyReportSerializer, 403: OpenApiResponse(description="Forbidden")},
+    operation_id="bookings_analytics_occupancy",
+    description=(
+        "Загрузка объявлений за период (только администраторы): доля занятых ночей, средняя длина "
+        "проживания и lead time по CONFIRMED/COMPLETED броням. Группировка: listing, city, month, city_month."
+    ),
+)
+class OccupancyAnalyticsView(APIView):
+    permission_classes = [IsAuthenticatedAndActive, permissions.IsAdminUser]
+
+    def get(self, request):
+        params = OccupancyQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        v = params.validated_data
+        data = {
+            "date_from": v["from"],
+            "date_to": v["to"],
+            "group_by": v["group_by"],
+            "rows": occupancy_report(v["from"], v["to"], group_by=v["group_by"]),
+        }
+        return Response(OccupancyReportSerializer(data).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["bookings"],
+    responses={(200, "text/calendar"): str, 304: OpenApiResponse(description="Not modified"),
+               404: OpenApiResponse(description="Not found")},
+    operation_id="accommodations_calendar_ics",
+    description=(
+        "iCal-лента занятости объявления (подтверждённые брони) для синхронизации с другими площадками. "
+        "Отдаётся закэшированный снимок текущей версии календаря; поддерживается If-None-Match (ETag)."
+    ),
+)
+class AccommodationICalFeedView(APIView):
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, acc_id: int):
+        feed = get_feed(acc_id)
+        if feed is None:
+            return Response({"detail": "Accommodation not found"}, status=status.HTTP_404_NOT_FOUND)
+        etag = feed_etag(feed)
+        if etag in [t.strip() for t in request.headers.get("If-None-Match", "").split(",")]:
+            resp = HttpResponseNotModified()
+        else:
+            resp = HttpResponse(feed_body(feed), content_type=ICS_CONTENT_TYPE)
+        resp["ETag"] = etag
+        resp["Cache-Control"] = "no-cache"  # кэшировать можно, но перепроверять по ETag
+        return resp
+
+
+@extend_schema(
+    tags=["bookings"],
+    request={"multipart/form-data": ExternalCalendarImportSerializer},
+    responses={200: ExternalCalendarImportResultSerializer, 403: OpenApiResponse(description="Forbidden"),
+               404: OpenApiResponse(description="Not found")},
+    operation_id="accommodations_calendar_import",
+    description=(
+        "Импорт .ics внешней площадки (только владелец). Файл разбирается потоково; записываются только "
+        "отличия от предыдущего импорта той же ленты (source). Требуется CSRF."
+    ),
+)
+@method_decorator(csrf_protect, name="dispatch")
+class ImportExternalCalendarView(APIView):
+    permission_classes = [IsAuthenticatedAndActive, IsHost]
+
+    def post(self, request, acc_id: int):
+        ser = ExternalCalendarImportSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        acc = DjangoAccommodationRepository().get_by_id(acc_id)
+        if not acc:
+            return Response({"detail": "Accommodation not found"}, status=status.HTTP_404_NOT_FOUND)
+        if acc.owner_id != request.user.id:
+            return Response({"detail": "Not owner of the accommodation"}, status=status.HTTP_403_FORBIDDEN)
+        source = ser.validated_data["source"]
+        lines = (raw.decode("utf-8", "replace") for raw in ser.validated_data["file"])
+        try:
+            result = import_external_calendar(acc_id, lines, source=source)
+        except CalendarFormatError as e:
+            # Не iCalendar или обрезанный файл: транзакция импорта откатывается, прежние блоки остаются
+            return response_from_app_error(ApplicationError(str(e)))
+        data = {"source": source, **vars(result)}
+        return Response(ExternalCalendarImportResultSerializer(data).data, status=status.HTTP_200_OK)
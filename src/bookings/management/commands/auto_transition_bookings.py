@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from src.bookings.infrastructure.maintenance import auto_transition_bookings
+
+
+class Command(BaseCommand):
+    help = (
+        "Завершает прошедшие подтверждённые брони (COMPLETED) и истекает старые заявки (EXPIRED) "
+        "короткими порциями. Запускать периодически (cron/планировщик)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--max-batches", type=int, default=None, help="Лимит порций на каждый из проходов")
+        parser.add_argument("--sleep", type=float, default=None, help="Пауза между порциями, секунды")
+        parser.add_argument("--expire-after-days", type=int, default=None)
+
+    def handle(self, *args, **opts):
+        res = auto_transition_bookings(
+            batch_size=opts["batch_size"],
+            max_batches=opts["max_batches"],
+            sleep_seconds=opts["sleep"],
+            expire_after_days=opts["expire_after_days"],
+        )
+        self.stdout.write(
+            f"completed={res.completed} expired={res.expired} scanned={res.scanned} batches={res.batches} "
+            f"elapsed={res.elapsed_ms:.0f}ms max_batch={res.max_batch_ms:.1f}ms"
+        )
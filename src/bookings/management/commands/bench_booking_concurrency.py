@@ -0,0 +1,142 @@
+# Стресс-бенчмарк: параллельные создание + подтверждение броней, проверка отсутствия двойных бронирований
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from typing import List
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+
+from src.accommodations.infrastructure.orm.models import Accommodation
+from src.bookings.application.commands import ConfirmBookingCommand, CreateBookingCommand
+from src.bookings.application.use_cases.confirm_booking import ConfirmBookingUseCase
+from src.bookings.application.use_cases.create_booking import CreateBookingUseCase
+from src.bookings.infrastructure.repositories import DjangoBookingRepository
+from src.shared.errors import ApplicationError
+
+BENCH_HOST_EMAIL = "bench-booking-host@example.com"
+BENCH_GUEST_EMAIL = "bench-booking-guest@example.com"
+BENCH_TITLE_PREFIX = "bench-booking-"
+
+DOUBLE_BOOKINGS_SQL = (
+    "SELECT COUNT(*) FROM bookings a JOIN bookings b "
+    "ON a.accommodation_id = b.accommodation_id AND a.id < b.id "
+    "WHERE a.status = 'confirmed' AND b.status = 'confirmed' "
+    "AND a.start_date < b.end_date AND b.start_date < a.end_date "
+    "AND a.accommodation_id IN ({ids})"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Запускает N потоков, которые создают и сразу подтверждают брони на пересекающиеся даты "
+        "небольшого числа объявлений. Печатает пропускную способность и проверяет, "
+        "что пересекающихся CONFIRMED-броней нет."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--ops", type=int, default=200, help="Попыток брони на поток")
+        parser.add_argument("--listings", type=int, default=3, help="Число объявлений (меньше — больше конкуренции)")
+        parser.add_argument("--horizon-days", type=int, default=60, help="Окно дат, в котором выбираются заезды")
+        parser.add_argument("--max-nights", type=int, default=5)
+        parser.add_argument("--keep", action="store_true", help="Не удалять синтетические данные после прогона")
+
+    def handle(self, *args, **opts):
+        if connection.vendor == "sqlite" and opts["threads"] > 1:
+            self.stdout.write(self.style.WARNING(
+                "SQLite сериализует запись на уровне файла — цифры пропускной способности не показательны"
+            ))
+        host, guest, acc_ids = self._fixtures(opts["listings"])
+        stats: Counter = Counter()
+        lock = threading.Lock()
+        start_day = date.today() + timedelta(days=1)
+
+        def worker(seed: int) -> None:
+            rnd = random.Random(seed)
+            repo = DjangoBookingRepository()
+            create_uc, confirm_uc = CreateBookingUseCase(repo), ConfirmBookingUseCase(repo)
+            local: Counter = Counter()
+            try:
+                for _ in range(opts["ops"]):
+                    check_in = start_day + timedelta(days=rnd.randrange(opts["horizon_days"]))
+                    nights = rnd.randint(1, opts["max_nights"])
+                    try:
+                        dto = create_uc.execute(CreateBookingCommand(
+                            accommodation_id=rnd.choice(acc_ids),
+                            guest_id=guest.id,
+                            host_id=host.id,
+                            start_date=check_in,
+                            end_date=check_in + timedelta(days=nights),
+                        ))
+                        local["created"] += 1
+                        confirm_uc.execute(ConfirmBookingCommand(booking_id=dto.id, actor_user_id=host.id))
+                        local["confirmed"] += 1
+                    except ApplicationError as ex:
+                        local["overlap" if "overlap" in str(ex).lower() else "error"] += 1
+            finally:
+                close_old_connections()
+                connection.close()
+                with lock:
+                    stats.update(local)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(opts["threads"])]
+        t0 = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - t0
+
+        attempts = opts["threads"] * opts["ops"]
+        with connection.cursor() as cur:
+            cur.execute(DOUBLE_BOOKINGS_SQL.format(ids=",".join(str(i) for i in acc_ids)))
+            double_bookings = cur.fetchone()[0]
+
+        self.stdout.write(
+            f"threads={opts['threads']} attempts={attempts} elapsed={elapsed:.2f}s "
+            f"throughput={attempts / elapsed:.1f} ops/s "
+            f"created={stats['created']} confirmed={stats['confirmed']} "
+            f"rejected_overlap={stats['overlap']} errors={stats['error']}"
+        )
+        if not opts["keep"]:
+            self._cleanup()
+        if double_bookings:
+            raise CommandError(f"double bookings detected: {double_bookings}")
+        self.stdout.write(self.style.SUCCESS("double bookings: 0"))
+
+    def _fixtures(self, listings: int):
+        User = get_user_model()
+        host = User.objects.filter(email=BENCH_HOST_EMAIL).first() or User.objects.create_user(
+            email=BENCH_HOST_EMAIL, password=None
+        )
+        guest = User.objects.filter(email=BENCH_GUEST_EMAIL).first() or User.objects.create_user(
+            email=BENCH_GUEST_EMAIL, password=None
+        )
+        host.roles, guest.roles = ["host"], ["guest"]
+        host.save(update_fields=["roles"])
+        guest.save(update_fields=["roles"])
+        acc_ids: List[int] = []
+        for i in range(listings):
+            acc = Accommodation.objects.create(
+                owner_id=host.id,
+                title=f"{BENCH_TITLE_PREFIX}{i}",
+                description="synthetic listing for bench_booking_concurrency",
+                city="Berlin",
+                region="Berlin",
+                country="DE",
+                price_cents=10000,
+                rooms=1,
+                housing_type="apartment",
+            )
+            acc_ids.append(acc.id)
+        return host, guest, acc_ids
+
+    def _cleanup(self) -> None:
+        Accommodation.objects.filter(title__startswith=BENCH_TITLE_PREFIX, owner__email=BENCH_HOST_EMAIL).delete()
+        get_user_model().objects.filter(email__in=[BENCH_HOST_EMAIL, BENCH_GUEST_EMAIL]).delete()
@@ -0,0 +1,115 @@
+# Микробенчмарк: проверка пересечений через in-memory индекс интервалов против EXISTS-запроса ORM
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from src.accommodations.infrastructure.orm.models import Accommodation
+from src.bookings.domain.interval_index import BookingIntervalIndex
+from src.bookings.domain.services import BLOCKING_STATUSES
+from src.bookings.domain.value_objects import StayPeriod
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.bookings.infrastructure.repositories import DjangoBookingRepository
+
+BENCH_HOST_EMAIL = "bench-interval-host@example.com"
+BENCH_TITLE_PREFIX = "bench-interval-"
+
+
+class Command(BaseCommand):
+    help = (
+        "Генерирует подтверждённые непересекающиеся брони для N объявлений и сравнивает время has_overlap: "
+        "DjangoBookingRepository (EXISTS) против BookingIntervalIndex. Результаты обоих путей сверяются."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--listings", type=int, default=50)
+        parser.add_argument("--bookings-per-listing", type=int, default=200)
+        parser.add_argument("--queries", type=int, default=2000)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--keep", action="store_true", help="Не удалять синтетические данные после прогона")
+
+    def handle(self, *args, **opts):
+        rnd = random.Random(opts["seed"])
+        acc_ids = self._seed(rnd, opts["listings"], opts["bookings_per_listing"])
+        try:
+            t0 = time.perf_counter()
+            index = BookingIntervalIndex()
+            rows = BookingORM.objects.filter(
+                accommodation_id__in=acc_ids, status=BookingORM.Status.CONFIRMED
+            ).values_list("id", "accommodation_id", "start_date", "end_date")
+            for booking_id, acc_id, start, end in rows.iterator():
+                index.add(acc_id, booking_id, StayPeriod(start, end))
+            self.stdout.write(f"index build: {len(index)} intervals in {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+            horizon = opts["bookings_per_listing"] * 4
+            base = date.today()
+            queries = []
+            for _ in range(opts["queries"]):
+                start = base + timedelta(days=rnd.randrange(horizon))
+                queries.append((rnd.choice(acc_ids), StayPeriod(start, start + timedelta(days=rnd.randint(1, 7)))))
+
+            repo = DjangoBookingRepository()
+            orm_times, idx_times, orm_res, idx_res = [], [], [], []
+            for acc_id, period in queries:
+                t = time.perf_counter()
+                orm_res.append(repo.has_overlap(acc_id, period, BLOCKING_STATUSES))
+                orm_times.append(time.perf_counter() - t)
+                t = time.perf_counter()
+                idx_res.append(index.has_overlap(acc_id, period))
+                idx_times.append(time.perf_counter() - t)
+
+            if orm_res != idx_res:
+                mismatches = sum(a != b for a, b in zip(orm_res, idx_res))
+                raise CommandError(f"index disagrees with ORM on {mismatches} queries")
+            self._report("orm (EXISTS)", orm_times)
+            self._report("interval index", idx_times)
+            self.stdout.write(
+                f"speedup (median): {statistics.median(orm_times) / max(statistics.median(idx_times), 1e-9):.0f}x; "
+                f"overlapping answers: {sum(orm_res)}/{len(orm_res)}"
+            )
+        finally:
+            if not opts["keep"]:
+                Accommodation.objects.filter(id__in=acc_ids).delete()
+                get_user_model().objects.filter(email=BENCH_HOST_EMAIL).delete()
+
+    def _report(self, label: str, times) -> None:
+        us = sorted(t * 1e6 for t in times)
+        self.stdout.write(
+            f"{label:>16}: median={statistics.median(us):.1f}us p95={us[int(len(us) * 0.95) - 1]:.1f}us "
+            f"total={sum(us) / 1000:.1f}ms"
+        )
+
+    def _seed(self, rnd: random.Random, listings: int, per_listing: int):
+        User = get_user_model()
+        host = User.objects.filter(email=BENCH_HOST_EMAIL).first() or User.objects.create_user(
+            email=BENCH_HOST_EMAIL, password=None
+        )
+        acc_ids = []
+        bookings = []
+        for i in range(listings):
+            acc = Accommodation.objects.create(
+                owner_id=host.id, title=f"{BENCH_TITLE_PREFIX}{i}", description="synthetic listing",
+                city="Berlin", region="Berlin", country="DE", price_cents=10000, rooms=1, housing_type="apartment",
+            )
+            acc_ids.append(acc.id)
+            day = date.today()
+            for _ in range(per_listing):
+                day += timedelta(days=rnd.randint(0, 3))
+                nights = rnd.randint(1, 5)
+                # Отклонённые/отменённые брони — «шум», который индекс не хранит, а ORM фильтрует по статусу
+                status = BookingORM.Status.CONFIRMED if rnd.random() < 0.6 else rnd.choice(
+                    [BookingORM.Status.REJECTED, BookingORM.Status.CANCELLED]
+                )
+                bookings.append(BookingORM(
+                    accommodation_id=acc.id, guest_id=host.id, host_id=host.id,
+                    start_date=day, end_date=day + timedelta(days=nights), status=status,
+                ))
+                if status == BookingORM.Status.CONFIRMED:
+                    day += timedelta(days=nights)
+        BookingORM.objects.bulk_create(bookings, batch_size=2000)
+        return acc_ids
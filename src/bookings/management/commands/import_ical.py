@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.accommodations.infrastructure.orm.models import Accommodation
+from src.bookings.infrastructure.ical import import_external_calendar
+
+
+class Command(BaseCommand):
+    help = (
+        "Импортирует .ics внешней площадки как занятые периоды объявления. Файл читается построчно; "
+        "записываются только отличия от предыдущего импорта той же ленты."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--accommodation", type=int, required=True)
+        parser.add_argument("--file", required=True, help="Путь к .ics")
+        parser.add_argument("--source", default="default", help="Имя ленты (площадки)")
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **opts):
+        if not Accommodation.objects.filter(pk=opts["accommodation"]).exists():
+            raise CommandError("Accommodation not found")
+        try:
+            with open(opts["file"], encoding="utf-8", errors="replace", newline="") as f:
+                res = import_external_calendar(
+                    opts["accommodation"], f, source=opts["source"], batch_size=opts["batch_size"]
+                )
+        except OSError as ex:
+            raise CommandError(str(ex))
+        self.stdout.write(
+            f"source={opts['source']} created={res.created} updated={res.updated} "
+            f"deleted={res.deleted} unchanged={res.unchanged}"
+        )
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from src.bookings.application.queries import OCCUPANCY_GROUP_BY_CHOICES
+from src.bookings.infrastructure.occupancy_analytics import DEFAULT_CHUNK_SIZE, occupancy_report
+
+
+class Command(BaseCommand):
+    help = (
+        "Отчёт по загрузке объявлений за период: доля занятых ночей, средняя длина проживания и lead time. "
+        "Объявления обрабатываются порциями, память ограничена размером порции."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from", dest="date_from", type=date.fromisoformat, default=None,
+                            help="Первая ночь (YYYY-MM-DD), по умолчанию — 30 дней назад")
+        parser.add_argument("--to", dest="date_to", type=date.fromisoformat, default=None,
+                            help="Последняя ночь (YYYY-MM-DD, включительно), по умолчанию — сегодня")
+        parser.add_argument("--group-by", choices=OCCUPANCY_GROUP_BY_CHOICES, default="listing")
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Объявлений в порции")
+
+    def handle(self, *args, **opts):
+        end = opts["date_to"] or timezone.localdate()
+        start = opts["date_from"] or (end - timedelta(days=29))
+        if opts["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be >= 1")
+        try:
+            rows = occupancy_report(start, end, group_by=opts["group_by"], chunk_size=opts["chunk_size"])
+        except ValueError as ex:
+            raise CommandError(str(ex))
+        for r in rows:
+            label = " ".join(str(r[k]) for k in ("accommodation_id", "city", "month") if r[k] is not None)
+            self.stdout.write(
+                f"{label}: occupancy={r['occupancy_rate']:.2%} "
+                f"nights={r['occupied_nights']}/{r['available_nights']} stays={r['stays']} "
+                f"avg_stay={r['avg_stay_nights']} avg_lead={r['avg_lead_days']}"
+            )
+        self.stdout.write(f"rows={len(rows)} group_by={opts['group_by']} from={start} to={end}")
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from src.bookings.infrastructure.calendar import rebuild_calendar
+
+
+class Command(BaseCommand):
+    help = "Пересчитывает помесячные маски занятости (booking_month_occupancy) из подтверждённых броней."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--accommodation", type=int, action="append", dest="ids", help="Только эти объявления")
+
+    def handle(self, *args, **opts):
+        rows = rebuild_calendar(opts["ids"])
+        self.stdout.write(f"rebuilt {rows} month rows")
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0005_accommodation_average_rating_and_more'),
+        ('bookings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccommodationBookingLock',
+            fields=[
+                ('accommodation', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='booking_lock', serialize=False, to='accommodations.accommodation')),
+            ],
+            options={
+                'db_table': 'booking_locks',
+            },
+        ),
+    ]
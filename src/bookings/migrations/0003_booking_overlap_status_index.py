@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0005_accommodation_average_rating_and_more'),
+        ('bookings', '0002_accommodation_booking_lock'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='booking',
+            name='bookings_accommo_32d1c3_idx',
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['accommodation', 'status', 'start_date', 'end_date'], name='bookings_accommo_184a63_idx'),
+        ),
+    ]
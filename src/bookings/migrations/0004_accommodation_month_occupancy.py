@@ -0,0 +1,60 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:51
+
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _month_masks(start, end):
+    # Копия src.bookings.domain.calendar.month_masks (миграция не зависит от кода приложения)
+    masks = {}
+    d = start
+    while d < end:
+        m = d.replace(day=1)
+        masks[m] = masks.get(m, 0) | (1 << (d.day - 1))
+        d += timedelta(days=1)
+    return masks
+
+
+def backfill_occupancy(apps, schema_editor):
+    Booking = apps.get_model("bookings", "Booking")
+    Occupancy = apps.get_model("bookings", "AccommodationMonthOccupancy")
+    acc = {}
+    qs = Booking.objects.filter(status__in=["confirmed", "completed"]).values_list(
+        "accommodation_id", "start_date", "end_date"
+    )
+    for acc_id, start, end in qs.iterator():
+        for m, mask in _month_masks(start, end).items():
+            acc[(acc_id, m)] = acc.get((acc_id, m), 0) | mask
+    Occupancy.objects.bulk_create(
+        [Occupancy(accommodation_id=a, month=m, bits=b) for (a, m), b in acc.items()],
+        batch_size=BACKFILL_BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0005_accommodation_average_rating_and_more'),
+        ('bookings', '0003_booking_overlap_status_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccommodationMonthOccupancy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('bits', models.IntegerField(default=0)),
+                ('accommodation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='month_occupancy', to='accommodations.accommodation')),
+            ],
+            options={
+                'db_table': 'booking_month_occupancy',
+                'constraints': [models.UniqueConstraint(fields=('accommodation', 'month'), name='uniq_booking_month_occupancy')],
+            },
+        ),
+        migrations.RunPython(backfill_occupancy, migrations.RunPython.noop),
+    ]
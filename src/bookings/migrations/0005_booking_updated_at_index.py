@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0005_accommodation_average_rating_and_more'),
+        ('bookings', '0004_accommodation_month_occupancy'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['updated_at'], name='bookings_updated_199695_idx'),
+        ),
+    ]
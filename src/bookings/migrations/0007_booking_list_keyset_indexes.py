@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0005_accommodation_average_rating_and_more'),
+        ('bookings', '0006_booking_status_expired'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='booking',
+            name='bookings_guest_i_0048dc_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='booking',
+            name='bookings_host_id_802a28_idx',
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['guest', 'status', 'created_at'], name='bookings_guest_i_a13b51_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['host', 'status', 'start_date'], name='bookings_host_id_b0a312_idx'),
+        ),
+    ]
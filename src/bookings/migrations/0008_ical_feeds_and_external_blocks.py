@@ -0,0 +1,46 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0006_nightly_rate_rules'),
+        ('bookings', '0007_booking_list_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccommodationCalendarFeed',
+            fields=[
+                ('accommodation', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='calendar_feed', serialize=False, to='accommodations.accommodation')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('snapshot_version', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('snapshot_day', models.DateField(blank=True, null=True)),
+                ('snapshot', models.TextField(blank=True, default='')),
+            ],
+            options={
+                'db_table': 'booking_calendar_feeds',
+            },
+        ),
+        migrations.CreateModel(
+            name='ExternalCalendarBlock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=64)),
+                ('uid', models.CharField(max_length=255)),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('summary', models.CharField(blank=True, default='', max_length=255)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('accommodation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='external_blocks', to='accommodations.accommodation')),
+            ],
+            options={
+                'db_table': 'booking_external_blocks',
+                'indexes': [models.Index(fields=['accommodation', 'start_date', 'end_date'], name='booking_ext_accommo_aca077_idx')],
+                'constraints': [models.UniqueConstraint(fields=('accommodation', 'source', 'uid'), name='uniq_booking_external_block')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0009_accommodation_reviews_snapshot'),
+        ('bookings', '0008_ical_feeds_and_external_blocks'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', 'start_date'], name='bookings_status_f0ab31_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', 'end_date'], name='bookings_status_9dea1a_idx'),
+        ),
+    ]
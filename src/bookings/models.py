@@ -1,3 +1,15 @@
-from .infrastructure.orm.models import Booking
+from .infrastructure.orm.models import (
+    Booking,
+    AccommodationBookingLock,
+    AccommodationMonthOccupancy,
+    AccommodationCalendarFeed,
+    ExternalCalendarBlock,
+)
 
-__all__ = ["Booking"]
+__all__ = [
+    "Booking",
+    "AccommodationBookingLock",
+    "AccommodationMonthOccupancy",
+    "AccommodationCalendarFeed",
+    "ExternalCalendarBlock",
+]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from src.bookings.infrastructure.calendar import read_month_masks
+from src.bookings.infrastructure.maintenance import auto_transition_bookings
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.bookings.infrastructure.repositories import DjangoBookingRepository
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+class AutoTransitionJobTests(TestCase):
+    def setUp(self):
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        self.today = timezone.localdate()
+
+    def _booking(self, start: date, nights: int, status: str, age_days: int = 0) -> BookingORM:
+        b = BookingORM.objects.create(
+            accommodation=self.acc, guest=self.guest, host=self.host,
+            start_date=start, end_date=start + timedelta(days=nights), status=status,
+        )
+        if age_days:
+            BookingORM.objects.filter(pk=b.pk).update(created_at=timezone.now() - timedelta(days=age_days))
+        return b
+
+    def test_completes_finished_and_expires_stale_in_chunks(self):
+        finished = [self._booking(self.today - timedelta(days=10 + i * 3), 2, "confirmed") for i in range(5)]
+        ongoing = self._booking(self.today - timedelta(days=1), 3, "confirmed")
+        stale = [self._booking(self.today + timedelta(days=30 + i), 2, "requested", age_days=10) for i in range(3)]
+        started = self._booking(self.today, 2, "requested")
+        fresh = self._booking(self.today + timedelta(days=5), 2, "requested", age_days=1)
+
+        res = auto_transition_bookings(expire_after_days=7, batch_size=2, sleep_seconds=0)
+
+        self.assertEqual((res.completed, res.expired), (5, 4))
+        # 5 завершений по 2 + 3 старые заявки по 2 + 1 заявка с наступившим заездом
+        self.assertEqual(res.batches, 3 + 2 + 1)
+        statuses = dict(BookingORM.objects.values_list("id", "status"))
+        self.assertTrue(all(statuses[b.id] == "completed" for b in finished))
+        self.assertTrue(all(statuses[b.id] == "expired" for b in stale + [started]))
+        self.assertEqual(statuses[ongoing.id], "confirmed")
+        self.assertEqual(statuses[fresh.id], "requested")
+
+        # Повторный запуск — нечего делать
+        again = auto_transition_bookings(expire_after_days=7, batch_size=2, sleep_seconds=0)
+        self.assertEqual((again.completed, again.expired, again.scanned), (0, 0, 0))
+
+    def test_completed_stay_stays_in_calendar(self):
+        start = self.today - timedelta(days=3)
+        booking = self._booking(start, 2, "requested")
+        repo = DjangoBookingRepository()
+        domain = repo.get_by_id(booking.id)
+        domain.confirm(actor_user_id=self.host.id)
+        repo.update(domain)
+        auto_transition_bookings(batch_size=10, sleep_seconds=0)
+        self.assertEqual(BookingORM.objects.get(pk=booking.id).status, "completed")
+        masks = read_month_masks(self.acc.id, start, start + timedelta(days=1))
+        self.assertTrue(any(masks.values()))
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+class AvailabilityApiTests(TestCase):
+    URL = "/api/bookings/availability/"
+
+    def setUp(self):
+        self.client = APIClient()
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.free = create_accommodation(owner_id=self.host.id, title="free")
+        self.busy = create_accommodation(owner_id=self.host.id, title="busy")
+        self.requested_only = create_accommodation(owner_id=self.host.id, title="requested only")
+        self.inactive = create_accommodation(owner_id=self.host.id, title="inactive", is_active=False)
+        self.start = date.today() + timedelta(days=10)
+        self.end = self.start + timedelta(days=3)
+        self._booking(self.busy, self.start + timedelta(days=1), BookingORM.Status.CONFIRMED)
+        self._booking(self.requested_only, self.start, BookingORM.Status.REQUESTED)
+        self._booking(self.free, self.end, BookingORM.Status.CONFIRMED)  # начинается в день выезда
+
+    def _booking(self, acc, start: date, status: str) -> None:
+        BookingORM.objects.create(
+            accommodation=acc, guest=self.guest, host=self.host,
+            start_date=start, end_date=start + timedelta(days=2), status=status,
+        )
+
+    def _post(self, ids, start=None, end=None):
+        payload = {
+            "accommodation_ids": ids,
+            "start_date": (start or self.start).isoformat(),
+            "end_date": (end or self.end).isoformat(),
+        }
+        return self.client.post(self.URL, payload, format="json")
+
+    def test_bitmap_follows_request_order_in_one_query(self):
+        ids = [self.busy.id, self.free.id, 999999, self.requested_only.id, self.inactive.id]
+        with self.assertNumQueries(1):
+            resp = self._post(ids)
+        self.assertEqual(resp.status_code, 200, resp.content)
+        body = resp.json()
+        self.assertEqual(body["bitmap"], "01010")
+        self.assertEqual(body["available_ids"], [self.free.id, self.requested_only.id])
+
+    def test_validation(self):
+        self.assertEqual(self._post([]).status_code, 400)
+        self.assertEqual(self._post([self.free.id], start=self.end, end=self.start).status_code, 400)
+        self.assertEqual(self._post(list(range(1, 502))).status_code, 400)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.shared.testing.api import ensure_csrf
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+class BatchDecideApiTests(TestCase):
+    URL = "/api/bookings/batch-decide/"
+
+    def setUp(self):
+        self.client = APIClient()
+        self.host = create_user("host@example.com", roles=["host"])
+        self.other_host = create_user("other@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        self.acc2 = create_accommodation(owner_id=self.host.id, title="second")
+        self.foreign_acc = create_accommodation(owner_id=self.other_host.id, title="foreign")
+        self.start = date.today() + timedelta(days=10)
+
+    def _booking(self, acc, offset: int, nights: int, status=BookingORM.Status.REQUESTED) -> BookingORM:
+        start = self.start + timedelta(days=offset)
+        return BookingORM.objects.create(
+            accommodation=acc, guest=self.guest, host_id=acc.owner_id,
+            start_date=start, end_date=start + timedelta(days=nights), status=status,
+        )
+
+    def _post(self, items):
+        self.client.force_authenticate(user=self.host)
+        headers = ensure_csrf(self.client)
+        return self.client.post(self.URL, {"items": items}, format="json", **headers)
+
+    def test_mixed_batch_reports_per_item_outcomes(self):
+        a = self._booking(self.acc, 0, 3)
+        b = self._booking(self.acc, 1, 3)  # пересекается с a — проиграет в том же пакете
+        c = self._booking(self.acc2, 0, 3)
+        d = self._booking(self.acc2, 10, 2)
+        confirmed = self._booking(self.acc2, 20, 2, status=BookingORM.Status.CONFIRMED)
+        foreign = self._booking(self.foreign_acc, 0, 2)
+
+        resp = self._post([
+            {"booking_id": a.id, "action": "confirm"},
+            {"booking_id": b.id, "action": "confirm"},
+            {"booking_id": c.id, "action": "reject"},
+            {"booking_id": d.id, "action": "confirm"},
+            {"booking_id": confirmed.id, "action": "confirm"},
+            {"booking_id": foreign.id, "action": "reject"},
+            {"booking_id": a.id, "action": "reject"},
+        ])
+        self.assertEqual(resp.status_code, 200, resp.content)
+        body = resp.json()
+        results = body["results"]
+        self.assertEqual(body["applied"], 3)
+        self.assertEqual([r["ok"] for r in results], [True, False, True, True, False, False, False])
+        self.assertIn("overlaps", results[1]["error"])
+        self.assertEqual(results[4]["error"], "Only requested booking can be confirmed")
+        self.assertEqual(results[5]["error"], "Booking not found")
+        self.assertEqual(results[6]["error"], "Duplicate booking_id in batch")
+
+        statuses = dict(BookingORM.objects.values_list("id", "status"))
+        self.assertEqual(statuses[a.id], "confirmed")
+        self.assertEqual(statuses[b.id], "requested")
+        self.assertEqual(statuses[c.id], "rejected")
+        self.assertEqual(statuses[d.id], "confirmed")
+        self.assertEqual(statuses[foreign.id], "requested")
+
+    def test_cancel_frees_dates_for_confirmation_in_same_batch(self):
+        old = self._booking(self.acc, 0, 3, status=BookingORM.Status.CONFIRMED)
+        new = self._booking(self.acc, 1, 3)
+        resp = self._post([
+            {"booking_id": new.id, "action": "confirm"},
+            {"booking_id": old.id, "action": "cancel"},
+        ])
+        self.assertEqual(resp.status_code, 200, resp.content)
+        self.assertEqual(resp.json()["applied"], 2)
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        items = [{"booking_id": self._booking(self.acc, i * 3, 2).id, "action": "reject"} for i in range(3)]
+        self._post(items)  # прогрев (csrf, строки-замки)
+        more = [{"booking_id": self._booking(self.acc2, i * 3, 2).id, "action": "reject"} for i in range(20)]
+        with CaptureQueriesContext(connection) as small:
+            self._post(more[:2])
+        with CaptureQueriesContext(connection) as large:
+            self._post(more[2:])
+        self.assertEqual(len(large), len(small))
+
+    def test_validation(self):
+        self.assertEqual(self._post([]).status_code, 400)
+        self.assertEqual(self._post([{"booking_id": 1, "action": "approve"}]).status_code, 400)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+class BookingListsPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        self.start = date.today() + timedelta(days=10)
+        created = timezone.now()
+        self.bookings = []
+        for i in range(7):
+            b = BookingORM.objects.create(
+                accommodation=self.acc, guest=self.guest, host=self.host,
+                start_date=self.start + timedelta(days=(i * 5) % 7),  # заезды не по порядку создания
+                end_date=self.start + timedelta(days=(i * 5) % 7 + 1),
+                status="confirmed" if i % 3 == 0 else "requested",
+            )
+            # Одинаковый created_at у пар строк — курсор обязан различать их по id
+            BookingORM.objects.filter(pk=b.pk).update(created_at=created - timedelta(minutes=i // 2))
+            self.bookings.append(b)
+
+    def _walk(self, url: str, **params):
+        ids, cursor, pages = [], None, 0
+        while True:
+            query = dict(params, **({"cursor": cursor} if cursor else {}))
+            resp = self.client.get(url, query)
+            self.assertEqual(resp.status_code, 200, resp.content)
+            body = resp.json()
+            ids += [item["id"] for item in body["items"]]
+            pages += 1
+            cursor = body["next_cursor"]
+            if not cursor:
+                return ids, pages
+
+    def test_guest_pages_are_complete_and_ordered(self):
+        self.client.force_authenticate(user=self.guest)
+        ids, pages = self._walk("/api/bookings/me/", limit=3)
+        expected = [b.id for b in sorted(
+            BookingORM.objects.filter(guest=self.guest), key=lambda b: (b.created_at, b.id), reverse=True
+        )]
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 3)
+
+    def test_guest_status_and_date_filters(self):
+        self.client.force_authenticate(user=self.guest)
+        ids, _ = self._walk("/api/bookings/me/", status="confirmed", limit=2)
+        self.assertEqual(sorted(ids), sorted(b.id for b in self.bookings if b.status == "confirmed"))
+        ids, _ = self._walk("/api/bookings/me/", start_from=self.start.isoformat(), start_to=self.start.isoformat())
+        self.assertEqual(ids, [self.bookings[0].id])
+
+    def test_host_pages_by_start_date(self):
+        self.client.force_authenticate(user=self.host)
+        ids, _ = self._walk("/api/bookings/requests/", limit=2)
+        requested = sorted((b for b in self.bookings if b.status == "requested"), key=lambda b: (b.start_date, b.id))
+        self.assertEqual(ids, [b.id for b in requested])
+        ids, _ = self._walk("/api/bookings/requests/", status=["requested", "confirmed"], limit=4)
+        self.assertEqual(len(ids), 7)
+
+    def test_invalid_cursor_and_limit(self):
+        self.client.force_authenticate(user=self.guest)
+        self.assertEqual(self.client.get("/api/bookings/me/", {"cursor": "not-a-cursor"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/bookings/me/", {"limit": 0}).status_code, 400)
+        self.assertEqual(self.client.get("/api/bookings/me/", {"limit": 101}).status_code, 400)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.db import OperationalError, connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from src.bookings.application.commands import RejectBookingCommand
+from src.bookings.application.use_cases.reject_booking import RejectBookingUseCase
+from src.bookings.domain.entities import BookingStatus
+from src.bookings.infrastructure.orm.models import AccommodationBookingLock, Booking as BookingORM
+from src.bookings.infrastructure.repositories import DjangoBookingRepository
+from src.shared.testing.api import ensure_csrf
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+class BookingLockingApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+
+    def _create(self, start: date, end: date):
+        self.client.force_authenticate(user=self.guest)
+        headers = ensure_csrf(self.client)
+        payload = {"accommodation_id": self.acc.id, "start_date": start.isoformat(), "end_date": end.isoformat()}
+        return self.client.post("/api/bookings/", payload, format="json", **headers)
+
+    def test_lock_row_created_lazily_once(self):
+        start = date.today() + timedelta(days=10)
+        self.assertEqual(self._create(start, start + timedelta(days=2)).status_code, 201)
+        self.assertEqual(self._create(start + timedelta(days=5), start + timedelta(days=7)).status_code, 201)
+        self.assertEqual(AccommodationBookingLock.objects.filter(pk=self.acc.id).count(), 1)
+
+    def test_second_overlapping_request_cannot_be_confirmed(self):
+        start = date.today() + timedelta(days=10)
+        first = self._create(start, start + timedelta(days=3)).json()
+        second = self._create(start + timedelta(days=1), start + timedelta(days=4)).json()
+
+        self.client.force_authenticate(user=self.host)
+        headers = ensure_csrf(self.client)
+        resp1 = self.client.post(f"/api/bookings/{first['id']}/confirm/", **headers)
+        self.assertEqual(resp1.status_code, 200, resp1.content)
+        resp2 = self.client.post(f"/api/bookings/{second['id']}/confirm/", **headers)
+        self.assertEqual(resp2.status_code, 400, resp2.content)
+        self.assertEqual(BookingORM.objects.get(pk=second["id"]).status, BookingORM.Status.REQUESTED)
+
+
+class RunExclusiveRetryTests(TransactionTestCase):
+    def setUp(self):
+        self.host = create_user("host@example.com", roles=["host"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        self.repo = DjangoBookingRepository()
+
+    @override_settings(BOOKING_LOCK_RETRY_ATTEMPTS=3, BOOKING_LOCK_RETRY_BASE_DELAY_SECONDS=0)
+    def test_retries_lock_conflicts_then_succeeds(self):
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) < 3:
+                raise OperationalError("Deadlock found when trying to get lock")
+            return "ok"
+
+        self.assertEqual(self.repo.run_exclusive(self.acc.id, fn), "ok")
+        self.assertEqual(len(calls), 3)
+
+    @override_settings(BOOKING_LOCK_RETRY_ATTEMPTS=2, BOOKING_LOCK_RETRY_BASE_DELAY_SECONDS=0)
+    def test_gives_up_after_bounded_attempts_and_passes_domain_errors(self):
+        calls = []
+
+        def deadlock():
+            calls.append(1)
+            raise OperationalError("Lock wait timeout exceeded")
+
+        with self.assertRaises(OperationalError):
+            self.repo.run_exclusive(self.acc.id, deadlock)
+        self.assertEqual(len(calls), 2)
+
+        def overlap():
+            calls.append(1)
+            raise ValueError("Booking overlaps with an existing confirmed booking")
+
+        with self.assertRaises(ValueError):
+            self.repo.run_exclusive(self.acc.id, overlap)
+        self.assertEqual(len(calls), 3)
+
+
+class ConditionalTransitionTests(TestCase):
+    def setUp(self):
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        start = date.today() + timedelta(days=10)
+        self.booking = BookingORM.objects.create(
+            accommodation=self.acc, guest=self.guest, host=self.host,
+            start_date=start, end_date=start + timedelta(days=2),
+        )
+
+    def test_reject_is_select_plus_single_update(self):
+        with CaptureQueriesContext(connection) as ctx:
+            RejectBookingUseCase(DjangoBookingRepository()).execute(
+                RejectBookingCommand(booking_id=self.booking.id, actor_user_id=self.host.id)
+            )
+        statements = [q["sql"].split()[0].upper() for q in ctx.captured_queries]
+        self.assertEqual([s for s in statements if s in ("SELECT", "UPDATE")], ["SELECT", "UPDATE"])
+        self.assertEqual(BookingORM.objects.get(pk=self.booking.id).status, BookingORM.Status.REJECTED)
+
+    def test_stale_expected_status_updates_nothing(self):
+        repo = DjangoBookingRepository()
+        domain = repo.get_by_id(self.booking.id)
+        BookingORM.objects.filter(pk=self.booking.id).update(status=BookingORM.Status.CANCELLED)
+        domain.reject(actor_user_id=self.host.id)
+        self.assertFalse(repo.apply_transition(domain, BookingStatus.REQUESTED, host_id=self.host.id))
+        self.assertEqual(BookingORM.objects.get(pk=self.booking.id).status, BookingORM.Status.CANCELLED)
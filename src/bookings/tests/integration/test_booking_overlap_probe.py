@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.test import TestCase
+
+from src.bookings.domain.entities import BookingStatus
+from src.bookings.domain.services import BLOCKING_STATUSES
+from src.bookings.domain.value_objects import StayPeriod
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.bookings.infrastructure.repositories import DjangoBookingRepository
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+class BookingOverlapProbeTests(TestCase):
+    def setUp(self):
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        self.repo = DjangoBookingRepository()
+        self.start = date.today() + timedelta(days=10)
+
+    def _booking(self, offset: int, nights: int, status: str) -> BookingORM:
+        start = self.start + timedelta(days=offset)
+        return BookingORM.objects.create(
+            accommodation=self.acc, guest=self.guest, host=self.host,
+            start_date=start, end_date=start + timedelta(days=nights), status=status,
+        )
+
+    def test_non_blocking_statuses_do_not_overlap(self):
+        for status in (BookingORM.Status.REJECTED, BookingORM.Status.CANCELLED, BookingORM.Status.REQUESTED):
+            self._booking(0, 5, status)
+        period = StayPeriod(self.start + timedelta(days=1), self.start + timedelta(days=3))
+        with self.assertNumQueries(1):
+            self.assertFalse(self.repo.has_overlap(self.acc.id, period, BLOCKING_STATUSES))
+        self.assertTrue(self.repo.has_overlap(self.acc.id, period, {BookingStatus.REQUESTED}))
+
+    def test_confirmed_overlap_half_open_and_exclude(self):
+        confirmed = self._booking(0, 3, BookingORM.Status.CONFIRMED)
+        touching = StayPeriod(self.start + timedelta(days=3), self.start + timedelta(days=5))
+        overlapping = StayPeriod(self.start + timedelta(days=2), self.start + timedelta(days=5))
+        self.assertFalse(self.repo.has_overlap(self.acc.id, touching, BLOCKING_STATUSES))
+        self.assertTrue(self.repo.has_overlap(self.acc.id, overlapping, BLOCKING_STATUSES))
+        self.assertFalse(
+            self.repo.has_overlap(self.acc.id, overlapping, BLOCKING_STATUSES, exclude_booking_id=confirmed.id)
+        )
+        self.assertEqual(
+            [b.id for b in self.repo.find_overlaps(self.acc.id, overlapping, statuses=BLOCKING_STATUSES)],
+            [confirmed.id],
+        )
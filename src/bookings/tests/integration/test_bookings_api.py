@@ -140,7 +140,7 @@ class BookingsApiTests(TestCase):
         self.client.force_authenticate(user=self.guest)
         resp = self.client.get("/api/bookings/me/")
         self.assertEqual(resp.status_code, 200, resp.content)
-        ids = [item["id"] for item in resp.json()]
+        ids = [item["id"] for item in resp.json()["items"]]
         self.assertIn(b1["id"], ids)
         self.assertIn(b2["id"], ids)
 
@@ -148,6 +148,6 @@ class BookingsApiTests(TestCase):
         self.client.force_authenticate(user=self.host)
         resp = self.client.get("/api/bookings/requests/")
         self.assertEqual(resp.status_code, 200, resp.content)
-        ids = [item["id"] for item in resp.json()]
+        ids = [item["id"] for item in resp.json()["items"]]
         self.assertIn(b1["id"], ids)
         self.assertIn(b2["id"], ids)
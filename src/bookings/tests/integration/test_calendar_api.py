@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from src.bookings.infrastructure.calendar import rebuild_calendar
+from src.bookings.infrastructure.orm.models import AccommodationMonthOccupancy, Booking as BookingORM
+from src.shared.testing.api import ensure_csrf
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+class CalendarApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        self.start = date.today() + timedelta(days=10)
+        self.url = f"/api/accommodations/{self.acc.id}/calendar/"
+
+    def _book_and_confirm(self, start: date, nights: int) -> int:
+        self.client.force_authenticate(user=self.guest)
+        headers = ensure_csrf(self.client)
+        payload = {
+            "accommodation_id": self.acc.id,
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=nights)).isoformat(),
+        }
+        booking_id = self.client.post("/api/bookings/", payload, format="json", **headers).json()["id"]
+        self.client.force_authenticate(user=self.host)
+        headers = ensure_csrf(self.client)
+        resp = self.client.post(f"/api/bookings/{booking_id}/confirm/", **headers)
+        self.assertEqual(resp.status_code, 200, resp.content)
+        return booking_id
+
+    def _calendar(self) -> str:
+        self.client.force_authenticate(user=None)
+        frm, to = self.start - timedelta(days=1), self.start + timedelta(days=4)
+        with self.assertNumQueries(3):  # объявление + маски + блоки внешних календарей
+            resp = self.client.get(self.url, {"from": frm.isoformat(), "to": to.isoformat()})
+        self.assertEqual(resp.status_code, 200, resp.content)
+        return resp.json()["occupancy"]
+
+    def test_confirm_and_cancel_update_bitmap(self):
+        self.assertEqual(self._calendar(), "000000")
+        booking_id = self._book_and_confirm(self.start, 3)
+        self.assertEqual(self._calendar(), "011100")
+
+        self.client.force_authenticate(user=self.host)
+        headers = ensure_csrf(self.client)
+        resp = self.client.post(f"/api/bookings/{booking_id}/cancel/", **headers)
+        self.assertEqual(resp.status_code, 200, resp.content)
+        self.assertEqual(self._calendar(), "000000")
+
+    def test_rebuild_matches_incremental(self):
+        self._book_and_confirm(self.start, 2)
+        self._book_and_confirm(self.start + timedelta(days=40), 5)
+        before = dict(AccommodationMonthOccupancy.objects.values_list("month", "bits"))
+        rebuild_calendar([self.acc.id])
+        self.assertEqual(dict(AccommodationMonthOccupancy.objects.values_list("month", "bits")), before)
+
+    def test_unknown_accommodation_and_bad_range(self):
+        self.assertEqual(self.client.get("/api/accommodations/999999/calendar/").status_code, 404)
+        resp = self.client.get(self.url, {"from": "2026-01-01", "to": "2027-06-01"})
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(len(self.client.get(self.url).json()["occupancy"]), 366)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from src.bookings.domain.services import OVERLAP_ERROR
+from src.bookings.infrastructure.orm.models import ExternalCalendarBlock
+from src.shared.testing.api import ensure_csrf
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+def _feed(*events: str) -> bytes:
+    body = "".join(
+        f"BEGIN:VEVENT\r\nUID:{uid}\r\nDTSTART;VALUE=DATE:{s}\r\nDTEND;VALUE=DATE:{e}\r\nEND:VEVENT\r\n"
+        for uid, s, e in (ev.split("/") for ev in events)
+    )
+    return f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\n{body}END:VCALENDAR\r\n".encode()
+
+
+class ICalFeedApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        self.url = f"/api/accommodations/{self.acc.id}/calendar.ics"
+        self.start = date.today() + timedelta(days=5)
+
+    def _book_and_confirm(self, nights: int = 2) -> int:
+        self.client.force_authenticate(user=self.guest)
+        headers = ensure_csrf(self.client)
+        payload = {
+            "accommodation_id": self.acc.id,
+            "start_date": self.start.isoformat(),
+            "end_date": (self.start + timedelta(days=nights)).isoformat(),
+        }
+        booking_id = self.client.post("/api/bookings/", payload, format="json", **headers).json()["id"]
+        self.client.force_authenticate(user=self.host)
+        headers = ensure_csrf(self.client)
+        self.assertEqual(self.client.post(f"/api/bookings/{booking_id}/confirm/", **headers).status_code, 200)
+        self.client.force_authenticate(user=None)
+        return booking_id
+
+    def test_feed_snapshot_etag_and_invalidation(self):
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp["Content-Type"], "text/calendar; charset=utf-8")
+        self.assertNotIn(b"BEGIN:VEVENT", resp.content)
+        etag = resp["ETag"]
+
+        with self.assertNumQueries(1):  # строка ленты — тело не собирается
+            self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with self.assertNumQueries(1):  # снимок актуален — без выборки броней
+            self.assertEqual(self.client.get(self.url).content, resp.content)
+
+        booking_id = self._book_and_confirm()
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp["ETag"], etag)
+        self.assertIn(f"UID:booking-{booking_id}@ichbooking".encode(), resp.content)
+        self.assertIn(f"DTSTART;VALUE=DATE:{self.start:%Y%m%d}".encode(), resp.content)
+
+    def test_feed_not_found(self):
+        self.assertEqual(self.client.get("/api/accommodations/999999/calendar.ics").status_code, 404)
+
+    def _import(self, content: bytes, user=None, source: str = "airbnb", content_type: str = "text/calendar"):
+        self.client.force_authenticate(user=user or self.host)
+        headers = ensure_csrf(self.client)
+        upload = SimpleUploadedFile("feed.ics", content, content_type=content_type)
+        return self.client.post(
+            f"/api/accommodations/{self.acc.id}/calendar/import/",
+            {"file": upload, "source": source}, format="multipart", **headers,
+        )
+
+    def test_import_diffs_against_previous_import(self):
+        resp = self._import(_feed("a/20260301/20260303", "b/20260310/20260312"))
+        self.assertEqual(resp.status_code, 200, resp.content)
+        self.assertEqual(resp.json(), {"source": "airbnb", "created": 2, "updated": 0, "deleted": 0, "unchanged": 0})
+        untouched = ExternalCalendarBlock.objects.get(uid="a").updated_at
+
+        resp = self._import(_feed("a/20260301/20260303", "b/20260310/20260313", "c/20260401/20260402"))
+        self.assertEqual(resp.json(), {"source": "airbnb", "created": 1, "updated": 1, "deleted": 0, "unchanged": 1})
+        self.assertEqual(ExternalCalendarBlock.objects.get(uid="a").updated_at, untouched)
+        self.assertEqual(ExternalCalendarBlock.objects.get(uid="b").end_date, date(2026, 3, 13))
+
+        resp = self._import(_feed("c/20260401/20260402"))
+        self.assertEqual(resp.json()["deleted"], 2)
+        # Другая лента синхронизируется независимо
+        self._import(_feed("a/20260501/20260502"), source="booking-com")
+        self.assertEqual(
+            sorted(ExternalCalendarBlock.objects.values_list("source", "uid")),
+            [("airbnb", "c"), ("booking-com", "a")],
+        )
+
+    def test_imported_block_makes_dates_unavailable(self):
+        block_end = self.start + timedelta(days=3)
+        self.assertEqual(self._import(_feed(f"x/{self.start:%Y%m%d}/{block_end:%Y%m%d}")).status_code, 200)
+
+        self.client.force_authenticate(user=self.guest)
+        headers = ensure_csrf(self.client)
+        payload = {
+            "accommodation_id": self.acc.id,
+            "start_date": (self.start + timedelta(days=1)).isoformat(),
+            "end_date": (block_end + timedelta(days=2)).isoformat(),
+        }
+        resp = self.client.post("/api/bookings/", payload, format="json", **headers)
+        self.assertEqual(resp.status_code, 400, resp.content)
+        self.assertEqual(resp.json()["detail"], OVERLAP_ERROR)
+
+        period = {"start_date": self.start.isoformat(), "end_date": block_end.isoformat()}
+        resp = self.client.post("/api/bookings/availability/", {"accommodation_ids": [self.acc.id], **period},
+                                format="json")
+        self.assertEqual(resp.json()["available_ids"], [])
+        # Со дня выезда из блока — свободно
+        after = {"start_date": block_end.isoformat(), "end_date": (block_end + timedelta(days=2)).isoformat()}
+        resp = self.client.post("/api/bookings/availability/", {"accommodation_ids": [self.acc.id], **after},
+                                format="json")
+        self.assertEqual(resp.json()["available_ids"], [self.acc.id])
+
+        resp = self.client.get(f"/api/accommodations/{self.acc.id}/calendar/",
+                               {"from": self.start.isoformat(), "to": block_end.isoformat()})
+        self.assertEqual(resp.json()["occupancy"], "1110")
+
+    def test_import_only_owner(self):
+        other = create_user("other@example.com", roles=["host"])
+        self.assertEqual(self._import(_feed("a/20260301/20260303"), user=other).status_code, 403)
+
+    def test_malformed_feed_rejected_without_touching_blocks(self):
+        self.assertEqual(self._import(_feed("a/20260301/20260303")).status_code, 200)
+        truncated = _feed("b/20260310/20260312").replace(b"END:VCALENDAR\r\n", b"")
+        for content in (b"\x89PNG\r\n\x1a\n\x00\xff", truncated):
+            resp = self._import(content)
+            self.assertEqual(resp.status_code, 400, resp.content)
+            self.assertIn("Invalid iCalendar", resp.json()["detail"])
+        self.assertEqual(list(ExternalCalendarBlock.objects.values_list("uid", flat=True)), ["a"])
+
+    @override_settings(ICAL_IMPORT_MAX_BYTES=100)
+    def test_upload_size_and_content_type_checked(self):
+        resp = self._import(_feed("a/20260301/20260303", "b/20260310/20260312"))
+        self.assertEqual(resp.status_code, 400, resp.content)
+        self.assertIn("file", resp.json())
+        resp = self._import(b"BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n", content_type="image/png")
+        self.assertEqual(resp.status_code, 400, resp.content)
+        self.assertFalse(ExternalCalendarBlock.objects.exists())
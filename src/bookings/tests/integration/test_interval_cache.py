@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from src.bookings.domain.value_objects import StayPeriod
+from src.bookings.infrastructure.interval_cache import get_confirmed_bookings_cache, reset_confirmed_bookings_cache
+from src.bookings.infrastructure.orm.models import Booking as BookingORM, ExternalCalendarBlock
+from src.bookings.infrastructure.repositories import DjangoBookingRepository
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+@override_settings(BOOKING_INTERVAL_INDEX_ENABLED=True, BOOKING_INTERVAL_INDEX_REFRESH_SECONDS=3600)
+class ConfirmedBookingsCacheTests(TestCase):
+    def setUp(self):
+        reset_confirmed_bookings_cache()
+        self.addCleanup(reset_confirmed_bookings_cache)
+        # Фоновый поток прогрева в тестах не запускаем — только фиксируем запрос на прогрев
+        patcher = mock.patch("src.bookings.infrastructure.interval_cache.start_background_warmup")
+        self.start_warmup = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        self.repo = DjangoBookingRepository()
+        self.start = date.today() + timedelta(days=10)
+        self.period = StayPeriod(self.start, self.start + timedelta(days=3))
+
+    def _booking(self, status: str) -> BookingORM:
+        return BookingORM.objects.create(
+            accommodation=self.acc, guest=self.guest, host=self.host,
+            start_date=self.start, end_date=self.start + timedelta(days=3), status=status,
+        )
+
+    def test_cold_index_falls_back_to_database(self):
+        self._booking(BookingORM.Status.CONFIRMED)
+        cache = get_confirmed_bookings_cache()
+        self.assertIsNone(cache.has_overlap(self.acc.id, self.period))
+        self.assertEqual(self.repo.find_available([self.acc.id], self.period), [])
+        # Прогрев запрашивается лениво, первым чтением холодного индекса, и только один раз
+        self.start_warmup.assert_called_once_with()
+
+    def test_failed_warmup_is_requested_again(self):
+        cache = get_confirmed_bookings_cache()
+        self.assertIsNone(cache.has_overlap(self.acc.id, self.period))
+        cache.warmup_failed()
+        self.assertIsNone(cache.has_overlap(self.acc.id, self.period))
+        self.assertEqual(self.start_warmup.call_count, 2)
+
+    def test_warm_index_follows_status_transitions(self):
+        booking = self._booking(BookingORM.Status.REQUESTED)
+        cache = get_confirmed_bookings_cache()
+        cache.warm()
+        self.assertFalse(cache.has_overlap(self.acc.id, self.period))
+
+        domain = self.repo.get_by_id(booking.id)
+        domain.confirm(actor_user_id=self.host.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.repo.update(domain)
+        self.assertTrue(cache.has_overlap(self.acc.id, self.period))
+        other = create_accommodation(owner_id=self.host.id, title="other")
+        with self.assertNumQueries(1):  # только фильтр is_active и внешние блоки
+            self.assertEqual(self.repo.find_available([self.acc.id, other.id], self.period), [other.id])
+        ExternalCalendarBlock.objects.create(
+            accommodation=other, source="airbnb", uid="x",
+            start_date=self.start, end_date=self.start + timedelta(days=1),
+        )
+        self.assertEqual(self.repo.find_available([self.acc.id, other.id], self.period), [])
+
+        domain.cancel(actor_user_id=self.host.id, today=date.today(), cancel_deadline_days=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.repo.update(domain)
+        self.assertFalse(cache.has_overlap(self.acc.id, self.period))
+        # Периоды до горизонта прогрева индекс не покрывает
+        past = StayPeriod(timezone.localdate() - timedelta(days=5), timezone.localdate() + timedelta(days=1))
+        self.assertIsNone(cache.has_overlap(self.acc.id, past))
+
+    def test_refresh_picks_up_changes_from_other_processes(self):
+        cache = get_confirmed_bookings_cache()
+        cache.warm()
+        self._booking(BookingORM.Status.CONFIRMED)  # запись «мимо» хуков этого процесса
+        self.assertFalse(cache.has_overlap(self.acc.id, self.period))
+        cache.refresh(force=True)
+        self.assertTrue(cache.has_overlap(self.acc.id, self.period))
+
+    def test_refresh_drops_deleted_bookings(self):
+        booking = self._booking(BookingORM.Status.CONFIRMED)
+        other = create_accommodation(owner_id=self.host.id, title="other")
+        BookingORM.objects.create(
+            accommodation=other, guest=self.guest, host=self.host,
+            start_date=self.start, end_date=self.start + timedelta(days=3), status=BookingORM.Status.CONFIRMED,
+        )
+        cache = get_confirmed_bookings_cache()
+        self.assertEqual(cache.warm(), 2)
+
+        # Удаления не меняют updated_at: их находит сверка числа записей с БД
+        other_id = other.id
+        BookingORM.objects.filter(pk=booking.pk).delete()
+        other.delete()  # брони объявления удаляются каскадом
+        cache.refresh(force=True)
+        self.assertFalse(cache.has_overlap(self.acc.id, self.period))
+        self.assertFalse(cache.has_overlap(other_id, self.period))
+        self.assertEqual(self.repo.find_available([self.acc.id], self.period), [self.acc.id])
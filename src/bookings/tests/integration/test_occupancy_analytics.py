@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from src.accommodations.infrastructure.orm.models import Accommodation as AccommodationORM
+from src.bookings.infrastructure.occupancy_analytics import occupancy_matrix, occupancy_report
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+class OccupancyMatrixTests(SimpleTestCase):
+    def test_ranges_filled_and_overlaps_not_double_counted(self):
+        rows = np.array([0, 0, 1])
+        starts = np.array([1, 2, 0])
+        ends = np.array([3, 4, 5])
+        occ = occupancy_matrix(rows, starts, ends, n_listings=3, n_days=5)
+        self.assertEqual(occ.astype(int).tolist(), [[0, 1, 1, 1, 0], [1, 1, 1, 1, 1], [0, 0, 0, 0, 0]])
+
+
+class OccupancyAnalyticsTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.admin = create_user("admin@example.com")
+        self.admin.is_staff = True
+        self.admin.save(update_fields=["is_staff"])
+        self.berlin = create_accommodation(owner_id=self.host.id)
+        self.paris = create_accommodation(owner_id=self.host.id, city="Paris")
+        self.other_berlin = create_accommodation(owner_id=self.host.id)
+        self.start, self.end = date(2026, 1, 25), date(2026, 2, 3)  # 10 ночей: 7 в январе, 3 в феврале
+        AccommodationORM.objects.update(created_at=self._aware(date(2025, 12, 1)))
+
+    @staticmethod
+    def _aware(d: date) -> datetime:
+        return timezone.make_aware(datetime.combine(d, datetime.min.time()))
+
+    def _booking(self, acc, start: date, nights: int, status=BookingORM.Status.CONFIRMED, lead_days: int = 0):
+        b = BookingORM.objects.create(
+            accommodation=acc, guest=self.guest, host=self.host,
+            start_date=start, end_date=start + timedelta(days=nights), status=status,
+        )
+        BookingORM.objects.filter(pk=b.pk).update(created_at=self._aware(start - timedelta(days=lead_days)))
+
+    def _fixtures(self):
+        self._booking(self.berlin, date(2026, 1, 30), 4, lead_days=10)  # 30.01–02.02: 2 в январе + 2 в феврале
+        self._booking(self.berlin, date(2026, 1, 20), 7, status=BookingORM.Status.COMPLETED)  # 25–26.01 в диапазоне
+        self._booking(self.paris, date(2026, 1, 25), 2, lead_days=4)
+        self._booking(self.paris, date(2026, 1, 28), 3, status=BookingORM.Status.CANCELLED)  # не занимает
+
+    def test_group_by_listing(self):
+        self._fixtures()
+        rows = {r["accommodation_id"]: r for r in occupancy_report(self.start, self.end, chunk_size=2)}
+        self.assertEqual(rows[self.berlin.id]["occupied_nights"], 6)
+        self.assertEqual(rows[self.berlin.id]["available_nights"], 10)
+        self.assertEqual(rows[self.berlin.id]["occupancy_rate"], 0.6)
+        # Заезд 20.01 вне диапазона — в статистику проживаний не входит
+        self.assertEqual(rows[self.berlin.id]["stays"], 1)
+        self.assertEqual(rows[self.berlin.id]["avg_stay_nights"], 4)
+        self.assertEqual(rows[self.berlin.id]["avg_lead_days"], 10)
+        self.assertEqual(rows[self.paris.id]["occupied_nights"], 2)
+        self.assertEqual(rows[self.other_berlin.id]["occupied_nights"], 0)
+        self.assertIsNone(rows[self.other_berlin.id]["avg_stay_nights"])
+
+    def test_group_by_city_month(self):
+        self._fixtures()
+        rows = {(r["city"], r["month"]): r for r in occupancy_report(self.start, self.end, group_by="city_month")}
+        self.assertEqual(rows[("Berlin", "2026-01")]["occupied_nights"], 4)
+        self.assertEqual(rows[("Berlin", "2026-01")]["available_nights"], 14)
+        self.assertEqual(rows[("Berlin", "2026-02")]["occupied_nights"], 2)
+        self.assertEqual(rows[("Berlin", "2026-02")]["available_nights"], 6)
+        self.assertEqual(rows[("Paris", "2026-01")]["stays"], 1)
+        self.assertEqual(rows[("Paris", "2026-02")]["occupied_nights"], 0)
+
+    def test_available_nights_skip_inactive_and_not_yet_listed(self):
+        self._fixtures()
+        create_accommodation(owner_id=self.host.id, is_active=False)
+        AccommodationORM.objects.filter(pk=self.other_berlin.pk).update(created_at=self._aware(date(2026, 2, 1)))
+        late = create_accommodation(owner_id=self.host.id)
+        AccommodationORM.objects.filter(pk=late.pk).update(created_at=self._aware(date(2026, 3, 1)))
+
+        rows = {(r["city"], r["month"]): r for r in occupancy_report(self.start, self.end, group_by="city_month")}
+        # Неактивное и созданное после диапазона объявления не учитываются; other_berlin — только с 01.02
+        self.assertEqual(rows[("Berlin", "2026-01")]["available_nights"], 7)
+        self.assertEqual(rows[("Berlin", "2026-02")]["available_nights"], 6)
+        self.assertEqual(rows[("Berlin", "2026-01")]["occupancy_rate"], round(4 / 7, 4))
+
+    def test_listing_rows_sorted_by_numeric_id(self):
+        for new_id, acc in ((90009, self.paris), (100010, self.other_berlin)):
+            AccommodationORM.objects.filter(pk=acc.pk).update(id=new_id)
+        ids = [r["accommodation_id"] for r in occupancy_report(self.start, self.end)]
+        self.assertEqual(ids, [self.berlin.id, 90009, 100010])
+
+    def test_chunking_does_not_change_result(self):
+        self._fixtures()
+        self.assertEqual(
+            occupancy_report(self.start, self.end, group_by="city", chunk_size=1),
+            occupancy_report(self.start, self.end, group_by="city", chunk_size=500),
+        )
+
+    def test_endpoint_admin_only(self):
+        self._fixtures()
+        url = "/api/bookings/analytics/occupancy/"
+        params = {"from": self.start.isoformat(), "to": self.end.isoformat(), "group_by": "month"}
+        self.client.force_authenticate(user=self.host)
+        self.assertEqual(self.client.get(url, params).status_code, 403)
+
+        self.client.force_authenticate(user=self.admin)
+        resp = self.client.get(url, params)
+        self.assertEqual(resp.status_code, 200, resp.content)
+        body = resp.json()
+        self.assertEqual(body["group_by"], "month")
+        self.assertEqual([r["month"] for r in body["rows"]], ["2026-01", "2026-02"])
+        self.assertEqual(body["rows"][0]["occupied_nights"], 6)
+
+        self.assertEqual(self.client.get(url, {**params, "group_by": "country"}).status_code, 400)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+from datetime import date, datetime, timedelta, timezone
+from django.test import SimpleTestCase
+from src.bookings.domain.entities import BookingStatus
+from src.bookings.tests.factories import make_booking
+
+NOW = datetime(2026, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class BookingExpireIfStaleTests(SimpleTestCase):
+    def test_expire_old_request(self):
+        b = make_booking(start=date(2026, 6, 1), status=BookingStatus.REQUESTED)
+        b.created_at = NOW - timedelta(days=8)
+        b.expire_if_stale(today=NOW.date(), requested_before=NOW - timedelta(days=7))
+        self.assertEqual(b.status, BookingStatus.EXPIRED)
+
+    def test_expire_when_check_in_reached(self):
+        b = make_booking(start=NOW.date(), status=BookingStatus.REQUESTED)
+        b.created_at = NOW - timedelta(hours=1)
+        b.expire_if_stale(today=NOW.date(), requested_before=NOW - timedelta(days=7))
+        self.assertEqual(b.status, BookingStatus.EXPIRED)
+
+    def test_fresh_or_decided_not_expired(self):
+        fresh = make_booking(start=date(2026, 6, 1), status=BookingStatus.REQUESTED)
+        fresh.created_at = NOW - timedelta(days=1)
+        confirmed = make_booking(start=date(2026, 6, 1), status=BookingStatus.CONFIRMED)
+        confirmed.created_at = NOW - timedelta(days=30)
+        for b in (fresh, confirmed):
+            b.expire_if_stale(today=NOW.date(), requested_before=NOW - timedelta(days=7))
+        self.assertEqual(fresh.status, BookingStatus.REQUESTED)
+        self.assertEqual(confirmed.status, BookingStatus.CONFIRMED)
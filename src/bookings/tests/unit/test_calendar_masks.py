@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from datetime import date
+
+from django.test import SimpleTestCase
+
+from src.bookings.domain.calendar import month_masks, occupancy_string
+from src.bookings.domain.value_objects import StayPeriod
+
+
+class CalendarMaskTests(SimpleTestCase):
+    def test_checkout_day_is_free(self):
+        masks = month_masks(StayPeriod(date(2026, 3, 2), date(2026, 3, 5)))
+        self.assertEqual(masks, {date(2026, 3, 1): 0b1110})
+
+    def test_period_spanning_months_and_leap_day(self):
+        masks = month_masks(StayPeriod(date(2028, 1, 30), date(2028, 3, 2)))
+        self.assertEqual(masks[date(2028, 1, 1)], (1 << 29) | (1 << 30))
+        self.assertEqual(masks[date(2028, 2, 1)], (1 << 29) - 1)  # 29 ночей февраля
+        self.assertEqual(masks[date(2028, 3, 1)], 0b1)
+
+    def test_occupancy_string(self):
+        masks = month_masks(StayPeriod(date(2026, 1, 31), date(2026, 2, 2)))
+        self.assertEqual(occupancy_string(masks, date(2026, 1, 30), date(2026, 2, 3)), "01100")
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Optional
+
+from django.test import SimpleTestCase
+
+from src.bookings.application.commands import CreateBookingCommand
+from src.bookings.application.use_cases.create_booking import CreateBookingUseCase
+from src.bookings.domain.entities import Booking, BookingStatus
+from src.bookings.domain.repository_interfaces import IBookingRepository
+from src.bookings.domain.value_objects import StayPeriod
+from src.bookings.tests.factories import make_booking
+from src.shared.errors import ApplicationError
+
+
+class FakeBookingRepo(IBookingRepository):
+    """Фейк: фиксирует, что чтение пересечений и запись выполняются под блокировкой объявления."""
+
+    def __init__(self, existing: Optional[list[Booking]] = None):
+        self.items = list(existing or [])
+        self.locked: Optional[int] = None
+        self.lock_calls: list[int] = []
+
+    def run_exclusive(self, accommodation_id, fn):
+        self.lock_calls.append(accommodation_id)
+        self.locked = accommodation_id
+        try:
+            return fn()
+        finally:
+            self.locked = None
+
+    def has_overlap(self, accommodation_id, period: StayPeriod, statuses, exclude_booking_id: Optional[int] = None):
+        assert self.locked == accommodation_id, "has_overlap outside of lock"
+        self.probed_statuses = set(statuses)
+        return any(
+            b.accommodation_id == accommodation_id and b.status in self.probed_statuses and b.period.overlaps(period)
+            for b in self.items
+            if exclude_booking_id is None or b.id != exclude_booking_id
+        )
+
+    def create(self, booking: Booking) -> Booking:
+        assert self.locked == booking.accommodation_id, "create outside of lock"
+        booking.id = len(self.items) + 1
+        self.items.append(booking)
+        return booking
+
+
+class CreateBookingUseCaseTests(SimpleTestCase):
+    def _cmd(self, start: date, nights: int = 2) -> CreateBookingCommand:
+        return CreateBookingCommand(
+            accommodation_id=1, guest_id=10, host_id=20, start_date=start, end_date=start + timedelta(days=nights)
+        )
+
+    def test_check_and_insert_happen_under_lock(self):
+        repo = FakeBookingRepo()
+        start = date.today() + timedelta(days=5)
+        dto = CreateBookingUseCase(repo).execute(self._cmd(start))
+        self.assertEqual(dto.status, BookingStatus.REQUESTED)
+        self.assertEqual(repo.lock_calls, [1])
+
+    def test_overlap_with_confirmed_rejected(self):
+        start = date.today() + timedelta(days=5)
+        repo = FakeBookingRepo([make_booking(start=start, status=BookingStatus.CONFIRMED)])
+        with self.assertRaises(ApplicationError):
+            CreateBookingUseCase(repo).execute(self._cmd(start + timedelta(days=1)))
+        self.assertEqual(len(repo.items), 1)
+
+    def test_probe_uses_blocking_statuses_only(self):
+        start = date.today() + timedelta(days=5)
+        repo = FakeBookingRepo([
+            make_booking(start=start, status=BookingStatus.REJECTED),
+            make_booking(start=start, status=BookingStatus.CANCELLED),
+            make_booking(start=start, status=BookingStatus.REQUESTED),
+        ])
+        CreateBookingUseCase(repo).execute(self._cmd(start))
+        self.assertEqual(repo.probed_statuses, {BookingStatus.CONFIRMED})
+        self.assertEqual(len(repo.items), 4)
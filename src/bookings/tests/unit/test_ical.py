@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+from django.test import SimpleTestCase
+
+from src.bookings.domain.ical import CalendarEvent, CalendarFormatError, iter_events, render_ics
+
+
+class ICalTests(SimpleTestCase):
+    def test_render_then_parse_roundtrip(self):
+        events = [
+            CalendarEvent(uid="booking-1@x", start=date(2026, 3, 1), end=date(2026, 3, 4), summary="Reserved"),
+            CalendarEvent(uid="booking-2@x", start=date(2026, 3, 10), end=date(2026, 3, 11), summary="a, b" * 30),
+        ]
+        text = render_ics(events, prodid="-//t//t//EN", calname="x", stamp=datetime(2026, 1, 1, tzinfo=timezone.utc))
+        self.assertTrue(all(len(line.encode()) <= 75 for line in text.split("\r\n")))
+        self.assertEqual(list(iter_events(text.splitlines(keepends=True))), events)
+
+    def test_parse_external_feed(self):
+        feed = [
+            "BEGIN:VCALENDAR\r\n",
+            "BEGIN:VEVENT\r\n",
+            "UID:abc\r\n",
+            "DTSTART;TZID=Europe/Berlin:20260305T150000\r\n",
+            "DTEND;TZID=Europe/Berlin:20260308T110000\r\n",
+            "SUMMARY:Airbnb (Not avai\r\n",
+            " lable)\r\n",
+            "END:VEVENT\r\n",
+            "BEGIN:VEVENT\r\nUID:one-night\r\nDTSTART;VALUE=DATE:20260401\r\nEND:VEVENT\r\n",
+            "BEGIN:VEVENT\r\nUID:cancelled\r\nDTSTART:20260401\r\nSTATUS:CANCELLED\r\nEND:VEVENT\r\n",
+            "BEGIN:VEVENT\r\nDTSTART:20260401\r\nEND:VEVENT\r\n",  # без UID
+            "END:VCALENDAR\r\n",
+        ]
+        lines = "".join(feed).splitlines(keepends=True)
+        self.assertEqual(list(iter_events(lines)), [
+            CalendarEvent(uid="abc", start=date(2026, 3, 5), end=date(2026, 3, 8), summary="Airbnb (Not available)"),
+            CalendarEvent(uid="one-night", start=date(2026, 4, 1), end=date(2026, 4, 2)),
+        ])
+
+    def test_non_calendar_and_truncated_streams_rejected(self):
+        with self.assertRaises(CalendarFormatError):
+            list(iter_events(["\x89PNG\r\n", "BEGIN:VCALENDAR\r\n", "END:VCALENDAR\r\n"]))
+        truncated = ["BEGIN:VCALENDAR\r\n", "BEGIN:VEVENT\r\n", "UID:a\r\n", "DTSTART:20260401\r\n", "END:VEVENT\r\n"]
+        with self.assertRaises(CalendarFormatError):
+            list(iter_events(truncated))
+        self.assertEqual(list(iter_events(["\ufeffBEGIN:VCALENDAR\r\n", "END:VCALENDAR\r\n"])), [])
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase
+
+from src.bookings.domain.interval_index import BookingIntervalIndex
+from src.bookings.domain.value_objects import StayPeriod
+
+
+def _period(offset: int, nights: int) -> StayPeriod:
+    start = date(2026, 1, 1) + timedelta(days=offset)
+    return StayPeriod(start, start + timedelta(days=nights))
+
+
+class BookingIntervalIndexTests(SimpleTestCase):
+    def test_half_open_boundaries(self):
+        idx = BookingIntervalIndex()
+        idx.add(1, 10, _period(5, 3))  # ночи 5,6,7
+        self.assertFalse(idx.has_overlap(1, _period(2, 3)))  # выезд в день заезда
+        self.assertFalse(idx.has_overlap(1, _period(8, 2)))  # заезд в день выезда
+        self.assertTrue(idx.has_overlap(1, _period(7, 1)))
+        self.assertFalse(idx.has_overlap(2, _period(5, 3)))
+
+    def test_remove_and_readd_same_booking(self):
+        idx = BookingIntervalIndex()
+        idx.add(1, 10, _period(5, 3))
+        idx.add(1, 10, _period(20, 3))  # повторный add заменяет интервал брони
+        self.assertFalse(idx.has_overlap(1, _period(5, 3)))
+        self.assertTrue(idx.remove(1, 10))
+        self.assertFalse(idx.remove(1, 10))
+        self.assertEqual(len(idx), 0)
+
+    def test_matches_brute_force(self):
+        rnd = random.Random(7)
+        idx = BookingIntervalIndex()
+        intervals = {}
+        for booking_id in range(300):
+            acc = rnd.randint(1, 3)
+            p = _period(rnd.randrange(200), rnd.randint(1, 20))
+            idx.add(acc, booking_id, p)
+            intervals[booking_id] = (acc, p)
+        for booking_id in rnd.sample(sorted(intervals), 100):
+            acc, _ = intervals.pop(booking_id)
+            idx.remove(acc, booking_id)
+        for _ in range(500):
+            acc, q = rnd.randint(1, 3), _period(rnd.randrange(220), rnd.randint(1, 10))
+            expected = sorted(b for b, (a, p) in intervals.items() if a == acc and p.overlaps(q))
+            self.assertEqual(sorted(idx.overlapping(acc, q)), expected)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Optional
+
+from django.test import SimpleTestCase
+
+from src.bookings.application.commands import ConfirmBookingCommand, RejectBookingCommand
+from src.bookings.application.use_cases.confirm_booking import ConfirmBookingUseCase
+from src.bookings.application.use_cases.reject_booking import RejectBookingUseCase
+from src.bookings.domain.entities import Booking, BookingStatus
+from src.bookings.domain.repository_interfaces import IBookingRepository
+from src.bookings.tests.factories import make_booking
+from src.shared.errors import ApplicationError
+
+
+class FakeCasRepo(IBookingRepository):
+    """Фейк с compare-and-set: concurrent_status имитирует запись другого запроса между SELECT и UPDATE."""
+
+    def __init__(self, booking: Booking, concurrent_status: Optional[BookingStatus] = None):
+        self.row = booking
+        self.concurrent_status = concurrent_status
+        self.cas_calls = []
+
+    def get_by_id(self, booking_id: int) -> Optional[Booking]:
+        return replace(self.row) if self.row.id == booking_id else None
+
+    def run_exclusive(self, accommodation_id, fn):
+        return fn()
+
+    def has_overlap(self, accommodation_id, period, statuses, exclude_booking_id=None) -> bool:
+        return False
+
+    def apply_transition(self, booking, expected_status, *, host_id=None, guest_id=None) -> bool:
+        self.cas_calls.append((expected_status, host_id, guest_id))
+        if self.concurrent_status is not None:
+            self.row = replace(self.row, status=self.concurrent_status)
+            self.concurrent_status = None
+        if self.row.status != expected_status:
+            return False
+        self.row = replace(self.row, status=booking.status)
+        return True
+
+
+class StatusTransitionTests(SimpleTestCase):
+    def setUp(self):
+        self.booking = make_booking(status=BookingStatus.REQUESTED)
+        self.booking.id = 1
+
+    def test_confirm_is_conditional_on_read_status_and_host(self):
+        repo = FakeCasRepo(self.booking)
+        dto = ConfirmBookingUseCase(repo).execute(ConfirmBookingCommand(booking_id=1, actor_user_id=self.booking.host_id))
+        self.assertEqual(dto.status, BookingStatus.CONFIRMED)
+        self.assertEqual(repo.cas_calls, [(BookingStatus.REQUESTED, self.booking.host_id, None)])
+
+    def test_lost_race_maps_to_domain_error(self):
+        repo = FakeCasRepo(self.booking, concurrent_status=BookingStatus.REJECTED)
+        with self.assertRaisesMessage(ApplicationError, "Only requested booking can be confirmed"):
+            ConfirmBookingUseCase(repo).execute(
+                ConfirmBookingCommand(booking_id=1, actor_user_id=self.booking.host_id)
+            )
+        self.assertEqual(repo.row.status, BookingStatus.REJECTED)
+
+    def test_domain_rejects_before_any_write(self):
+        repo = FakeCasRepo(self.booking)
+        with self.assertRaisesMessage(ApplicationError, "Only host can reject booking"):
+            RejectBookingUseCase(repo).execute(RejectBookingCommand(booking_id=1, actor_user_id=self.booking.guest_id))
+        self.assertEqual(repo.cas_calls, [])
@@ -4,3 +4,24 @@ from django.apps import AppConfig
 class CommonConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'src.common'
+
+    def ready(self) -> None:
+        from src.common.infrastructure.jobs import purge_finished_jobs, register_job
+        from src.common.infrastructure.outbox import dispatch_outbox, purge_processed_events
+        from src.common.infrastructure.repositories import LOG_SEARCH_QUERY_JOB, log_search_query_job
+        from src.common.infrastructure.rollups import purge_listing_view_logs, rollup_listing_views
+        from src.common.infrastructure.scheduler import PERIODIC_JOB, register_periodic, run_periodic_job
+
+        # Обработчики фоновых задач (enqueue → run_workers)
+        register_job(LOG_SEARCH_QUERY_JOB, log_search_query_job)
+        register_job(PERIODIC_JOB, run_periodic_job)  # слоты периодических задач, занятые лидером
+
+        # Периодические задачи: лидер планировщика ставит каждый слот в очередь один раз на кластер,
+        # выполняют воркеры run_workers.
+        # Сам планировщик здесь не запускается (ready() вызывают и migrate/shell/test/run_workers) —
+        # его стартуют веб-точки входа core.wsgi/core.asgi (SCHEDULER_ENABLED) или команда run_scheduler
+        register_periodic("common.rollup_listing_views", "*/5 * * * *", rollup_listing_views)
+        register_periodic("common.purge_listing_view_logs", "30 3 * * *", purge_listing_view_logs)
+        register_periodic("common.dispatch_outbox", "* * * * *", dispatch_outbox)  # подстраховка диспетчера
+        register_periodic("common.purge_outbox_events", "40 3 * * *", purge_processed_events)
+        register_periodic("common.purge_background_jobs", "50 3 * * *", purge_finished_jobs)
@@ -0,0 +1,116 @@
+# Слой domain: расписания в формате cron (5 полей) — разбор и поиск ближайших срабатываний (без Django)
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import FrozenSet, Optional, Tuple
+
+ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+# (минимум, максимум) для: минута, час, день месяца, месяц, день недели (0 и 7 — воскресенье)
+_BOUNDS: Tuple[Tuple[int, int], ...] = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+_SEARCH_LIMIT_DAYS = 366 * 5  # дальше — расписание невыполнимо (например, 30 февраля)
+
+
+def _parse_field(raw: str, lo: int, hi: int) -> FrozenSet[int]:
+    values = set()
+    for part in raw.split(","):
+        rng, _, step_raw = part.partition("/")
+        step = int(step_raw) if step_raw else 1
+        if step < 1:
+            raise ValueError(f"Invalid step in {part!r}")
+        if rng == "*":
+            start, end = lo, hi
+        elif "-" in rng:
+            a, b = rng.split("-", 1)
+            start, end = int(a), int(b)
+        else:
+            start = int(rng)
+            end = hi if step_raw else start  # "5/15" — с 5-й каждые 15
+        if not lo <= start <= end <= hi:
+            raise ValueError(f"Value out of range {lo}-{hi} in {part!r}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronSpec:
+    """
+    Расписание «минута час день_месяца месяц день_недели» (локальное время).
+    Как в cron: если ограничены и день месяца, и день недели, достаточно совпадения любого из них.
+    """
+    expr: str
+    minutes: FrozenSet[int]
+    hours: FrozenSet[int]
+    days: FrozenSet[int]
+    months: FrozenSet[int]
+    weekdays: FrozenSet[int]  # 0 — воскресенье
+    days_restricted: bool
+    weekdays_restricted: bool
+
+    @classmethod
+    def parse(cls, expr: str) -> "CronSpec":
+        text = ALIASES.get(expr.strip(), expr.strip())
+        fields = text.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expr!r}")
+        try:
+            parsed = [_parse_field(f, lo, hi) for f, (lo, hi) in zip(fields, _BOUNDS)]
+        except ValueError as ex:
+            raise ValueError(f"Invalid cron expression {expr!r}: {ex}") from None
+        minutes, hours, days, months, weekdays = parsed
+        return cls(
+            expr=expr,
+            minutes=minutes,
+            hours=hours,
+            days=days,
+            months=months,
+            weekdays=frozenset(d % 7 for d in weekdays),
+            days_restricted=fields[2] != "*",
+            weekdays_restricted=fields[4] != "*",
+        )
+
+    def _day_matches(self, dt: datetime) -> bool:
+        dom = dt.day in self.days
+        dow = (dt.weekday() + 1) % 7 in self.weekdays
+        if self.days_restricted and self.weekdays_restricted:
+            return dom or dow
+        return dom and dow
+
+    def matches(self, dt: datetime) -> bool:
+        return (
+            dt.minute in self.minutes
+            and dt.hour in self.hours
+            and dt.month in self.months
+            and self._day_matches(dt)
+        )
+
+    def next_after(self, dt: datetime) -> datetime:
+        """Первое срабатывание строго после dt (до минуты). Неподходящие месяцы/дни/часы пропускаются целиком."""
+        cur = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=_SEARCH_LIMIT_DAYS)
+        while cur <= limit:
+            if cur.month not in self.months:
+                cur = (cur.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(cur):
+                cur = cur.replace(hour=0, minute=0) + timedelta(days=1)
+            elif cur.hour not in self.hours:
+                cur = cur.replace(minute=0) + timedelta(hours=1)
+            elif cur.minute not in self.minutes:
+                cur += timedelta(minutes=1)
+            else:
+                return cur
+        raise ValueError(f"Cron expression never fires: {self.expr!r}")
+
+    def latest_at_or_before(self, dt: datetime, not_before: datetime) -> Optional[datetime]:
+        """Последнее срабатывание в окне [not_before, dt] — «просроченный» слот, который пора выполнить."""
+        cur = dt.replace(second=0, microsecond=0)
+        while cur >= not_before:
+            if self.matches(cur):
+                return cur
+            cur -= timedelta(minutes=1)
+        return None
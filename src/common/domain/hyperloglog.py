@@ -0,0 +1,104 @@
+# Слой domain: HyperLogLog — приближённый подсчёт уникальных значений (без зависимостей от Django)
+from __future__ import annotations
+
+import hashlib
+import math
+from typing import Iterable, Optional
+
+HLL_PRECISION = 10  # 2^10 = 1024 регистра
+HLL_REGISTERS = 1 << HLL_PRECISION
+# Стандартная относительная ошибка оценки: 1.04 / sqrt(m) ≈ 3.25% при m = 1024
+HLL_RELATIVE_ERROR = 1.04 / math.sqrt(HLL_REGISTERS)
+
+_FMT_SPARSE = 1  # пары (индекс, ранг) по 2 байта: 10 бит индекса + 6 бит ранга
+_FMT_DENSE = 2  # все регистры, упакованные по 6 бит
+_DENSE_SIZE = HLL_REGISTERS * 6 // 8  # 768 байт
+_ALPHA = 0.7213 / (1 + 1.079 / HLL_REGISTERS)
+
+
+def hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """
+    HLL на 1024 регистрах. Сериализуется компактно:
+    - sparse (2 байта на ненулевой регистр) для малых кардинальностей — типичный случай «объявление × день»;
+    - dense (768 байт) — когда ненулевых регистров много.
+    Слияние (merge) — поэлементный максимум, поэтому скетчи за дни можно объединять по любому диапазону.
+    """
+
+    __slots__ = ("registers",)
+
+    def __init__(self, registers: Optional[bytearray] = None):
+        self.registers = registers if registers is not None else bytearray(HLL_REGISTERS)
+
+    def add(self, value: str) -> bool:
+        """Добавляет значение. Возвращает True, если скетч изменился (иначе запись можно пропустить)."""
+        h = hash64(value)
+        idx = h >> (64 - HLL_PRECISION)
+        rest = h & ((1 << (64 - HLL_PRECISION)) - 1)
+        rank = (64 - HLL_PRECISION) - rest.bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+            return True
+        return False
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        regs = self.registers
+        for i, r in enumerate(other.registers):
+            if r > regs[i]:
+                regs[i] = r
+        return self
+
+    def count(self) -> int:
+        m = HLL_REGISTERS
+        zeros = 0
+        total = 0.0
+        for r in self.registers:
+            total += 2.0 ** -r
+            if r == 0:
+                zeros += 1
+        estimate = _ALPHA * m * m / total
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # linear counting для малых значений
+        return int(round(estimate))
+
+    def to_bytes(self) -> bytes:
+        nonzero = [(i, r) for i, r in enumerate(self.registers) if r]
+        if len(nonzero) * 2 < _DENSE_SIZE:
+            out = bytearray([_FMT_SPARSE])
+            for i, r in nonzero:
+                out += ((i << 6) | r).to_bytes(2, "big")
+            return bytes(out)
+        packed = 0
+        for r in self.registers:
+            packed = (packed << 6) | r
+        return bytes([_FMT_DENSE]) + packed.to_bytes(_DENSE_SIZE, "big")
+
+    @classmethod
+    def from_bytes(cls, data: Optional[bytes]) -> "HyperLogLog":
+        regs = bytearray(HLL_REGISTERS)
+        if not data:
+            return cls(regs)
+        data = bytes(data)
+        fmt, body = data[0], data[1:]
+        if fmt == _FMT_SPARSE:
+            for k in range(0, len(body), 2):
+                word = int.from_bytes(body[k:k + 2], "big")
+                regs[word >> 6] = word & 0x3F
+        elif fmt == _FMT_DENSE:
+            packed = int.from_bytes(body, "big")
+            for i in range(HLL_REGISTERS - 1, -1, -1):
+                regs[i] = packed & 0x3F
+                packed >>= 6
+        else:
+            raise ValueError("Unknown HyperLogLog format")
+        return cls(regs)
+
+    @classmethod
+    def merged(cls, blobs: Iterable[Optional[bytes]]) -> "HyperLogLog":
+        acc = cls()
+        for blob in blobs:
+            acc.merge(cls.from_bytes(blob))
+        return acc
@@ -0,0 +1,337 @@
+# Слой infrastructure: очередь фоновых задач в БД (enqueue → run_workers) и пул воркеров
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from src.common.infrastructure.orm.models import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE = "default"
+WORKER_MODES = ("thread", "process")
+
+JobHandler = Callable[[Dict[str, Any]], None]
+
+# Исходы выполнения одной задачи
+DONE, RETRIED, FAILED, LOST = "done", "retried", "failed", "lost"
+
+
+@dataclass
+class WorkResult:
+    claimed: int = 0
+    done: int = 0
+    retried: int = 0
+    failed: int = 0
+    lost: int = 0  # захват истёк до завершения — задачу уже перехватил другой воркер
+    elapsed_ms: float = 0.0
+
+    def add(self, outcome: str) -> None:
+        setattr(self, outcome, getattr(self, outcome) + 1)
+
+
+_handlers: Dict[str, JobHandler] = {}
+_handlers_lock = threading.Lock()
+
+
+def register_job(name: str, handler: JobHandler) -> None:
+    """Регистрирует обработчик задачи (обычно из AppConfig.ready). Обработчик получает payload."""
+    with _handlers_lock:
+        current = _handlers.get(name)
+        if current is not None and current is not handler:
+            raise ValueError(f"Job {name!r} is already registered")
+        _handlers[name] = handler
+
+
+def enqueue(
+        name: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        queue: str = DEFAULT_QUEUE,
+        delay_seconds: float = 0,
+        priority: int = 0,
+        max_attempts: Optional[int] = None,
+) -> int:
+    """
+    Ставит задачу в очередь и возвращает её id. Внутри транзакции задача появится только после коммита
+    (и исчезнет при откате) — воркеры не увидят задачу по несохранённым данным.
+    """
+    if name not in _handlers:
+        raise ValueError(f"Unknown job: {name}")
+    job = BackgroundJob.objects.create(
+        queue=queue,
+        name=name,
+        payload=payload or {},
+        priority=priority,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        run_at=timezone.now() + timedelta(seconds=delay_seconds),
+    )
+    return job.pk
+
+
+def queue_concurrency(queue: str) -> Optional[int]:
+    """Лимит одновременно выполняемых задач очереди на все воркеры (None — без лимита)."""
+    return settings.JOB_QUEUE_CONCURRENCY.get(queue)
+
+
+def _claimable(now: datetime) -> Q:
+    # Готовая к запуску задача либо «зависшая»: воркер не отчитался за visibility timeout
+    return Q(status=BackgroundJob.Status.QUEUED, run_at__lte=now) | Q(
+        status=BackgroundJob.Status.RUNNING, locked_until__lt=now
+    )
+
+
+def claim_jobs(queue: str, limit: int, visibility_timeout: float) -> List[BackgroundJob]:
+    """
+    Захватывает до limit задач очереди одним запросом: SELECT ... FOR UPDATE SKIP LOCKED,
+    затем условный UPDATE с токеном захвата (он же защищает на СУБД без SKIP LOCKED — SQLite).
+    Лимит очереди учитывает задачи, выполняемые сейчас всеми воркерами; между подсчётом и захватом
+    возможна гонка двух воркеров — лимит может быть кратковременно превышен на размер их порций.
+    """
+    now = timezone.now()
+    token = uuid.uuid4().hex
+    with transaction.atomic():
+        cap = queue_concurrency(queue)
+        if cap is not None:
+            running = BackgroundJob.objects.filter(
+                queue=queue, status=BackgroundJob.Status.RUNNING, locked_until__gte=now
+            ).count()
+            limit = min(limit, cap - running)
+        if limit <= 0:
+            return []
+        ids = list(
+            BackgroundJob.objects.select_for_update(skip_locked=True)
+            .filter(_claimable(now), queue=queue)
+            .order_by("-priority", "run_at", "id")
+            .values_list("id", flat=True)[:limit]
+        )
+        if not ids:
+            return []
+        BackgroundJob.objects.filter(_claimable(now), id__in=ids).update(
+            status=BackgroundJob.Status.RUNNING,
+            locked_until=now + timedelta(seconds=visibility_timeout),
+            claim_token=token,
+            attempts=F("attempts") + 1,
+            started_at=now,
+        )
+    return list(BackgroundJob.objects.filter(claim_token=token, id__in=ids).order_by("-priority", "run_at", "id"))
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    base = settings.JOB_RETRY_BASE_DELAY_SECONDS
+    return timedelta(seconds=min(base * (2 ** (attempts - 1)), settings.JOB_RETRY_MAX_DELAY_SECONDS))
+
+
+def run_job(job: BackgroundJob) -> str:
+    """
+    Выполняет захваченную задачу и фиксирует исход. Все отметки — условные по claim_token:
+    если захват истёк и задачу перехватил другой воркер, результат этого запуска не записывается (LOST).
+    Обработчик сам управляет транзакциями: долгие задачи не держат одну транзакцию на всё время работы.
+    """
+    owned = BackgroundJob.objects.filter(pk=job.pk, claim_token=job.claim_token)
+    if job.attempts > job.max_attempts:
+        # Перехвачена после истечения захвата на последней попытке — больше не запускаем
+        updated = owned.update(
+            status=BackgroundJob.Status.FAILED, locked_until=None, finished_at=timezone.now(),
+            last_error="visibility timeout exceeded on last attempt",
+        )
+        return FAILED if updated else LOST
+    try:
+        handler = _handlers.get(job.name)
+        if handler is None:
+            raise LookupError(f"No handler registered for job {job.name!r}")
+        handler(job.payload)
+    except Exception as ex:  # noqa: BLE001 — любой сбой обработчика ведёт к повтору
+        error = repr(ex)[:2000]
+        if job.attempts >= job.max_attempts:
+            updated = owned.update(
+                status=BackgroundJob.Status.FAILED, locked_until=None, finished_at=timezone.now(), last_error=error
+            )
+            logger.error("jobs: %s failed after %s attempts: %s", job, job.attempts, error)
+            return FAILED if updated else LOST
+        updated = owned.update(
+            status=BackgroundJob.Status.QUEUED,
+            run_at=timezone.now() + _retry_delay(job.attempts),
+            locked_until=None,
+            last_error=error,
+        )
+        logger.warning("jobs: %s attempt %s failed: %s", job, job.attempts, error)
+        return RETRIED if updated else LOST
+    updated = owned.update(status=BackgroundJob.Status.DONE, locked_until=None, finished_at=timezone.now())
+    return DONE if updated else LOST
+
+
+def _run_in_thread(job: BackgroundJob) -> str:
+    try:
+        return run_job(job)
+    finally:
+        connections.close_all()  # соединения потокозависимы: закрываем соединения этого потока
+
+
+def _init_process() -> None:
+    # fork наследует настроенный Django, spawn — нет
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+    import django
+
+    django.setup()
+
+
+def _run_in_process(job_id: int, claim_token: str) -> str:
+    try:
+        job = BackgroundJob.objects.filter(pk=job_id, claim_token=claim_token).first()
+        return run_job(job) if job is not None else LOST
+    finally:
+        connections.close_all()
+
+
+def process_jobs(
+        queues: Sequence[str] = (DEFAULT_QUEUE,),
+        *,
+        batch_size: Optional[int] = None,
+        max_jobs: Optional[int] = None,
+        visibility_timeout: Optional[float] = None,
+) -> WorkResult:
+    """Выполняет доступные задачи в текущем потоке, пока очереди не опустеют (или до max_jobs)."""
+    batch_size = batch_size or settings.JOB_CLAIM_BATCH_SIZE
+    visibility_timeout = visibility_timeout or settings.JOB_VISIBILITY_TIMEOUT_SECONDS
+    result = WorkResult()
+    t0 = time.perf_counter()
+    progressed = True
+    while progressed:
+        progressed = False
+        for queue in queues:
+            limit = batch_size if max_jobs is None else min(batch_size, max_jobs - result.claimed)
+            if limit <= 0:
+                break
+            jobs = claim_jobs(queue, limit, visibility_timeout)
+            result.claimed += len(jobs)
+            progressed = progressed or bool(jobs)
+            for job in jobs:
+                result.add(run_job(job))
+    result.elapsed_ms = (time.perf_counter() - t0) * 1000
+    return result
+
+
+class WorkerPool:
+    """
+    Пул воркеров: главный поток захватывает задачи порциями (не больше свободных слотов пула)
+    и раздаёт их потокам или процессам. Очереди обходятся по кругу, чтобы одна не вытесняла остальные.
+    """
+
+    def __init__(
+            self,
+            queues: Sequence[str] = (DEFAULT_QUEUE,),
+            *,
+            concurrency: Optional[int] = None,
+            mode: Optional[str] = None,
+            batch_size: Optional[int] = None,
+            visibility_timeout: Optional[float] = None,
+            poll_interval: Optional[float] = None,
+    ):
+        self.queues = list(queues)
+        self.concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+        self.mode = mode or settings.JOB_WORKER_MODE
+        if self.mode not in WORKER_MODES:
+            raise ValueError(f"mode must be one of {WORKER_MODES}")
+        self.batch_size = batch_size or settings.JOB_CLAIM_BATCH_SIZE
+        self.visibility_timeout = visibility_timeout or settings.JOB_VISIBILITY_TIMEOUT_SECONDS
+        self.poll_interval = settings.JOB_POLL_INTERVAL_SECONDS if poll_interval is None else poll_interval
+        self.stop_event = threading.Event()
+        self._next_queue = 0
+
+    def _executor(self) -> Executor:
+        if self.mode == "process":
+            connections.close_all()  # дочерние процессы не должны унаследовать открытые соединения
+            return ProcessPoolExecutor(max_workers=self.concurrency, initializer=_init_process)
+        return ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="job-worker")
+
+    def _submit(self, executor: Executor, job: BackgroundJob) -> Future:
+        if self.mode == "process":
+            return executor.submit(_run_in_process, job.pk, job.claim_token)
+        return executor.submit(_run_in_thread, job)
+
+    def _claim(self, free: int) -> Tuple[List[BackgroundJob], bool]:
+        """Захваченные задачи и признак, что все очереди удалось опросить (сбой БД — повтор на следующем круге)."""
+        claimed: List[BackgroundJob] = []
+        polled = True
+        for _ in range(len(self.queues)):
+            if free - len(claimed) <= 0:
+                break
+            queue = self.queues[self._next_queue]
+            self._next_queue = (self._next_queue + 1) % len(self.queues)
+            try:
+                claimed += claim_jobs(queue, min(self.batch_size, free - len(claimed)), self.visibility_timeout)
+            except DatabaseError as ex:
+                polled = False
+                logger.warning("jobs: claim from %r failed: %r", queue, ex)
+        return claimed, polled
+
+    def run(self, *, stop_when_idle: bool = False) -> WorkResult:
+        """Работает до stop_event (или до опустошения очередей при stop_when_idle); дожидается начатых задач."""
+        result = WorkResult()
+        t0 = time.perf_counter()
+        in_flight: Dict[Future, BackgroundJob] = {}
+        with self._executor() as executor:
+            while True:
+                jobs, polled = [], True
+                if not self.stop_event.is_set():
+                    jobs, polled = self._claim(self.concurrency - len(in_flight))
+                result.claimed += len(jobs)
+                for job in jobs:
+                    in_flight[self._submit(executor, job)] = job
+                if not in_flight:
+                    if self.stop_event.is_set() or (stop_when_idle and polled):
+                        break
+                    self.stop_event.wait(self.poll_interval)
+                    continue
+                finished, _ = wait(in_flight, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    job = in_flight.pop(future)
+                    try:
+                        result.add(future.result())
+                    except Exception:  # noqa: BLE001 — сбой самого воркера (например, упавший процесс)
+                        logger.exception("jobs: worker crashed on %s", job)
+                        result.add(LOST)  # задача вернётся в очередь по истечении захвата
+        result.elapsed_ms = (time.perf_counter() - t0) * 1000
+        return result
+
+
+def job_counts() -> Dict[str, Dict[str, int]]:
+    """{queue: {status: count}} — для мониторинга."""
+    counts: Dict[str, Dict[str, int]] = {}
+    rows = (
+        BackgroundJob.objects.order_by().values("queue", "status").annotate(n=Count("id"))
+        .values_list("queue", "status", "n")
+    )
+    for queue, status, n in rows:
+        counts.setdefault(queue, {})[status] = n
+    return counts
+
+
+def purge_finished_jobs(*, retention_days: Optional[int] = None, batch_size: int = 1000) -> int:
+    """Удаляет выполненные задачи старше retention_days порциями (упавшие оставляем для разбора)."""
+    retention_days = settings.JOB_RETENTION_DAYS if retention_days is None else retention_days
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    total = 0
+    while True:
+        ids = list(
+            BackgroundJob.objects.filter(status=BackgroundJob.Status.DONE, finished_at__lt=cutoff)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return total
+        deleted, _ = BackgroundJob.objects.filter(id__in=ids).delete()
+        total += deleted
@@ -0,0 +1,84 @@
+# Слой infrastructure: дневная воронка объявлений (показы → просмотры → заявки → подтверждения)
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db.models import F
+from django.utils import timezone
+
+from src.accommodations.infrastructure.orm.models import Accommodation as AccORM
+from src.common.infrastructure.orm.models import ListingDailyStats
+from src.common.infrastructure.rollups import views_by_day
+
+FUNNEL_COUNTERS = ("impressions", "views", "booking_requests", "confirmations")
+
+
+def _bump(accommodation_ids: Iterable[int], day: Optional[date] = None, **deltas: int) -> None:
+    """
+    Атомарно прибавляет дельты к дневным счётчикам: вставка недостающих строк (конфликты игнорируются)
+    + один UPDATE ... SET x = x + d. Два запроса на событие независимо от числа объявлений.
+    """
+    ids = sorted(set(accommodation_ids))
+    if not ids:
+        return
+    day = day or timezone.localdate()
+    ListingDailyStats.objects.bulk_create(
+        [ListingDailyStats(accommodation_id=i, day=day) for i in ids], ignore_conflicts=True
+    )
+    ListingDailyStats.objects.filter(accommodation_id__in=ids, day=day).update(
+        **{field: F(field) + delta for field, delta in deltas.items()}
+    )
+
+
+def record_impressions(accommodation_ids: Iterable[int]) -> None:
+    _bump(accommodation_ids, impressions=1)
+
+
+def record_booking_requested(accommodation_id: int) -> None:
+    _bump([accommodation_id], booking_requests=1)
+
+
+def record_booking_confirmed(accommodation_id: int, count: int = 1) -> None:
+    _bump([accommodation_id], confirmations=count)
+
+
+def _rate(num: int, den: int) -> float:
+    return round(num / den, 4) if den else 0.0
+
+
+def _with_rates(c: Dict[str, Any]) -> Dict[str, Any]:
+    c["view_rate"] = _rate(c["views"], c["impressions"])
+    c["request_rate"] = _rate(c["booking_requests"], c["views"])
+    c["confirmation_rate"] = _rate(c["confirmations"], c["booking_requests"])
+    return c
+
+
+def host_funnel_stats(owner_id: int, start: date, end: date) -> List[Dict[str, Any]]:
+    """
+    Воронка по всем объявлениям хоста за дни [start, end] (включительно) из предагрегированных таблиц.
+    Три запроса независимо от числа объявлений; в days — только дни с активностью.
+    """
+    listings = list(AccORM.objects.filter(owner_id=owner_id).order_by("id").values_list("id", "title"))
+    ids = [acc_id for acc_id, _ in listings]
+    per_day: Dict[int, Dict[date, Dict[str, Any]]] = {acc_id: {} for acc_id in ids}
+
+    def _cell(acc_id: int, day: date) -> Dict[str, Any]:
+        return per_day[acc_id].setdefault(day, {"day": day, **{k: 0 for k in FUNNEL_COUNTERS}})
+
+    if ids:
+        rows = ListingDailyStats.objects.filter(
+            accommodation_id__in=ids, day__gte=start, day__lte=end
+        ).values_list("accommodation_id", "day", "impressions", "booking_requests", "confirmations")
+        for acc_id, day, impressions, requests, confirmations in rows:
+            cell = _cell(acc_id, day)
+            cell.update(impressions=impressions, booking_requests=requests, confirmations=confirmations)
+        for (acc_id, day), (views, _) in views_by_day(ids, start, end + timedelta(days=1)).items():
+            _cell(acc_id, day)["views"] = views
+
+    result: List[Dict[str, Any]] = []
+    for acc_id, title in listings:
+        days = [_with_rates(per_day[acc_id][d]) for d in sorted(per_day[acc_id])]
+        totals = {k: sum(d[k] for d in days) for k in FUNNEL_COUNTERS}
+        result.append({"accommodation_id": acc_id, "title": title, "totals": _with_rates(totals), "days": days})
+    return result
@@ -3,12 +3,14 @@ from __future__ import annotations
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class SearchQueryLog(models.Model):
     """
     Лог поискового запроса (только при наличии фильтров/keyword).
-    Нормализуем и строим query_signature (агрегация по одинаковым запросам).
+    Нормализуем и строим query_signature (читаемая форма) и query_hash —
+    64-битный ключ, по которому идёт агрегация одинаковых запросов.
     """
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, null=True, blank=True,
@@ -25,28 +27,34 @@ class SearchQueryLog(models.Model):
     rooms_max = models.IntegerField(null=True, blank=True)
     housing_types_csv = models.CharField(max_length=255, blank=True, default="")  # "apartment,studio"
 
-    # Нормализованный ключ (сигнатура) для агрегации
-    query_signature = models.CharField(max_length=255, db_index=True)
+    # Нормализованная сигнатура в читаемом виде (без индекса)
+    query_signature = models.CharField(max_length=255)
+    # Компактный ключ сигнатуры для группировки и индексов
+    query_hash = models.BigIntegerField()
 
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     class Meta:
         db_table = "search_query_logs"
         indexes = [
-            models.Index(fields=["query_signature", "created_at"]),
+            models.Index(fields=["query_hash", "created_at"]),
         ]
 
     def __str__(self) -> str:
         return f"SearchLog[{self.query_signature}]"
 
+
 class ListingViewLog(models.Model):
     """
     Лог фактов просмотра объявления.
     user — опционально (анонимные просмотры тоже считаем).
+    Без FK-каскада: удаление объявления не должно удалять миллионы строк одним запросом,
+    «осиротевшие» записи уходят по ретенции (см. infrastructure/rollups.py).
     """
     accommodation = models.ForeignKey(
         "accommodations.Accommodation",
-        on_delete=models.CASCADE,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
         related_name="view_logs",
         db_index=True,
     )
@@ -68,3 +76,218 @@ class ListingViewLog(models.Model):
 
     def __str__(self) -> str:
         return f"ViewLog acc={self.accommodation_id} by={self.user_id or 'anon'}"
+
+
+class ListingViewDaily(models.Model):
+    """
+    Дневной агрегат просмотров объявления (строится из ListingViewLog).
+    unique_users — число различных авторизованных пользователей за день.
+    """
+    accommodation = models.ForeignKey(
+        "accommodations.Accommodation",
+        on_delete=models.CASCADE,
+        related_name="view_daily",
+    )
+    day = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+    unique_users = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "listing_view_daily"
+        constraints = [
+            models.UniqueConstraint(fields=["accommodation", "day"], name="uniq_listing_view_daily"),
+        ]
+        indexes = [
+            models.Index(fields=["day"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"ViewDaily acc={self.accommodation_id} {self.day}: {self.views}"
+
+
+class ListingVisitorsDaily(models.Model):
+    """
+    HyperLogLog-скетч уникальных посетителей объявления за день (авторизованные + анонимные по отпечатку).
+    Формат hll — src.common.domain.hyperloglog.HyperLogLog.to_bytes().
+    """
+    accommodation = models.ForeignKey(
+        "accommodations.Accommodation",
+        on_delete=models.CASCADE,
+        related_name="visitors_daily",
+    )
+    day = models.DateField()
+    hll = models.BinaryField(max_length=1024)
+
+    class Meta:
+        db_table = "listing_visitors_daily"
+        constraints = [
+            models.UniqueConstraint(fields=["accommodation", "day"], name="uniq_listing_visitors_daily"),
+        ]
+
+    def __str__(self) -> str:
+        return f"VisitorsDaily acc={self.accommodation_id} {self.day}"
+
+
+class ListingDailyStats(models.Model):
+    """
+    Дневная воронка объявления, поддерживается инкрементально (F-дельты):
+    impressions — попадания в фильтрованную выдачу, booking_requests — созданные заявки,
+    confirmations — подтверждения хостом. Просмотры берутся из ListingViewDaily.
+    """
+    accommodation = models.ForeignKey(
+        "accommodations.Accommodation",
+        on_delete=models.CASCADE,
+        related_name="daily_stats",
+    )
+    day = models.DateField()
+    impressions = models.PositiveIntegerField(default=0)
+    booking_requests = models.PositiveIntegerField(default=0)
+    confirmations = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "listing_daily_stats"
+        constraints = [
+            models.UniqueConstraint(fields=["accommodation", "day"], name="uniq_listing_daily_stats"),
+        ]
+
+    def __str__(self) -> str:
+        return f"DailyStats acc={self.accommodation_id} {self.day}"
+
+
+class RollupCheckpoint(models.Model):
+    """High-water mark инкрементальных джоб: последний обработанный id исходной таблицы."""
+    name = models.CharField(max_length=64, unique=True)
+    last_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "rollup_checkpoints"
+
+    def __str__(self) -> str:
+        return f"Checkpoint[{self.name}]={self.last_id}"
+
+
+class OutboxEvent(models.Model):
+    """
+    Transactional outbox: событие пишется в той же транзакции, что и изменение агрегата,
+    а побочные эффекты выполняет диспетчер (dispatch_outbox) вне пользовательского запроса.
+    """
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"  # исчерпаны попытки — нужен разбор
+
+    topic = models.CharField(max_length=64)
+    aggregate_type = models.CharField(max_length=32)
+    aggregate_id = models.BigIntegerField()
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    # Захват диспетчером: пока locked_until в будущем, событие не выдаётся другим экземплярам
+    locked_until = models.DateTimeField(null=True, blank=True)
+    claim_token = models.CharField(max_length=32, blank=True, default="")
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "outbox_events"
+        indexes = [
+            models.Index(fields=["status", "available_at"]),
+            models.Index(fields=["status", "processed_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"Outbox#{self.pk} {self.topic} {self.aggregate_type}={self.aggregate_id} {self.status}"
+
+
+class BackgroundJob(models.Model):
+    """
+    Фоновая задача очереди (enqueue → run_workers). Воркер захватывает задачу на visibility timeout:
+    не успел отчитаться (упал/завис) — задача снова становится доступной другим воркерам.
+    """
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"  # исчерпаны попытки
+
+    queue = models.CharField(max_length=32, default="default")
+    name = models.CharField(max_length=100)  # имя зарегистрированного обработчика
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.QUEUED)
+    priority = models.SmallIntegerField(default=0)  # больше — раньше
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    claim_token = models.CharField(max_length=32, blank=True, default="")
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "background_jobs"
+        indexes = [
+            models.Index(fields=["queue", "status", "run_at"]),
+            models.Index(fields=["status", "locked_until"]),
+            models.Index(fields=["status", "finished_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"Job#{self.pk} {self.queue}:{self.name} {self.status}"
+
+
+class SchedulerLease(models.Model):
+    """
+    Аренда лидерства планировщика: периодические задачи запускает только держатель непросроченной аренды.
+    Реплика, переставшая продлевать аренду, теряет лидерство по истечении expires_at.
+    """
+    name = models.CharField(max_length=64, primary_key=True)
+    holder = models.CharField(max_length=128)
+    expires_at = models.DateTimeField()
+    acquired_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "scheduler_leases"
+
+    def __str__(self) -> str:
+        return f"Lease {self.name} → {self.holder} until {self.expires_at:%Y-%m-%d %H:%M:%S}"
+
+
+class ScheduledJobRun(models.Model):
+    """
+    История запусков периодических задач. Уникальность (job, scheduled_for) гарантирует,
+    что слот расписания выполняется в кластере ровно один раз, даже при смене лидера.
+    Лидер занимает слот (queued) и ставит задачу в очередь фоновых задач; воркер переводит её в running.
+    """
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        SUCCEEDED = "succeeded", "Succeeded"
+        FAILED = "failed", "Failed"
+
+    job = models.CharField(max_length=100)
+    scheduled_for = models.DateTimeField()
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.RUNNING)
+    holder = models.CharField(max_length=128)
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration_ms = models.PositiveIntegerField(null=True, blank=True)
+    result = models.CharField(max_length=255, blank=True, default="")
+    error = models.TextField(blank=True, default="")
+
+    class Meta:
+        db_table = "scheduled_job_runs"
+        constraints = [
+            models.UniqueConstraint(fields=["job", "scheduled_for"], name="uniq_scheduled_job_slot"),
+        ]
+        indexes = [
+            models.Index(fields=["status", "started_at"]),
+            models.Index(fields=["started_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.job}@{self.scheduled_for:%Y-%m-%d %H:%M} {self.status}"
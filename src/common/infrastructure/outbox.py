@@ -0,0 +1,215 @@
+# Слой infrastructure: transactional outbox — запись событий в транзакции изменения и их асинхронная доставка
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from src.common.infrastructure.orm.models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+# Темы событий (topic). Полезная нагрузка — минимальный JSON, обработчик перечитывает агрегат сам
+BOOKING_STATUS_CHANGED = "booking.status_changed"
+REVIEW_CHANGED = "review.changed"
+ACCOMMODATION_CHANGED = "accommodation.changed"
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    id: int
+    topic: str
+    aggregate_type: str
+    aggregate_id: int
+    payload: Dict[str, Any]
+    attempts: int
+
+
+OutboxHandler = Callable[[OutboxMessage], None]
+EventSpec = Tuple[str, str, int, Optional[Dict[str, Any]]]  # (topic, aggregate_type, aggregate_id, payload)
+
+
+@dataclass
+class DispatchResult:
+    batches: int = 0
+    claimed: int = 0
+    done: int = 0
+    retried: int = 0
+    failed: int = 0
+    elapsed_ms: float = 0.0
+    batch_ms: List[float] = field(default_factory=list)
+
+
+@dataclass
+class OutboxStats:
+    pending: int
+    failed: int
+    oldest_pending_id: Optional[int]
+    lag_seconds: float  # возраст самого старого ожидающего события (0 — очередь пуста)
+
+
+_handlers: Dict[str, List[OutboxHandler]] = {}
+_handlers_lock = threading.Lock()
+
+
+def register_outbox_handler(topic: str, handler: OutboxHandler) -> None:
+    """Подписка на тему (обычно из AppConfig.ready). Повторная регистрация того же обработчика игнорируется."""
+    with _handlers_lock:
+        handlers = _handlers.setdefault(topic, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+
+def publish_event(
+        topic: str, aggregate_type: str, aggregate_id: int, payload: Optional[Dict[str, Any]] = None
+) -> None:
+    publish_events([(topic, aggregate_type, aggregate_id, payload)])
+
+
+def publish_events(events: Iterable[EventSpec]) -> None:
+    """
+    Пишет события одним INSERT. Вызывать внутри транзакции изменения: откат — и событий не будет,
+    коммит — событие гарантированно дойдёт до обработчиков (at-least-once).
+    """
+    rows = [
+        OutboxEvent(topic=topic, aggregate_type=agg_type, aggregate_id=agg_id, payload=payload or {})
+        for topic, agg_type, agg_id, payload in events
+    ]
+    if rows:
+        OutboxEvent.objects.bulk_create(rows)
+
+
+def _claimable(now: datetime) -> Q:
+    return Q(status=OutboxEvent.Status.PENDING, available_at__lte=now) & (
+        Q(locked_until__isnull=True) | Q(locked_until__lt=now)
+    )
+
+
+def claim_events(batch_size: int, lease_seconds: float) -> List[OutboxEvent]:
+    """
+    Захват порции: SELECT ... FOR UPDATE SKIP LOCKED (параллельные диспетчеры берут разные строки),
+    затем условный UPDATE с токеном захвата — он же защищает на СУБД без SKIP LOCKED (SQLite).
+    Захват — короткая транзакция; обработка идёт вне её, упавший диспетчер освобождает события по lease.
+    """
+    now = timezone.now()
+    token = uuid.uuid4().hex
+    with transaction.atomic():
+        ids = list(
+            OutboxEvent.objects.select_for_update(skip_locked=True)
+            .filter(_claimable(now))
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return []
+        OutboxEvent.objects.filter(_claimable(now), id__in=ids).update(
+            locked_until=now + timedelta(seconds=lease_seconds),
+            claim_token=token,
+            attempts=F("attempts") + 1,
+        )
+    return list(OutboxEvent.objects.filter(claim_token=token, id__in=ids).order_by("id"))
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    base = settings.OUTBOX_RETRY_BASE_DELAY_SECONDS
+    return timedelta(seconds=min(base * (2 ** (attempts - 1)), settings.OUTBOX_RETRY_MAX_DELAY_SECONDS))
+
+
+def _process(event: OutboxEvent, result: DispatchResult) -> None:
+    message = OutboxMessage(
+        id=event.id,
+        topic=event.topic,
+        aggregate_type=event.aggregate_type,
+        aggregate_id=event.aggregate_id,
+        payload=event.payload,
+        attempts=event.attempts,
+    )
+    owned = OutboxEvent.objects.filter(pk=event.pk, claim_token=event.claim_token)
+    try:
+        with transaction.atomic():
+            for handler in list(_handlers.get(event.topic, ())):
+                handler(message)
+            # Отметка — в транзакции обработчиков: эффект и «обработано» фиксируются вместе
+            owned.update(status=OutboxEvent.Status.DONE, processed_at=timezone.now(), locked_until=None)
+        result.done += 1
+    except Exception as ex:  # noqa: BLE001 — любой сбой обработчика ведёт к повтору
+        now = timezone.now()
+        if event.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            owned.update(status=OutboxEvent.Status.FAILED, locked_until=None, last_error=repr(ex)[:2000])
+            result.failed += 1
+            logger.error("outbox: event %s (%s) failed after %s attempts: %r",
+                         event.pk, event.topic, event.attempts, ex)
+        else:
+            owned.update(
+                available_at=now + _retry_delay(event.attempts), locked_until=None, last_error=repr(ex)[:2000]
+            )
+            result.retried += 1
+            logger.warning("outbox: event %s (%s) attempt %s failed: %r", event.pk, event.topic, event.attempts, ex)
+
+
+def dispatch_outbox(
+        *,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+        lease_seconds: Optional[float] = None,
+) -> DispatchResult:
+    """Обрабатывает доступные события порциями, пока очередь не опустеет (или до max_batches)."""
+    batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+    lease_seconds = lease_seconds or settings.OUTBOX_LEASE_SECONDS
+    result = DispatchResult()
+    t0 = time.perf_counter()
+    while max_batches is None or result.batches < max_batches:
+        tb = time.perf_counter()
+        events = claim_events(batch_size, lease_seconds)
+        if not events:
+            break
+        for event in events:
+            _process(event, result)
+        ms = (time.perf_counter() - tb) * 1000
+        result.batches += 1
+        result.claimed += len(events)
+        result.batch_ms.append(ms)
+        logger.info("outbox: batch=%s claimed=%s %.1fms", result.batches, len(events), ms)
+        if len(events) < batch_size:
+            break
+    result.elapsed_ms = (time.perf_counter() - t0) * 1000
+    return result
+
+
+def outbox_stats(now: Optional[datetime] = None) -> OutboxStats:
+    """Метрики отставания: размер очереди и возраст самого старого необработанного события."""
+    now = now or timezone.now()
+    pending = OutboxEvent.objects.filter(status=OutboxEvent.Status.PENDING)
+    oldest = pending.order_by("id").values_list("id", "created_at").first()
+    return OutboxStats(
+        pending=pending.count(),
+        failed=OutboxEvent.objects.filter(status=OutboxEvent.Status.FAILED).count(),
+        oldest_pending_id=oldest[0] if oldest else None,
+        lag_seconds=max(0.0, (now - oldest[1]).total_seconds()) if oldest else 0.0,
+    )
+
+
+def purge_processed_events(*, retention_days: Optional[int] = None, batch_size: int = 1000) -> int:
+    """Удаляет обработанные события старше retention_days порциями. Возвращает число удалённых."""
+    retention_days = settings.OUTBOX_RETENTION_DAYS if retention_days is None else retention_days
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    total = 0
+    while True:
+        ids = list(
+            OutboxEvent.objects.filter(status=OutboxEvent.Status.DONE, processed_at__lt=cutoff)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return total
+        deleted, _ = OutboxEvent.objects.filter(id__in=ids).delete()
+        total += deleted
@@ -1,12 +1,16 @@
 # Слой infrastructure: реализации репозиториев (Django ORM), адаптеры для domain.repository_interfaces
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import hashlib
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
 from django.db.models import Count, QuerySet, Max
+from django.utils import timezone
 
-from src.common.infrastructure.orm.models import SearchQueryLog, ListingViewLog
+from src.common.domain.hyperloglog import HyperLogLog
+from src.common.infrastructure.orm.models import SearchQueryLog, ListingViewLog, ListingVisitorsDaily
 from django.db import transaction
 
 
@@ -20,6 +24,17 @@ def _norm_list_str(xs: Optional[List[str]]) -> List[str]:
     return sorted(list(dict.fromkeys(xs)))  # uniq + sort
 
 
+def signature_hash(signature: str) -> int:
+    """
+    Компактный 64-битный ключ сигнатуры (знаковый, помещается в BIGINT).
+    Используется как ключ группировки и индексов вместо VARCHAR(255).
+    """
+    if not signature:
+        return 0
+    digest = hashlib.blake2b(signature.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
 def build_query_signature(
         *,
         keyword: Optional[str],
@@ -49,7 +64,7 @@ def build_query_signature(
     if norm["housing_types"]:
         parts.append(f"housing_types={','.join(norm['housing_types'])}")
     signature = "|".join(parts)
-    return {"norm": norm, "signature": signature}
+    return {"norm": norm, "signature": signature, "hash": signature_hash(signature)}
 
 
 def log_search_query(
@@ -89,18 +104,29 @@ def log_search_query(
         rooms_max=norm["rooms_max"],
         housing_types_csv=",".join(norm["housing_types"]) if norm["housing_types"] else "",
         query_signature=signature,
+        query_hash=built["hash"],
     )
 
 
+LOG_SEARCH_QUERY_JOB = "common.log_search_query"
+
+
+def log_search_query_job(payload: Dict[str, Any]) -> None:
+    """Фоновая задача: payload — именованные аргументы log_search_query (при SEARCH_LOG_ASYNC)."""
+    log_search_query(**payload)
+
+
 def list_popular_queries(limit: int = 10) -> List[Dict[str, Any]]:
     """
-    ТОП популярных нормализованных запросов, сгруппированных по query_signature.
+    ТОП популярных нормализованных запросов, сгруппированных по query_hash
+    (64-битный ключ сигнатуры, см. signature_hash).
     Берём представительные параметры через агрегаты (Max).
     """
     qs: QuerySet = (
-        SearchQueryLog.objects.values("query_signature")
+        SearchQueryLog.objects.values("query_hash")
         .annotate(
             count=Count("*"),
+            query_signature=Max("query_signature"),
             keyword=Max("keyword"),
             city=Max("city"),
             region=Max("region"),
@@ -151,7 +177,61 @@ def list_popular_queries(limit: int = 10) -> List[Dict[str, Any]]:
     return results
 
 
-def log_listing_view(*, accommodation_id: int, user_id: Optional[int]) -> None:
-    # Простая запись лога просмотра (без дедупликаций)
+def visitor_key(*, user_id: Optional[int], fingerprint: Optional[str] = None) -> Optional[str]:
+    """Ключ посетителя для подсчёта уникальных: пользователь, иначе анонимный отпечаток клиента."""
+    if user_id:
+        return f"u:{user_id}"
+    if fingerprint:
+        return f"a:{fingerprint}"
+    return None
+
+
+def track_unique_visitor(*, accommodation_id: int, key: str, day: Optional[date] = None) -> None:
+    """
+    Добавляет посетителя в дневной HLL-скетч объявления.
+    Пишем только если скетч изменился: повторные визиты (и большинство новых при большой кардинальности)
+    не порождают записи; изменение применяется под select_for_update.
+    """
+    day = day or timezone.localdate()
+    blob = (
+        ListingVisitorsDaily.objects.filter(accommodation_id=accommodation_id, day=day)
+        .values_list("hll", flat=True).first()
+    )
+    if blob is not None and not HyperLogLog.from_bytes(blob).add(key):
+        return
+    with transaction.atomic():
+        row, _ = ListingVisitorsDaily.objects.get_or_create(
+            accommodation_id=accommodation_id, day=day, defaults={"hll": b""}
+        )
+        row = ListingVisitorsDaily.objects.select_for_update().get(pk=row.pk)
+        hll = HyperLogLog.from_bytes(row.hll)
+        if hll.add(key) or not row.hll:
+            row.hll = hll.to_bytes()
+            row.save(update_fields=["hll"])
+
+
+def estimate_unique_visitors(accommodation_id: int, start: date, end: date) -> Tuple[int, List[Tuple[date, int]]]:
+    """
+    Оценка уникальных посетителей за дни [start, end] (включительно) слиянием дневных HLL-скетчей.
+    Возвращает (итог за период, [(день, оценка за день), ...]).
+    """
+    rows = (
+        ListingVisitorsDaily.objects.filter(accommodation_id=accommodation_id, day__gte=start, day__lte=end)
+        .order_by("day").values_list("day", "hll")
+    )
+    total = HyperLogLog()
+    per_day: List[Tuple[date, int]] = []
+    for day, blob in rows:
+        hll = HyperLogLog.from_bytes(blob)
+        per_day.append((day, hll.count()))
+        total.merge(hll)
+    return total.count(), per_day
+
+
+def log_listing_view(*, accommodation_id: int, user_id: Optional[int], fingerprint: Optional[str] = None) -> None:
+    # Простая запись лога просмотра (без дедупликаций) + HLL уникальных посетителей
     with transaction.atomic():
         ListingViewLog.objects.create(accommodation_id=accommodation_id, user_id=user_id or None)
+    key = visitor_key(user_id=user_id, fingerprint=fingerprint)
+    if key:
+        track_unique_visitor(accommodation_id=accommodation_id, key=key)
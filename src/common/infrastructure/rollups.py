@@ -0,0 +1,190 @@
+# Слой infrastructure: инкрементальные дневные агрегаты и ретенция сырого лога просмотров
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from src.accommodations.infrastructure.orm.models import Accommodation
+from src.common.infrastructure.orm.models import ListingViewDaily, ListingViewLog, RollupCheckpoint
+
+LISTING_VIEWS_CHECKPOINT = "listing_view_daily"
+
+Key = Tuple[int, date]  # (accommodation_id, day)
+
+
+@dataclass
+class RollupResult:
+    batches: int = 0
+    rows: int = 0
+    last_id: int = 0
+
+
+@dataclass
+class PurgeResult:
+    batches: int = 0
+    deleted: int = 0
+
+
+def _day_bounds(days: Iterable[date]) -> Tuple[datetime, datetime]:
+    days = sorted(days)
+    tz = timezone.get_current_timezone()
+    start = datetime.combine(days[0], datetime.min.time(), tzinfo=tz)
+    end = datetime.combine(days[-1] + timedelta(days=1), datetime.min.time(), tzinfo=tz)
+    return start, end
+
+
+def _lock_checkpoint(name: str) -> RollupCheckpoint:
+    # Строка чекпоинта под select_for_update — заодно не даёт двум экземплярам джобы работать параллельно
+    RollupCheckpoint.objects.get_or_create(name=name)
+    return RollupCheckpoint.objects.select_for_update().get(name=name)
+
+
+def _rollup_batch(batch_size: int, safety_lag: timedelta) -> Tuple[int, int]:
+    """Одна порция: читает строки после high-water mark и прибавляет их к дневным агрегатам."""
+    with transaction.atomic():
+        cp = _lock_checkpoint(LISTING_VIEWS_CHECKPOINT)
+        rows = list(
+            ListingViewLog.objects.filter(id__gt=cp.last_id, created_at__lt=timezone.now() - safety_lag)
+            .order_by("id")
+            .values_list("id", "accommodation_id", "user_id", "created_at")[:batch_size]
+        )
+        if not rows:
+            return 0, cp.last_id
+
+        views: Dict[Key, int] = {}
+        users: Dict[Key, Set[int]] = {}
+        for _, acc_id, user_id, created_at in rows:
+            key = (acc_id, timezone.localtime(created_at).date())
+            views[key] = views.get(key, 0) + 1
+            if user_id is not None:
+                users.setdefault(key, set()).add(user_id)
+
+        # Объявления могли удалить — агрегаты для них не пишем (сырые строки уйдут по ретенции)
+        alive = set(Accommodation.objects.filter(id__in={k[0] for k in views}).values_list("id", flat=True))
+        views = {k: v for k, v in views.items() if k[0] in alive}
+
+        # Пользователи, уже учтённые в этот день предыдущими порциями (id <= last_id)
+        seen: Set[Tuple[int, date, int]] = set()
+        all_users: Set[int] = set().union(*(users.get(k, set()) for k in views))
+        if views and all_users:
+            start, end = _day_bounds(k[1] for k in views)
+            seen = set(
+                ListingViewLog.objects.filter(
+                    id__lte=cp.last_id,
+                    accommodation_id__in={k[0] for k in views},
+                    user_id__in=all_users,
+                    created_at__gte=start,
+                    created_at__lt=end,
+                )
+                .annotate(day=TruncDate("created_at"))
+                .values_list("accommodation_id", "day", "user_id")
+                .distinct()
+            )
+
+        if views:
+            existing = {
+                (o.accommodation_id, o.day): o
+                for o in ListingViewDaily.objects.filter(
+                    accommodation_id__in={k[0] for k in views}, day__in={k[1] for k in views}
+                )
+            }
+            out: List[ListingViewDaily] = []
+            for key, cnt in views.items():
+                new_users = sum(1 for u in users.get(key, ()) if (key[0], key[1], u) not in seen)
+                cur = existing.get(key)
+                out.append(ListingViewDaily(
+                    accommodation_id=key[0],
+                    day=key[1],
+                    views=(cur.views if cur else 0) + cnt,
+                    unique_users=(cur.unique_users if cur else 0) + new_users,
+                ))
+            ListingViewDaily.objects.bulk_create(
+                out,
+                update_conflicts=True,
+                unique_fields=["accommodation", "day"],
+                update_fields=["views", "unique_users"],
+            )
+
+        cp.last_id = rows[-1][0]
+        cp.save(update_fields=["last_id", "updated_at"])
+        return len(rows), cp.last_id
+
+
+def rollup_listing_views(
+        *,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+        safety_lag_seconds: Optional[int] = None,
+) -> RollupResult:
+    """
+    Инкрементально переносит ListingViewLog в ListingViewDaily начиная с high-water mark.
+    Каждая порция — отдельная короткая транзакция (агрегаты + чекпоинт атомарно).
+    """
+    batch_size = batch_size or settings.LISTING_VIEW_ROLLUP_BATCH_SIZE
+    lag = timedelta(seconds=(
+        settings.LISTING_VIEW_ROLLUP_SAFETY_LAG_SECONDS if safety_lag_seconds is None else safety_lag_seconds
+    ))
+    result = RollupResult()
+    while max_batches is None or result.batches < max_batches:
+        n, last_id = _rollup_batch(batch_size, lag)
+        result.last_id = last_id
+        if not n:
+            break
+        result.batches += 1
+        result.rows += n
+    return result
+
+
+def purge_listing_view_logs(
+        *,
+        retention_days: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        sleep_seconds: Optional[float] = None,
+        max_batches: Optional[int] = None,
+) -> PurgeResult:
+    """
+    Удаляет сырые записи старше retention_days небольшими порциями с паузами (щадим репликацию).
+    Удаляются только строки, уже учтённые в агрегатах (id <= high-water mark).
+    """
+    retention_days = settings.LISTING_VIEW_LOG_RETENTION_DAYS if retention_days is None else retention_days
+    if retention_days < 1:
+        raise ValueError("retention_days must be >= 1")
+    batch_size = batch_size or settings.LISTING_VIEW_LOG_PURGE_BATCH_SIZE
+    sleep_seconds = settings.LISTING_VIEW_LOG_PURGE_SLEEP_SECONDS if sleep_seconds is None else sleep_seconds
+
+    cp = RollupCheckpoint.objects.filter(name=LISTING_VIEWS_CHECKPOINT).first()
+    high_water = cp.last_id if cp else 0
+    cutoff = timezone.now() - timedelta(days=retention_days)
+
+    result = PurgeResult()
+    while max_batches is None or result.batches < max_batches:
+        ids = list(
+            ListingViewLog.objects.filter(id__lte=high_water, created_at__lt=cutoff)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        deleted, _ = ListingViewLog.objects.filter(id__in=ids).delete()
+        result.batches += 1
+        result.deleted += deleted
+        if len(ids) < batch_size:
+            break
+        if sleep_seconds:
+            time.sleep(sleep_seconds)
+    return result
+
+
+def views_by_day(accommodation_ids: Iterable[int], start: date, end: date) -> Dict[Key, Tuple[int, int]]:
+    """Просмотры по дням из агрегатов: {(accommodation_id, day): (views, unique_users)}, day в [start, end)."""
+    qs = ListingViewDaily.objects.filter(
+        accommodation_id__in=list(accommodation_ids), day__gte=start, day__lt=end
+    ).values_list("accommodation_id", "day", "views", "unique_users")
+    return {(acc_id, day): (v, u) for acc_id, day, v, u in qs}
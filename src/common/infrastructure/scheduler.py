@@ -0,0 +1,250 @@
+# Слой infrastructure: встроенный планировщик периодических задач с выбором лидера через аренду в БД
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from src.common.domain.cron import CronSpec
+from src.common.infrastructure.jobs import enqueue
+from src.common.infrastructure.orm.models import ScheduledJobRun, SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+LEADER_LEASE = "scheduler"
+PERIODIC_JOB = "scheduler.run_periodic"  # фоновая задача, выполняющая занятый лидером слот
+
+
+@dataclass(frozen=True)
+class PeriodicJob:
+    name: str
+    spec: CronSpec
+    func: Callable[[], Any]  # возвращаемое значение (обычно dataclass-результат) попадает в историю кратко
+
+
+_registry: Dict[str, PeriodicJob] = {}
+_registry_lock = threading.Lock()
+
+
+def register_periodic(name: str, schedule: str, func: Callable[[], Any]) -> None:
+    """Регистрирует периодическую задачу по cron-выражению (обычно из AppConfig.ready)."""
+    job = PeriodicJob(name=name, spec=CronSpec.parse(schedule), func=func)
+    with _registry_lock:
+        current = _registry.get(name)
+        if current is not None and current.func is not func:
+            raise ValueError(f"Periodic job {name!r} is already registered")
+        _registry[name] = job
+
+
+def periodic_jobs() -> List[PeriodicJob]:
+    with _registry_lock:
+        return sorted(_registry.values(), key=lambda j: j.name)
+
+
+def acquire_lease(name: str, holder: str, lease_seconds: float, now: Optional[datetime] = None) -> bool:
+    """
+    Продлевает свою аренду или забирает просроченную; True — holder лидер до now + lease_seconds.
+    Каждый шаг — один условный UPDATE (или INSERT первой строки), поэтому две реплики не станут лидерами одновременно.
+    """
+    now = now or timezone.now()
+    expires = now + timedelta(seconds=lease_seconds)
+    leases = SchedulerLease.objects.filter(name=name)
+    if leases.filter(holder=holder).update(expires_at=expires):
+        return True
+    if leases.filter(expires_at__lt=now).update(holder=holder, expires_at=expires, acquired_at=now):
+        logger.info("scheduler: %s became leader of %r", holder, name)
+        return True
+    try:
+        with transaction.atomic():
+            SchedulerLease.objects.create(name=name, holder=holder, expires_at=expires, acquired_at=now)
+    except IntegrityError:
+        return False  # аренду держит другая реплика
+    logger.info("scheduler: %s became leader of %r", holder, name)
+    return True
+
+
+def release_lease(name: str, holder: str) -> None:
+    """Отдаёт лидерство сразу (при остановке), не дожидаясь истечения аренды."""
+    SchedulerLease.objects.filter(name=name, holder=holder).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+
+def _summarize(value: Any) -> str:
+    # MaintenanceResult(completed=3, ...) -> "completed=3 ..." (списки вроде batch_ms не пишем)
+    if value is None:
+        return ""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        parts = []
+        for k, v in dataclasses.asdict(value).items():
+            if isinstance(v, (list, dict)):
+                continue
+            parts.append(f"{k}={v:.1f}" if isinstance(v, float) else f"{k}={v}")
+        return " ".join(parts)[:255]
+    return str(value)[:255]
+
+
+def run_periodic_job(payload: Dict[str, Any]) -> None:
+    """
+    Обработчик PERIODIC_JOB (воркер run_workers): выполняет занятый слот и записывает итог в историю.
+    Переход queued -> running условный: повторная доставка той же задачи (истёк visibility timeout)
+    слот второй раз не выполнит.
+    """
+    run_id = payload["run_id"]
+    now = timezone.now()
+    if not ScheduledJobRun.objects.filter(pk=run_id, status=ScheduledJobRun.Status.QUEUED).update(
+        status=ScheduledJobRun.Status.RUNNING, started_at=now
+    ):
+        return
+    run = ScheduledJobRun.objects.get(pk=run_id)
+    with _registry_lock:
+        job = _registry.get(run.job)
+    if job is None:
+        run.status = ScheduledJobRun.Status.FAILED
+        run.error = f"periodic job {run.job!r} is not registered"
+        run.finished_at = timezone.now()
+        run.save(update_fields=["status", "error", "finished_at"])
+        return
+    _execute(job, run)
+
+
+def _execute(job: PeriodicJob, run: ScheduledJobRun) -> ScheduledJobRun:
+    t0 = time.perf_counter()
+    try:
+        run.result = _summarize(job.func())
+        run.status = ScheduledJobRun.Status.SUCCEEDED
+    except Exception:  # noqa: BLE001 — сбой задачи фиксируется в истории, воркер продолжает
+        run.status = ScheduledJobRun.Status.FAILED
+        run.error = traceback.format_exc()[-4000:]
+        logger.exception("scheduler: job %s (slot %s) failed", job.name, run.scheduled_for)
+    run.finished_at = timezone.now()
+    run.duration_ms = int((time.perf_counter() - t0) * 1000)
+    run.save(update_fields=["status", "result", "error", "finished_at", "duration_ms"])
+    logger.info("scheduler: %s %s in %sms %s", job.name, run.status, run.duration_ms, run.result)
+    return run
+
+
+def list_recent_runs(
+        *, job: Optional[str] = None, status: Optional[str] = None, limit: int = 100
+) -> List[ScheduledJobRun]:
+    """История запусков, новые первыми (индекс started_at); job/status — необязательные фильтры."""
+    qs = ScheduledJobRun.objects.order_by("-started_at", "-id")
+    if job:
+        qs = qs.filter(job=job)
+    if status:
+        qs = qs.filter(status=status)
+    return list(qs[:limit])
+
+
+class Scheduler:
+    """
+    Планировщик одной реплики. На каждом тике: продлить/получить аренду лидерства; лидер находит
+    у каждой задачи последний наступивший слот расписания (не старше SCHEDULER_MISFIRE_GRACE_SECONDS)
+    и, если слот ещё не занят, занимает его и ставит PERIODIC_JOB в очередь фоновых задач
+    (SCHEDULER_JOB_QUEUE). Сами задачи выполняют воркеры run_workers: долгая задача не задерживает
+    тик и остальные слоты. Слот «занимается» вставкой строки истории с уникальным (job, scheduled_for)
+    в одной транзакции с постановкой в очередь — даже два лидера подряд не займут один слот дважды.
+    Пропущенные за простой слоты не догоняются: ставится только последний.
+    """
+
+    def __init__(
+            self,
+            *,
+            holder: Optional[str] = None,
+            lease_seconds: Optional[float] = None,
+            grace_seconds: Optional[float] = None,
+    ):
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds or settings.SCHEDULER_LEASE_SECONDS
+        self.grace_seconds = settings.SCHEDULER_MISFIRE_GRACE_SECONDS if grace_seconds is None else grace_seconds
+        self.stop_event = threading.Event()
+
+    def is_leader(self, now: Optional[datetime] = None) -> bool:
+        return acquire_lease(LEADER_LEASE, self.holder, self.lease_seconds, now)
+
+    def tick(self, now: Optional[datetime] = None) -> List[ScheduledJobRun]:
+        """Один проход планировщика. Возвращает поставленные в очередь запуски (пусто — не лидер или нечего)."""
+        now = now or timezone.now()
+        if not self.is_leader(now):
+            return []
+        self._abandon_stale_runs(now)
+        local = timezone.localtime(now).replace(tzinfo=None)
+        not_before = local - timedelta(seconds=self.grace_seconds)
+        runs: List[ScheduledJobRun] = []
+        for job in periodic_jobs():
+            slot = job.spec.latest_at_or_before(local, not_before)
+            if slot is None:
+                continue
+            run = self._claim_slot(job, timezone.make_aware(slot), now)
+            if run is not None:
+                runs.append(run)
+        return runs
+
+    def _claim_slot(self, job: PeriodicJob, slot: datetime, now: datetime) -> Optional[ScheduledJobRun]:
+        if ScheduledJobRun.objects.filter(job=job.name, scheduled_for=slot).exists():
+            return None
+        try:
+            with transaction.atomic():
+                run = ScheduledJobRun.objects.create(
+                    job=job.name, scheduled_for=slot, holder=self.holder, started_at=now,
+                    status=ScheduledJobRun.Status.QUEUED,
+                )
+                enqueue(PERIODIC_JOB, {"run_id": run.pk}, queue=settings.SCHEDULER_JOB_QUEUE)
+        except IntegrityError:
+            return None  # слот уже занят другой репликой
+        logger.info("scheduler: %s slot %s queued", job.name, slot)
+        return run
+
+    def _abandon_stale_runs(self, now: datetime) -> None:
+        # Воркер упал посреди задачи (или задачу так и не взяли): слот не повторяем (ровно один раз),
+        # но и «queued»/«running» вечно не держим
+        ScheduledJobRun.objects.filter(
+            status__in=[ScheduledJobRun.Status.QUEUED, ScheduledJobRun.Status.RUNNING],
+            started_at__lt=now - timedelta(seconds=settings.SCHEDULER_STALE_RUN_SECONDS),
+        ).update(status=ScheduledJobRun.Status.FAILED, finished_at=now, error="abandoned: not finished in time")
+
+    def run_forever(self, tick_seconds: Optional[float] = None) -> None:
+        tick_seconds = tick_seconds or settings.SCHEDULER_TICK_SECONDS
+        logger.info("scheduler: started as %s", self.holder)
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    self.tick()
+                except Exception:  # noqa: BLE001 — например, БД недоступна: пробуем на следующем тике
+                    logger.exception("scheduler: tick failed")
+                self.stop_event.wait(tick_seconds)
+        finally:
+            try:
+                release_lease(LEADER_LEASE, self.holder)
+            except Exception:  # noqa: BLE001
+                logger.exception("scheduler: failed to release lease")
+
+
+_started = False
+_started_lock = threading.Lock()
+
+
+def start_scheduler() -> None:
+    """
+    Запускает планировщик в фоновом потоке процесса (SCHEDULER_ENABLED); повторный вызов ничего не делает.
+    Вызывается из веб-точек входа (core.wsgi / core.asgi), а не из AppConfig.ready(): иначе поток
+    поднимался бы в каждой management-команде, включая migrate до создания таблиц планировщика.
+    """
+    global _started
+    if not settings.SCHEDULER_ENABLED:
+        return
+    with _started_lock:
+        if _started:
+            return
+        _started = True
+    threading.Thread(target=Scheduler().run_forever, name="periodic-scheduler", daemon=True).start()
@@ -0,0 +1,111 @@
+# Слой infrastructure: in-memory дедупликация просмотров объявлений в скользящем окне
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Set
+
+from django.conf import settings
+
+
+class TimeBucketedSet:
+    """
+    Множество ключей с истечением по времени: окно делится на корзины по bucket_seconds,
+    целиком устаревшая корзина выбрасывается за O(1). Ключ «помнится» от (window - bucket) до window секунд.
+    Размер ограничен max_keys: при переполнении вытесняются самые старые корзины.
+    Храним только hash() ключа — фиксированная цена записи независимо от длины ключа.
+    """
+
+    def __init__(
+            self,
+            *,
+            window_seconds: float,
+            buckets: int = 6,
+            max_keys: int = 200_000,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self._buckets_n = max(1, buckets)
+        self._bucket_seconds = max(window_seconds / self._buckets_n, 0.001)
+        self._max_keys = max(1, max_keys)
+        self._clock = clock
+        self._buckets: "OrderedDict[int, Set[int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add_if_absent(self, key: Hashable) -> bool:
+        """True — ключ новый в окне (и запомнен), False — уже встречался."""
+        h = hash(key)
+        now_bucket = int(self._clock() // self._bucket_seconds)
+        with self._lock:
+            self._expire(now_bucket)
+            for keys in self._buckets.values():
+                if h in keys:
+                    return False
+            current = self._buckets.get(now_bucket)
+            if current is None:
+                current = self._buckets[now_bucket] = set()
+            current.add(h)
+            self._size += 1
+            while self._size > self._max_keys and self._buckets:
+                _, evicted = self._buckets.popitem(last=False)
+                self._size -= len(evicted)
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self._size = 0
+
+    def _expire(self, now_bucket: int) -> None:
+        oldest_alive = now_bucket - self._buckets_n + 1
+        while self._buckets:
+            bucket_id = next(iter(self._buckets))
+            if bucket_id >= oldest_alive:
+                break
+            self._size -= len(self._buckets.pop(bucket_id))
+
+
+_dedup: Optional[TimeBucketedSet] = None
+_dedup_lock = threading.Lock()
+
+
+def get_listing_view_dedup() -> Optional[TimeBucketedSet]:
+    """Процесс-локальный дедупликатор (None — отключено: LISTING_VIEW_DEDUP_WINDOW_SECONDS = 0)."""
+    global _dedup
+    window = settings.LISTING_VIEW_DEDUP_WINDOW_SECONDS
+    if window <= 0:
+        return None
+    if _dedup is None:
+        with _dedup_lock:
+            if _dedup is None:
+                _dedup = TimeBucketedSet(
+                    window_seconds=window,
+                    buckets=settings.LISTING_VIEW_DEDUP_BUCKETS,
+                    max_keys=settings.LISTING_VIEW_DEDUP_MAX_KEYS,
+                )
+    return _dedup
+
+
+def reset_listing_view_dedup() -> None:
+    """Сбрасывает дедупликатор (пересоздаётся по текущим настройкам) — для тестов/смены настроек."""
+    global _dedup
+    with _dedup_lock:
+        _dedup = None
+
+
+def should_record_listing_view(*, accommodation_id: int, visitor: Optional[str]) -> bool:
+    """
+    Фильтр перед increment_views/log_listing_view: повторный просмотр тем же посетителем
+    (user id или анонимный отпечаток) в пределах окна не пишется вовсе.
+    Дедупликация — best-effort в пределах процесса (у каждого воркера своё окно).
+    """
+    if not visitor:
+        return True
+    dedup = get_listing_view_dedup()
+    if dedup is None:
+        return True
+    return dedup.add_if_absent((accommodation_id, visitor))
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+
+from django.conf import settings
+
+
+def client_ip(meta) -> str:
+    """
+    IP клиента. X-Forwarded-For учитывается только за TRUSTED_PROXY_COUNT доверенными прокси:
+    каждый из них дописывает адрес справа, поэтому клиент — N-й адрес с конца; всё левее мог подставить сам клиент.
+    """
+    trusted = getattr(settings, "TRUSTED_PROXY_COUNT", 0)
+    if trusted > 0:
+        hops = [h.strip() for h in (meta.get("HTTP_X_FORWARDED_FOR") or "").split(",") if h.strip()]
+        if len(hops) >= trusted:
+            return hops[-trusted]
+    return meta.get("REMOTE_ADDR") or ""
+
+
+def client_fingerprint(request) -> str:
+    """
+    Анонимизированный отпечаток клиента: HMAC(SECRET_KEY, IP | User-Agent), 16 hex-символов.
+    Сырые IP/UA не сохраняются; используется для анонимных посетителей.
+    """
+    meta = getattr(request, "META", {}) or {}
+    ip = client_ip(meta)
+    ua = meta.get("HTTP_USER_AGENT") or ""
+    digest = hmac.new(settings.SECRET_KEY.encode("utf-8"), f"{ip}|{ua}".encode("utf-8"), hashlib.sha256)
+    return digest.hexdigest()[:16]
@@ -1,10 +1,105 @@
 # Слой interfaces: DRF сериалайзеры (если используете DRF)
 from __future__ import annotations
 
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import serializers
 
+MAX_STATS_RANGE_DAYS = 366
+
 
 class PopularSearchItemSerializer(serializers.Serializer):
     count = serializers.IntegerField()
     params = serializers.JSONField()
     querystring = serializers.CharField()
+
+
+class DateRangeQuerySerializer(serializers.Serializer):
+    """
+    Параметры ?from=&to= (даты включительно). По умолчанию — последние 30 дней.
+    В validated_data ключи "from" и "to".
+    """
+    from_ = serializers.DateField(required=False)
+    to = serializers.DateField(required=False)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        fields["from"] = fields.pop("from_")
+        return fields
+
+    def validate(self, attrs):
+        to = attrs.get("to") or timezone.localdate()
+        start = attrs.get("from") or (to - timedelta(days=29))
+        if start > to:
+            raise serializers.ValidationError("'from' must be <= 'to'")
+        if (to - start).days + 1 > MAX_STATS_RANGE_DAYS:
+            raise serializers.ValidationError(f"Range must not exceed {MAX_STATS_RANGE_DAYS} days")
+        return {"from": start, "to": to}
+
+
+class UniqueVisitorsDaySerializer(serializers.Serializer):
+    day = serializers.DateField()
+    unique_visitors = serializers.IntegerField()
+
+
+class UniqueVisitorsStatsSerializer(serializers.Serializer):
+    accommodation_id = serializers.IntegerField()
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    unique_visitors = serializers.IntegerField()
+    relative_error = serializers.FloatField()
+    days = UniqueVisitorsDaySerializer(many=True)
+
+
+class FunnelCountersSerializer(serializers.Serializer):
+    impressions = serializers.IntegerField()
+    views = serializers.IntegerField()
+    booking_requests = serializers.IntegerField()
+    confirmations = serializers.IntegerField()
+    view_rate = serializers.FloatField(help_text="views / impressions")
+    request_rate = serializers.FloatField(help_text="booking_requests / views")
+    confirmation_rate = serializers.FloatField(help_text="confirmations / booking_requests")
+
+
+class FunnelDaySerializer(FunnelCountersSerializer):
+    day = serializers.DateField()
+
+
+class ListingFunnelSerializer(serializers.Serializer):
+    accommodation_id = serializers.IntegerField()
+    title = serializers.CharField()
+    totals = FunnelCountersSerializer()
+    days = FunnelDaySerializer(many=True)
+
+
+class HostFunnelStatsSerializer(serializers.Serializer):
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    listings = ListingFunnelSerializer(many=True)
+
+
+class OutboxStatsSerializer(serializers.Serializer):
+    pending = serializers.IntegerField()
+    failed = serializers.IntegerField()
+    oldest_pending_id = serializers.IntegerField(allow_null=True)
+    lag_seconds = serializers.FloatField(help_text="Возраст самого старого необработанного события")
+
+
+class ScheduledJobRunsQuerySerializer(serializers.Serializer):
+    job = serializers.CharField(required=False)
+    status = serializers.ChoiceField(choices=["queued", "running", "succeeded", "failed"], required=False)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=500, default=100)
+
+
+class ScheduledJobRunSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    job = serializers.CharField()
+    scheduled_for = serializers.DateTimeField()
+    status = serializers.CharField()
+    holder = serializers.CharField(help_text="Реплика-лидер, выполнившая запуск")
+    started_at = serializers.DateTimeField()
+    finished_at = serializers.DateTimeField(allow_null=True)
+    duration_ms = serializers.IntegerField(allow_null=True)
+    result = serializers.CharField()
+    error = serializers.CharField()
@@ -1,8 +1,10 @@
 # Слой interfaces: маршрутизация текущего приложения
 from django.urls import path
 
-from src.common.interfaces.rest.views import PopularSearchesView
+from src.common.interfaces.rest.views import OutboxStatsView, PopularSearchesView, ScheduledJobRunsView
 
 urlpatterns = [
     path("search/popular/", PopularSearchesView.as_view(), name="search-popular"),
+    path("outbox/stats/", OutboxStatsView.as_view(), name="outbox-stats"),  # GET
+    path("scheduler/runs/", ScheduledJobRunsView.as_view(), name="scheduler-runs"),  # GET
 ]
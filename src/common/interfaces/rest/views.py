@@ -8,8 +8,23 @@ from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from src.common.interfaces.rest.serializers import PopularSearchItemSerializer
-from src.common.infrastructure.repositories import list_popular_queries
+from src.accommodations.infrastructure.repositories import DjangoAccommodationRepository
+from src.common.domain.hyperloglog import HLL_RELATIVE_ERROR
+from src.common.interfaces.permissions import IsAuthenticatedAndActive
+from src.common.infrastructure.listing_stats import host_funnel_stats
+from src.common.infrastructure.outbox import outbox_stats
+from src.common.infrastructure.scheduler import list_recent_runs
+from src.common.interfaces.rest.serializers import (
+    DateRangeQuerySerializer,
+    HostFunnelStatsSerializer,
+    OutboxStatsSerializer,
+    PopularSearchItemSerializer,
+    ScheduledJobRunSerializer,
+    ScheduledJobRunsQuerySerializer,
+    UniqueVisitorsStatsSerializer,
+)
+from src.common.infrastructure.repositories import estimate_unique_visitors, list_popular_queries
+from src.users.interfaces.rest.permissions import IsHost
 
 
 @extend_schema(
@@ -27,6 +42,99 @@ class PopularSearchesView(APIView):
         return Response(PopularSearchItemSerializer(data, many=True).data, status=status.HTTP_200_OK)
 
 
+@extend_schema(
+    tags=["accommodations"],
+    parameters=[DateRangeQuerySerializer],
+    responses={200: UniqueVisitorsStatsSerializer},
+    operation_id="accommodations_stats_unique_visitors",
+    description=(
+        "Уникальные посетители объявления за период (только владелец). "
+        "Оценка HyperLogLog по дневным скетчам: относительная ошибка ≈ 3.25% (1σ), "
+        "анонимные посетители различаются по анонимизированному отпечатку IP+User-Agent."
+    ),
+)
+class ListingUniqueVisitorsView(APIView):
+    permission_classes = [IsAuthenticatedAndActive, IsHost]
+
+    def get(self, request, acc_id: int):
+        params = DateRangeQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        start, end = params.validated_data["from"], params.validated_data["to"]
+
+        acc = DjangoAccommodationRepository().get_by_id(acc_id)
+        if not acc:
+            return Response({"detail": "Accommodation not found"}, status=status.HTTP_404_NOT_FOUND)
+        if acc.owner_id != request.user.id:
+            return Response({"detail": "Not owner of the accommodation"}, status=status.HTTP_403_FORBIDDEN)
+
+        total, per_day = estimate_unique_visitors(acc_id, start, end)
+        data = {
+            "accommodation_id": acc_id,
+            "date_from": start,
+            "date_to": end,
+            "unique_visitors": total,
+            "relative_error": round(HLL_RELATIVE_ERROR, 4),
+            "days": [{"day": d, "unique_visitors": n} for d, n in per_day],
+        }
+        return Response(UniqueVisitorsStatsSerializer(data).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["accommodations"],
+    parameters=[DateRangeQuerySerializer],
+    responses={200: HostFunnelStatsSerializer},
+    operation_id="accommodations_my_stats",
+    description=(
+        "Воронка по объявлениям текущего хоста: показы → просмотры → заявки → подтверждения по дням "
+        "и конверсии. Читается из дневных агрегатов; просмотры появляются после rollup_listing_views."
+    ),
+)
+class HostListingStatsView(APIView):
+    permission_classes = [IsAuthenticatedAndActive, IsHost]
+
+    def get(self, request):
+        params = DateRangeQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        start, end = params.validated_data["from"], params.validated_data["to"]
+        data = {
+            "date_from": start,
+            "date_to": end,
+            "listings": host_funnel_stats(request.user.id, start, end),
+        }
+        return Response(HostFunnelStatsSerializer(data).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["utils"],
+    responses={200: OutboxStatsSerializer},
+    operation_id="outbox_stats",
+    description="Отставание диспетчера outbox: необработанные/упавшие события и возраст самого старого (админы).",
+)
+class OutboxStatsView(APIView):
+    permission_classes = [IsAuthenticatedAndActive, permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(OutboxStatsSerializer(outbox_stats()).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["utils"],
+    parameters=[ScheduledJobRunsQuerySerializer],
+    responses={200: ScheduledJobRunSerializer(many=True)},
+    operation_id="scheduler_runs",
+    description="История запусков периодических задач (новые первыми): длительность, результат, ошибки (админы).",
+)
+class ScheduledJobRunsView(APIView):
+    permission_classes = [IsAuthenticatedAndActive, permissions.IsAdminUser]
+
+    def get(self, request):
+        params = ScheduledJobRunsQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        v = params.validated_data
+        runs = list_recent_runs(job=v.get("job"), status=v.get("status"), limit=v["limit"])
+        return Response(ScheduledJobRunSerializer(runs, many=True).data, status=status.HTTP_200_OK)
+
+
 @extend_schema(tags=["utils"], operation_id="set_csrf_cookie", description="Устанавливает csrftoken cookie",
                responses={204: None})
 @method_decorator(ensure_csrf_cookie, name="dispatch")
@@ -0,0 +1,148 @@
+# Бенчмарк: размер индексов и время GROUP BY для search_query_logs (query_signature vs query_hash)
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from typing import Dict, List, Optional
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from src.common.infrastructure.orm.models import SearchQueryLog
+from src.common.infrastructure.repositories import build_query_signature
+
+LEGACY_INDEX = "bench_legacy_query_sig_idx"
+BENCH_KEYWORD_PREFIX = "bench-"
+
+GROUP_BY_SQL = {
+    "query_signature": (
+        "SELECT query_signature, COUNT(*) AS c FROM search_query_logs "
+        "GROUP BY query_signature ORDER BY c DESC LIMIT 20"
+    ),
+    "query_hash": (
+        "SELECT query_hash, COUNT(*) AS c FROM search_query_logs "
+        "GROUP BY query_hash ORDER BY c DESC LIMIT 20"
+    ),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Сравнивает размер индексов и время GROUP BY по query_signature (VARCHAR) и query_hash (BIGINT). "
+        "С --legacy-index временно воссоздаёт старый индекс (query_signature, created_at) для замера «до»."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=0, help="Сгенерировать N синтетических записей лога")
+        parser.add_argument("--distinct", type=int, default=1000, help="Число различных сигнатур при генерации")
+        parser.add_argument("--repeat", type=int, default=5, help="Повторов каждого GROUP BY")
+        parser.add_argument("--legacy-index", action="store_true", help="Замерить и со старым индексом")
+        parser.add_argument("--cleanup", action="store_true", help="Удалить синтетические записи после замера")
+
+    def handle(self, *args, **opts):
+        if opts["seed"]:
+            self._seed(opts["seed"], opts["distinct"])
+
+        rows = SearchQueryLog.objects.count()
+        self.stdout.write(f"rows: {rows}")
+
+        if opts["legacy_index"]:
+            with connection.cursor() as cur:
+                cur.execute(f"CREATE INDEX {LEGACY_INDEX} ON search_query_logs (query_signature, created_at)")
+            try:
+                self._report("before (query_signature indexed)", "query_signature", opts["repeat"])
+            finally:
+                self._drop_legacy_index()
+        self._report("after (query_hash indexed)", "query_hash", opts["repeat"])
+
+        if opts["cleanup"]:
+            deleted, _ = SearchQueryLog.objects.filter(keyword__startswith=BENCH_KEYWORD_PREFIX).delete()
+            self.stdout.write(f"cleanup: deleted {deleted} rows")
+
+    def _seed(self, n: int, distinct: int) -> None:
+        rnd = random.Random(42)
+        cities = ["Berlin", "München", "Hamburg", "Köln", "Frankfurt", "Stuttgart", "Leipzig", "Dresden"]
+        types = ["apartment", "house", "studio", "room", "other"]
+        variants = []
+        for i in range(max(1, distinct)):
+            variants.append(build_query_signature(
+                keyword=f"{BENCH_KEYWORD_PREFIX}{i}",
+                city=rnd.choice(cities),
+                region="",
+                price_min=float(rnd.randrange(0, 200, 10)),
+                price_max=float(rnd.randrange(200, 2000, 50)),
+                rooms_min=rnd.randint(1, 3),
+                rooms_max=rnd.randint(3, 6),
+                housing_types=rnd.sample(types, rnd.randint(1, 3)),
+            ))
+        batch: List[SearchQueryLog] = []
+        for _ in range(n):
+            built = rnd.choice(variants)
+            norm = built["norm"]
+            batch.append(SearchQueryLog(
+                keyword=norm["keyword"],
+                city=norm["city"],
+                region=norm["region"],
+                price_min=norm["price_min"],
+                price_max=norm["price_max"],
+                rooms_min=norm["rooms_min"],
+                rooms_max=norm["rooms_max"],
+                housing_types_csv=",".join(norm["housing_types"]),
+                query_signature=built["signature"],
+                query_hash=built["hash"],
+            ))
+            if len(batch) >= 1000:
+                SearchQueryLog.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            SearchQueryLog.objects.bulk_create(batch)
+        self.stdout.write(f"seeded: {n} rows, {distinct} distinct signatures")
+
+    def _report(self, label: str, column: str, repeat: int) -> None:
+        self.stdout.write(f"--- {label}")
+        sizes = self._index_sizes()
+        if sizes is None:
+            self.stdout.write("  index sizes: n/a for this backend")
+        else:
+            for name, size in sorted(sizes.items()):
+                self.stdout.write(f"  index {name}: {size / 1024:.1f} KiB")
+        timings = []
+        with connection.cursor() as cur:
+            for _ in range(max(1, repeat)):
+                t0 = time.perf_counter()
+                cur.execute(GROUP_BY_SQL[column])
+                cur.fetchall()
+                timings.append((time.perf_counter() - t0) * 1000)
+        self.stdout.write(
+            f"  GROUP BY {column}: median {statistics.median(timings):.2f} ms, min {min(timings):.2f} ms"
+        )
+
+    def _index_sizes(self) -> Optional[Dict[str, int]]:
+        with connection.cursor() as cur:
+            if connection.vendor == "mysql":
+                cur.execute("ANALYZE TABLE search_query_logs")
+                cur.fetchall()
+                cur.execute(
+                    "SELECT index_name, stat_value * @@innodb_page_size FROM mysql.innodb_index_stats "
+                    "WHERE database_name = DATABASE() AND table_name = 'search_query_logs' AND stat_name = 'size'"
+                )
+                return {name: int(size) for name, size in cur.fetchall()}
+            if connection.vendor == "sqlite":
+                try:
+                    cur.execute(
+                        "SELECT name, SUM(pgsize) FROM dbstat WHERE name IN "
+                        "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'search_query_logs') "
+                        "GROUP BY name"
+                    )
+                except Exception:
+                    return None  # sqlite собран без dbstat
+                return {name: int(size) for name, size in cur.fetchall()}
+        return None
+
+    def _drop_legacy_index(self) -> None:
+        with connection.cursor() as cur:
+            if connection.vendor == "mysql":
+                cur.execute(f"DROP INDEX {LEGACY_INDEX} ON search_query_logs")
+            else:
+                cur.execute(f"DROP INDEX {LEGACY_INDEX}")
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.common.infrastructure.outbox import dispatch_outbox, outbox_stats, purge_processed_events
+
+
+class Command(BaseCommand):
+    help = (
+        "Доставляет события transactional outbox обработчикам (порциями, с повторами). "
+        "По умолчанию — один проход до опустошения очереди; --loop — постоянный диспетчер."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--max-batches", type=int, default=None, help="Лимит порций за проход")
+        parser.add_argument("--loop", action="store_true", help="Работать постоянно")
+        parser.add_argument("--interval", type=float, default=1.0, help="Пауза при пустой очереди (--loop), секунды")
+        parser.add_argument("--purge", action="store_true", help="После прохода удалить старые обработанные события")
+
+    def handle(self, *args, **opts):
+        while True:
+            res = dispatch_outbox(batch_size=opts["batch_size"], max_batches=opts["max_batches"])
+            stats = outbox_stats()
+            if res.claimed or not opts["loop"]:
+                self.stdout.write(
+                    f"claimed={res.claimed} done={res.done} retried={res.retried} failed={res.failed} "
+                    f"batches={res.batches} elapsed={res.elapsed_ms:.0f}ms "
+                    f"pending={stats.pending} lag={stats.lag_seconds:.1f}s failed_total={stats.failed}"
+                )
+            if opts["purge"]:
+                self.stdout.write(f"purged={purge_processed_events()}")
+            if not opts["loop"]:
+                return
+            if not res.claimed:
+                time.sleep(opts["interval"])
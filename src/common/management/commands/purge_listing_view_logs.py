@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from src.common.infrastructure.rollups import purge_listing_view_logs
+
+
+class Command(BaseCommand):
+    help = "Удаляет сырые ListingViewLog старше срока хранения порциями с паузами (только уже агрегированные)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--retention-days", type=int, default=None)
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--sleep", type=float, default=None, help="Пауза между порциями, сек")
+        parser.add_argument("--max-batches", type=int, default=None)
+
+    def handle(self, *args, **opts):
+        res = purge_listing_view_logs(
+            retention_days=opts["retention_days"],
+            batch_size=opts["batch_size"],
+            sleep_seconds=opts["sleep"],
+            max_batches=opts["max_batches"],
+        )
+        self.stdout.write(f"deleted {res.deleted} rows in {res.batches} batches")
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from src.common.infrastructure.rollups import rollup_listing_views
+
+
+class Command(BaseCommand):
+    help = "Инкрементально агрегирует ListingViewLog в дневные агрегаты (listing_view_daily) от high-water mark."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--max-batches", type=int, default=None)
+        parser.add_argument("--safety-lag", type=int, default=None, help="Секунды: не трогать более свежие строки")
+
+    def handle(self, *args, **opts):
+        res = rollup_listing_views(
+            batch_size=opts["batch_size"],
+            max_batches=opts["max_batches"],
+            safety_lag_seconds=opts["safety_lag"],
+        )
+        self.stdout.write(f"rolled up {res.rows} rows in {res.batches} batches, high-water mark={res.last_id}")
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import signal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from src.common.infrastructure.scheduler import Scheduler, periodic_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Планировщик периодических задач в отдельном процессе (альтернатива SCHEDULER_ENABLED в веб-репликах). "
+        "Наступившие слоты ставит в очередь только лидер (выполняют воркеры run_workers) — "
+        "можно запускать несколько экземпляров."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Один тик и выход")
+        parser.add_argument("--list", action="store_true", help="Показать задачи и ближайшие запуски")
+
+    def handle(self, *args, **opts):
+        if opts["list"]:
+            local = timezone.localtime().replace(tzinfo=None)
+            for job in periodic_jobs():
+                next_run = job.spec.next_after(local)
+                self.stdout.write(f"{job.name:<36} {job.spec.expr:<16} next={next_run:%Y-%m-%d %H:%M}")
+            return
+
+        scheduler = Scheduler()
+        if opts["once"]:
+            runs = scheduler.tick()
+            for run in runs:
+                self.stdout.write(f"{run.job} {run.scheduled_for:%Y-%m-%d %H:%M} {run.status}")
+            self.stdout.write(f"holder={scheduler.holder} runs={len(runs)}")
+            return
+
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, lambda *_: scheduler.stop_event.set())
+        scheduler.run_forever()
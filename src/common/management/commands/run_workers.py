@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import signal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from src.common.infrastructure.jobs import (
+    DEFAULT_QUEUE, WORKER_MODES, WorkerPool, job_counts, purge_finished_jobs,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Пул воркеров фоновых задач: захватывает задачи порциями и выполняет их в потоках или процессах. "
+        "SIGTERM/SIGINT — мягкая остановка: новые задачи не берутся, начатые дорабатываются."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--queues", default=DEFAULT_QUEUE, help="Очереди через запятую (default,logging)")
+        parser.add_argument("--concurrency", type=int, default=None, help="Размер пула")
+        parser.add_argument("--mode", choices=WORKER_MODES, default=None, help="thread | process")
+        parser.add_argument("--batch-size", type=int, default=None, help="Сколько задач захватывать за запрос")
+        parser.add_argument("--once", action="store_true", help="Выйти, когда очереди опустеют")
+        parser.add_argument("--purge", action="store_true", help="Перед стартом удалить старые выполненные задачи")
+
+    def handle(self, *args, **opts):
+        queues = [q.strip() for q in opts["queues"].split(",") if q.strip()]
+        if not queues:
+            raise CommandError("--queues must name at least one queue")
+        if opts["purge"]:
+            self.stdout.write(f"purged={purge_finished_jobs()}")
+
+        pool = WorkerPool(
+            queues, concurrency=opts["concurrency"], mode=opts["mode"], batch_size=opts["batch_size"],
+        )
+        if not opts["once"]:
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(sig, lambda *_: pool.stop_event.set())
+        self.stdout.write(
+            f"workers: queues={','.join(queues)} mode={pool.mode} concurrency={pool.concurrency} "
+            f"limits={settings.JOB_QUEUE_CONCURRENCY or {}}"
+        )
+        res = pool.run(stop_when_idle=opts["once"])
+        self.stdout.write(
+            f"claimed={res.claimed} done={res.done} retried={res.retried} failed={res.failed} lost={res.lost} "
+            f"elapsed={res.elapsed_ms:.0f}ms queues={job_counts()}"
+        )
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:39
+
+import hashlib
+
+from django.db import migrations, models
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _signature_hash(signature: str) -> int:
+    # Копия src.common.infrastructure.repositories.signature_hash (миграция не зависит от кода приложения)
+    if not signature:
+        return 0
+    digest = hashlib.blake2b(signature.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def backfill_query_hash(apps, schema_editor):
+    SearchQueryLog = apps.get_model("common", "SearchQueryLog")
+    last_id = 0
+    while True:
+        batch = list(
+            SearchQueryLog.objects.filter(id__gt=last_id, query_hash__isnull=True)
+            .order_by("id")
+            .only("id", "query_signature")[:BACKFILL_BATCH_SIZE]
+        )
+        if not batch:
+            break
+        for row in batch:
+            row.query_hash = _signature_hash(row.query_signature)
+        SearchQueryLog.objects.bulk_update(batch, ["query_hash"])
+        last_id = batch[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0002_listingviewlog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='searchquerylog',
+            name='query_hash',
+            field=models.BigIntegerField(null=True),
+        ),
+        migrations.RunPython(backfill_query_hash, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='searchquerylog',
+            name='query_hash',
+            field=models.BigIntegerField(),
+        ),
+        migrations.RemoveIndex(
+            model_name='searchquerylog',
+            name='search_quer_query_s_f7986f_idx',
+        ),
+        migrations.AlterField(
+            model_name='searchquerylog',
+            name='query_signature',
+            field=models.CharField(max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='searchquerylog',
+            index=models.Index(fields=['query_hash', 'created_at'], name='search_quer_query_h_7b31ce_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0005_accommodation_average_rating_and_more'),
+        ('common', '0003_searchquerylog_query_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                ('last_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'rollup_checkpoints',
+            },
+        ),
+        migrations.AlterField(
+            model_name='listingviewlog',
+            name='accommodation',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='view_logs', to='accommodations.accommodation'),
+        ),
+        migrations.CreateModel(
+            name='ListingViewDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('unique_users', models.PositiveIntegerField(default=0)),
+                ('accommodation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='view_daily', to='accommodations.accommodation')),
+            ],
+            options={
+                'db_table': 'listing_view_daily',
+                'indexes': [models.Index(fields=['day'], name='listing_vie_day_dff832_idx')],
+                'constraints': [models.UniqueConstraint(fields=('accommodation', 'day'), name='uniq_listing_view_daily')],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0005_accommodation_average_rating_and_more'),
+        ('common', '0004_listing_view_daily_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ListingVisitorsDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('hll', models.BinaryField(max_length=1024)),
+                ('accommodation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='visitors_daily', to='accommodations.accommodation')),
+            ],
+            options={
+                'db_table': 'listing_visitors_daily',
+                'constraints': [models.UniqueConstraint(fields=('accommodation', 'day'), name='uniq_listing_visitors_daily')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0005_accommodation_average_rating_and_more'),
+        ('common', '0005_listingvisitorsdaily'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ListingDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('impressions', models.PositiveIntegerField(default=0)),
+                ('booking_requests', models.PositiveIntegerField(default=0)),
+                ('confirmations', models.PositiveIntegerField(default=0)),
+                ('accommodation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='accommodations.accommodation')),
+            ],
+            options={
+                'db_table': 'listing_daily_stats',
+                'constraints': [models.UniqueConstraint(fields=('accommodation', 'day'), name='uniq_listing_daily_stats')],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0008_background_jobs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchedulerLease',
+            fields=[
+                ('name', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('holder', models.CharField(max_length=128)),
+                ('expires_at', models.DateTimeField()),
+                ('acquired_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'scheduler_leases',
+            },
+        ),
+        migrations.CreateModel(
+            name='ScheduledJobRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job', models.CharField(max_length=100)),
+                ('scheduled_for', models.DateTimeField()),
+                ('status', models.CharField(choices=[('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='running', max_length=16)),
+                ('holder', models.CharField(max_length=128)),
+                ('started_at', models.DateTimeField()),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('duration_ms', models.PositiveIntegerField(blank=True, null=True)),
+                ('result', models.CharField(blank=True, default='', max_length=255)),
+                ('error', models.TextField(blank=True, default='')),
+            ],
+            options={
+                'db_table': 'scheduled_job_runs',
+                'indexes': [models.Index(fields=['status', 'started_at'], name='scheduled_j_status_bae2f9_idx'), models.Index(fields=['started_at'], name='scheduled_j_started_12646f_idx')],
+                'constraints': [models.UniqueConstraint(fields=('job', 'scheduled_for'), name='uniq_scheduled_job_slot')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0009_scheduler'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='scheduledjobrun',
+            name='status',
+            field=models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='running', max_length=16),
+        ),
+    ]
@@ -1,3 +1,9 @@
-from .infrastructure.orm.models import SearchQueryLog
+from .infrastructure.orm.models import (
+    SearchQueryLog, ListingViewLog, ListingViewDaily, ListingVisitorsDaily, ListingDailyStats, RollupCheckpoint,
+    OutboxEvent, BackgroundJob, SchedulerLease, ScheduledJobRun,
+)
 
-__all__ = ["SearchQueryLog"]
\ No newline at end of file
+__all__ = [
+    "SearchQueryLog", "ListingViewLog", "ListingViewDaily", "ListingVisitorsDaily", "ListingDailyStats",
+    "RollupCheckpoint", "OutboxEvent", "BackgroundJob", "SchedulerLease", "ScheduledJobRun",
+]
\ No newline at end of file
@@ -0,0 +1 @@
+# Интеграционные тесты
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from src.common.infrastructure.rollups import rollup_listing_views
+from src.common.infrastructure.view_dedup import reset_listing_view_dedup
+from src.shared.testing.api import ensure_csrf
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+class HostStatsApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        reset_listing_view_dedup()
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id, title="Funnel flat", city="Leipzig", region="Sachsen")
+        self.other = create_accommodation(owner_id=self.host.id, title="Quiet flat", city="Dresden", region="Sachsen")
+
+    def _book(self, start: date) -> int:
+        self.client.force_authenticate(user=self.guest)
+        headers = ensure_csrf(self.client)
+        resp = self.client.post("/api/bookings/", {
+            "accommodation_id": self.acc.id,
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=2)).isoformat(),
+        }, format="json", **headers)
+        self.assertEqual(resp.status_code, 201, resp.content)
+        return resp.json()["id"]
+
+    def test_funnel_from_daily_aggregates(self):
+        # 2 показа в фильтрованном поиске
+        for _ in range(2):
+            self.assertEqual(self.client.get("/api/accommodations/search/", {"city": "Leipzig"}).status_code, 200)
+        # 2 просмотра разными посетителями
+        self.client.get(f"/api/accommodations/{self.acc.id}/", HTTP_USER_AGENT="a")
+        self.client.get(f"/api/accommodations/{self.acc.id}/", HTTP_USER_AGENT="b")
+        rollup_listing_views(safety_lag_seconds=0)
+        # 2 заявки, 1 подтверждение
+        b1 = self._book(date.today() + timedelta(days=10))
+        self._book(date.today() + timedelta(days=20))
+        self.client.force_authenticate(user=self.host)
+        headers = ensure_csrf(self.client)
+        resp = self.client.post(f"/api/bookings/{b1}/confirm/", {}, format="json", **headers)
+        self.assertEqual(resp.status_code, 200, resp.content)
+
+        resp = self.client.get("/api/accommodations/my/stats/")
+        self.assertEqual(resp.status_code, 200, resp.content)
+        listings = {item["accommodation_id"]: item for item in resp.json()["listings"]}
+        self.assertEqual(set(listings), {self.acc.id, self.other.id})
+
+        totals = listings[self.acc.id]["totals"]
+        self.assertEqual(
+            (totals["impressions"], totals["views"], totals["booking_requests"], totals["confirmations"]),
+            (2, 2, 2, 1),
+        )
+        self.assertEqual(totals["view_rate"], 1.0)
+        self.assertEqual(totals["confirmation_rate"], 0.5)
+        days = listings[self.acc.id]["days"]
+        self.assertEqual([d["day"] for d in days], [timezone.localdate().isoformat()])
+        self.assertEqual(listings[self.other.id]["days"], [])
+
+    def test_range_outside_activity_is_empty(self):
+        self.client.get("/api/accommodations/search/", {"city": "Leipzig"})
+        self.client.force_authenticate(user=self.host)
+        resp = self.client.get("/api/accommodations/my/stats/", {"from": "2020-01-01", "to": "2020-01-31"})
+        self.assertEqual(resp.status_code, 200, resp.content)
+        self.assertTrue(all(item["days"] == [] for item in resp.json()["listings"]))
+
+    def test_guest_forbidden(self):
+        self.client.force_authenticate(user=self.guest)
+        self.assertEqual(self.client.get("/api/accommodations/my/stats/").status_code, 403)
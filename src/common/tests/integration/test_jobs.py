@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from src.common.infrastructure.jobs import (
+    LOST,
+    WorkerPool,
+    claim_jobs,
+    enqueue,
+    process_jobs,
+    register_job,
+    run_job,
+)
+from src.common.infrastructure.orm.models import BackgroundJob, SearchQueryLog
+
+_calls = []
+_calls_lock = threading.Lock()
+_failures = []
+
+
+def _record(payload):
+    with _calls_lock:
+        _calls.append(payload["n"])
+
+
+def _flaky(payload):
+    if _failures:
+        _failures.pop()
+        raise RuntimeError("boom")
+
+
+register_job("test.record", _record)
+register_job("test.flaky", _flaky)
+
+
+class JobQueueTests(TestCase):
+    def setUp(self):
+        _calls.clear()
+        _failures.clear()
+
+    def test_enqueue_unknown_job_rejected(self):
+        with self.assertRaises(ValueError):
+            enqueue("test.missing")
+
+    def test_jobs_run_by_priority_and_marked_done(self):
+        enqueue("test.record", {"n": 1})
+        enqueue("test.record", {"n": 2}, priority=10)
+        enqueue("test.record", {"n": 3}, delay_seconds=3600)  # ещё не время
+
+        res = process_jobs(batch_size=1)
+        self.assertEqual((res.claimed, res.done), (2, 2))
+        self.assertEqual(_calls, [2, 1])
+        self.assertEqual(
+            sorted(BackgroundJob.objects.values_list("status", flat=True)),
+            ["done", "done", "queued"],
+        )
+
+    @override_settings(JOB_RETRY_BASE_DELAY_SECONDS=30)
+    def test_failed_job_retried_with_backoff_then_failed(self):
+        _failures.extend([1, 1])
+        job_id = enqueue("test.flaky", max_attempts=2)
+
+        self.assertEqual(process_jobs().retried, 1)
+        job = BackgroundJob.objects.get(pk=job_id)
+        self.assertEqual((job.status, job.attempts), (BackgroundJob.Status.QUEUED, 1))
+        self.assertGreater(job.run_at, timezone.now() + timedelta(seconds=20))
+        self.assertIn("boom", job.last_error)
+        self.assertEqual(process_jobs().claimed, 0)
+
+        BackgroundJob.objects.filter(pk=job_id).update(run_at=timezone.now())
+        self.assertEqual(process_jobs().failed, 1)
+        self.assertEqual(BackgroundJob.objects.get(pk=job_id).status, BackgroundJob.Status.FAILED)
+
+    def test_visibility_timeout_makes_stuck_job_claimable_again(self):
+        enqueue("test.record", {"n": 1})
+        [stuck] = claim_jobs("default", 10, visibility_timeout=60)
+        self.assertEqual(claim_jobs("default", 10, visibility_timeout=60), [])
+
+        BackgroundJob.objects.filter(pk=stuck.pk).update(locked_until=timezone.now() - timedelta(seconds=1))
+        [again] = claim_jobs("default", 10, visibility_timeout=60)
+        self.assertEqual((again.pk, again.attempts), (stuck.pk, 2))
+
+        # Первый воркер «очнулся»: его результат не перетирает захват второго
+        self.assertEqual(run_job(stuck), LOST)
+        self.assertEqual(run_job(again), "done")
+        self.assertEqual(_calls, [1, 1])
+
+    @override_settings(JOB_QUEUE_CONCURRENCY={"reports": 1})
+    def test_queue_concurrency_limit(self):
+        for n in range(3):
+            enqueue("test.record", {"n": n}, queue="reports")
+        self.assertEqual(len(claim_jobs("reports", 10, visibility_timeout=60)), 1)
+        self.assertEqual(claim_jobs("reports", 10, visibility_timeout=60), [])
+        # Без лимита очередь default не ограничена
+        for n in range(3):
+            enqueue("test.record", {"n": n})
+        self.assertEqual(len(claim_jobs("default", 10, visibility_timeout=60)), 3)
+
+    @override_settings(SEARCH_LOG_ASYNC=True)
+    def test_search_log_deferred_to_logging_queue(self):
+        resp = APIClient().get("/api/accommodations/search/", {"city": "Berlin"})
+        self.assertEqual(resp.status_code, 200, resp.content)
+        self.assertFalse(SearchQueryLog.objects.exists())
+        self.assertEqual(BackgroundJob.objects.get().queue, "logging")
+
+        self.assertEqual(process_jobs(["logging"]).done, 1)
+        self.assertEqual(SearchQueryLog.objects.get().city, "Berlin")
+
+
+class WorkerPoolTests(TransactionTestCase):
+    def setUp(self):
+        _calls.clear()
+
+    def test_thread_pool_drains_all_queues(self):
+        for n in range(6):
+            enqueue("test.record", {"n": n})
+        for n in range(6, 9):
+            enqueue("test.record", {"n": n}, queue="logging")
+
+        # Тестовая БД — in-memory SQLite с общим кэшем: блокировки на уровне таблиц не дают писать
+        # из нескольких потоков одновременно, поэтому здесь один поток пула (параллелизм — на MySQL)
+        res = WorkerPool(["default", "logging"], concurrency=1, mode="thread", batch_size=2).run(stop_when_idle=True)
+
+        self.assertEqual((res.claimed, res.done, res.failed), (9, 9, 0))
+        self.assertEqual(sorted(_calls), list(range(9)))
+        self.assertFalse(BackgroundJob.objects.exclude(status=BackgroundJob.Status.DONE).exists())
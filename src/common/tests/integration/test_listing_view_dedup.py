@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from src.accommodations.infrastructure.orm.models import Accommodation as AccORM
+from src.common.infrastructure.orm.models import ListingViewLog
+from src.common.infrastructure.view_dedup import reset_listing_view_dedup
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+class ListingViewDedupTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        reset_listing_view_dedup()
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+
+    def tearDown(self):
+        reset_listing_view_dedup()
+
+    def _get(self, **extra):
+        resp = self.client.get(f"/api/accommodations/{self.acc.id}/", **extra)
+        self.assertEqual(resp.status_code, 200, resp.content)
+
+    def _counts(self):
+        views = AccORM.objects.get(pk=self.acc.id).views_count
+        return views, ListingViewLog.objects.filter(accommodation_id=self.acc.id).count()
+
+    def test_repeat_views_skip_counter_and_log(self):
+        for _ in range(3):
+            self._get()
+        self.assertEqual(self._counts(), (1, 1))
+
+        self.client.force_authenticate(user=self.guest)
+        self._get()
+        self._get()
+        self.assertEqual(self._counts(), (2, 2))
+
+    @override_settings(LISTING_VIEW_DEDUP_WINDOW_SECONDS=0)
+    def test_disabled_window_counts_every_view(self):
+        reset_listing_view_dedup()
+        self._get()
+        self._get()
+        self.assertEqual(self._counts(), (2, 2))
+
+    def test_missing_listing_not_tracked(self):
+        with mock.patch("src.accommodations.interfaces.rest.views.should_record_listing_view") as dedup:
+            resp = self.client.get(f"/api/accommodations/{self.acc.id + 1000}/")
+        self.assertEqual(resp.status_code, 404, resp.content)
+        dedup.assert_not_called()
+        self.assertFalse(ListingViewLog.objects.exists())
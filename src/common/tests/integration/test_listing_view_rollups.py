@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from src.accommodations.infrastructure.orm.models import Accommodation as AccORM
+from src.common.infrastructure.orm.models import ListingViewDaily, ListingViewLog
+from src.common.infrastructure.repositories import log_listing_view
+from src.common.infrastructure.rollups import purge_listing_view_logs, rollup_listing_views
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+class ListingViewRollupTests(TestCase):
+    def setUp(self):
+        self.host = create_user("host@example.com", roles=["host"])
+        self.u1 = create_user("u1@example.com")
+        self.u2 = create_user("u2@example.com")
+        self.acc = create_accommodation(owner_id=self.host.id)
+
+    def _daily(self) -> ListingViewDaily:
+        return ListingViewDaily.objects.get(accommodation_id=self.acc.id, day=timezone.localdate())
+
+    def test_incremental_rollup_counts_views_and_unique_users(self):
+        log_listing_view(accommodation_id=self.acc.id, user_id=self.u1.id)
+        log_listing_view(accommodation_id=self.acc.id, user_id=self.u1.id)
+        log_listing_view(accommodation_id=self.acc.id, user_id=None)
+
+        res = rollup_listing_views(safety_lag_seconds=0)
+        self.assertEqual(res.rows, 3)
+        daily = self._daily()
+        self.assertEqual((daily.views, daily.unique_users), (3, 1))
+
+        # Повторный запуск без новых строк ничего не меняет (high-water mark)
+        self.assertEqual(rollup_listing_views(safety_lag_seconds=0).rows, 0)
+
+        # Новая порция: u1 уже учтён ранее, u2 — новый
+        log_listing_view(accommodation_id=self.acc.id, user_id=self.u1.id)
+        log_listing_view(accommodation_id=self.acc.id, user_id=self.u2.id)
+        rollup_listing_views(safety_lag_seconds=0, batch_size=1)
+        daily = self._daily()
+        self.assertEqual((daily.views, daily.unique_users), (5, 2))
+
+    def test_purge_removes_only_old_rolled_up_rows(self):
+        for _ in range(5):
+            log_listing_view(accommodation_id=self.acc.id, user_id=None)
+        ListingViewLog.objects.update(created_at=timezone.now() - timedelta(days=40))
+        # Не агрегированные строки не удаляются
+        self.assertEqual(purge_listing_view_logs(retention_days=30, sleep_seconds=0).deleted, 0)
+
+        rollup_listing_views(safety_lag_seconds=0)
+        log_listing_view(accommodation_id=self.acc.id, user_id=None)  # свежая строка остаётся
+        res = purge_listing_view_logs(retention_days=30, batch_size=2, sleep_seconds=0)
+        self.assertEqual(res.deleted, 5)
+        self.assertEqual(res.batches, 3)
+        self.assertEqual(ListingViewLog.objects.count(), 1)
+
+    def test_deleting_listing_keeps_raw_log_and_rollup_skips_it(self):
+        log_listing_view(accommodation_id=self.acc.id, user_id=self.u1.id)
+        acc_id = self.acc.id
+        AccORM.objects.filter(pk=acc_id).delete()
+        self.assertEqual(ListingViewLog.objects.filter(accommodation_id=acc_id).count(), 1)
+
+        res = rollup_listing_views(safety_lag_seconds=0)
+        self.assertEqual(res.rows, 1)
+        self.assertFalse(ListingViewDaily.objects.filter(accommodation_id=acc_id).exists())
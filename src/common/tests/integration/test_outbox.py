@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from src.accommodations.infrastructure.orm.models import Accommodation as AccORM
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.common.infrastructure.orm.models import OutboxEvent
+from src.common.infrastructure.outbox import (
+    BOOKING_STATUS_CHANGED,
+    REVIEW_CHANGED,
+    claim_events,
+    dispatch_outbox,
+    outbox_stats,
+    publish_event,
+    register_outbox_handler,
+)
+from src.reviews.domain.entities import Review
+from src.reviews.domain.value_objects import Rating
+from src.reviews.infrastructure.repositories import DjangoReviewRepository
+from src.shared.testing.factories import create_user, create_accommodation
+
+FLAKY_TOPIC = "test.flaky"
+_flaky_failures = []
+
+
+def _flaky_handler(message) -> None:
+    if _flaky_failures:
+        _flaky_failures.pop()
+        raise RuntimeError("boom")
+
+
+register_outbox_handler(FLAKY_TOPIC, _flaky_handler)
+
+
+class OutboxTests(TestCase):
+    def setUp(self):
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        _flaky_failures.clear()
+
+    def test_review_change_published_and_dispatched(self):
+        booking = BookingORM.objects.create(
+            accommodation_id=self.acc.id, guest=self.guest, host=self.host,
+            start_date=timezone.localdate() - timedelta(days=5), end_date=timezone.localdate() - timedelta(days=3),
+            status=BookingORM.Status.COMPLETED,
+        )
+        DjangoReviewRepository().create(Review(
+            id=None, accommodation_id=self.acc.id, author_id=self.guest.id, booking_id=booking.id,
+            rating=Rating(4), text="Nice and quiet",
+        ))
+        event = OutboxEvent.objects.get(topic=REVIEW_CHANGED)
+        self.assertEqual(event.payload, {"accommodation_id": self.acc.id, "action": "created"})
+        # Рейтинг сдвигается дельтой в транзакции отзыва, не в диспетчере
+        acc = AccORM.objects.get(pk=self.acc.id)
+        self.assertEqual((acc.reviews_count, float(acc.average_rating)), (1, 4.0))
+
+        res = dispatch_outbox()
+        self.assertEqual((res.claimed, res.done), (1, 1))
+        self.assertEqual(OutboxEvent.objects.get(pk=event.pk).status, OutboxEvent.Status.DONE)
+        self.assertEqual(outbox_stats().pending, 0)
+
+    def test_booking_events_written_in_same_transaction(self):
+        from src.bookings.application.commands import CreateBookingCommand
+        from src.bookings.application.use_cases.create_booking import CreateBookingUseCase
+        from src.bookings.infrastructure.repositories import DjangoBookingRepository
+
+        start = timezone.localdate() + timedelta(days=3)
+        dto = CreateBookingUseCase(DjangoBookingRepository()).execute(CreateBookingCommand(
+            accommodation_id=self.acc.id, guest_id=self.guest.id, host_id=self.host.id,
+            start_date=start, end_date=start + timedelta(days=2),
+        ))
+        event = OutboxEvent.objects.get(topic=BOOKING_STATUS_CHANGED, aggregate_id=dto.id)
+        self.assertEqual(event.payload["to"], "requested")
+        self.assertIsNone(event.payload["from"])
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                publish_event(FLAKY_TOPIC, "test", 1)
+                raise RuntimeError("rollback")
+        self.assertFalse(OutboxEvent.objects.filter(topic=FLAKY_TOPIC).exists())
+
+    @override_settings(OUTBOX_MAX_ATTEMPTS=2, OUTBOX_RETRY_BASE_DELAY_SECONDS=30)
+    def test_failed_handler_retried_with_backoff_then_marked_failed(self):
+        _flaky_failures.extend([1, 1])
+        publish_event(FLAKY_TOPIC, "test", 1)
+
+        res = dispatch_outbox()
+        self.assertEqual(res.retried, 1)
+        event = OutboxEvent.objects.get(topic=FLAKY_TOPIC)
+        self.assertEqual((event.status, event.attempts), (OutboxEvent.Status.PENDING, 1))
+        self.assertIn("boom", event.last_error)
+        self.assertGreater(event.available_at, timezone.now() + timedelta(seconds=20))
+        self.assertEqual(dispatch_outbox().claimed, 0)  # ещё не время повтора
+
+        OutboxEvent.objects.filter(pk=event.pk).update(available_at=timezone.now())
+        self.assertEqual(dispatch_outbox().failed, 1)
+        self.assertEqual(OutboxEvent.objects.get(pk=event.pk).status, OutboxEvent.Status.FAILED)
+        self.assertEqual(outbox_stats().failed, 1)
+
+    def test_claimed_events_are_not_handed_out_until_lease_expires(self):
+        publish_event(FLAKY_TOPIC, "test", 1)
+        publish_event(FLAKY_TOPIC, "test", 2)
+        first = claim_events(batch_size=1, lease_seconds=60)
+        second = claim_events(batch_size=10, lease_seconds=60)
+        self.assertEqual(len(first), 1)
+        self.assertEqual([e.aggregate_id for e in second], [2])
+        self.assertEqual(claim_events(batch_size=10, lease_seconds=60), [])
+
+        # Диспетчер «умер»: lease истёк — событие снова доступно
+        OutboxEvent.objects.filter(pk=first[0].pk).update(locked_until=timezone.now() - timedelta(seconds=1))
+        again = claim_events(batch_size=10, lease_seconds=60)
+        self.assertEqual([e.pk for e in again], [first[0].pk])
+        self.assertEqual(again[0].attempts, 2)
+
+    def test_lag_metric(self):
+        publish_event(FLAKY_TOPIC, "test", 1)
+        OutboxEvent.objects.update(created_at=timezone.now() - timedelta(seconds=90))
+        stats = outbox_stats()
+        self.assertEqual(stats.pending, 1)
+        self.assertGreaterEqual(stats.lag_seconds, 90)
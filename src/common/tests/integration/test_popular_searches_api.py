@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from src.common.infrastructure.orm.models import SearchQueryLog
+from src.common.infrastructure.repositories import log_search_query
+
+
+def _log(**kw):
+    params = dict(
+        user_id=None, keyword=None, city=None, region=None, price_min=None, price_max=None,
+        rooms_min=None, rooms_max=None, housing_types=[],
+    )
+    params.update(kw)
+    log_search_query(**params)
+
+
+class PopularSearchesApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_groups_by_hash_and_orders_by_count(self):
+        for _ in range(3):
+            _log(city="Berlin", housing_types=["studio", "apartment"])
+        _log(city=" Berlin ", housing_types=["apartment", "studio"])  # та же нормализованная сигнатура
+        _log(keyword="loft")
+
+        self.assertEqual(SearchQueryLog.objects.values("query_hash").distinct().count(), 2)
+
+        resp = self.client.get("/api/common/search/popular/", {"limit": 10})
+        self.assertEqual(resp.status_code, 200, resp.content)
+        data = resp.json()
+        self.assertEqual([item["count"] for item in data], [4, 1])
+        self.assertEqual(data[0]["params"], {"city": "Berlin", "housing_types": ["apartment", "studio"]})
+        self.assertEqual(data[1]["params"], {"keyword": "loft"})
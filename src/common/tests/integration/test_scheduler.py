@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
+
+from django.apps import apps
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from src.common.infrastructure import scheduler as scheduler_module
+from src.common.infrastructure.jobs import process_jobs
+from src.common.infrastructure.orm.models import ScheduledJobRun, SchedulerLease
+from src.common.infrastructure.scheduler import (
+    LEADER_LEASE,
+    Scheduler,
+    acquire_lease,
+    register_periodic,
+    release_lease,
+    run_periodic_job,
+)
+from src.shared.testing.factories import create_user
+
+NOW = datetime(2026, 10, 19, 12, 7, 20, tzinfo=dt_timezone.utc)
+
+
+@override_settings(TIME_ZONE="UTC")
+class SchedulerTests(TestCase):
+    def setUp(self):
+        # Изоляция от задач, зарегистрированных приложениями
+        patcher = mock.patch.dict(scheduler_module._registry, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.calls = []
+        register_periodic("test.every_5_min", "*/5 * * * *", lambda: self.calls.append("five"))
+        register_periodic("test.hourly", "0 * * * *", lambda: self.calls.append("hourly"))
+
+    def test_single_leader_until_lease_expires(self):
+        self.assertTrue(acquire_lease(LEADER_LEASE, "a", 60, NOW))
+        self.assertFalse(acquire_lease(LEADER_LEASE, "b", 60, NOW + timedelta(seconds=30)))
+        self.assertTrue(acquire_lease(LEADER_LEASE, "a", 60, NOW + timedelta(seconds=30)))  # продление
+        self.assertFalse(acquire_lease(LEADER_LEASE, "b", 60, NOW + timedelta(seconds=80)))
+        self.assertTrue(acquire_lease(LEADER_LEASE, "b", 60, NOW + timedelta(seconds=91)))
+        self.assertEqual(SchedulerLease.objects.get().holder, "b")
+
+        release_lease(LEADER_LEASE, "b")
+        self.assertTrue(acquire_lease(LEADER_LEASE, "a", 60))
+
+    def test_due_slot_runs_once_cluster_wide(self):
+        a, b = Scheduler(holder="a"), Scheduler(holder="b")
+        runs = a.tick(NOW)
+        self.assertEqual([(r.job, r.status) for r in runs], [("test.every_5_min", "queued")])
+        self.assertEqual(runs[0].scheduled_for, datetime(2026, 10, 19, 12, 5, tzinfo=dt_timezone.utc))
+        self.assertEqual(self.calls, [])  # тик только ставит слот в очередь
+        self.assertEqual(process_jobs().done, 1)
+        self.assertEqual(self.calls, ["five"])
+        self.assertEqual(ScheduledJobRun.objects.get().status, ScheduledJobRun.Status.SUCCEEDED)
+        self.assertEqual(b.tick(NOW), [])  # не лидер
+
+        # Аренда «a» истекла, лидером стала «b», но слот 12:05 уже занят
+        self.assertEqual(b.tick(NOW + timedelta(seconds=61)), [])
+        self.assertEqual(process_jobs().claimed, 0)
+        self.assertEqual(SchedulerLease.objects.get().holder, "b")
+        self.assertEqual(len(b.tick(NOW.replace(minute=10, second=5))), 1)
+        process_jobs()
+        self.assertEqual(self.calls, ["five", "five"])
+
+    @override_settings(SCHEDULER_MISFIRE_GRACE_SECONDS=60)
+    def test_missed_slots_older_than_grace_are_skipped(self):
+        self.assertEqual(Scheduler(holder="a").tick(NOW), [])  # 12:05 — 2 минуты назад
+        self.assertEqual(len(Scheduler(holder="a").tick(NOW.replace(minute=10, second=30))), 1)
+
+    def test_failure_recorded_with_duration_and_error(self):
+        def boom():
+            raise RuntimeError("rollup failed")
+
+        register_periodic("test.broken", "*/5 * * * *", boom)
+        Scheduler(holder="a").tick(NOW)
+        self.assertEqual(process_jobs().done, 2)  # сбой задачи записан в историю, сама фоновая задача выполнена
+        run = ScheduledJobRun.objects.get(job="test.broken")
+        self.assertEqual(run.status, ScheduledJobRun.Status.FAILED)
+        self.assertIn("RuntimeError: rollup failed", run.error)
+        self.assertIsNotNone(run.duration_ms)
+        # Сбой одной задачи не мешает остальным
+        self.assertEqual(ScheduledJobRun.objects.get(job="test.every_5_min").status, ScheduledJobRun.Status.SUCCEEDED)
+
+    def test_result_summary_and_stale_runs(self):
+        from src.common.infrastructure.rollups import RollupResult
+
+        register_periodic("test.rollup", "*/5 * * * *", lambda: RollupResult(batches=2, rows=10, last_id=7))
+        ScheduledJobRun.objects.create(
+            job="test.hourly", scheduled_for=NOW - timedelta(days=1), holder="dead",
+            started_at=NOW - timedelta(days=1),
+        )
+        Scheduler(holder="a").tick(NOW)
+        process_jobs()
+        self.assertEqual(ScheduledJobRun.objects.get(job="test.rollup").result, "batches=2 rows=10 last_id=7")
+        stale = ScheduledJobRun.objects.get(holder="dead")
+        self.assertEqual(stale.status, ScheduledJobRun.Status.FAILED)
+        self.assertIn("abandoned", stale.error)
+
+    def test_slow_job_does_not_hold_the_tick(self):
+        register_periodic("test.slow", "*/5 * * * *", lambda: self.fail("must run in a worker, not in the tick"))
+        runs = Scheduler(holder="a").tick(NOW)
+        self.assertEqual(sorted(r.job for r in runs), ["test.every_5_min", "test.slow"])
+        self.assertEqual(self.calls, [])
+
+    def test_redelivered_slot_runs_once(self):
+        run = Scheduler(holder="a").tick(NOW)[0]
+        run_periodic_job({"run_id": run.pk})
+        run_periodic_job({"run_id": run.pk})  # повторная доставка после истечения visibility timeout
+        self.assertEqual(self.calls, ["five"])
+
+    def test_runs_endpoint_admin_only(self):
+        Scheduler(holder="a").tick(NOW)
+        process_jobs()
+        client = APIClient()
+        client.force_authenticate(create_user("user@example.com"))
+        self.assertEqual(client.get("/api/common/scheduler/runs/").status_code, 403)
+
+        admin = create_user("admin@example.com")
+        admin.is_staff = True
+        admin.save(update_fields=["is_staff"])
+        client.force_authenticate(admin)
+        resp = client.get("/api/common/scheduler/runs/", {"job": "test.every_5_min", "status": "succeeded"})
+        self.assertEqual(resp.status_code, 200, resp.content)
+        self.assertEqual([r["job"] for r in resp.json()], ["test.every_5_min"])
+
+
+@override_settings(SCHEDULER_ENABLED=True)
+class SchedulerStartupTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(scheduler_module, "Scheduler")
+        self.scheduler_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        started = mock.patch.object(scheduler_module, "_started", False)
+        started.start()
+        self.addCleanup(started.stop)
+
+    def test_app_ready_and_workers_do_not_start_scheduler(self):
+        # То же, что делает django.setup() в любой management-команде и в дочерних процессах пула
+        for config in apps.get_app_configs():
+            config.ready()
+        call_command("run_workers", "--once", "--concurrency", "1", stdout=StringIO())
+        self.scheduler_cls.assert_not_called()
+
+    def test_web_entrypoint_starts_scheduler_once(self):
+        scheduler_module.start_scheduler()
+        scheduler_module.start_scheduler()
+        self.scheduler_cls.assert_called_once_with()
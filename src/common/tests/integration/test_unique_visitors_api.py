@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from src.common.infrastructure.orm.models import ListingVisitorsDaily
+from src.common.infrastructure.view_dedup import reset_listing_view_dedup
+from src.shared.testing.factories import create_user, create_accommodation
+
+
+class UniqueVisitorsApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        reset_listing_view_dedup()
+        self.host = create_user("host@example.com", roles=["host"])
+        self.guest = create_user("guest@example.com", roles=["guest"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+
+    def _view(self, user=None, ua="test-agent"):
+        self.client.force_authenticate(user=user)
+        resp = self.client.get(f"/api/accommodations/{self.acc.id}/", HTTP_USER_AGENT=ua)
+        self.assertEqual(resp.status_code, 200, resp.content)
+
+    def test_counts_users_and_anonymous_fingerprints(self):
+        self._view(self.guest)
+        self._view(self.guest)
+        self._view(None, ua="browser-a")
+        self._view(None, ua="browser-a")
+        self._view(None, ua="browser-b")
+        self.assertEqual(ListingVisitorsDaily.objects.filter(accommodation_id=self.acc.id).count(), 1)
+
+        self.client.force_authenticate(user=self.host)
+        resp = self.client.get(f"/api/accommodations/{self.acc.id}/stats/visitors/")
+        self.assertEqual(resp.status_code, 200, resp.content)
+        data = resp.json()
+        self.assertEqual(data["unique_visitors"], 3)
+        self.assertEqual(len(data["days"]), 1)
+        self.assertAlmostEqual(data["relative_error"], 0.0325, places=4)
+
+    def test_only_owner_can_read_stats(self):
+        other_host = create_user("other@example.com", roles=["host"])
+        self.client.force_authenticate(user=other_host)
+        resp = self.client.get(f"/api/accommodations/{self.acc.id}/stats/visitors/")
+        self.assertEqual(resp.status_code, 403, resp.content)
+
+    def test_invalid_range(self):
+        self.client.force_authenticate(user=self.host)
+        resp = self.client.get(
+            f"/api/accommodations/{self.acc.id}/stats/visitors/", {"from": "2025-02-01", "to": "2025-01-01"}
+        )
+        self.assertEqual(resp.status_code, 400, resp.content)
+
+    def test_detail_of_missing_listing_is_404(self):
+        resp = self.client.get("/api/accommodations/999999/")
+        self.assertEqual(resp.status_code, 404, resp.content)
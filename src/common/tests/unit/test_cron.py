@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from django.test import SimpleTestCase
+
+from src.common.domain.cron import CronSpec
+
+
+class CronSpecTests(SimpleTestCase):
+    def test_parse_fields_steps_ranges_and_lists(self):
+        spec = CronSpec.parse("*/15 9-17/4 1,15 * 1-5")
+        self.assertEqual(spec.minutes, {0, 15, 30, 45})
+        self.assertEqual(spec.hours, {9, 13, 17})
+        self.assertEqual(spec.days, {1, 15})
+        self.assertEqual(spec.weekdays, {1, 2, 3, 4, 5})
+
+    def test_aliases_and_sunday_as_seven(self):
+        self.assertEqual(CronSpec.parse("@daily").minutes, {0})
+        self.assertEqual(CronSpec.parse("0 0 * * 7").weekdays, {0})
+
+    def test_invalid_expressions_rejected(self):
+        for expr in ("* * * *", "60 * * * *", "*/0 * * * *", "5-1 * * * *", "a * * * *"):
+            with self.assertRaises(ValueError, msg=expr):
+                CronSpec.parse(expr)
+
+    def test_next_after_skips_to_next_matching_workday(self):
+        spec = CronSpec.parse("*/15 9-17 * * 1-5")
+        friday_evening = datetime(2026, 10, 23, 17, 50)
+        self.assertEqual(spec.next_after(friday_evening), datetime(2026, 10, 26, 9, 0))
+        self.assertEqual(spec.next_after(datetime(2026, 10, 26, 9, 0)), datetime(2026, 10, 26, 9, 15))
+
+    def test_next_after_crosses_month_and_year(self):
+        spec = CronSpec.parse("30 3 1 1 *")
+        self.assertEqual(spec.next_after(datetime(2026, 10, 19, 12, 0)), datetime(2027, 1, 1, 3, 30))
+
+    def test_day_of_month_or_weekday_when_both_restricted(self):
+        spec = CronSpec.parse("0 0 13 * 5")  # 13-е число ИЛИ пятница
+        self.assertTrue(spec.matches(datetime(2026, 10, 13, 0, 0)))  # вторник, 13-е
+        self.assertTrue(spec.matches(datetime(2026, 10, 23, 0, 0)))  # пятница
+        self.assertFalse(spec.matches(datetime(2026, 10, 22, 0, 0)))
+
+    def test_impossible_schedule_never_fires(self):
+        with self.assertRaises(ValueError):
+            CronSpec.parse("0 0 30 2 *").next_after(datetime(2026, 1, 1))
+
+    def test_latest_slot_within_window(self):
+        spec = CronSpec.parse("*/5 * * * *")
+        now = datetime(2026, 10, 19, 12, 7, 30)
+        self.assertEqual(spec.latest_at_or_before(now, datetime(2026, 10, 19, 12, 0)), datetime(2026, 10, 19, 12, 5))
+        self.assertIsNone(spec.latest_at_or_before(now, datetime(2026, 10, 19, 12, 6)))
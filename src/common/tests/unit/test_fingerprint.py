@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, override_settings
+
+from src.common.interfaces.fingerprint import client_fingerprint, client_ip
+
+
+def _request(xff: str = "", remote: str = "10.0.0.1", ua: str = "ua"):
+    return SimpleNamespace(META={"HTTP_X_FORWARDED_FOR": xff, "REMOTE_ADDR": remote, "HTTP_USER_AGENT": ua})
+
+
+class ClientIpTests(SimpleTestCase):
+    @override_settings(TRUSTED_PROXY_COUNT=0)
+    def test_forwarded_header_ignored_without_trusted_proxy(self):
+        self.assertEqual(client_ip(_request("1.1.1.1").META), "10.0.0.1")
+        self.assertEqual(client_fingerprint(_request("1.1.1.1")), client_fingerprint(_request("2.2.2.2")))
+
+    @override_settings(TRUSTED_PROXY_COUNT=1)
+    def test_spoofed_hops_left_of_trusted_proxy_ignored(self):
+        # Клиент подставил "6.6.6.6", прокси дописал реальный адрес клиента справа
+        self.assertEqual(client_ip(_request("6.6.6.6, 203.0.113.7").META), "203.0.113.7")
+        self.assertEqual(
+            client_fingerprint(_request("6.6.6.6, 203.0.113.7")), client_fingerprint(_request("9.9.9.9, 203.0.113.7"))
+        )
+
+    @override_settings(TRUSTED_PROXY_COUNT=2)
+    def test_short_header_falls_back_to_remote_addr(self):
+        self.assertEqual(client_ip(_request("203.0.113.7, 10.0.0.5").META), "203.0.113.7")
+        self.assertEqual(client_ip(_request("203.0.113.7").META), "10.0.0.1")
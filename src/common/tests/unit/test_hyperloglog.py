@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from django.test import SimpleTestCase
+
+from src.common.domain.hyperloglog import HLL_RELATIVE_ERROR, HyperLogLog
+
+
+class HyperLogLogTests(SimpleTestCase):
+    def test_small_cardinality_is_near_exact(self):
+        hll = HyperLogLog()
+        for i in range(50):
+            hll.add(f"u:{i}")
+            hll.add(f"u:{i}")  # повтор не влияет
+        self.assertAlmostEqual(hll.count(), 50, delta=2)
+
+    def test_large_cardinality_within_error_bound(self):
+        hll = HyperLogLog()
+        n = 20000
+        for i in range(n):
+            hll.add(f"a:{i}")
+        # 3σ
+        self.assertLess(abs(hll.count() - n) / n, 3 * HLL_RELATIVE_ERROR)
+
+    def test_add_reports_changes(self):
+        hll = HyperLogLog()
+        self.assertTrue(hll.add("u:1"))
+        self.assertFalse(hll.add("u:1"))
+
+    def test_sparse_and_dense_roundtrip(self):
+        small = HyperLogLog()
+        for i in range(10):
+            small.add(str(i))
+        blob = small.to_bytes()
+        self.assertLess(len(blob), 32)
+        self.assertEqual(HyperLogLog.from_bytes(blob).registers, small.registers)
+
+        big = HyperLogLog()
+        for i in range(5000):
+            big.add(str(i))
+        blob = big.to_bytes()
+        self.assertEqual(len(blob), 769)
+        self.assertEqual(HyperLogLog.from_bytes(blob).registers, big.registers)
+
+    def test_merge_counts_union(self):
+        a, b = HyperLogLog(), HyperLogLog()
+        for i in range(300):
+            a.add(str(i))
+        for i in range(200, 500):
+            b.add(str(i))
+        merged = HyperLogLog.merged([a.to_bytes(), b.to_bytes(), None])
+        self.assertAlmostEqual(merged.count(), 500, delta=500 * 3 * HLL_RELATIVE_ERROR)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from django.test import SimpleTestCase
 
-from src.common.infrastructure.repositories import build_query_signature
+from src.common.infrastructure.repositories import build_query_signature, signature_hash
 
 
 class BuildQuerySignatureTests(SimpleTestCase):
@@ -43,4 +43,20 @@ class BuildQuerySignatureTests(SimpleTestCase):
             rooms_max=None,
             housing_types=[],
         )
-        self.assertEqual(built["signature"], "")
\ No newline at end of file
+        self.assertEqual(built["signature"], "")
+        self.assertEqual(built["hash"], 0)
+
+    def test_hash_is_stable_signed_64bit(self):
+        a = build_query_signature(
+            keyword="loft", city="Berlin", region=None, price_min=None, price_max=None,
+            rooms_min=None, rooms_max=None, housing_types=["studio", "apartment"],
+        )
+        b = build_query_signature(
+            keyword=" loft ", city="Berlin ", region="", price_min=None, price_max=None,
+            rooms_min=None, rooms_max=None, housing_types=["apartment", "studio", "studio"],
+        )
+        self.assertEqual(a["signature"], b["signature"])
+        self.assertEqual(a["hash"], b["hash"])
+        self.assertEqual(a["hash"], signature_hash(a["signature"]))
+        self.assertTrue(-(2 ** 63) <= a["hash"] < 2 ** 63)
+        self.assertNotEqual(a["hash"], signature_hash(a["signature"] + "|rooms_min=1"))
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from django.test import SimpleTestCase
+
+from src.common.infrastructure.view_dedup import TimeBucketedSet
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TimeBucketedSetTests(SimpleTestCase):
+    def test_repeat_within_window_is_deduplicated(self):
+        clock = FakeClock()
+        s = TimeBucketedSet(window_seconds=60, buckets=6, clock=clock)
+        self.assertTrue(s.add_if_absent((1, "u:1")))
+        clock.now += 30
+        self.assertFalse(s.add_if_absent((1, "u:1")))
+        self.assertTrue(s.add_if_absent((2, "u:1")))  # другое объявление — другой ключ
+
+    def test_key_expires_after_window(self):
+        clock = FakeClock()
+        s = TimeBucketedSet(window_seconds=60, buckets=6, clock=clock)
+        s.add_if_absent("k")
+        clock.now += 61
+        self.assertTrue(s.add_if_absent("k"))
+        self.assertEqual(len(s), 1)  # старая корзина выброшена
+
+    def test_size_is_bounded_by_evicting_oldest_buckets(self):
+        clock = FakeClock()
+        s = TimeBucketedSet(window_seconds=60, buckets=6, max_keys=5, clock=clock)
+        for i in range(3):
+            s.add_if_absent(f"old-{i}")
+        clock.now += 10
+        for i in range(3):
+            s.add_if_absent(f"new-{i}")
+        self.assertLessEqual(len(s), 5)
+        self.assertTrue(s.add_if_absent("old-0"))  # вытеснен вместе со старой корзиной
+        self.assertFalse(s.add_if_absent("new-2"))
@@ -1,17 +1,23 @@
 # Python
 from __future__ import annotations
 
+from typing import Optional
+
 from src.reviews.domain.dtos import ReviewDTO
 from src.reviews.domain.entities import Review
 
 
-def to_dto(r: Review) -> ReviewDTO:
+def to_dto(r: Review, text_limit: Optional[int] = None) -> ReviewDTO:
+    text, truncated = r.text, False
+    if text_limit is not None and len(text) > text_limit:
+        text, truncated = text[:text_limit].rstrip() + "…", True
     return ReviewDTO(
         id=r.id or 0,
         accommodation_id=r.accommodation_id,
         author_id=r.author_id,
         booking_id=r.booking_id,
         rating=r.rating.value,
-        text=r.text,
+        text=text,
         created_at=r.created_at,
-    )
\ No newline at end of file
+        text_truncated=truncated,
+    )
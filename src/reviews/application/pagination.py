@@ -0,0 +1,39 @@
+# Слой application: непрозрачные курсоры keyset-пагинации отзывов (base64url JSON [сортировка, ключ, id])
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional
+
+from src.reviews.domain.dtos import ReviewSort
+from src.reviews.domain.entities import Review
+from src.reviews.domain.repository_interfaces import ReviewCursor
+from src.shared.errors import ApplicationError
+
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 100
+SUMMARY_TEXT_LENGTH = 200  # длина превью текста в кратком режиме
+
+
+def encode_cursor(sort: ReviewSort, review: Review) -> str:
+    key = review.created_at.isoformat() if sort is ReviewSort.NEWEST else review.rating.value
+    raw = json.dumps([sort.value, key, review.id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], sort: ReviewSort) -> Optional[ReviewCursor]:
+    """Курсор привязан к сортировке: чужой (от другой sort) отклоняется, а не даёт «дырявую» страницу."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, key, review_id = json.loads(raw)
+        if sort_value != sort.value:
+            raise ValueError("cursor belongs to another sort")
+        if sort is ReviewSort.NEWEST:
+            return datetime.fromisoformat(key), int(review_id)
+        return int(key), int(review_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise ApplicationError("Invalid cursor")
@@ -2,13 +2,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
+
+from src.reviews.application.pagination import DEFAULT_PAGE_LIMIT
+from src.reviews.domain.dtos import ReviewSort
 
 
 @dataclass(frozen=True)
 class ListReviewsForAccommodationQuery:
     accommodation_id: int
+    sort: ReviewSort = ReviewSort.NEWEST
+    cursor: Optional[str] = None
+    limit: int = DEFAULT_PAGE_LIMIT
+    summary: bool = False  # текст обрезается до SUMMARY_TEXT_LENGTH
 
 
 @dataclass(frozen=True)
 class ListMyReviewsQuery:
     author_id: int
+    sort: ReviewSort = ReviewSort.NEWEST
+    cursor: Optional[str] = None
+    limit: int = DEFAULT_PAGE_LIMIT
+    summary: bool = False
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from src.reviews.application.mappers import to_dto
+from src.reviews.application.pagination import MAX_PAGE_LIMIT, SUMMARY_TEXT_LENGTH, decode_cursor, encode_cursor
 from src.reviews.application.queries import ListMyReviewsQuery
-from src.reviews.domain.dtos import ReviewDTO
+from src.reviews.domain.dtos import ReviewPageDTO
 from src.reviews.domain.repository_interfaces import IReviewRepository
 
 
@@ -10,6 +11,16 @@ class ListMyReviewsUseCase:
     def __init__(self, reviews: IReviewRepository):
         self._reviews = reviews
 
-    def execute(self, q: ListMyReviewsQuery) -> list[ReviewDTO]:
-        items = self._reviews.list_by_author(q.author_id)
-        return [to_dto(r) for r in items]
+    def execute(self, q: ListMyReviewsQuery) -> ReviewPageDTO:
+        limit = max(1, min(q.limit, MAX_PAGE_LIMIT))
+        text_limit = SUMMARY_TEXT_LENGTH if q.summary else None
+        reviews = self._reviews.list_by_author(
+            q.author_id,
+            sort=q.sort,
+            after=decode_cursor(q.cursor, q.sort),
+            limit=limit + 1,
+            text_limit=text_limit + 1 if text_limit else None,
+        )
+        page, more = reviews[:limit], len(reviews) > limit
+        next_cursor = encode_cursor(q.sort, page[-1]) if more else None
+        return ReviewPageDTO(items=[to_dto(r, text_limit) for r in page], next_cursor=next_cursor)
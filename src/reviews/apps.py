@@ -7,7 +7,16 @@ class ReviewsConfig(AppConfig):
     verbose_name = 'Reviews'
 
     def ready(self) -> None:
-        # Регистрация сигналов пересчёта рейтинга
+        # Сигналы сдвигают рейтинг объявления дельтами и публикуют outbox-события по отзывам
         # Импорт внутри ready(), чтобы избежать побочных эффектов при миграциях
         from .infrastructure.orm import signals  # noqa: F401
+        from src.common.infrastructure.outbox import REVIEW_CHANGED, register_outbox_handler
+        from src.common.infrastructure.scheduler import register_periodic
+        from src.reviews.infrastructure.ratings import reconcile_ratings
+        from src.reviews.infrastructure.snapshots import on_review_changed
 
+        # Снимок последних отзывов на объявлении — пересобирается по событию (at-least-once, идемпотентно)
+        register_outbox_handler(REVIEW_CHANGED, on_review_changed)
+
+        # Сверка денормализованного рейтинга с отзывами (исправляет дрейф)
+        register_periodic("reviews.reconcile_ratings", "20 4 * * *", reconcile_ratings)
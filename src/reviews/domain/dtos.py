@@ -1,8 +1,16 @@
 # Слой domain: DTO для обмена данными между слоями (без зависимостей от Django)
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+
+class ReviewSort(Enum):
+    NEWEST = "newest"  # (created_at, id) по убыванию
+    RATING_DESC = "rating_desc"  # (rating, id) по убыванию
+    RATING_ASC = "rating_asc"  # (rating, id) по возрастанию
 
 
 @dataclass
@@ -14,6 +22,23 @@ class ReviewDTO:
     rating: int
     text: str
     created_at: datetime
+    text_truncated: bool = False  # краткий режим: text обрезан до превью
+
+
+@dataclass
+class ReviewPageDTO:
+    items: List[ReviewDTO] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ReviewEligibility:
+    """Всё, что нужно для проверки права оставить отзыв по брони, — одним запросом (см. get_eligibility)."""
+    booking_id: int
+    guest_id: int
+    accommodation_id: int
+    is_completed: bool
+    already_reviewed: bool
 
 
 @dataclass
@@ -1,10 +1,15 @@
 # Слой domain: контракты репозиториев, абстрактные интерфейсы репозиториев (protocols/ABC)
 from __future__ import annotations
 
-from typing import Optional, Protocol, runtime_checkable
+from datetime import datetime
+from typing import Optional, Protocol, Tuple, Union, runtime_checkable
 
+from .dtos import ReviewEligibility, ReviewSort
 from .entities import Review
 
+# Keyset-курсор: (значение ключа сортировки последней выданной строки — created_at или rating, id)
+ReviewCursor = Tuple[Union[datetime, int], int]
+
 
 @runtime_checkable
 class IReviewRepository(Protocol):
@@ -12,13 +17,40 @@ class IReviewRepository(Protocol):
 
     def get_by_id(self, review_id: int) -> Optional[Review]: ...
 
-    def list_for_accommodation(self, accommodation_id: int) -> list[Review]: ...
-
-    def list_by_author(self, author_id: int) -> list[Review]: ...
+    def list_for_accommodation(
+        self,
+        accommodation_id: int,
+        *,
+        sort: ReviewSort = ReviewSort.NEWEST,
+        after: Optional[ReviewCursor] = None,
+        limit: Optional[int] = None,
+        text_limit: Optional[int] = None,
+    ) -> list[Review]:
+        """
+        Отзывы объявления в порядке sort; after — keyset-курсор последней выданной строки.
+        text_limit — читать из БД только первые text_limit символов текста (краткий режим).
+        """
+        ...
+
+    def list_by_author(
+        self,
+        author_id: int,
+        *,
+        sort: ReviewSort = ReviewSort.NEWEST,
+        after: Optional[ReviewCursor] = None,
+        limit: Optional[int] = None,
+        text_limit: Optional[int] = None,
+    ) -> list[Review]: ...
 
     def exists_for_booking(self, booking_id: int) -> bool: ...
 
-    def create(self, review: Review) -> Review: ...
+    def get_eligibility(self, booking_id: int) -> Optional[ReviewEligibility]:
+        """Владелец, объявление, статус брони и флаг «отзыв уже есть» за один запрос; None — брони нет."""
+        ...
+
+    def create(self, review: Review) -> Review:
+        """Дубликат по booking_id (уникальность в БД) — ValueError(DUPLICATE_REVIEW_MESSAGE)."""
+        ...
 
     def update(self, review: Review) -> Review: ...
 
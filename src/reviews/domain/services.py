@@ -4,6 +4,8 @@ from __future__ import annotations
 from .entities import Review
 from .value_objects import Rating
 
+DUPLICATE_REVIEW_MESSAGE = "Review for this booking already exists"
+
 
 def create_review(
         *,
@@ -29,7 +31,7 @@ def create_review(
     if not booking_is_completed:
         raise ValueError("Booking must be completed to leave a review")
     if not is_unique_for_booking:
-        raise ValueError("Review for this booking already exists")
+        raise ValueError(DUPLICATE_REVIEW_MESSAGE)
 
     t = (text or "").strip()
     if len(t) < 10:
@@ -34,10 +34,19 @@ class Review(models.Model):
     class Meta:
         db_table = "reviews"
         indexes = [
-            models.Index(fields=["accommodation", "created_at"]),
-            models.Index(fields=["author", "created_at"]),
+            # Keyset-пагинация списков отзывов (см. DjangoReviewRepository): (ключ сортировки, id)
+            models.Index(fields=["accommodation", "created_at", "id"]),
+            models.Index(fields=["accommodation", "rating", "id"]),
+            models.Index(fields=["author", "created_at", "id"]),
             models.Index(fields=["rating"]),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Снимок сохранённых значений: post_save считает дельту рейтинга без повторного чтения
+        instance._stored_rating = (instance.__dict__.get("accommodation_id"), instance.__dict__.get("rating"))
+        return instance
+
     def __str__(self) -> str:
         return f"Review#{self.pk} acc={self.accommodation_id} by={self.author_id} rating={self.rating}"
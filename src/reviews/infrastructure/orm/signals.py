@@ -1,41 +1,41 @@
-from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
 
-from django.db import transaction
-from django.db.models import Avg, Count
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from .models import Review
-from src.accommodations.infrastructure.orm.models import Accommodation
+from src.common.infrastructure.outbox import REVIEW_CHANGED, publish_event
+from src.reviews.infrastructure.ratings import apply_rating_change
 
 
-def _quantize_rating(value: float | None) -> Decimal:
-    if not value:
-        return Decimal("0.00")
-    return Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-
-def update_accommodation_rating(accommodation_id: int) -> None:
-    agg = Review.objects.filter(accommodation_id=accommodation_id).aggregate(
-        avg=Avg("rating"),
-        cnt=Count("id"),
-    )
-    avg = _quantize_rating(agg["avg"])
-    cnt = int(agg["cnt"] or 0)
-
-    # Обновляем денормализованные поля атомарно
-    Accommodation.objects.filter(id=accommodation_id).update(
-        average_rating=avg,
-        reviews_count=cnt,
-    )
+def _publish_review_changed(instance: Review, action: str, previous_accommodation_id: Optional[int] = None) -> None:
+    # Событие для подписчиков (снимок отзывов на объявлении и внешние) — в транзакции сохранения/удаления отзыва
+    payload = {"accommodation_id": instance.accommodation_id, "action": action}
+    if previous_accommodation_id is not None and previous_accommodation_id != instance.accommodation_id:
+        payload["previous_accommodation_id"] = previous_accommodation_id
+    publish_event(REVIEW_CHANGED, "review", instance.pk, payload)
 
 
 @receiver(post_save, sender=Review)
-def on_review_saved(sender, instance: Review, **kwargs):
-    # Используем on_commit, чтобы гарантировать наличие записанного отзыва
-    transaction.on_commit(lambda: update_accommodation_rating(instance.accommodation_id))
+def on_review_saved(sender, instance: Review, created: bool = False, **kwargs):
+    # Рейтинг объявления — дельтами в той же транзакции (повторная доставка outbox удвоила бы дельту)
+    old_acc, old_rating = getattr(instance, "_stored_rating", (None, None))
+    if created:
+        apply_rating_change(instance.accommodation_id, new=instance.rating)
+    else:
+        # Нет снимка (экземпляр собран не из БД) — прежняя оценка неизвестна, дрейф исправит reconcile_ratings
+        if old_acc is not None and old_rating is not None:
+            if old_acc != instance.accommodation_id:
+                apply_rating_change(old_acc, old=old_rating)
+                apply_rating_change(instance.accommodation_id, new=instance.rating)
+            else:
+                apply_rating_change(instance.accommodation_id, old=old_rating, new=instance.rating)
+    instance._stored_rating = (instance.accommodation_id, instance.rating)
+    _publish_review_changed(instance, "created" if created else "updated", old_acc)
 
 
 @receiver(post_delete, sender=Review)
 def on_review_deleted(sender, instance: Review, **kwargs):
-    transaction.on_commit(lambda: update_accommodation_rating(instance.accommodation_id))
\ No newline at end of file
+    acc_id, rating = getattr(instance, "_stored_rating", (instance.accommodation_id, instance.rating))
+    apply_rating_change(acc_id, old=rating)
+    _publish_review_changed(instance, "deleted")
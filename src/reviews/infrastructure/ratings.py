@@ -0,0 +1,146 @@
+# Слой infrastructure: денормализованный рейтинг объявления — O(1) дельты и сверка с отзывами
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Count, DecimalField, F, FloatField, Q, Sum, Value, When
+from django.db.models.functions import Cast, Greatest, Round
+
+from src.accommodations.infrastructure.orm.models import Accommodation
+from src.reviews.infrastructure.orm.models import Review
+
+logger = logging.getLogger(__name__)
+
+STAR_FIELDS = {stars: f"rating_{stars}_count" for stars in range(1, 6)}
+COUNTER_FIELDS = ("rating_sum", "reviews_count", *STAR_FIELDS.values())
+Counters = Tuple[int, ...]  # значения COUNTER_FIELDS
+_EMPTY: Counters = (0,) * len(COUNTER_FIELDS)
+
+
+def average_rating_expression() -> Case:
+    """average_rating = rating_sum / reviews_count (0 без отзывов) — вычисляется в БД по текущей строке."""
+    return Case(
+        When(reviews_count__gt=0, then=Round(Cast("rating_sum", FloatField()) / F("reviews_count"), 2)),
+        default=Value(Decimal("0.00")),
+        output_field=DecimalField(max_digits=3, decimal_places=2),
+    )
+
+
+def _shift(field_name: str, delta: int) -> Greatest:
+    # Greatest — не уйти в минус при дрейфе (его исправит reconcile_ratings)
+    return Greatest(F(field_name) + delta, Value(0))
+
+
+def apply_rating_change(accommodation_id: int, *, old: Optional[int] = None, new: Optional[int] = None) -> None:
+    """
+    Учитывает замену оценки old → new (None — оценки не было/больше нет) дельтами счётчиков,
+    не читая отзывы: O(1) вместо AVG/COUNT/GROUP BY по всем отзывам объявления.
+    Два UPDATE в транзакции записи отзыва: первый берёт блокировку строки, второй выводит среднее
+    из уже обновлённых значений (в одном SET MySQL и SQLite по-разному видят «старые» значения колонок).
+    """
+    if old == new:
+        return
+    deltas: Dict[str, int] = {
+        "rating_sum": (new or 0) - (old or 0),
+        "reviews_count": (new is not None) - (old is not None),
+    }
+    if old is not None:
+        deltas[STAR_FIELDS[old]] = -1
+    if new is not None:
+        deltas[STAR_FIELDS[new]] = 1
+    rows = Accommodation.objects.filter(pk=accommodation_id)
+    if rows.update(**{name: _shift(name, delta) for name, delta in deltas.items() if delta}):
+        rows.update(average_rating=average_rating_expression())
+
+
+def _quantize_rating(total: int, count: int) -> Decimal:
+    if not count:
+        return Decimal("0.00")
+    return (Decimal(total) / Decimal(count)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+@dataclass
+class ReconcileResult:
+    checked: int = 0
+    drifted: int = 0
+    fixed: int = 0
+    batches: int = 0
+    elapsed_ms: float = 0.0
+    drifted_ids: List[int] = field(default_factory=list)
+
+
+def _actual(ids: List[int]) -> Dict[int, Counters]:
+    rows = (
+        Review.objects.filter(accommodation_id__in=ids)
+        .values("accommodation_id")
+        .annotate(
+            total=Sum("rating"),
+            cnt=Count("id"),
+            **{name: Count("id", filter=Q(rating=stars)) for stars, name in STAR_FIELDS.items()},
+        )
+        .values_list("accommodation_id", "total", "cnt", *STAR_FIELDS.values())
+    )
+    return {row[0]: tuple(int(v or 0) for v in row[1:]) for row in rows}
+
+
+def reconcile_ratings(
+        *,
+        batch_size: Optional[int] = None,
+        sleep_seconds: Optional[float] = None,
+        max_batches: Optional[int] = None,
+        fix: bool = True,
+) -> ReconcileResult:
+    """
+    Сверяет счётчики рейтинга (сумма, число, по звёздам) и average_rating с отзывами
+    порциями объявлений (keyset по id).
+    Расхождения исправляются под блокировкой строк объявлений и с повторным подсчётом: конкурентная
+    запись отзыва либо уже зафиксирована (и учтена), либо применит свою дельту после нас.
+    """
+    batch_size = batch_size or settings.RATING_RECONCILE_BATCH_SIZE
+    sleep_seconds = settings.RATING_RECONCILE_SLEEP_SECONDS if sleep_seconds is None else sleep_seconds
+    result = ReconcileResult()
+    t0 = time.perf_counter()
+    last_id = 0
+    while max_batches is None or result.batches < max_batches:
+        stored = list(
+            Accommodation.objects.filter(pk__gt=last_id)
+            .order_by("pk")
+            .values_list("pk", "average_rating", *COUNTER_FIELDS)[:batch_size]
+        )
+        if not stored:
+            break
+        last_id = stored[-1][0]
+        actual = _actual([row[0] for row in stored])
+        drifted = []
+        for pk, avg, *counters in stored:
+            expected = actual.get(pk, _EMPTY)
+            if tuple(counters) != expected or avg != _quantize_rating(*expected[:2]):
+                drifted.append(pk)
+        result.batches += 1
+        result.checked += len(stored)
+        result.drifted += len(drifted)
+        result.drifted_ids += drifted
+        if drifted and fix:
+            with transaction.atomic():
+                locked = list(Accommodation.objects.select_for_update().filter(pk__in=drifted).order_by("pk"))
+                fresh = _actual(drifted)
+                for acc in locked:
+                    counters = fresh.get(acc.pk, _EMPTY)
+                    for name, value in zip(COUNTER_FIELDS, counters):
+                        setattr(acc, name, value)
+                    acc.average_rating = _quantize_rating(*counters[:2])
+                Accommodation.objects.bulk_update(locked, [*COUNTER_FIELDS, "average_rating"])
+            result.fixed += len(locked)
+            logger.warning("ratings: repaired drift for accommodations %s", drifted)
+        if len(stored) < batch_size:
+            break
+        if sleep_seconds:
+            time.sleep(sleep_seconds)
+    result.elapsed_ms = (time.perf_counter() - t0) * 1000
+    return result
@@ -1,24 +1,29 @@
 # Слой infrastructure: реализации репозиториев (Django ORM), адаптеры для domain.repository_interfaces
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-from django.db.models import QuerySet
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.db.models.functions import Substr
 
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.reviews.domain.dtos import ReviewEligibility, ReviewSort
 from src.reviews.domain.entities import Review as ReviewDomain
-from src.reviews.domain.repository_interfaces import IReviewRepository
+from src.reviews.domain.repository_interfaces import IReviewRepository, ReviewCursor
+from src.reviews.domain.services import DUPLICATE_REVIEW_MESSAGE
 from src.reviews.domain.value_objects import Rating
 from src.reviews.infrastructure.orm.models import Review as ReviewORM
 
 
-def _to_domain(obj: ReviewORM) -> ReviewDomain:
+def _to_domain(obj: ReviewORM, text: Optional[str] = None) -> ReviewDomain:
     return ReviewDomain(
         id=obj.id,
         accommodation_id=obj.accommodation_id,
         author_id=obj.author_id,
         booking_id=obj.booking_id,
         rating=Rating(obj.rating),
-        text=obj.text,
+        text=obj.text if text is None else text,
         created_at=obj.created_at,
         updated_at=obj.updated_at,
     )
@@ -33,6 +38,36 @@ def _apply_domain(src: ReviewDomain, dst: ReviewORM) -> ReviewORM:
     return dst
 
 
+# Ключ keyset-пагинации и направление; id — тай-брейкер. Индексы (accommodation|author, created_at, id)
+# и (accommodation, rating, id) отдают строки уже в нужном порядке, без filesort
+_SORT_KEYS: Dict[ReviewSort, Tuple[str, bool]] = {
+    ReviewSort.NEWEST: ("created_at", True),
+    ReviewSort.RATING_DESC: ("rating", True),
+    ReviewSort.RATING_ASC: ("rating", False),
+}
+
+
+def _page(
+        qs: QuerySet[ReviewORM],
+        sort: ReviewSort,
+        after: Optional[ReviewCursor],
+        limit: Optional[int],
+        text_limit: Optional[int],
+) -> list[ReviewDomain]:
+    key, desc = _SORT_KEYS[sort]
+    op = "lt" if desc else "gt"
+    if after is not None:
+        qs = qs.filter(Q(**{f"{key}__{op}": after[0]}) | Q(**{key: after[0], f"id__{op}": after[1]}))
+    direction = "-" if desc else ""
+    qs = qs.order_by(f"{direction}{key}", f"{direction}id")
+    if text_limit:
+        # Краткий режим: полный текст из БД не читаем, только префикс
+        qs = qs.defer("text").annotate(text_preview=Substr("text", 1, text_limit))
+    if limit is not None:
+        qs = qs[:limit]
+    return [_to_domain(o, o.text_preview if text_limit else None) for o in qs]
+
+
 class DjangoReviewRepository(IReviewRepository):
     def get_by_id(self, review_id: int) -> Optional[ReviewDomain]:
         try:
@@ -40,31 +75,77 @@ class DjangoReviewRepository(IReviewRepository):
         except ReviewORM.DoesNotExist:
             return None
 
-    def list_for_accommodation(self, accommodation_id: int) -> list[ReviewDomain]:
-        qs: QuerySet[ReviewORM] = ReviewORM.objects.filter(accommodation_id=accommodation_id).order_by("-created_at")
-        return [_to_domain(o) for o in qs]
+    def list_for_accommodation(
+            self,
+            accommodation_id: int,
+            *,
+            sort: ReviewSort = ReviewSort.NEWEST,
+            after: Optional[ReviewCursor] = None,
+            limit: Optional[int] = None,
+            text_limit: Optional[int] = None,
+    ) -> list[ReviewDomain]:
+        qs: QuerySet[ReviewORM] = ReviewORM.objects.filter(accommodation_id=accommodation_id)
+        return _page(qs, sort, after, limit, text_limit)
 
-    def list_by_author(self, author_id: int) -> list[ReviewDomain]:
-        qs: QuerySet[ReviewORM] = ReviewORM.objects.filter(author_id=author_id).order_by("-created_at")
-        return [_to_domain(o) for o in qs]
+    def list_by_author(
+            self,
+            author_id: int,
+            *,
+            sort: ReviewSort = ReviewSort.NEWEST,
+            after: Optional[ReviewCursor] = None,
+            limit: Optional[int] = None,
+            text_limit: Optional[int] = None,
+    ) -> list[ReviewDomain]:
+        qs: QuerySet[ReviewORM] = ReviewORM.objects.filter(author_id=author_id)
+        return _page(qs, sort, after, limit, text_limit)
 
     def exists_for_booking(self, booking_id: int) -> bool:
         return ReviewORM.objects.filter(booking_id=booking_id).exists()
 
+    def get_eligibility(self, booking_id: int) -> Optional[ReviewEligibility]:
+        row = (
+            BookingORM.objects.filter(pk=booking_id)
+            .annotate(already_reviewed=Exists(ReviewORM.objects.filter(booking_id=OuterRef("pk"))))
+            .values_list("guest_id", "accommodation_id", "status", "already_reviewed")
+            .first()
+        )
+        if row is None:
+            return None
+        guest_id, accommodation_id, booking_status, already_reviewed = row
+        return ReviewEligibility(
+            booking_id=booking_id,
+            guest_id=guest_id,
+            accommodation_id=accommodation_id,
+            is_completed=booking_status == BookingORM.Status.COMPLETED,
+            already_reviewed=bool(already_reviewed),
+        )
+
     def create(self, review: ReviewDomain) -> ReviewDomain:
         obj = ReviewORM()
         obj = _apply_domain(review, obj)
-        obj.save()
+        try:
+            with transaction.atomic():  # отзыв + outbox-событие (post_save) — одна транзакция
+                obj.save()
+        except IntegrityError:
+            # Гонка двух запросов на одну бронь: второй упирается в уникальный booking_id.
+            # Проверка только на пути ошибки — чтобы не выдать нарушение FK за дубликат
+            if ReviewORM.objects.filter(booking_id=review.booking_id).exists():
+                raise ValueError(DUPLICATE_REVIEW_MESSAGE) from None
+            raise
         return _to_domain(obj)
 
     def update(self, review: ReviewDomain) -> ReviewDomain:
-        obj = ReviewORM.objects.get(pk=review.id)
-        obj = _apply_domain(review, obj)
-        obj.save()
+        with transaction.atomic():
+            # Блокировка строки: дельта рейтинга (post_save) считается от актуальной прежней оценки
+            obj = ReviewORM.objects.select_for_update().get(pk=review.id)
+            obj = _apply_domain(review, obj)
+            obj.save()
         return _to_domain(obj)
 
     def delete(self, review_id: int, author_id: Optional[int] = None) -> None:
         qs = ReviewORM.objects.filter(pk=review_id)
         if author_id is not None:
             qs = qs.filter(author_id=author_id)
-        qs.delete()
+        with transaction.atomic():
+            for obj in qs.select_for_update():
+                obj.delete()
@@ -0,0 +1,48 @@
+# Слой infrastructure: денормализованный снимок последних отзывов на строке объявления (accommodations.reviews_snapshot)
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from django.db.models.functions import Substr
+
+from src.accommodations.infrastructure.orm.models import Accommodation
+from src.common.infrastructure.outbox import OutboxMessage
+from src.reviews.infrastructure.orm.models import Review
+
+SNAPSHOT_REVIEWS = 3
+SNAPSHOT_TEXT_LENGTH = 200
+
+
+def build_reviews_snapshot(accommodation_id: int) -> Dict[str, Any]:
+    """Последние SNAPSHOT_REVIEWS отзывов: один SELECT ... LIMIT по индексу (accommodation, created_at, id)."""
+    rows = (
+        Review.objects.filter(accommodation_id=accommodation_id)
+        .order_by("-created_at", "-id")
+        .annotate(preview=Substr("text", 1, SNAPSHOT_TEXT_LENGTH + 1))
+        .values("id", "author_id", "rating", "preview", "created_at")[:SNAPSHOT_REVIEWS]
+    )
+    latest = []
+    for row in rows:
+        truncated = len(row["preview"]) > SNAPSHOT_TEXT_LENGTH
+        latest.append({
+            "id": row["id"],
+            "author_id": row["author_id"],
+            "rating": row["rating"],
+            "text": row["preview"][:SNAPSHOT_TEXT_LENGTH].rstrip() + "…" if truncated else row["preview"],
+            "text_truncated": truncated,
+            "created_at": row["created_at"].isoformat(),
+        })
+    return {"latest": latest}
+
+
+def refresh_reviews_snapshot(accommodation_id: int) -> None:
+    """Пересобирает снимок из отзывов целиком — идемпотентно, повторная доставка события безопасна."""
+    Accommodation.objects.filter(pk=accommodation_id).update(reviews_snapshot=build_reviews_snapshot(accommodation_id))
+
+
+def on_review_changed(message: OutboxMessage) -> None:
+    """Обработчик outbox-события review.changed: отзыв мог уйти с другого объявления — обновляем оба."""
+    for key in ("accommodation_id", "previous_accommodation_id"):
+        accommodation_id = message.payload.get(key)
+        if accommodation_id is not None:
+            refresh_reviews_snapshot(accommodation_id)
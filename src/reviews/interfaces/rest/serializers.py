@@ -3,6 +3,9 @@ from __future__ import annotations
 
 from rest_framework import serializers
 
+from src.reviews.application.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, SUMMARY_TEXT_LENGTH
+from src.reviews.domain.dtos import ReviewSort
+
 
 class ReviewCreateSerializer(serializers.Serializer):
     accommodation_id = serializers.IntegerField(required=False)
@@ -19,6 +22,24 @@ class ReviewDetailSerializer(serializers.Serializer):
     rating = serializers.IntegerField()
     text = serializers.CharField()
     created_at = serializers.DateTimeField()
+    text_truncated = serializers.BooleanField(help_text="Текст обрезан (summary=true)")
+
+
+class ReviewListQuerySerializer(serializers.Serializer):
+    sort = serializers.ChoiceField(
+        choices=[(s.value, s.value) for s in ReviewSort], required=False, default=ReviewSort.NEWEST.value,
+        help_text="newest — новые сначала; rating_desc/rating_asc — по оценке",
+    )
+    cursor = serializers.CharField(required=False, help_text="next_cursor из предыдущей страницы")
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=MAX_PAGE_LIMIT, default=DEFAULT_PAGE_LIMIT)
+    summary = serializers.BooleanField(
+        required=False, default=False, help_text=f"Краткий режим: текст до {SUMMARY_TEXT_LENGTH} символов"
+    )
+
+
+class ReviewPageSerializer(serializers.Serializer):
+    items = ReviewDetailSerializer(many=True)
+    next_cursor = serializers.CharField(allow_null=True)
 
 
 class ReviewUpdateSerializer(serializers.Serializer):
@@ -17,6 +17,8 @@ from src.users.interfaces.rest.permissions import IsGuest
 from src.reviews.interfaces.rest.serializers import (
     ReviewCreateSerializer,
     ReviewDetailSerializer,
+    ReviewListQuerySerializer,
+    ReviewPageSerializer,
     ReviewUpdateSerializer,
 )
 from src.reviews.application.commands import CreateReviewCommand, UpdateReviewCommand, DeleteReviewCommand, \
@@ -27,16 +29,27 @@ from src.reviews.application.use_cases.list_reviews_for_accommodation import Lis
 from src.reviews.application.use_cases.list_my_reviews import ListMyReviewsUseCase
 from src.reviews.application.use_cases.update_review import UpdateReviewUseCase
 from src.reviews.application.use_cases.delete_review import DeleteReviewUseCase
+from src.reviews.domain.dtos import ReviewSort
 
 from src.reviews.infrastructure.repositories import DjangoReviewRepository
-from src.bookings.infrastructure.repositories import DjangoBookingRepository
+
+
+def _list_params(request) -> dict:
+    params = ReviewListQuerySerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    v = params.validated_data
+    return {"sort": ReviewSort(v["sort"]), "cursor": v.get("cursor"), "limit": v["limit"], "summary": v["summary"]}
 
 
 @extend_schema(
     tags=["reviews"],
-    responses={200: ReviewDetailSerializer(many=True)},
+    parameters=[ReviewListQuerySerializer],
+    responses={200: ReviewPageSerializer},
     operation_id="reviews_list_for_accommodation",
-    description="Список отзывов по объявлению (публично).",
+    description=(
+        "Список отзывов по объявлению (публично). Курсорная пагинация: передайте next_cursor "
+        "из ответа в ?cursor= (с той же sort), пока он не станет null."
+    ),
     methods=["GET"],
 )
 @extend_schema(
@@ -61,16 +74,20 @@ class AccommodationReviewsView(APIView):
     def get(self, request, accommodation_id: int):
         reviews_repo = DjangoReviewRepository()
         use_case = ListReviewsForAccommodationUseCase(reviews=reviews_repo)
-        dtos = use_case.execute(ListReviewsForAccommodationQuery(accommodation_id=accommodation_id))
-        return Response(ReviewDetailSerializer(dtos, many=True).data, status=status.HTTP_200_OK)
+        try:
+            page = use_case.execute(
+                ListReviewsForAccommodationQuery(accommodation_id=accommodation_id, **_list_params(request))
+            )
+        except ApplicationError as e:
+            return response_from_app_error(e)
+        return Response(ReviewPageSerializer(page).data, status=status.HTTP_200_OK)
 
     @method_decorator(csrf_protect)
     def post(self, request, accommodation_id: int):
         ser = ReviewCreateSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
         reviews_repo = DjangoReviewRepository()
-        bookings_repo = DjangoBookingRepository()
-        use_case = CreateReviewUseCase(reviews=reviews_repo, bookings=bookings_repo)
+        use_case = CreateReviewUseCase(reviews=reviews_repo)
         try:
             dto = use_case.execute(
                 CreateReviewCommand(
@@ -90,9 +107,10 @@ class AccommodationReviewsView(APIView):
 
 @extend_schema(
     tags=["reviews"],
-    responses={200: ReviewDetailSerializer(many=True)},
+    parameters=[ReviewListQuerySerializer],
+    responses={200: ReviewPageSerializer},
     operation_id="reviews_list_mine",
-    description="Мои отзывы (guest).",
+    description="Мои отзывы (guest). Курсорная пагинация через next_cursor.",
 )
 class ListMyReviewsView(APIView):
     permission_classes = [IsAuthenticatedAndActive, IsGuest]
@@ -100,8 +118,11 @@ class ListMyReviewsView(APIView):
     def get(self, request):
         reviews_repo = DjangoReviewRepository()
         use_case = ListMyReviewsUseCase(reviews=reviews_repo)
-        dtos = use_case.execute(ListMyReviewsQuery(author_id=request.user.id))
-        return Response(ReviewDetailSerializer(dtos, many=True).data, status=status.HTTP_200_OK)
+        try:
+            page = use_case.execute(ListMyReviewsQuery(author_id=request.user.id, **_list_params(request)))
+        except ApplicationError as e:
+            return response_from_app_error(e)
+        return Response(ReviewPageSerializer(page).data, status=status.HTTP_200_OK)
 
 
 class ListReviewsByUserIdView(APIView):
@@ -110,8 +131,11 @@ class ListReviewsByUserIdView(APIView):
     def get(self, request, user_id: int):
         reviews_repo = DjangoReviewRepository()
         use_case = ListMyReviewsUseCase(reviews=reviews_repo)
-        dtos = use_case.execute(ListMyReviewsQuery(author_id=user_id))
-        return Response(ReviewDetailSerializer(dtos, many=True).data, status=status.HTTP_200_OK)
+        try:
+            page = use_case.execute(ListMyReviewsQuery(author_id=user_id, **_list_params(request)))
+        except ApplicationError as e:
+            return response_from_app_error(e)
+        return Response(ReviewPageSerializer(page).data, status=status.HTTP_200_OK)
 
 
 @extend_schema(
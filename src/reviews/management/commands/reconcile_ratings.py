@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from src.reviews.infrastructure.ratings import reconcile_ratings
+
+
+class Command(BaseCommand):
+    help = (
+        "Сверяет денормализованный рейтинг объявлений (rating_sum/reviews_count/average_rating) с отзывами "
+        "порциями и исправляет расхождения. Запускать периодически (cron/планировщик)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--max-batches", type=int, default=None)
+        parser.add_argument("--sleep", type=float, default=None, help="Пауза между порциями, секунды")
+        parser.add_argument("--dry-run", action="store_true", help="Только найти расхождения, не исправлять")
+
+    def handle(self, *args, **opts):
+        res = reconcile_ratings(
+            batch_size=opts["batch_size"],
+            max_batches=opts["max_batches"],
+            sleep_seconds=opts["sleep"],
+            fix=not opts["dry_run"],
+        )
+        self.stdout.write(
+            f"checked={res.checked} drifted={res.drifted} fixed={res.fixed} batches={res.batches} "
+            f"elapsed={res.elapsed_ms:.0f}ms"
+        )
+        if res.drifted_ids:
+            shown = ", ".join(map(str, res.drifted_ids[:50]))
+            self.stdout.write(f"drifted ids: {shown}{' ...' if len(res.drifted_ids) > 50 else ''}")
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accommodations', '0008_accommodation_rating_histogram'),
+        ('bookings', '0008_ical_feeds_and_external_blocks'),
+        ('reviews', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['accommodation', 'created_at', 'id'], name='reviews_accommo_1a65df_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['accommodation', 'rating', 'id'], name='reviews_accommo_9abe59_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['author', 'created_at', 'id'], name='reviews_author__f795d4_idx'),
+        ),
+        # Старые (…, created_at) убираем после создания новых — списки не остаются без индекса
+        migrations.RemoveIndex(
+            model_name='review',
+            name='reviews_accommo_4a0925_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='review',
+            name='reviews_author__f98b87_idx',
+        ),
+    ]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from src.accommodations.infrastructure.orm.models import Accommodation as AccORM
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.reviews.domain.entities import Review
+from src.reviews.domain.value_objects import Rating
+from src.reviews.infrastructure.orm.models import Review as ReviewORM
+from src.reviews.infrastructure.ratings import reconcile_ratings
+from src.reviews.infrastructure.repositories import DjangoReviewRepository
+from src.shared.testing.factories import create_accommodation, create_user
+
+
+class RatingAggregateTests(TestCase):
+    def setUp(self):
+        self.host = create_user("host@example.com", roles=["host"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        self.other = create_accommodation(owner_id=self.host.id)
+        self.repo = DjangoReviewRepository()
+        self._n = 0
+
+    def _review(self, rating: int, acc_id=None) -> Review:
+        self._n += 1
+        guest = create_user(f"guest{self._n}@example.com", roles=["guest"])
+        start = timezone.localdate() - timedelta(days=10 + self._n * 3)
+        booking = BookingORM.objects.create(
+            accommodation_id=acc_id or self.acc.id, guest=guest, host=self.host,
+            start_date=start, end_date=start + timedelta(days=2), status=BookingORM.Status.COMPLETED,
+        )
+        return self.repo.create(Review(
+            id=None, accommodation_id=acc_id or self.acc.id, author_id=guest.id, booking_id=booking.id,
+            rating=Rating(rating), text="Fine",
+        ))
+
+    def _state(self, acc_id=None):
+        acc = AccORM.objects.get(pk=acc_id or self.acc.id)
+        return acc.rating_sum, acc.reviews_count, acc.average_rating
+
+    def test_create_update_delete_apply_deltas(self):
+        first = self._review(4)
+        self._review(5)
+        self._review(2)
+        self.assertEqual(self._state(), (11, 3, Decimal("3.67")))
+
+        first.rating = Rating(1)
+        self.repo.update(first)
+        self.assertEqual(self._state(), (8, 3, Decimal("2.67")))
+
+        self.repo.delete(first.id)
+        self.assertEqual(self._state(), (7, 2, Decimal("3.50")))
+
+        # Каскадное удаление брони тоже уходит дельтой
+        BookingORM.objects.filter(review__isnull=False).delete()
+        self.assertEqual(self._state(), (0, 0, Decimal("0.00")))
+
+    def _stars(self, acc_id=None):
+        acc = AccORM.objects.get(pk=acc_id or self.acc.id)
+        return [getattr(acc, f"rating_{stars}_count") for stars in range(1, 6)]
+
+    def test_star_counters_follow_writes_and_feed_distribution(self):
+        first = self._review(5)
+        self._review(5)
+        self._review(3)
+        self.assertEqual(self._stars(), [0, 0, 1, 0, 2])
+
+        first.rating = Rating(1)
+        self.repo.update(first)
+        self.assertEqual(self._stars(), [1, 0, 1, 0, 1])
+        self.repo.delete(first.id)
+        self.assertEqual(self._stars(), [0, 0, 1, 0, 1])
+
+        resp = APIClient().get(f"/api/accommodations/{self.acc.id}/")
+        self.assertEqual(resp.status_code, 200, resp.content)
+        self.assertEqual(
+            [(b["stars"], b["count"], b["percent"]) for b in resp.json()["rating_distribution"]],
+            [(5, 1, 50.0), (4, 0, 0.0), (3, 1, 50.0), (2, 0, 0.0), (1, 0, 0.0)],
+        )
+
+    def test_write_does_not_scan_reviews(self):
+        for rating in (5, 4, 3):
+            self._review(rating)
+        with CaptureQueriesContext(connection) as ctx:
+            self._review(5)
+        aggregates = [q["sql"] for q in ctx.captured_queries if "AVG(" in q["sql"] or "COUNT(" in q["sql"]]
+        self.assertEqual(aggregates, [])
+        self.assertEqual(self._state(), (17, 4, Decimal("4.25")))
+
+    def test_reconcile_detects_and_repairs_drift_in_chunks(self):
+        self._review(4)
+        self._review(3, acc_id=self.other.id)
+        AccORM.objects.filter(pk=self.acc.id).update(rating_sum=99, average_rating=Decimal("4.50"))
+        AccORM.objects.filter(pk=self.other.id).update(reviews_count=7)
+
+        dry = reconcile_ratings(batch_size=1, sleep_seconds=0, fix=False)
+        self.assertEqual((dry.checked, dry.drifted, dry.fixed, dry.batches), (2, 2, 0, 2))
+        self.assertEqual(self._state()[0], 99)
+
+        res = reconcile_ratings(batch_size=1, sleep_seconds=0)
+        self.assertEqual((res.drifted, res.fixed), (2, 2))
+        self.assertEqual(self._state(), (4, 1, Decimal("4.00")))
+        self.assertEqual(self._state(self.other.id), (3, 1, Decimal("3.00")))
+        self.assertEqual(reconcile_ratings(sleep_seconds=0).drifted, 0)
+
+    def test_reconcile_repairs_star_counter_drift(self):
+        self._review(4)
+        AccORM.objects.filter(pk=self.acc.id).update(rating_4_count=0, rating_2_count=3)
+        self.assertEqual(reconcile_ratings(sleep_seconds=0).drifted_ids, [self.acc.id])
+        self.assertEqual(self._stars(), [0, 0, 0, 1, 0])
+
+    def test_stale_instance_without_snapshot_does_not_corrupt_counts(self):
+        review = self._review(4)
+        obj = ReviewORM(pk=review.id, accommodation_id=self.acc.id, author_id=review.author_id,
+                        booking_id=review.booking_id, rating=5, text="Changed", created_at=review.created_at)
+        obj.save()  # прежняя оценка неизвестна — счётчики не трогаем, дрейф исправит сверка
+        self.assertEqual(self._state()[1], 1)
+        self.assertEqual(reconcile_ratings(sleep_seconds=0).fixed, 1)
+        self.assertEqual(self._state(), (5, 1, Decimal("5.00")))
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.reviews.infrastructure.orm.models import Review as ReviewORM
+from src.shared.testing.factories import create_accommodation, create_user
+
+
+class ReviewPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.host = create_user("pag_host@example.com", roles=["host"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        self.guest = create_user("pag_guest@example.com", roles=["guest"])
+        now = timezone.now()
+        # Одинаковые created_at у пар — проверка тай-брейкера по id
+        for n, rating in enumerate([5, 3, 4, 1, 5, 2, 4]):
+            start = timezone.localdate() - timedelta(days=10 + n * 3)
+            booking = BookingORM.objects.create(
+                accommodation_id=self.acc.id, guest=self.guest, host=self.host,
+                start_date=start, end_date=start + timedelta(days=2), status=BookingORM.Status.COMPLETED,
+            )
+            review = ReviewORM.objects.create(
+                accommodation_id=self.acc.id, author=self.guest, booking=booking,
+                rating=rating, text=f"Review number {n} " + "x" * 300,
+            )
+            ReviewORM.objects.filter(pk=review.pk).update(created_at=now - timedelta(hours=n // 2))
+
+    def _collect(self, url, **params):
+        ids, cursor = [], None
+        while True:
+            resp = self.client.get(url, {**params, **({"cursor": cursor} if cursor else {})})
+            self.assertEqual(resp.status_code, 200, resp.content)
+            body = resp.json()
+            self.assertLessEqual(len(body["items"]), params.get("limit", 20))
+            ids += [item["id"] for item in body["items"]]
+            cursor = body["next_cursor"]
+            if not cursor:
+                return ids
+
+    def _expected(self, *order):
+        qs = ReviewORM.objects.filter(accommodation_id=self.acc.id).order_by(*order)
+        return list(qs.values_list("id", flat=True))
+
+    def test_pages_cover_all_reviews_in_each_sort(self):
+        url = f"/api/accommodations/{self.acc.id}/reviews/"
+        self.assertEqual(self._collect(url, limit=2), self._expected("-created_at", "-id"))
+        self.assertEqual(self._collect(url, limit=3, sort="rating_desc"), self._expected("-rating", "-id"))
+        self.assertEqual(self._collect(url, limit=3, sort="rating_asc"), self._expected("rating", "id"))
+        self.assertEqual(self._collect("/api/reviews/user/%d/" % self.guest.id, limit=4),
+                         self._expected("-created_at", "-id"))
+
+    def test_summary_mode_truncates_text(self):
+        resp = self.client.get(f"/api/accommodations/{self.acc.id}/reviews/", {"summary": "true", "limit": 1})
+        item = resp.json()["items"][0]
+        self.assertTrue(item["text_truncated"])
+        self.assertLessEqual(len(item["text"]), 201)
+        self.assertTrue(item["text"].endswith("…"))
+
+        full = self.client.get(f"/api/accommodations/{self.acc.id}/reviews/", {"limit": 1}).json()["items"][0]
+        self.assertFalse(full["text_truncated"])
+        self.assertGreater(len(full["text"]), 300)
+
+    def test_invalid_or_foreign_cursor_rejected(self):
+        url = f"/api/accommodations/{self.acc.id}/reviews/"
+        self.assertEqual(self.client.get(url, {"cursor": "garbage"}).status_code, 400)
+        cursor = self.client.get(url, {"limit": 1, "sort": "rating_desc"}).json()["next_cursor"]
+        self.assertEqual(self.client.get(url, {"cursor": cursor, "sort": "rating_asc"}).status_code, 400)
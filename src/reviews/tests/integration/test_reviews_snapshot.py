@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from src.bookings.infrastructure.orm.models import Booking as BookingORM
+from src.common.infrastructure.outbox import dispatch_outbox
+from src.reviews.domain.entities import Review
+from src.reviews.domain.value_objects import Rating
+from src.reviews.infrastructure.orm.models import Review as ReviewORM
+from src.reviews.infrastructure.repositories import DjangoReviewRepository
+from src.shared.testing.factories import create_accommodation, create_user
+
+
+class ReviewsSnapshotTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.host = create_user("snap_host@example.com", roles=["host"])
+        self.acc = create_accommodation(owner_id=self.host.id)
+        self.other = create_accommodation(owner_id=self.host.id)
+        self.repo = DjangoReviewRepository()
+        self._n = 0
+
+    def _review(self, rating: int, text: str = "Pleasant stay") -> Review:
+        self._n += 1
+        guest = create_user(f"snap_guest{self._n}@example.com", roles=["guest"])
+        start = timezone.localdate() - timedelta(days=10 + self._n * 3)
+        booking = BookingORM.objects.create(
+            accommodation_id=self.acc.id, guest=guest, host=self.host,
+            start_date=start, end_date=start + timedelta(days=2), status=BookingORM.Status.COMPLETED,
+        )
+        review = self.repo.create(Review(
+            id=None, accommodation_id=self.acc.id, author_id=guest.id, booking_id=booking.id,
+            rating=Rating(rating), text=text,
+        ))
+        ReviewORM.objects.filter(pk=review.id).update(created_at=timezone.now() - timedelta(days=10 - self._n))
+        return review
+
+    def _summary(self, acc_id=None):
+        resp = self.client.get(f"/api/accommodations/{acc_id or self.acc.id}/", {"include": "reviews_summary"})
+        self.assertEqual(resp.status_code, 200, resp.content)
+        return resp.json()["reviews_summary"]
+
+    def test_summary_from_snapshot_refreshed_by_outbox(self):
+        first = self._review(2)
+        self._review(5, text="Long review " + "y" * 400)
+        self._review(4)
+        newest = self._review(3)
+        dispatch_outbox()
+
+        with CaptureQueriesContext(connection) as ctx:
+            summary = self._summary()
+        reads = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+        self.assertEqual([sql for sql in reads if '"reviews"' in sql], [])
+        self.assertEqual(len([sql for sql in reads if 'FROM "accommodations"' in sql]), 1)
+
+        self.assertEqual(summary["reviews_count"], 4)
+        self.assertEqual(summary["average_rating"], "3.50")
+        self.assertEqual([r["id"] for r in summary["latest"]], [newest.id, newest.id - 1, newest.id - 2])
+        long_text = summary["latest"][2]
+        self.assertTrue(long_text["text_truncated"])
+        self.assertLessEqual(len(long_text["text"]), 201)
+
+        self.repo.delete(newest.id)
+        dispatch_outbox()
+        self.assertEqual([r["id"] for r in self._summary()["latest"]], [newest.id - 1, newest.id - 2, first.id])
+
+    def test_moved_review_refreshes_both_listings(self):
+        review = self._review(4)
+        dispatch_outbox()
+        obj = ReviewORM.objects.get(pk=review.id)
+        obj.accommodation_id = self.other.id
+        obj.save()
+        dispatch_outbox()
+        self.assertEqual(self._summary()["latest"], [])
+        self.assertEqual([r["id"] for r in self._summary(self.other.id)["latest"]], [review.id])
+
+    def test_summary_only_on_request(self):
+        resp = self.client.get(f"/api/accommodations/{self.acc.id}/")
+        self.assertIsNone(resp.json()["reviews_summary"])
+        resp = self.client.get(f"/api/accommodations/{self.acc.id}/", {"include": "reviews_summary,photos"})
+        self.assertEqual(resp.status_code, 400, resp.content)
@@ -32,10 +32,10 @@ class FakeReviewRepo(IReviewRepository):
     def get_by_id(self, review_id: int) -> Optional[Review]:
         return self._store.get(review_id)
 
-    def list_for_accommodation(self, accommodation_id: int) -> list[Review]:
+    def list_for_accommodation(self, accommodation_id: int, **_) -> list[Review]:
         return [r for r in self._store.values() if r.accommodation_id == accommodation_id]
 
-    def list_by_author(self, author_id: int) -> list[Review]:
+    def list_by_author(self, author_id: int, **_) -> list[Review]:
         return [r for r in self._store.values() if r.author_id == author_id]
 
     def exists_for_booking(self, booking_id: int) -> bool: